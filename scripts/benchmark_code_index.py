@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Measure CodebaseReader startup with and without the on-disk index cache.
+
+Reports the time until the constructor returns and until the index is
+ready for lookups, for:
+  - no cache (parse every file, synchronously or in a background thread)
+  - warm cache, validated synchronously
+  - warm cache, validated in a background thread (what Conductor uses)
+
+Usage:
+    python scripts/benchmark_code_index.py
+    python scripts/benchmark_code_index.py --root src/ --runs 5
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.logger import get_logger
+from src.llm.codebase_reader import CodebaseReader
+
+
+def measure(runs: int, **kwargs):
+    """Return (constructor ms, ready ms), best of runs."""
+    best_init = best_ready = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        reader = CodebaseReader(logger=get_logger(), **kwargs)
+        init = time.perf_counter() - start
+        reader.wait_until_ready()
+        ready = time.perf_counter() - start
+        if reader._refresh_thread:
+            reader._refresh_thread.join()
+        best_init = min(best_init, init)
+        best_ready = min(best_ready, ready)
+    return best_init * 1000, best_ready * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark code index startup")
+    parser.add_argument("--root", default="src/")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = str(Path(tmp) / "code_index.json")
+        CodebaseReader(logger=get_logger(), codebase_root=args.root, cache_path=cache)
+        cache_kb = Path(cache).stat().st_size / 1024
+
+        results = [
+            ("no cache", measure(args.runs, codebase_root=args.root)),
+            ("no cache, background build", measure(args.runs, codebase_root=args.root, background=True)),
+            ("cache, sync validation", measure(args.runs, codebase_root=args.root, cache_path=cache)),
+            (
+                "cache, background validation",
+                measure(args.runs, codebase_root=args.root, cache_path=cache, background=True),
+            ),
+        ]
+
+    print(f"cache file: {cache_kb:.0f} KB")
+    print(f"{'startup':<30} {'constructor ms':>15} {'ready ms':>10}")
+    print("-" * 57)
+    for label, (init_ms, ready_ms) in results:
+        print(f"{label:<30} {init_ms:>15.1f} {ready_ms:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
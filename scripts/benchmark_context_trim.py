@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for context window trimming.
+
+Measures how OllamaInference._trim_context and
+ConversationHistory.trim_for_inference scale with history length, reporting
+wall time and the number of token counter calls per run.
+
+Usage:
+    python scripts/benchmark_context_trim.py
+    python scripts/benchmark_context_trim.py --sizes 10 100 1000 10000 --repeat 5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.logger import DemiLogger
+from src.llm import LLMConfig, OllamaInference
+from src.llm.history_manager import ConversationHistory
+from src.llm.tokenizer import TokenCounter
+
+
+def build_messages(count: int):
+    """Build an alternating user/assistant conversation of the given length."""
+    return [
+        {
+            "role": "user" if i % 2 == 0 else "assistant",
+            "content": f"message {i} " + "lorem ipsum dolor sit amet " * 4,
+        }
+        for i in range(count)
+    ]
+
+
+def bench_inference_trim(size: int, repeat: int):
+    """Time OllamaInference._trim_context with a cold token cache."""
+    inference = OllamaInference(LLMConfig(), DemiLogger())
+    messages = [{"role": "system", "content": "You are Demi."}] + build_messages(size)
+
+    best = float("inf")
+    calls = 0
+    for _ in range(repeat):
+        counter = TokenCounter()
+        counter._tokenizer_attempted = True  # fallback estimation only
+        inference.token_counter = counter
+        start = time.perf_counter()
+        inference._trim_context(messages, max_tokens=4096)
+        best = min(best, time.perf_counter() - start)
+        stats = counter.get_stats()
+        calls = stats["hits"] + stats["misses"]
+    return best, calls
+
+
+def bench_history_trim(size: int, repeat: int):
+    """Time ConversationHistory.trim_for_inference with a counting tokenizer."""
+    history = ConversationHistory(max_context_tokens=4096)
+    for msg in build_messages(size):
+        history.add_message(msg["role"], msg["content"])
+
+    best = float("inf")
+    calls = 0
+    for _ in range(repeat):
+        counted = [0]
+
+        def token_counter(text):
+            counted[0] += 1
+            return max(1, len(text) // 4)
+
+        start = time.perf_counter()
+        history.trim_for_inference(system_prompt_tokens=500, token_counter=token_counter)
+        best = min(best, time.perf_counter() - start)
+        calls = counted[0]
+    return best, calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark context trimming")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000]
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'messages':>10} | {'_trim_context ms':>17} {'counts':>8} | "
+          f"{'trim_for_inference ms':>22} {'counts':>8}")
+    print("-" * 76)
+    for size in args.sizes:
+        inf_time, inf_calls = bench_inference_trim(size, args.repeat)
+        hist_time, hist_calls = bench_history_trim(size, args.repeat)
+        print(f"{size:>10} | {inf_time * 1000:>17.3f} {inf_calls:>8} | "
+              f"{hist_time * 1000:>22.3f} {hist_calls:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Measure interim transcripts against transcribing only finished utterances.
+
+An utterance starting with the wake word is streamed in 20 ms packets in
+(scaled) real time. A fake Whisper decoder costs `--rtf` seconds per
+second of audio and returns the words completed in the window it is
+given, with timings. Compared:
+  - final only: one decode of the whole utterance after the hangover
+  - interim, no commit: InterimTranscriber without word timestamps, so
+    every interim re-decodes the whole utterance so far
+  - interim + commit: InterimTranscriber with stable-prefix commit
+
+Reports when the wake word is first recognized (from utterance start),
+how long after the utterance ends the final transcript is ready, and how
+much audio was decoded in total.
+
+Usage:
+    python scripts/benchmark_interim_transcripts.py
+    python scripts/benchmark_interim_transcripts.py --words 25 --rtf 0.2 --interval-ms 300
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.voice.interim import InterimTranscriber
+from src.voice.stt import FasterWhisperWord, TranscriptionResult
+
+SAMPLE_RATE = 16000
+PACKET_MS = 20
+HANGOVER_MS = 500
+WAKE_WORD = "demi"
+
+
+def make_script(words: int):
+    """Spoken words as (text, start s, end s): 300 ms words, 100 ms gaps."""
+    texts = ["Demi"] + [f"word{i}" for i in range(1, words)]
+    return [(text, i * 0.4, i * 0.4 + 0.3) for i, text in enumerate(texts)]
+
+
+def make_decoder(script, rtf: float, speed: float, timestamps: bool):
+    """Fake decoder; audio samples encode their position in 10 ms units."""
+
+    async def decode(audio, interim):
+        samples = np.frombuffer(audio, dtype=np.int16)
+        seconds = len(samples) / SAMPLE_RATE
+        await asyncio.sleep(seconds * rtf / speed)
+        start = samples[0] / 100
+        words = [
+            FasterWhisperWord(text, s - start, e - start, 1.0)
+            for text, s, e in script
+            if s >= start - 0.005 and e <= start + seconds
+        ]
+        return TranscriptionResult(
+            text=" ".join(word.text for word in words),
+            words=words if interim and timestamps else [],
+        )
+
+    return decode
+
+
+async def run(mode: str, script, args):
+    """Stream one utterance; return (wake ms, final ready ms, decoded s, decodes)."""
+    speed = args.speed
+    seconds = script[-1][2] + 0.1
+    audio = (np.arange(int(SAMPLE_RATE * seconds)) // 160).astype(np.int16).tobytes()
+    packet = SAMPLE_RATE * PACKET_MS // 1000 * 2
+
+    decode = make_decoder(script, args.rtf, speed, timestamps=mode == "interim + commit")
+    interim = None
+    if mode != "final only":
+        interim = InterimTranscriber(decode, interval_ms=args.interval_ms, max_window_ms=60000)
+
+    start = time.perf_counter()
+    elapsed_ms = lambda: (time.perf_counter() - start) * 1000 * speed
+    wake_ms = None
+
+    for end in range(packet, len(audio) + 1, packet):
+        if interim:
+            result = interim.poll(end * 1000 // 32000, lambda: audio[:end])
+            if wake_ms is None and result and WAKE_WORD in result.text.lower():
+                wake_ms = elapsed_ms()
+        await asyncio.sleep(PACKET_MS / 1000 / speed)
+
+    speech_end_ms = elapsed_ms()
+    await asyncio.sleep(HANGOVER_MS / 1000 / speed)
+    if interim:
+        final = await interim.finish(audio)
+        decoded_ms, decodes = interim.decoded_ms, interim.decodes
+    else:
+        final = await decode(audio, False)
+        decoded_ms, decodes = len(audio) // 32, 1
+    final_ms = elapsed_ms() - speech_end_ms
+
+    assert final.text.split() == [text for text, _, _ in script], final.text
+    if wake_ms is None:
+        wake_ms = elapsed_ms()
+    return wake_ms, final_ms, decoded_ms / 1000, decodes
+
+
+async def main_async(args):
+    script = make_script(args.words)
+    print(f"{script[-1][2] + 0.1:.1f} s utterance, {args.words} words, "
+          f"decoder RTF {args.rtf}, interim every {args.interval_ms} ms")
+    print(f"{'mode':<20} {'wake word ms':>12} {'final after end ms':>19} "
+          f"{'decoded s':>10} {'decodes':>8}")
+    print("-" * 73)
+    for mode in ("final only", "interim, no commit", "interim + commit"):
+        wake_ms, final_ms, decoded_s, decodes = await run(mode, script, args)
+        print(f"{mode:<20} {wake_ms:>12.0f} {final_ms:>19.0f} {decoded_s:>10.1f} {decodes:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark interim transcripts")
+    parser.add_argument("--words", type=int, default=15)
+    parser.add_argument("--rtf", type=float, default=0.1,
+                        help="Decoder seconds per second of audio")
+    parser.add_argument("--interval-ms", type=int, default=500)
+    parser.add_argument("--speed", type=float, default=5.0,
+                        help="Run this many times faster than real time")
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Benchmark PatternLearningDB lookups with a large learned-pattern store.
+
+Fills a temporary database with synthetic patterns and mistakes, then
+compares the indexed lookups against the old full-scan approach (load and
+decode every row, score each one).
+
+Usage:
+    python scripts/benchmark_pattern_index.py
+    python scripts/benchmark_pattern_index.py --patterns 100000 --mistakes 10000
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.storage import close_database
+from src.evolution.pattern_learning import (
+    LearnedPattern,
+    MistakeEntry,
+    PatternLearningDB,
+)
+
+VOCABULARY = [f"word{i:05d}" for i in range(20000)]
+
+
+def phrase(rng: random.Random, words: int = 8) -> str:
+    return " ".join(rng.choice(VOCABULARY) for _ in range(words))
+
+
+def populate(db: PatternLearningDB, patterns: int, mistakes: int, seed: int = 7):
+    """Insert synthetic rows in large transactions."""
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc).isoformat()
+
+    def insert(conn, start, end, kind):
+        for _ in range(start, end):
+            if kind == "pattern":
+                issue = phrase(rng)
+                db._store_pattern(LearnedPattern(
+                    pattern_id=f"pat_{uuid.uuid4().hex[:12]}",
+                    timestamp=now,
+                    trigger_issue=issue,
+                    trigger_keywords=db._extract_keywords(issue),
+                    effective_strategy=rng.choice(["shorten", "persona", "tone"]),
+                    before_example="before",
+                    after_example="after",
+                    times_applied=1,
+                    times_successful=1,
+                    avg_improvement=0.7,
+                ))
+            else:
+                db._store_mistake(MistakeEntry(
+                    entry_id=f"mist_{uuid.uuid4().hex[:12]}",
+                    timestamp=now,
+                    mistake_type="tone",
+                    mistake_description=phrase(rng),
+                    example_response=phrase(rng, 12),
+                    correction_strategy="fix",
+                    corrected_response="fixed",
+                    root_cause="cause",
+                    prevention_tip="tip",
+                ))
+
+    for kind, total in (("pattern", patterns), ("mistake", mistakes)):
+        for start in range(0, total, 5000):
+            db._db.write(insert, start, min(start + 5000, total), kind)
+
+
+def full_scan_patterns(db: PatternLearningDB, issue: str, top_k: int = 3):
+    """The previous find_patterns_for_issue: score every stored pattern."""
+    keywords = set(db._extract_keywords(issue))
+    scored = []
+    for pattern in db._get_all_patterns():
+        overlap = len(keywords & set(pattern.trigger_keywords))
+        if overlap > 0:
+            scored.append((overlap * 2 + pattern.success_rate() * 3, pattern))
+    scored.sort(key=lambda x: x[0], reverse=True)
+    return [p for _, p in scored[:top_k]]
+
+
+def full_scan_mistakes(db: PatternLearningDB, response: str):
+    """The previous find_mistake_prevention: re-extract keywords per mistake."""
+    response_lower = response.lower()
+    relevant = []
+    for mistake in db._get_all_mistakes():
+        keywords = set(
+            db._extract_keywords(mistake.mistake_description)
+            + db._extract_keywords(mistake.example_response)
+        )
+        matches = sum(1 for kw in keywords if kw in response_lower)
+        if matches >= 2:
+            relevant.append((matches, mistake))
+    relevant.sort(key=lambda x: x[0], reverse=True)
+    return [m for _, m in relevant[:5]]
+
+
+def timed(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pattern lookups")
+    parser.add_argument("--patterns", type=int, default=100000)
+    parser.add_argument("--mistakes", type=int, default=10000)
+    parser.add_argument("--queries", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    queries = [phrase(rng, 6) for _ in range(args.queries)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "patterns.db")
+        db = PatternLearningDB(db_path=path)
+
+        start = time.perf_counter()
+        populate(db, args.patterns, args.mistakes)
+        print(f"populated {args.patterns} patterns, {args.mistakes} mistakes "
+              f"in {time.perf_counter() - start:.1f}s")
+
+        # Fresh instance so the first lookup pays the index load
+        db = PatternLearningDB(db_path=path)
+        start = time.perf_counter()
+        db._ensure_index()
+        print(f"index load: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+        it = iter(queries * 1000)
+        indexed_patterns = timed(lambda: db.find_patterns_for_issue(next(it)), len(queries))
+        indexed_similar = timed(
+            lambda: db._find_similar_pattern(q := next(it), db._extract_keywords(q)),
+            len(queries),
+        )
+        indexed_mistakes = timed(lambda: db.find_mistake_prevention(next(it)), len(queries))
+
+        scan_patterns = timed(lambda: full_scan_patterns(db, next(it)), 3)
+        scan_mistakes = timed(lambda: full_scan_mistakes(db, next(it)), 3)
+
+        close_database(path)
+
+    print(f"{'lookup':<28} {'full scan ms':>12} {'indexed ms':>11} {'speedup':>8}")
+    print("-" * 62)
+    print(f"{'find_patterns_for_issue':<28} {scan_patterns:>12.1f} {indexed_patterns:>11.2f} "
+          f"{scan_patterns / indexed_patterns:>7.0f}x")
+    print(f"{'_find_similar_pattern':<28} {scan_patterns:>12.1f} {indexed_similar:>11.2f} "
+          f"{scan_patterns / indexed_similar:>7.0f}x")
+    print(f"{'find_mistake_prevention':<28} {scan_mistakes:>12.1f} {indexed_mistakes:>11.2f} "
+          f"{scan_mistakes / indexed_mistakes:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
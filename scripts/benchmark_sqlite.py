@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for SQLite inserts.
+
+Compares the old access pattern (a new sqlite3.connect per insert, default
+rollback journal) against the shared storage layer (persistent WAL
+connections with a single writer thread), reporting inserts/sec.
+
+Usage:
+    python scripts/benchmark_sqlite.py
+    python scripts/benchmark_sqlite.py --rows 5000 --batch 100
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.storage import close_database, get_database
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS metrics (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        value REAL NOT NULL,
+        metric_type TEXT NOT NULL,
+        timestamp REAL NOT NULL,
+        labels TEXT DEFAULT '{}'
+    );
+    CREATE INDEX IF NOT EXISTS idx_metrics_name_time ON metrics(name, timestamp);
+"""
+
+INSERT_SQL = """
+    INSERT INTO metrics (id, name, value, metric_type, timestamp, labels)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
+def make_row(i: int):
+    return (str(uuid.uuid4()), f"metric_{i % 20}", float(i), "gauge", time.time(), json.dumps({}))
+
+
+def bench_connect_per_insert(path: str, rows: int) -> float:
+    """Old pattern: open, insert, commit, close for every row."""
+    with sqlite3.connect(path) as conn:
+        conn.executescript(SCHEMA)
+    start = time.perf_counter()
+    for i in range(rows):
+        with sqlite3.connect(path) as conn:
+            conn.execute(INSERT_SQL, make_row(i))
+            conn.commit()
+        conn.close()
+    return rows / (time.perf_counter() - start)
+
+
+def bench_storage(path: str, rows: int) -> float:
+    """Shared layer: one transaction per insert on the writer thread."""
+    db = get_database(path)
+    db.executescript(SCHEMA)
+    start = time.perf_counter()
+    for i in range(rows):
+        db.execute(INSERT_SQL, make_row(i))
+    rate = rows / (time.perf_counter() - start)
+    close_database(path)
+    return rate
+
+
+def bench_storage_batched(path: str, rows: int, batch: int) -> float:
+    """Shared layer: executemany() batches of rows per transaction."""
+    db = get_database(path)
+    db.executescript(SCHEMA)
+    start = time.perf_counter()
+    for offset in range(0, rows, batch):
+        db.executemany(INSERT_SQL, [make_row(i) for i in range(offset, min(offset + batch, rows))])
+    rate = rows / (time.perf_counter() - start)
+    close_database(path)
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SQLite inserts")
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--batch", type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        before = bench_connect_per_insert(str(Path(tmp) / "before.db"), args.rows)
+        after = bench_storage(str(Path(tmp) / "after.db"), args.rows)
+        batched = bench_storage_batched(str(Path(tmp) / "batched.db"), args.rows, args.batch)
+
+    print(f"{'pattern':<36} {'inserts/sec':>12} {'speedup':>8}")
+    print("-" * 58)
+    print(f"{'connect per insert (before)':<36} {before:>12.0f} {1.0:>7.1f}x")
+    print(f"{'storage layer (after)':<36} {after:>12.0f} {after / before:>7.1f}x")
+    print(f"{f'storage layer, batch={args.batch}':<36} {batched:>12.0f} {batched / before:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Compare preparing a Discord utterance for Whisper via a temp WAV file
+against the in-memory PCM path.
+
+The model itself is left out, so only the per-utterance input overhead is
+measured:
+  - temp file: write NamedTemporaryFile WAV, read it back, convert to
+    float32 (what the model does with a path), delete the file
+  - in memory: pcm16_to_float32 on the PCM buffer
+
+Reports latency and, from tracemalloc, the number of allocations and peak
+bytes per utterance.
+
+Usage:
+    python scripts/benchmark_stt_input.py
+    python scripts/benchmark_stt_input.py --seconds 3 10 30 --runs 50
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import wave
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.voice.audio_capture import pcm16_to_float32, write_wav_file
+
+SAMPLE_RATE = 16000
+
+
+def temp_file_path(pcm: bytes) -> np.ndarray:
+    """The previous path: PCM -> temp WAV -> model loads the file."""
+    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
+        tmp_path = tmp.name
+    write_wav_file(tmp_path, pcm, SAMPLE_RATE)
+    try:
+        with wave.open(tmp_path, "rb") as wav:
+            raw = wav.readframes(wav.getnframes())
+        return np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+    finally:
+        os.remove(tmp_path)
+
+
+def in_memory_path(pcm: bytes) -> np.ndarray:
+    """The current path: PCM buffer -> float32 array."""
+    return pcm16_to_float32(pcm, SAMPLE_RATE)
+
+
+def measure(fn, pcm: bytes, runs: int):
+    """Return (median ms, allocations, peak KB) per call."""
+    fn(pcm)  # warm up
+
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn(pcm)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    fn(pcm)
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocations = sum(
+        stat.count_diff for stat in after.compare_to(before, "lineno") if stat.count_diff > 0
+    )
+
+    return timings[len(timings) // 2], allocations, peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark STT input preparation")
+    parser.add_argument("--seconds", type=float, nargs="+", default=[2, 5, 15])
+    parser.add_argument("--runs", type=int, default=100)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(3)
+    print(f"{'utterance':<10} {'path':<10} {'median ms':>10} {'allocs':>7} {'peak KB':>9}")
+    print("-" * 50)
+    for seconds in args.seconds:
+        pcm = rng.integers(-8000, 8000, int(SAMPLE_RATE * seconds), dtype=np.int16).tobytes()
+        for label, fn in (("temp file", temp_file_path), ("in memory", in_memory_path)):
+            ms, allocs, peak_kb = measure(fn, pcm, args.runs)
+            print(f"{seconds:>8.0f}s  {label:<10} {ms:>10.3f} {allocs:>7} {peak_kb:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-speaker voice receive buffers.
+
+Simulates concurrent Discord speakers sending a 20 ms PCM packet each
+(16 kHz mono, 640 bytes) and compares the previous buffering strategies
+against the preallocated PCMRingBuffer:
+  - grow: `audio += packet` on immutable bytes, flushed at the max
+    utterance length (the old STTSink)
+  - trim: `audio += packet` then slice back to the max size (the old
+    AudioBuffer)
+  - ring: PCMRingBuffer.append, flushed with take() at the max utterance
+
+Reports total time, p99 per-packet append time, peak traced memory
+(tracemalloc) and total bytes copied.
+
+Usage:
+    python scripts/benchmark_voice_buffers.py
+    python scripts/benchmark_voice_buffers.py --speakers 10 --seconds 60 --max-utterance 10
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.voice.pcm_buffer import PCMRingBuffer, PCM_BYTES_PER_SECOND
+
+PACKET_MS = 20
+PACKET = b"\x01\x02" * (PCM_BYTES_PER_SECOND * PACKET_MS // 1000 // 2)
+
+
+class GrowBuffer:
+    """Previous STTSink buffering: grow bytes, flush when full."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.data = b""
+        self.copied = 0
+
+    def append(self, packet: bytes):
+        self.data += packet
+        self.copied += len(self.data)
+        if len(self.data) >= self.max_size:
+            self.data = b""
+
+
+class TrimBuffer:
+    """Previous AudioBuffer: grow bytes, slice back to max size."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.data = b""
+        self.copied = 0
+
+    def append(self, packet: bytes):
+        self.data += packet
+        self.copied += len(self.data)
+        if len(self.data) > self.max_size:
+            self.data = self.data[-self.max_size:]
+            self.copied += self.max_size
+
+
+class RingBuffer:
+    """PCMRingBuffer, flushed at the max utterance like the sink."""
+
+    def __init__(self, max_size: int):
+        self.ring = PCMRingBuffer(max_size)
+        self.copied = 0
+
+    def append(self, packet: bytes):
+        self.ring.append(packet)
+        self.copied += len(packet)
+        if len(self.ring) >= self.ring.capacity:
+            self.copied += len(self.ring.take())
+
+
+def run(buffer_cls, speakers: int, seconds: float, max_size: int, timed: bool):
+    """Feed every speaker's packets round-robin; return (buffers, append times)."""
+    packets = int(seconds * 1000 / PACKET_MS)
+    buffers = [buffer_cls(max_size) for _ in range(speakers)]
+    timings = []
+    clock = time.perf_counter
+    for _ in range(packets):
+        for buffer in buffers:
+            if timed:
+                t0 = clock()
+                buffer.append(PACKET)
+                timings.append(clock() - t0)
+            else:
+                buffer.append(PACKET)
+    return buffers, timings
+
+
+def simulate(buffer_cls, speakers: int, seconds: float, max_size: int):
+    """Return (total ms, p99 append us, peak MB, copied MB)."""
+    start = time.perf_counter()
+    buffers, _ = run(buffer_cls, speakers, seconds, max_size, timed=False)
+    total_ms = (time.perf_counter() - start) * 1000
+    copied_mb = sum(buffer.copied for buffer in buffers) / 1e6
+
+    _, timings = run(buffer_cls, speakers, seconds, max_size, timed=True)
+    timings.sort()
+    p99_us = timings[int(len(timings) * 0.99)] * 1e6
+
+    tracemalloc.start()
+    buffers, _ = run(buffer_cls, speakers, seconds, max_size, timed=False)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return total_ms, p99_us, peak / 1e6, copied_mb
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark voice receive buffers")
+    parser.add_argument("--speakers", type=int, default=10)
+    parser.add_argument("--seconds", type=float, default=60)
+    parser.add_argument("--max-utterance", type=float, default=10)
+    args = parser.parse_args()
+
+    max_size = int(args.max_utterance * PCM_BYTES_PER_SECOND)
+    print(f"{args.speakers} speakers x {args.seconds:.0f}s, 20 ms packets, "
+          f"max utterance {args.max_utterance:.0f}s")
+    print(f"{'buffer':<8} {'total ms':>9} {'x realtime':>11} {'p99 us':>8} "
+          f"{'peak MB':>8} {'copied MB':>10}")
+    print("-" * 59)
+    for label, buffer_cls in (("grow", GrowBuffer), ("trim", TrimBuffer), ("ring", RingBuffer)):
+        total_ms, p99_us, peak_mb, copied_mb = simulate(
+            buffer_cls, args.speakers, args.seconds, max_size
+        )
+        print(f"{label:<8} {total_ms:>9.1f} {args.seconds * 1000 / total_ms:>11.0f} "
+              f"{p99_us:>8.1f} {peak_mb:>8.1f} {copied_mb:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
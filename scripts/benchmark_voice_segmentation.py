@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Compare ways of cutting a Discord speaker's audio into utterances for STT.
+
+A synthetic stream of utterances (voiced words with short gaps between
+them, longer pauses between utterances) is fed in 20 ms packets (what
+Discord delivers) to:
+  - 2 s chunks: queue every 2 seconds of audio (the path used without VAD)
+  - last-frame VAD: classify the newest 30 ms of the accumulated buffer on
+    every packet and cut at the first non-speech frame
+  - segmenter: SpeechSegmenter, each 30 ms frame classified once, with
+    pre-roll, hangover and max-utterance split
+
+Reports VAD calls, segments emitted, how many cut through speech, and the
+delay from the end of each utterance to the segment containing it.
+
+Usage:
+    python scripts/benchmark_voice_segmentation.py
+    python scripts/benchmark_voice_segmentation.py --utterances 50 --hangover-ms 300
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.voice.vad import SpeechSegmenter, VoiceActivityDetector
+
+SAMPLE_RATE = 16000
+PACKET_BYTES = 640  # 20 ms, 16-bit mono
+FRAME_BYTES = 960  # 30 ms
+
+
+def make_stream(utterances: int, rng: np.random.Generator):
+    """Build PCM of spoken utterances; return (pcm, [(start_byte, end_byte)]).
+
+    Each utterance is a few voiced "words" separated by short gaps, like the
+    pauses between words in real speech.
+    """
+    parts = []
+    spans = []
+    offset = 0
+
+    def add(samples):
+        nonlocal offset
+        parts.append(samples.astype(np.int16))
+        offset += len(samples) * 2
+
+    for _ in range(utterances):
+        add(rng.normal(0, 30, int(SAMPLE_RATE * rng.uniform(0.8, 1.5))))
+        start = offset
+        for word in range(rng.integers(2, 7)):
+            if word:
+                add(rng.normal(0, 30, int(SAMPLE_RATE * rng.uniform(0.08, 0.25))))
+            length = int(SAMPLE_RATE * rng.uniform(0.2, 0.6))
+            t = np.arange(length) / SAMPLE_RATE
+            pitch = rng.uniform(110, 220)
+            voiced = sum(np.sin(2 * np.pi * pitch * k * t) / k for k in range(1, 8))
+            add(6000 * voiced * np.hanning(length) ** 0.3 + rng.normal(0, 300, length))
+        spans.append((start, offset))
+
+    add(rng.normal(0, 30, SAMPLE_RATE))
+    return np.concatenate(parts).tobytes(), spans
+
+
+class CountingVAD(VoiceActivityDetector):
+    """VoiceActivityDetector that counts classified frames."""
+
+    calls = 0
+
+    def is_speech(self, audio_frame, sample_rate):
+        self.calls += 1
+        return super().is_speech(audio_frame, sample_rate)
+
+
+def run_chunks(pcm):
+    segments = []
+    buffered = 0
+    for pos in range(0, len(pcm), PACKET_BYTES):
+        buffered += PACKET_BYTES
+        if buffered >= 2 * SAMPLE_RATE * 2:
+            segments.append((pos + PACKET_BYTES - buffered, pos + PACKET_BYTES))
+            buffered = 0
+    return segments, 0
+
+
+def run_last_frame(pcm, vad):
+    segments = []
+    start = None
+    buffered = bytearray()
+    for pos in range(0, len(pcm), PACKET_BYTES):
+        buffered += pcm[pos:pos + PACKET_BYTES]
+        if start is None:
+            start = pos
+        speech = len(buffered) >= FRAME_BYTES and vad.is_speech(
+            bytes(buffered[-FRAME_BYTES:]), SAMPLE_RATE
+        )
+        if not speech:
+            if len(buffered) > SAMPLE_RATE:  # > 500 ms
+                segments.append((start, pos + PACKET_BYTES))
+            if len(buffered) >= FRAME_BYTES:
+                buffered.clear()
+                start = None
+    return segments, vad.calls
+
+
+def run_segmenter(pcm, vad, hangover_ms):
+    segmenter = SpeechSegmenter(vad, hangover_ms=hangover_ms, max_utterance_ms=10000)
+    segments = []
+    for pos in range(0, len(pcm), PACKET_BYTES):
+        for segment in segmenter.feed(pcm[pos:pos + PACKET_BYTES]):
+            end = pos + PACKET_BYTES
+            segments.append((end - len(segment), end))
+    return segments, vad.calls
+
+
+def score(segments, spans):
+    """Return (cuts through speech, mean delay ms, max delay ms, missed utterances)."""
+    cuts = sum(
+        1 for _, end in segments for s, e in spans if s + FRAME_BYTES < end < e - FRAME_BYTES
+    )
+    delays = []
+    missed = 0
+    for s, e in spans:
+        emitted = [end for start, end in segments if end >= e - FRAME_BYTES and start < e]
+        if emitted:
+            delays.append((min(emitted) - e) / 32)
+        else:
+            missed += 1
+    delays = delays or [0.0]
+    return cuts, float(np.mean(delays)), float(np.max(delays)), missed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark voice utterance segmentation")
+    parser.add_argument("--utterances", type=int, default=30)
+    parser.add_argument("--hangover-ms", type=int, default=500)
+    args = parser.parse_args()
+
+    pcm, spans = make_stream(args.utterances, np.random.default_rng(5))
+    audio_s = len(pcm) / 32000
+    print(f"{audio_s:.0f} s of audio, {args.utterances} utterances, "
+          f"{len(pcm) // PACKET_BYTES} packets")
+    print(f"{'method':<15} {'VAD calls':>9} {'segments':>8} {'mid-speech cuts':>15} "
+          f"{'missed':>6} {'mean delay ms':>13} {'max delay ms':>12} {'cpu ms':>7}")
+    print("-" * 95)
+
+    methods = (
+        ("2 s chunks", lambda: run_chunks(pcm)),
+        ("last-frame VAD", lambda: run_last_frame(pcm, CountingVAD())),
+        ("segmenter", lambda: run_segmenter(pcm, CountingVAD(), args.hangover_ms)),
+    )
+    for label, fn in methods:
+        start = time.perf_counter()
+        segments, calls = fn()
+        cpu_ms = (time.perf_counter() - start) * 1000
+        cuts, mean_delay, max_delay, missed = score(segments, spans)
+        print(f"{label:<15} {calls:>9} {len(segments):>8} {cuts:>15} {missed:>6} "
+              f"{mean_delay:>13.0f} {max_delay:>12.0f} {cpu_ms:>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,7 @@ from src.api.models import (
     SessionListResponse,
 )
 from src.core.logger import DemiLogger
+from src.core.storage import get_database
 
 router = APIRouter(prefix="/api/v1/auth", tags=["auth"])
 security = HTTPBearer()
@@ -120,8 +121,8 @@ def get_current_user(
 
 async def get_user_from_db(email: str) -> Optional[User]:
     """Query user by email"""
-    db_path = get_db_path()
-    with sqlite3.connect(db_path) as conn:
+    db = get_database(get_db_path())
+    with db.read() as conn:
         conn.row_factory = sqlite3.Row
         row = conn.execute("SELECT * FROM users WHERE email = ?", (email,)).fetchone()
 
@@ -168,28 +169,26 @@ async def create_session(
         is_active=True,
     )
 
-    db_path = get_db_path()
-    with sqlite3.connect(db_path) as conn:
-        conn.execute(
-            """
+    db = get_database(get_db_path())
+    await db.execute_async(
+        """
         INSERT INTO sessions
         (session_id, user_id, device_name, device_fingerprint, refresh_token_hash,
          created_at, last_activity, expires_at, is_active)
         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
         """,
-            (
-                session.session_id,
-                session.user_id,
-                session.device_name,
-                session.device_fingerprint,
-                session.refresh_token_hash,
-                session.created_at.isoformat(),
-                session.last_activity.isoformat(),
-                session.expires_at.isoformat(),
-                session.is_active,
-            ),
-        )
-        conn.commit()
+        (
+            session.session_id,
+            session.user_id,
+            session.device_name,
+            session.device_fingerprint,
+            session.refresh_token_hash,
+            session.created_at.isoformat(),
+            session.last_activity.isoformat(),
+            session.expires_at.isoformat(),
+            session.is_active,
+        ),
+    )
 
     logger.info(f"Session created (user_id: {user_id})")
     return session
@@ -218,31 +217,29 @@ async def login(req: LoginRequest):
     # Verify password
     if not verify_password(req.password, user.password_hash):
         # Increment failed attempts
-        db_path = get_db_path()
-        with sqlite3.connect(db_path) as conn:
-            new_failed_attempts = user.failed_login_attempts + 1
-
-            # Lock account after 5 failed attempts
-            locked_until = None
-            if new_failed_attempts >= MAX_FAILED_LOGIN_ATTEMPTS:
-                locked_until = datetime.now(timezone.utc) + timedelta(
-                    minutes=LOCKOUT_DURATION_MINUTES
-                )
-                logger.warning(f"Account locked: {user.email} (5 failed attempts)")
-
-            conn.execute(
-                """
-            UPDATE users
-            SET failed_login_attempts = ?, locked_until = ?
-            WHERE user_id = ?
-            """,
-                (
-                    new_failed_attempts,
-                    locked_until.isoformat() if locked_until else None,
-                    user.user_id,
-                ),
+        new_failed_attempts = user.failed_login_attempts + 1
+
+        # Lock account after 5 failed attempts
+        locked_until = None
+        if new_failed_attempts >= MAX_FAILED_LOGIN_ATTEMPTS:
+            locked_until = datetime.now(timezone.utc) + timedelta(
+                minutes=LOCKOUT_DURATION_MINUTES
             )
-            conn.commit()
+            logger.warning(f"Account locked: {user.email} (5 failed attempts)")
+
+        db = get_database(get_db_path())
+        await db.execute_async(
+            """
+        UPDATE users
+        SET failed_login_attempts = ?, locked_until = ?
+        WHERE user_id = ?
+        """,
+            (
+                new_failed_attempts,
+                locked_until.isoformat() if locked_until else None,
+                user.user_id,
+            ),
+        )
 
         if new_failed_attempts >= MAX_FAILED_LOGIN_ATTEMPTS:
             logger.warning(f"Account locked: too many failed attempts (user_id: {user.user_id})")
@@ -253,17 +250,15 @@ async def login(req: LoginRequest):
         raise HTTPException(status_code=403, detail="Account disabled")
 
     # Reset failed login attempts on successful login
-    db_path = get_db_path()
-    with sqlite3.connect(db_path) as conn:
-        conn.execute(
-            """
+    db = get_database(get_db_path())
+    await db.execute_async(
+        """
         UPDATE users
         SET last_login = ?, failed_login_attempts = 0, locked_until = NULL
         WHERE user_id = ?
         """,
-            (datetime.now(timezone.utc).isoformat(), user.user_id),
-        )
-        conn.commit()
+        (datetime.now(timezone.utc).isoformat(), user.user_id),
+    )
 
     # Create session
     refresh_token = create_refresh_token(user.user_id, "temp-session-id")
@@ -305,8 +300,8 @@ async def refresh_access_token(req: RefreshTokenRequest):
     user_id = payload.get("user_id")
 
     # Get session from DB
-    db_path = get_db_path()
-    with sqlite3.connect(db_path) as conn:
+    db = get_database(get_db_path())
+    with db.read() as conn:
         conn.row_factory = sqlite3.Row
         row = conn.execute(
             "SELECT * FROM sessions WHERE session_id = ? AND user_id = ?",
@@ -322,12 +317,10 @@ async def refresh_access_token(req: RefreshTokenRequest):
         raise HTTPException(status_code=401, detail="Session expired")
 
     # Update last activity
-    with sqlite3.connect(db_path) as conn:
-        conn.execute(
-            "UPDATE sessions SET last_activity = ? WHERE session_id = ?",
-            (datetime.now(timezone.utc).isoformat(), session_id),
-        )
-        conn.commit()
+    await db.execute_async(
+        "UPDATE sessions SET last_activity = ? WHERE session_id = ?",
+        (datetime.now(timezone.utc).isoformat(), session_id),
+    )
 
     # Get user email for access token
     user = await get_user_from_db_by_id(user_id)
@@ -358,8 +351,8 @@ async def list_sessions(current_user: dict = Depends(get_current_user)):
     user_id = current_user["user_id"]
     current_session_id = current_user["session_id"]
 
-    db_path = get_db_path()
-    with sqlite3.connect(db_path) as conn:
+    db = get_database(get_db_path())
+    with db.read() as conn:
         conn.row_factory = sqlite3.Row
         rows = conn.execute(
             """
@@ -397,21 +390,14 @@ async def revoke_session(
     """
     user_id = current_user["user_id"]
 
-    db_path = get_db_path()
-    with sqlite3.connect(db_path) as conn:
-        # Verify session belongs to user
-        row = conn.execute(
-            "SELECT user_id FROM sessions WHERE session_id = ?", (session_id,)
-        ).fetchone()
-
-        if not row or row[0] != user_id:
-            raise HTTPException(status_code=404, detail="Session not found")
-
-        # Revoke session
-        conn.execute(
-            "UPDATE sessions SET is_active = 0 WHERE session_id = ?", (session_id,)
-        )
-        conn.commit()
+    # Revoke session, only if it belongs to the user
+    db = get_database(get_db_path())
+    cursor = await db.execute_async(
+        "UPDATE sessions SET is_active = 0 WHERE session_id = ? AND user_id = ?",
+        (session_id, user_id),
+    )
+    if cursor.rowcount == 0:
+        raise HTTPException(status_code=404, detail="Session not found")
 
     logger.info(f"Session revoked (session_id: {session_id[-8:]}, user_id: {user_id[:8]})")  # Log last 8 chars only
 
@@ -420,8 +406,8 @@ async def revoke_session(
 
 async def get_user_from_db_by_id(user_id: str) -> User:
     """Query user by ID"""
-    db_path = get_db_path()
-    with sqlite3.connect(db_path) as conn:
+    db = get_database(get_db_path())
+    with db.read() as conn:
         conn.row_factory = sqlite3.Row
         row = conn.execute(
             "SELECT * FROM users WHERE user_id = ?", (user_id,)
@@ -35,6 +35,7 @@ from typing import Optional, Dict, Tuple
 from dataclasses import dataclass
 
 from src.core.logger import DemiLogger
+from src.core.storage import get_database
 from src.emotion.models import EmotionalState
 from src.emotion.persistence import EmotionPersistence
 from src.autonomy.coordinator import AutonomyCoordinator
@@ -62,8 +63,8 @@ def get_db_path() -> str:
 
 async def get_last_checkin_time(user_id: str) -> Optional[datetime]:
     """Get timestamp of last check-in message sent"""
-    db_path = get_db_path()
-    with sqlite3.connect(db_path) as conn:
+    db = get_database(get_db_path())
+    with db.read() as conn:
         conn.row_factory = sqlite3.Row
         row = conn.execute(
             """
@@ -82,8 +83,8 @@ async def get_last_checkin_time(user_id: str) -> Optional[datetime]:
 
 async def get_last_user_response_time(user_id: str) -> Optional[datetime]:
     """Get timestamp of last message user sent"""
-    db_path = get_db_path()
-    with sqlite3.connect(db_path) as conn:
+    db = get_database(get_db_path())
+    with db.read() as conn:
         conn.row_factory = sqlite3.Row
         row = conn.execute(
             """
@@ -306,24 +307,22 @@ async def send_autonomous_checkin(
     )
 
     # Record check-in attempt
-    db_path = get_db_path()
-    with sqlite3.connect(db_path) as conn:
-        conn.execute(
-            """
+    db = get_database(get_db_path())
+    await db.execute_async(
+        """
         INSERT INTO android_checkins
         (checkin_id, user_id, trigger, emotion_state, was_ignored, created_at)
         VALUES (?, ?, ?, ?, ?, ?)
         """,
-            (
-                str(uuid.uuid4()),
-                user_id,
-                trigger,
-                str(emotion_state.to_dict()),
-                False,
-                datetime.now(timezone.utc).isoformat(),
-            ),
-        )
-        conn.commit()
+        (
+            str(uuid.uuid4()),
+            user_id,
+            trigger,
+            str(emotion_state.to_dict()),
+            False,
+            datetime.now(timezone.utc).isoformat(),
+        ),
+    )
 
     # Send via WebSocket if user is connected
     manager = get_connection_manager()
@@ -334,8 +333,9 @@ async def send_autonomous_checkin(
 
 async def create_checkins_table():
     """Create android_checkins table for tracking autonomous messages"""
-    db_path = get_db_path()
-    with sqlite3.connect(db_path) as conn:
+    db = get_database(get_db_path())
+
+    def create(conn):
         conn.execute("""
         CREATE TABLE IF NOT EXISTS android_checkins (
             checkin_id TEXT PRIMARY KEY,
@@ -351,8 +351,9 @@ async def create_checkins_table():
         CREATE INDEX IF NOT EXISTS idx_checkins_user_time
         ON android_checkins(user_id, created_at DESC)
         """)
-        conn.commit()
-        logger.info("Android check-ins table created/verified")
+
+    db.write(create)
+    logger.info("Android check-ins table created/verified")
 
 
 class AutonomyTask:
@@ -392,8 +393,8 @@ class AutonomyTask:
     async def _check_all_users(self):
         """Check all users for check-in triggers"""
         # Get all users from database
-        db_path = get_db_path()
-        with sqlite3.connect(db_path) as conn:
+        db = get_database(get_db_path())
+        with db.read() as conn:
             conn.row_factory = sqlite3.Row
             users = conn.execute(
                 "SELECT user_id FROM users WHERE is_active = 1"
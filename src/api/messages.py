@@ -1,11 +1,11 @@
-import sqlite3
 import json
 import uuid
 import os
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional, Dict
+from typing import AsyncIterator, List, Optional, Dict, Tuple
 from src.api.models import AndroidMessage
 from src.core.logger import DemiLogger
+from src.core.storage import get_database
 
 logger = DemiLogger()
 
@@ -34,103 +34,185 @@ async def store_message(
         created_at=datetime.now(timezone.utc),
     )
 
-    db_path = get_db_path()
-    with sqlite3.connect(db_path) as conn:
-        conn.execute(
-            """
+    db = get_database(get_db_path())
+    await db.execute_async(
+        """
         INSERT INTO android_messages
         (message_id, conversation_id, user_id, sender, content, emotion_state, status, created_at)
         VALUES (?, ?, ?, ?, ?, ?, ?, ?)
         """,
-            (
-                message.message_id,
-                message.conversation_id,
-                message.user_id,
-                message.sender,
-                message.content,
-                json.dumps(emotion_state) if emotion_state else None,
-                message.status,
-                message.created_at.isoformat(),
-            ),
-        )
-        conn.commit()
+        (
+            message.message_id,
+            message.conversation_id,
+            message.user_id,
+            message.sender,
+            message.content,
+            json.dumps(emotion_state) if emotion_state else None,
+            message.status,
+            message.created_at.isoformat(),
+        ),
+    )
 
     logger.info(f"Message stored: {message.message_id} ({sender})")
     return message
 
 
+# Messages per "history" event when streaming to a client
+HISTORY_CHUNK_SIZE = 100
+
+# Most messages a single delta sync sends before the client must ask again
+MAX_SYNC_MESSAGES = 1000
+
+_MESSAGE_COLUMNS = """
+    message_id, conversation_id, user_id, sender, content,
+    emotion_state, status, delivered_at, read_at, created_at, rowid
+"""
+
+
+def _row_to_message(row: tuple) -> AndroidMessage:
+    """Build an AndroidMessage from a row selected with _MESSAGE_COLUMNS."""
+    return AndroidMessage(
+        message_id=row[0],
+        conversation_id=row[1],
+        user_id=row[2],
+        sender=row[3],
+        content=row[4],
+        emotion_state=json.loads(row[5]) if row[5] else None,
+        status=row[6],
+        delivered_at=datetime.fromisoformat(row[7]) if row[7] else None,
+        read_at=datetime.fromisoformat(row[8]) if row[8] else None,
+        created_at=datetime.fromisoformat(row[9]),
+    )
+
+
 async def get_conversation_history(
     conversation_id: str, days: int = 7, limit: int = 100
 ) -> List[AndroidMessage]:
     """Load last N days of conversation history"""
     cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-    db_path = get_db_path()
+    db = get_database(get_db_path())
 
-    with sqlite3.connect(db_path) as conn:
-        conn.row_factory = sqlite3.Row
-        rows = conn.execute(
-            """
-        SELECT * FROM android_messages
+    rows = db.query(
+        f"""
+        SELECT {_MESSAGE_COLUMNS} FROM android_messages
         WHERE conversation_id = ? AND created_at > ?
-        ORDER BY created_at DESC
+        ORDER BY created_at DESC, rowid DESC
         LIMIT ?
         """,
-            (conversation_id, cutoff.isoformat(), limit),
-        ).fetchall()
+        (conversation_id, cutoff.isoformat(), limit),
+    )
 
-    messages = []
-    for row in reversed(rows):  # Reverse for chronological order
-        emotion_state = (
-            json.loads(row["emotion_state"]) if row["emotion_state"] else None
-        )
-        messages.append(
-            AndroidMessage(
-                message_id=row["message_id"],
-                conversation_id=row["conversation_id"],
-                user_id=row["user_id"],
-                sender=row["sender"],
-                content=row["content"],
-                emotion_state=emotion_state,
-                status=row["status"],
-                delivered_at=datetime.fromisoformat(row["delivered_at"])
-                if row["delivered_at"]
-                else None,
-                read_at=datetime.fromisoformat(row["read_at"])
-                if row["read_at"]
-                else None,
-                created_at=datetime.fromisoformat(row["created_at"]),
-            )
+    # Reverse for chronological order
+    return [_row_to_message(row) for row in reversed(rows)]
+
+
+def _get_cursor(conversation_id: str, message_id: str) -> Optional[Tuple[str, int]]:
+    """Keyset cursor (created_at, rowid) of a message, or None if unknown."""
+    db = get_database(get_db_path())
+    row = db.query_one(
+        """
+        SELECT created_at, rowid FROM android_messages
+        WHERE message_id = ? AND conversation_id = ?
+        """,
+        (message_id, conversation_id),
+    )
+    return (row[0], row[1]) if row else None
+
+
+async def get_messages_before(
+    conversation_id: str, before_message_id: str, limit: int = HISTORY_CHUNK_SIZE
+) -> Optional[Tuple[List[AndroidMessage], bool]]:
+    """
+    Page of messages older than a given message (keyset pagination).
+
+    Returns:
+        (messages in chronological order, whether older messages exist),
+        or None if before_message_id is not in this conversation
+    """
+    cursor = _get_cursor(conversation_id, before_message_id)
+    if cursor is None:
+        return None
+
+    db = get_database(get_db_path())
+    rows = db.query(
+        f"""
+        SELECT {_MESSAGE_COLUMNS} FROM android_messages
+        WHERE conversation_id = ? AND (created_at, rowid) < (?, ?)
+        ORDER BY created_at DESC, rowid DESC
+        LIMIT ?
+        """,
+        (conversation_id, cursor[0], cursor[1], limit + 1),
+    )
+    has_more = len(rows) > limit
+    return [_row_to_message(row) for row in reversed(rows[:limit])], has_more
+
+
+async def iter_messages_since(
+    conversation_id: str,
+    since_message_id: str,
+    chunk_size: int = HISTORY_CHUNK_SIZE,
+    max_messages: int = MAX_SYNC_MESSAGES,
+) -> AsyncIterator[Tuple[List[AndroidMessage], bool]]:
+    """
+    Stream messages newer than a given message, oldest first, in chunks.
+
+    Each chunk is one keyset query continuing from the previous chunk's
+    last row, so long histories are never loaded or serialized at once.
+
+    Yields:
+        (chunk of messages, whether newer messages remain after this chunk).
+        Nothing is yielded if since_message_id is not in this conversation;
+        a single empty chunk is yielded if the client is up to date.
+    """
+    cursor = _get_cursor(conversation_id, since_message_id)
+    if cursor is None:
+        return
+
+    db = get_database(get_db_path())
+    sent = 0
+    while True:
+        limit = min(chunk_size, max_messages - sent)
+        rows = db.query(
+            f"""
+            SELECT {_MESSAGE_COLUMNS} FROM android_messages
+            WHERE conversation_id = ? AND (created_at, rowid) > (?, ?)
+            ORDER BY created_at, rowid
+            LIMIT ?
+            """,
+            (conversation_id, cursor[0], cursor[1], limit + 1),
         )
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        sent += len(rows)
+        yield [_row_to_message(row) for row in rows], has_more
 
-    return messages
+        if not has_more or sent >= max_messages:
+            return
+        cursor = (rows[-1][9], rows[-1][10])
 
 
 async def mark_as_read(message_id: str) -> None:
     """Mark message as read with timestamp"""
-    db_path = get_db_path()
-    with sqlite3.connect(db_path) as conn:
-        conn.execute(
-            """
+    db = get_database(get_db_path())
+    await db.execute_async(
+        """
         UPDATE android_messages
         SET status = 'read', read_at = ?
         WHERE message_id = ?
         """,
-            (datetime.now(timezone.utc).isoformat(), message_id),
-        )
-        conn.commit()
+        (datetime.now(timezone.utc).isoformat(), message_id),
+    )
     logger.debug(f"Message marked read: {message_id}")
 
 
 async def mark_as_delivered(message_id: str) -> None:
     """Mark message as delivered"""
-    db_path = get_db_path()
-    with sqlite3.connect(db_path) as conn:
-        conn.execute(
-            """
+    db = get_database(get_db_path())
+    await db.execute_async(
+        """
         UPDATE android_messages
         SET status = 'delivered', delivered_at = ?
         WHERE message_id = ? AND status = 'sent'
         """,
-            (datetime.now(timezone.utc).isoformat(), message_id),
-        )
-        conn.commit()
+        (datetime.now(timezone.utc).isoformat(), message_id),
+    )
@@ -1,6 +1,6 @@
-import sqlite3
 import os
 from src.core.logger import DemiLogger
+from src.core.storage import get_database
 
 logger = DemiLogger()
 
@@ -22,8 +22,9 @@ def get_db_path() -> str:
 
 def create_users_table():
     """Create users table if not exists"""
-    db_path = get_db_path()
-    with sqlite3.connect(db_path) as conn:
+    db = get_database(get_db_path())
+
+    def create(conn):
         conn.execute("""
         CREATE TABLE IF NOT EXISTS users (
             user_id TEXT PRIMARY KEY,
@@ -42,14 +43,16 @@ def create_users_table():
         CREATE INDEX IF NOT EXISTS idx_users_email
         ON users(email)
         """)
-        conn.commit()
-        logger.info("Users table created/verified")
+
+    db.write(create)
+    logger.info("Users table created/verified")
 
 
 def create_sessions_table():
     """Create sessions table for multi-device support"""
-    db_path = get_db_path()
-    with sqlite3.connect(db_path) as conn:
+    db = get_database(get_db_path())
+
+    def create(conn):
         conn.execute("""
         CREATE TABLE IF NOT EXISTS sessions (
             session_id TEXT PRIMARY KEY,
@@ -69,14 +72,16 @@ def create_sessions_table():
         CREATE INDEX IF NOT EXISTS idx_sessions_user
         ON sessions(user_id, is_active, expires_at)
         """)
-        conn.commit()
-        logger.info("Sessions table created/verified")
+
+    db.write(create)
+    logger.info("Sessions table created/verified")
 
 
 def create_android_messages_table():
     """Create messages table with read receipts"""
-    db_path = get_db_path()
-    with sqlite3.connect(db_path) as conn:
+    db = get_database(get_db_path())
+
+    def create(conn):
         conn.execute("""
         CREATE TABLE IF NOT EXISTS android_messages (
             message_id TEXT PRIMARY KEY,
@@ -92,10 +97,13 @@ def create_android_messages_table():
             FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
         )
         """)
-        # Index for conversation queries
+        # Index for conversation queries and keyset pagination. Ascending so
+        # ORDER BY created_at, rowid (either direction) needs no sort step;
+        # it replaces the earlier created_at DESC index.
+        conn.execute("DROP INDEX IF EXISTS idx_messages_conversation")
         conn.execute("""
-        CREATE INDEX IF NOT EXISTS idx_messages_conversation
-        ON android_messages(conversation_id, created_at DESC)
+        CREATE INDEX IF NOT EXISTS idx_messages_conversation_created
+        ON android_messages(conversation_id, created_at)
         """)
         # Index for unread messages
         conn.execute("""
@@ -103,8 +111,9 @@ def create_android_messages_table():
         ON android_messages(user_id, status, sender)
         WHERE status != 'read' AND sender = 'demi'
         """)
-        conn.commit()
-        logger.info("Android messages table created/verified")
+
+    db.write(create)
+    logger.info("Android messages table created/verified")
 
 
 def run_all_migrations():
@@ -1,16 +1,20 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, HTTPException, Query
-from typing import Dict, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 import asyncio
 import json
 from datetime import datetime, timezone
 
 from src.api.auth import verify_token
 from src.api.messages import (
+    HISTORY_CHUNK_SIZE,
     store_message,
     get_conversation_history,
+    get_messages_before,
+    iter_messages_since,
     mark_as_read,
     mark_as_delivered,
 )
+from src.api.models import AndroidMessage
 from src.core.logger import DemiLogger
 
 router = APIRouter(prefix="/api/v1/chat", tags=["chat"])
@@ -59,9 +63,77 @@ class ConnectionManager:
 manager = ConnectionManager()
 
 
+async def send_history(
+    websocket: WebSocket,
+    messages: List[AndroidMessage],
+    sync: str,
+    has_more: bool = False,
+):
+    """Send one "history" event.
+
+    Args:
+        websocket: Client connection
+        messages: Messages in chronological order
+        sync: "full" (recent history), "delta" (messages after the client's
+            cursor) or "page" (older messages before a cursor)
+        has_more: More messages exist in this direction
+    """
+    await websocket.send_json(
+        {
+            "event": "history",
+            "data": {
+                "messages": [msg.to_dict() for msg in messages],
+                "count": len(messages),
+                "sync": sync,
+                "has_more": has_more,
+            },
+        }
+    )
+
+
+async def send_delta_history(
+    websocket: WebSocket, conversation_id: str, since_message_id: str
+) -> bool:
+    """Stream messages newer than since_message_id as "history" chunks.
+
+    Returns:
+        False if since_message_id is unknown (the client needs a full sync)
+    """
+    found = False
+    async for chunk, has_more in iter_messages_since(conversation_id, since_message_id):
+        found = True
+        await send_history(websocket, chunk, sync="delta", has_more=has_more)
+    return found
+
+
+def parse_history_request(data: Any) -> Tuple[str, int]:
+    """Validate a client "history" request.
+
+    Returns:
+        (before cursor, page size clamped to [1, HISTORY_CHUNK_SIZE])
+
+    Raises:
+        ValueError: If the cursor is not a message id or limit is not an integer
+    """
+    if not isinstance(data, dict):
+        raise ValueError("data must be an object")
+    before = data.get("before")
+    if not isinstance(before, str) or not before:
+        raise ValueError("before must be a message id")
+    try:
+        limit = int(data.get("limit", HISTORY_CHUNK_SIZE))
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError("limit must be an integer") from None
+    return before, max(1, min(limit, HISTORY_CHUNK_SIZE))
+
+
 @router.websocket("/ws")
 async def websocket_endpoint(
-    websocket: WebSocket, token: str = Query(..., description="JWT access token")
+    websocket: WebSocket,
+    token: str = Query(..., description="JWT access token"),
+    since_message_id: Optional[str] = Query(
+        None, description="Last message the client has; only newer messages are sent"
+    ),
 ):
     """
     WebSocket endpoint for bidirectional real-time messaging.
@@ -85,6 +157,17 @@ async def websocket_endpoint(
       "timestamp": "..."
     }
 
+    History sync:
+    - On connect without since_message_id (or with an unknown one), the last
+      7 days (up to 100 messages) are sent as one "history" event with
+      "sync": "full".
+    - With since_message_id, only newer messages are sent, streamed as
+      "history" events of up to 100 messages with "sync": "delta". If the
+      last chunk has "has_more": true the client should send
+      {"event": "sync", "data": {"since_message_id": "<newest it has>"}}.
+    - {"event": "history", "data": {"before": "<message_id>", "limit": 50}}
+      returns an older page ("sync": "page", "has_more": older exist).
+
     Server also sends:
     - typing events: {"event": "typing", "data": {"is_typing": true}}
     - read_receipt events: {"event": "read_receipt", "data": {"message_id": "..."}}
@@ -104,17 +187,12 @@ async def websocket_endpoint(
     await manager.connect(user_id, websocket)
 
     try:
-        # Send conversation history (last 7 days)
-        history = await get_conversation_history(conversation_id, days=7, limit=100)
-        await websocket.send_json(
-            {
-                "event": "history",
-                "data": {
-                    "messages": [msg.to_dict() for msg in history],
-                    "count": len(history),
-                },
-            }
-        )
+        # Reconnecting clients get only what they missed; others the last 7 days
+        if not since_message_id or not await send_delta_history(
+            websocket, conversation_id, since_message_id
+        ):
+            history = await get_conversation_history(conversation_id, days=7, limit=100)
+            await send_history(websocket, history, sync="full")
 
         # Main message loop
         while True:
@@ -198,6 +276,35 @@ async def websocket_endpoint(
                 if message_id:
                     await mark_as_read(message_id)
 
+            elif event == "sync":
+                # Client catching up from its newest message
+                cursor = data.get("since_message_id") if isinstance(data, dict) else None
+                if not isinstance(cursor, str) or not cursor or not await send_delta_history(
+                    websocket, conversation_id, cursor
+                ):
+                    history = await get_conversation_history(
+                        conversation_id, days=7, limit=100
+                    )
+                    await send_history(websocket, history, sync="full")
+
+            elif event == "history":
+                # Older page before the client's oldest message
+                try:
+                    before, limit = parse_history_request(data)
+                except ValueError as e:
+                    await websocket.send_json(
+                        {"event": "error", "data": {"message": f"Invalid history request: {e}"}}
+                    )
+                    continue
+                page = await get_messages_before(conversation_id, before, limit)
+                if page is None:
+                    await websocket.send_json(
+                        {"event": "error", "data": {"message": "Unknown history cursor"}}
+                    )
+                else:
+                    messages, has_more = page
+                    await send_history(websocket, messages, sync="page", has_more=has_more)
+
             elif event == "ping":
                 # Keepalive
                 await websocket.send_json({"event": "pong"})
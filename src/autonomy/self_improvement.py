@@ -40,6 +40,7 @@ from src.autonomy.safety_guard import SafetyGuard, SafetyLevel, SafetyViolation
 from src.autonomy.emergency_healing import EmergencyHealing, HealingEvent
 from src.autonomy.autonomy_config import get_autonomy_config, SelfModificationConfig
 from src.llm.codebase_reader import CodebaseReader
+from src.llm.scheduler import RequestPriority
 
 logger = get_logger()
 
@@ -259,6 +260,9 @@ class SelfImprovementSystem:
         try:
             logger.info("Starting autonomous code review...")
             
+            # Pick up files edited since the last review
+            await asyncio.to_thread(self.codebase_reader.refresh)
+            
             # Get recent conversation patterns
             recent_interactions = self._get_recent_interactions()
             
@@ -270,7 +274,9 @@ class SelfImprovementSystem:
             
             # Run review through LLM
             messages = [{"role": "user", "content": review_prompt}]
-            response = await self.conductor.request_inference(messages)
+            response = await self.conductor.request_inference(
+                messages, priority=RequestPriority.SELF_IMPROVEMENT
+            )
             
             # Parse suggestions
             suggestions = self._parse_review_response(response)
@@ -438,6 +444,10 @@ class SelfImprovementSystem:
         # Record success with safety guard
         self.safety_guard.record_modification(file_path, new_content, True)
         
+        # Re-index the modified file so code lookups see the change
+        if self.codebase_reader:
+            await asyncio.to_thread(self.codebase_reader.refresh)
+        
         # Notify
         if self._on_suggestion_applied:
             await self._notify(self._on_suggestion_applied, suggestion)
@@ -4,24 +4,37 @@ Process isolation system for safe platform integration execution.
 Provides IsolatedPluginRunner for executing platform requests in isolated
 subprocess containers with resource limits, timeout enforcement, and comprehensive
 error handling. Prevents platform failures from cascading through the system.
+
+Platform requests are served by a pool of long-lived worker processes per
+plugin (see src/plugins/worker.py), so each request costs one IPC round-trip
+instead of a process start, project import and plugin discovery.
 """
 
 import asyncio
+import functools
+import itertools
 import json
+import os
 import psutil
 import signal
 import sys
 import resource
-from typing import Dict, Any, Optional, Tuple
+import time
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
 from src.core.logger import get_logger
 from src.core.config import DemiConfig
 from src.conductor.metrics import get_metrics
+from src.plugins.worker import BOOTSTRAP, ProtocolError, encode_frame, read_frame_async
 
 logger = get_logger()
 
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
 
 @dataclass
 class IsolationResult:
@@ -35,11 +48,195 @@ class IsolationResult:
     exit_code: int = 0
 
 
+class PluginWorker:
+    """One long-lived isolated worker process serving a single plugin."""
+
+    def __init__(self, plugin_name: str, process: asyncio.subprocess.Process):
+        self.plugin_name = plugin_name
+        self.process = process
+        self.requests_served = 0
+        self.started_at = time.monotonic()
+        self.last_used = self.started_at
+        self._ids = itertools.count(1)
+        self._stderr_task: Optional[asyncio.Task] = None
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    @property
+    def alive(self) -> bool:
+        return self.process.returncode is None
+
+    async def call(self, op: str, **fields) -> Dict[str, Any]:
+        """
+        Send one message and wait for its reply.
+
+        Raises:
+            ProtocolError: If the worker died or replied out of order
+        """
+        msg_id = next(self._ids)
+        self.process.stdin.write(encode_frame({"id": msg_id, "op": op, **fields}))
+        await self.process.stdin.drain()
+
+        reply = await read_frame_async(self.process.stdout)
+        if reply is None:
+            raise ProtocolError(f"Worker {self.pid} exited (code {self.process.returncode})")
+        if reply.get("id") != msg_id:
+            raise ProtocolError(f"Worker {self.pid} replied out of order")
+        self.last_used = time.monotonic()
+        return reply
+
+    async def wait_ready(self) -> Dict[str, Any]:
+        """Wait for the startup handshake sent once the plugin is loaded."""
+        reply = await read_frame_async(self.process.stdout)
+        if reply is None or not reply.get("ok"):
+            error = reply.get("error") if reply else "exited during startup"
+            raise ProtocolError(f"Worker for {self.plugin_name} failed to start: {error}")
+        return reply
+
+
+class PluginWorkerPool:
+    """
+    Pool of long-lived workers for one plugin.
+
+    Workers are recycled after max_requests_per_worker requests, pinged before
+    reuse when idle longer than health_check_interval, and discarded whenever
+    a request fails at the process or protocol level.
+    """
+
+    def __init__(
+        self,
+        plugin_name: str,
+        runner: "IsolatedPluginRunner",
+        size: int,
+        max_requests_per_worker: int,
+        health_check_interval: float,
+    ):
+        self.plugin_name = plugin_name
+        self._runner = runner
+        self.size = size
+        self.max_requests_per_worker = max_requests_per_worker
+        self.health_check_interval = health_check_interval
+
+        self._idle: Deque[PluginWorker] = deque()
+        self._workers: Dict[int, PluginWorker] = {}
+        self._slots = asyncio.Semaphore(size)
+
+        self.spawned = 0
+        self.recycled = 0
+        self.failed_health_checks = 0
+
+    async def acquire(self) -> PluginWorker:
+        """Take an idle healthy worker, spawning one if none is available."""
+        await self._slots.acquire()
+        try:
+            while self._idle:
+                worker = self._idle.popleft()
+                if await self._is_healthy(worker):
+                    return worker
+                await self.discard(worker)
+            return await self._spawn()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, worker: PluginWorker) -> None:
+        """Return a worker after a completed request, recycling it if it is used up."""
+        try:
+            if not worker.alive:
+                self._forget(worker)
+            elif worker.requests_served >= self.max_requests_per_worker:
+                self.recycled += 1
+                self._forget(worker)
+                asyncio.create_task(self._retire(worker))
+            else:
+                self._idle.append(worker)
+        finally:
+            self._slots.release()
+
+    async def discard(self, worker: PluginWorker, release_slot: bool = False) -> None:
+        """Kill a worker that timed out, crashed or broke the protocol."""
+        self._forget(worker)
+        try:
+            await self._runner._kill_process_tree(worker.process)
+        finally:
+            if release_slot:
+                self._slots.release()
+
+    async def close(self) -> None:
+        """Shut down every worker in the pool."""
+        workers = list(self._workers.values())
+        self._idle.clear()
+        await asyncio.gather(*(self._retire(w) for w in workers), return_exceptions=True)
+        self._workers.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "size": self.size,
+            "workers": len(self._workers),
+            "idle": len(self._idle),
+            "spawned": self.spawned,
+            "recycled": self.recycled,
+            "failed_health_checks": self.failed_health_checks,
+            "requests_by_worker": {
+                pid: w.requests_served for pid, w in self._workers.items()
+            },
+        }
+
+    async def _spawn(self) -> PluginWorker:
+        worker = await self._runner._create_worker(self.plugin_name)
+        self._workers[worker.pid] = worker
+        try:
+            await asyncio.wait_for(worker.wait_ready(), timeout=self._runner._timeout_seconds)
+        except BaseException:
+            await self.discard(worker)
+            raise
+        self.spawned += 1
+        return worker
+
+    async def _is_healthy(self, worker: PluginWorker) -> bool:
+        if not worker.alive:
+            return False
+        if time.monotonic() - worker.last_used < self.health_check_interval:
+            return True
+        try:
+            reply = await asyncio.wait_for(worker.call("ping"), timeout=5.0)
+            if reply.get("ok"):
+                return True
+        except (asyncio.TimeoutError, ProtocolError, OSError):
+            pass
+        self.failed_health_checks += 1
+        logger.warning(f"Plugin worker {worker.pid} ({self.plugin_name}) failed health check")
+        return False
+
+    async def _retire(self, worker: PluginWorker) -> None:
+        """Ask a worker to exit, killing it if it doesn't."""
+        self._forget(worker)
+        try:
+            if worker.alive:
+                await asyncio.wait_for(worker.call("shutdown"), timeout=2.0)
+                await asyncio.wait_for(worker.process.wait(), timeout=2.0)
+        except (asyncio.TimeoutError, ProtocolError, OSError):
+            pass
+        if worker.alive:
+            await self._runner._kill_process_tree(worker.process)
+        self._runner._active_processes.pop(worker.pid, None)
+
+    def _forget(self, worker: PluginWorker) -> None:
+        self._workers.pop(worker.pid, None)
+        try:
+            self._idle.remove(worker)
+        except ValueError:
+            pass
+
+
 class IsolatedPluginRunner:
     """
     Executes platform requests in isolated subprocess containers.
 
     Features:
+    - Pooled long-lived worker processes per plugin (one IPC round-trip per request)
     - Resource limits (memory, timeout)
     - Process monitoring during execution
     - Automatic cleanup and resource reclamation
@@ -62,10 +259,22 @@ class IsolatedPluginRunner:
         )
         self._check_interval_seconds = 0.5
 
+        # Worker pool settings
+        self._pool_size = self._config.conductor.get("isolation_pool_size", 2)
+        self._max_requests_per_worker = self._config.conductor.get(
+            "isolation_max_requests_per_worker", 500
+        )
+        self._health_check_interval = self._config.conductor.get(
+            "isolation_health_check_interval", 30
+        )
+        self._pools: Dict[str, PluginWorkerPool] = {}
+
         logger.info(
             "IsolatedPluginRunner initialized",
             memory_limit_mb=self._memory_limit_mb,
             timeout_seconds=self._timeout_seconds,
+            pool_size=self._pool_size,
+            max_requests_per_worker=self._max_requests_per_worker,
         )
 
     async def execute_request(
@@ -88,14 +297,17 @@ class IsolatedPluginRunner:
         start_time = datetime.now()
         result = IsolationResult(success=False)
 
-        try:
-            # Create subprocess for isolated execution
-            process = await self._create_isolated_process(
-                plugin_name, request, plugin_code
-            )
+        process = None
 
-            # Monitor process execution with resource tracking
-            result = await self._monitor_process_execution(process, plugin_name)
+        try:
+            if plugin_code:
+                # Custom code can't be served by a pooled worker: run it one-shot
+                process = await self._create_isolated_process(
+                    plugin_name, request, plugin_code
+                )
+                result = await self._monitor_process_execution(process, plugin_name)
+            else:
+                result = await self._execute_pooled(plugin_name, request)
 
             # Record metrics
             duration_ms = (datetime.now() - start_time).total_seconds() * 1000
@@ -122,7 +334,8 @@ class IsolatedPluginRunner:
             result.success = False
             result.error = f"Execution timeout after {self._timeout_seconds} seconds"
             result.exit_code = 124  # Timeout exit code
-            await self._kill_process_tree(process)
+            if process is not None:
+                await self._kill_process_tree(process)
 
         except Exception as e:
             logger.error(f"Isolation execution error for {plugin_name}: {str(e)}")
@@ -136,23 +349,132 @@ class IsolatedPluginRunner:
 
         return result
 
+    def _get_pool(self, plugin_name: str) -> PluginWorkerPool:
+        pool = self._pools.get(plugin_name)
+        if pool is None:
+            pool = PluginWorkerPool(
+                plugin_name,
+                self,
+                size=self._pool_size,
+                max_requests_per_worker=self._max_requests_per_worker,
+                health_check_interval=self._health_check_interval,
+            )
+            self._pools[plugin_name] = pool
+        return pool
+
+    async def _execute_pooled(
+        self, plugin_name: str, request: Dict[str, Any]
+    ) -> IsolationResult:
+        """
+        Execute a request on a pooled worker with one IPC round-trip.
+
+        The worker is killed (never returned to the pool) if the request times
+        out or the pipe breaks, since its state is unknown at that point.
+
+        Raises:
+            asyncio.TimeoutError: If the worker did not reply in time
+        """
+        result = IsolationResult(success=False)
+        pool = self._get_pool(plugin_name)
+        worker = await pool.acquire()
+
+        try:
+            reply = await asyncio.wait_for(
+                worker.call("request", request=request), timeout=self._timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            logger.error(
+                f"Timeout executing {plugin_name}, killing worker {worker.pid}"
+            )
+            await pool.discard(worker, release_slot=True)
+            raise
+        except (ProtocolError, OSError) as e:
+            await pool.discard(worker, release_slot=True)
+            result.error = str(e)
+            result.exit_code = worker.process.returncode or 1
+            return result
+        except BaseException:
+            await pool.discard(worker, release_slot=True)
+            raise
+
+        worker.requests_served += 1
+        result.memory_peak_mb = self.get_process_memory_usage(worker.pid) or 0.0
+        pool.release(worker)
+
+        if reply.get("ok"):
+            result.success = True
+            result.output = reply.get("result")
+        else:
+            result.error = reply.get("error", "Unknown worker error")
+            result.exit_code = 1
+        return result
+
+    async def _create_worker(self, plugin_name: str) -> PluginWorker:
+        """Start a long-lived worker process for a plugin."""
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            p for p in (str(PROJECT_ROOT), env.get("PYTHONPATH")) if p
+        )
+        env["DEMI_WORKER_CPU_BUDGET"] = str(int(self._timeout_seconds * 1.5))
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                sys.executable,
+                "-c",
+                BOOTSTRAP,
+                plugin_name,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=str(PROJECT_ROOT),
+                env=env,
+                preexec_fn=functools.partial(
+                    self._setup_process_limits,
+                    cpu_limit=int(self._timeout_seconds * 1.5)
+                    * (self._max_requests_per_worker + 1),
+                )
+                if sys.platform != "win32"
+                else None,
+            )
+        except Exception as e:
+            logger.error(f"Failed to create plugin worker: {str(e)}")
+            raise
+
+        worker = PluginWorker(plugin_name, process)
+        worker._stderr_task = asyncio.create_task(self._drain_stderr(worker))
+        self._active_processes[process.pid] = process
+        logger.debug(f"Started plugin worker {process.pid} for {plugin_name}")
+        return worker
+
+    async def _drain_stderr(self, worker: PluginWorker):
+        """Log worker stderr so a chatty plugin can't fill the pipe and stall."""
+        try:
+            while True:
+                line = await worker.process.stderr.readline()
+                if not line:
+                    break
+                text = line.decode("utf-8", errors="replace").strip()
+                if text:
+                    # Only log the first 100 chars to avoid leaking paths or details
+                    logger.debug(f"Worker {worker.pid} stderr: {text[:100]}")
+        except (asyncio.CancelledError, OSError):
+            pass
+
     async def _create_isolated_process(
-        self, plugin_name: str, request: Dict[str, Any], plugin_code: Optional[str]
+        self, plugin_name: str, request: Dict[str, Any], plugin_code: str
     ) -> asyncio.subprocess.Process:
-        """Create an isolated subprocess for the request."""
+        """Create a one-shot isolated subprocess running custom plugin code."""
         # Prepare request data for subprocess as safe JSON
         request_json = json.dumps(request)
 
-        # Build command to run isolated execution
-        if plugin_code:
-            # Run custom plugin code - pass request via stdin to avoid string injection
-            cmd = [
-                sys.executable,
-                "-c",
-                """
+        # Run custom plugin code - pass request via stdin to avoid string injection
+        cmd = [
+            sys.executable,
+            "-c",
+            f"""
 import json
 import sys
-sys.path.insert(0, '/home/mystiatech/projects/Demi')
+sys.path.insert(0, {str(PROJECT_ROOT)!r})
 
 # Read request from stdin
 request_data = sys.stdin.read()
@@ -160,34 +482,8 @@ request = json.loads(request_data)
 
 # Execute plugin code with request
 """
-                + plugin_code,
-            ]
-        else:
-            # Run standard plugin execution - pass request via stdin
-            cmd = [
-                sys.executable,
-                "-c",
-                f"""
-import json
-import sys
-import asyncio
-sys.path.insert(0, '/home/mystiatech/projects/Demi')
-
-from src.plugins.manager import PluginManager
-
-async def run():
-    manager = PluginManager()
-    await manager.discover_and_register()
-    plugin = await manager.load_plugin('{plugin_name}')
-    if plugin:
-        request_data = sys.stdin.read()
-        request_dict = json.loads(request_data)
-        result = plugin.handle_request({{'type': '{plugin_name}', **request_dict}})
-        print(json.dumps(result))
-
-asyncio.run(run())
-""",
-            ]
+            + plugin_code,
+        ]
 
         # Create subprocess with resource isolation
         try:
@@ -212,15 +508,23 @@ asyncio.run(run())
             logger.error(f"Failed to create isolated process: {str(e)}")
             raise
 
-    def _setup_process_limits(self):
-        """Set up resource limits for subprocess (Unix only)."""
+    def _setup_process_limits(self, cpu_limit: Optional[int] = None):
+        """
+        Set up resource limits for subprocess (Unix only).
+
+        Args:
+            cpu_limit: Hard CPU-seconds limit. One-shot processes default to
+                slightly more than the execution timeout; pooled workers pass a
+                lifetime budget and move their soft limit per request.
+        """
         try:
             # Set memory limit
             memory_bytes = self._memory_limit_mb * 1024 * 1024
             resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, memory_bytes))
 
             # Set CPU time limit (slightly higher than execution timeout)
-            cpu_limit = int(self._timeout_seconds * 1.5)
+            if cpu_limit is None:
+                cpu_limit = int(self._timeout_seconds * 1.5)
             resource.setrlimit(resource.RLIMIT_CPU, (cpu_limit, cpu_limit))
         except Exception as e:
             logger.warning(f"Could not set process limits: {str(e)}")
@@ -310,6 +614,13 @@ asyncio.run(run())
             f"Shutting down IsolatedPluginRunner with {len(self._active_processes)} active processes"
         )
 
+        for pool in list(self._pools.values()):
+            try:
+                await pool.close()
+            except Exception as e:
+                logger.warning(f"Error closing worker pool: {str(e)}")
+        self._pools.clear()
+
         for pid, process in list(self._active_processes.items()):
             try:
                 await self._kill_process_tree(process)
@@ -322,6 +633,10 @@ asyncio.run(run())
         """Get count of currently active isolated processes."""
         return len(self._active_processes)
 
+    def get_pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get worker pool statistics per plugin."""
+        return {name: pool.get_stats() for name, pool in self._pools.items()}
+
     def get_process_memory_usage(self, pid: int) -> Optional[float]:
         """Get memory usage in MB for a specific process."""
         try:
@@ -14,6 +14,7 @@ try:
         CollectorRegistry,
         generate_latest,
     )
+    from prometheus_client.core import GaugeMetricFamily
 
     HAS_PROMETHEUS = True
 except ImportError:
@@ -23,6 +24,36 @@ except ImportError:
         from prometheus_client import Counter, Histogram, Gauge, CollectorRegistry
 
 from src.core.logger import logger
+from src.monitoring.latency import QUANTILES, WINDOWS, get_latency_registry
+
+
+class LatencyPercentileCollector:
+    """Prometheus collector exporting in-process latency percentiles.
+
+    Reads src.monitoring.latency histograms at scrape time, so nothing is
+    recorded twice.
+    """
+
+    def collect(self):
+        quantiles = GaugeMetricFamily(
+            "demi_latency_ms",
+            "Latency percentiles over sliding windows (milliseconds)",
+            labels=["name", "window", "quantile"],
+        )
+        counts = GaugeMetricFamily(
+            "demi_latency_samples",
+            "Latency samples in each sliding window",
+            labels=["name", "window"],
+        )
+        for name, windows in get_latency_registry().snapshot().items():
+            for window in WINDOWS:
+                summary = windows[window]
+                counts.add_metric([name, window], summary["count"])
+                for label, q in QUANTILES.items():
+                    if summary[label] is not None:
+                        quantiles.add_metric([name, window, str(q)], summary[label])
+        yield quantiles
+        yield counts
 
 
 class MetricsRegistry:
@@ -87,6 +118,9 @@ class MetricsRegistry:
             registry=self._prometheus_registry,
         )
 
+        # Latency percentiles from the in-process histograms
+        self._prometheus_registry.register(LatencyPercentileCollector())
+
         logger.info("Prometheus metrics initialized", metrics_count=6)
 
     def get_counter(self, name: str) -> Optional["Counter"]:
@@ -17,12 +17,14 @@ import time
 import webbrowser
 import threading
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List
+from typing import AsyncIterator, Optional, Dict, Any, List
 from datetime import datetime
 
 from src.core.logger import get_logger
 from src.core.config import DemiConfig
 from src.core.database import DatabaseManager
+from src.core.storage import close_all_databases
+from src.monitoring.metrics import close_metrics_collector
 from src.plugins.manager import PluginManager
 from src.conductor.health import get_health_monitor, HealthMonitor, HealthStatus
 from src.conductor.scaler import PredictiveScaler
@@ -33,12 +35,15 @@ from src.llm import (
     UnifiedLLMInference,
     LLMConfig,
     InferenceError,
+    LLMOverloadedError,
+    RequestPriority,
     CodebaseReader,
     PromptBuilder,
     ConversationHistory,
     ResponseProcessor,
 )
 from src.emotion.persistence import EmotionPersistence
+from src.emotion.state_store import EmotionStateStore
 from src.emotion.modulation import PersonalityModulator
 from src.emotion.interactions import InteractionHandler
 from src.emotion.models import EmotionalState
@@ -54,10 +59,15 @@ from src.evolution import (
     ChangeTracker,
     ResponseRevisor,
     PatternLearningDB,
+    EvolutionPipeline,
+    EvolutionJob,
 )
 
 logger = get_logger()
 
+# Friendly reply when the LLM scheduler sheds a request under load
+OVERLOADED_RESPONSE = "I've got a lot going on right now... give me a moment and try again?"
+
 
 @dataclass
 class SystemStatus:
@@ -106,8 +116,13 @@ class Conductor:
         # Database
         self._db_manager = DatabaseManager(self._config)
 
-        # Codebase reader for self-awareness
-        self.codebase_reader = CodebaseReader(logger=self._logger)
+        # Codebase reader for self-awareness. The index is loaded from the
+        # on-disk cache and re-validated (or built) in a background thread.
+        self.codebase_reader = CodebaseReader(
+            logger=self._logger,
+            cache_path="~/.demi/code_index.json",
+            background=True,
+        )
 
         # LLM inference engine with Ollama/LMStudio fallback
         self.llm = UnifiedLLMInference(
@@ -121,6 +136,13 @@ class Conductor:
         self.emotion_persistence = EmotionPersistence(
             db_manager=self._db_manager, logger=self._logger
         )
+        # Live emotional state lives in memory; SQLite is written behind
+        self.emotion_store = EmotionStateStore.from_config(
+            self._config.conductor.get("emotion_store", {}),
+            self.emotion_persistence,
+            logger=self._logger,
+        )
+        self.emotion_store.load()
         self.personality_modulator = PersonalityModulator(logger=self._logger)
         self.decay_system = DecaySystem(tick_interval_seconds=300)  # 5 minute ticks
         self._last_interaction_time = time.time()  # Track for emotion decay
@@ -142,6 +164,7 @@ class Conductor:
             logger=self._logger,
             db_session=db_session,
             interaction_handler=interaction_handler,
+            emotion_store=self.emotion_store,
         )
 
         # Self-evolution systems (Phase 2)
@@ -152,6 +175,15 @@ class Conductor:
         self.change_tracker = ChangeTracker()
         self.response_revisor = ResponseRevisor()
         self.pattern_learning = PatternLearningDB()
+        self.evolution_pipeline = EvolutionPipeline.from_config(
+            self._config.conductor.get("evolution", {}),
+            error_analyzer=self.error_analyzer,
+            quality_analyzer=self.quality_analyzer,
+            self_critique=self.self_critique,
+            self_rewarder=self.self_rewarder,
+            change_tracker=self.change_tracker,
+            response_revisor=self.response_revisor,
+        )
         self._logger.info("Self-evolution systems initialized (Phase 2a + 2b)")
         
         # Log startup as a system change
@@ -266,6 +298,7 @@ class Conductor:
             # Step 4.3: Start emotion decay background task
             self._logger.info("Starting emotion decay system...")
             try:
+                await self.emotion_store.start()
                 decay_task = asyncio.create_task(self._emotion_decay_loop())
                 self._background_tasks.append(decay_task)
                 self._logger.info("Emotion decay system started")
@@ -550,12 +583,17 @@ class Conductor:
             self._logger.error("conductor_startup_failed", error=str(e), exc_info=True)
             return False
 
-    async def request_inference(self, messages: List[Dict[str, str]]) -> str:
+    async def request_inference(
+        self,
+        messages: List[Dict[str, str]],
+        priority: RequestPriority = RequestPriority.TEXT,
+    ) -> str:
         """
         Request inference from LLM.
 
         Args:
             messages: List of message dicts with 'role' and 'content'
+            priority: Scheduling lane for the request
 
         Returns:
             Response text from LLM, or fallback message if unavailable
@@ -569,7 +607,7 @@ class Conductor:
             start_time = time.time()
 
             # Call inference
-            response = await self.llm.chat(messages)
+            response = await self.llm.chat(messages, priority=priority)
 
             # Record latency
             latency = time.time() - start_time
@@ -578,6 +616,9 @@ class Conductor:
 
             return response
 
+        except LLMOverloadedError as e:
+            self._logger.warning(f"Inference shed: {str(e)}")
+            return OVERLOADED_RESPONSE
         except InferenceError as e:
             self._logger.error(f"Inference error: {str(e)}")
             return "I'm not ready to talk right now... wait a sec?"
@@ -591,6 +632,7 @@ class Conductor:
         user_id: str,
         content: str,
         context: Optional[Dict[str, Any]] = None,
+        priority: Optional[RequestPriority] = None,
     ) -> Dict[str, Any]:
         """
         Request inference from LLM for platform-specific message.
@@ -601,6 +643,7 @@ class Conductor:
             user_id: User identifier for emotion state lookup
             content: User's message content
             context: Additional context dict
+            priority: Scheduling lane (derived from platform/context if omitted)
 
         Returns:
             Response dict with content, emotion_state, and metadata
@@ -615,177 +658,269 @@ class Conductor:
             }
 
         try:
-            # Load Demi's current emotional state
-            emotion_state = self.emotion_persistence.load_latest_state()
-            if not emotion_state:
-                # Initialize with default state if none exists
-                emotion_state = EmotionalState()
-
-            # Get modulation parameters based on emotional state
-            modulation = self.personality_modulator.modulate(emotion_state)
-
-            # Build conversation history with current message
-            conversation_history = [{"role": "user", "content": content}]
-
-            # Build complete message list with system prompt and emotional modulation
-            messages = self.prompt_builder.build(
-                emotional_state=emotion_state,
-                modulation=modulation,
-                conversation_history=conversation_history,
-            )
+            emotion_state, messages = self._prepare_platform_inference(content)
 
             # Call inference with emotion state
             inference_start = time.time()
             response_content = await self.llm.chat(
-                messages=messages, emotional_state_before=emotion_state.to_dict()
+                messages=messages,
+                emotional_state_before=emotion_state.to_dict(),
+                priority=priority or RequestPriority.for_platform(platform, context),
             )
             inference_time = time.time() - inference_start
 
-            # Process response and update emotions
-            if self.response_processor:
-                processed = self.response_processor.process_response(
-                    response_text=response_content,
-                    inference_time_sec=inference_time,
-                    emotional_state_before=emotion_state,
-                    interaction_type="successful_response",
-                )
-                emotion_state_after = processed.emotional_state_after
-                response_content = processed.text
+            return await self._finalize_platform_response(
+                platform=platform,
+                content=content,
+                context=context,
+                emotion_state=emotion_state,
+                response_content=response_content,
+                inference_time=inference_time,
+            )
 
-                # Log emotion changes
-                emotions_before = emotion_state.get_all_emotions()
-                emotions_after = emotion_state_after.get_all_emotions()
-                self._logger.info(
-                    "Emotions updated",
-                    loneliness_delta=round(emotions_after["loneliness"] - emotions_before["loneliness"], 2),
-                    excitement_delta=round(emotions_after["excitement"] - emotions_before["excitement"], 2),
-                    frustration_delta=round(emotions_after["frustration"] - emotions_before["frustration"], 2),
-                )
+        except LLMOverloadedError as e:
+            self._logger.warning(f"Platform inference shed: {str(e)}")
+            return {
+                "content": OVERLOADED_RESPONSE,
+                "emotion_state": emotion_state.to_dict(),
+                "platform": platform,
+                "error": "LLM overloaded",
+            }
+        except Exception as e:
+            self._logger.exception(f"Error during platform inference: {str(e)}")
+            return {
+                "content": "I'm having trouble thinking right now... can you try again?",
+                "emotion_state": emotion_state.to_dict()
+                if "emotion_state" in locals()
+                else {},
+                "platform": platform,
+                "error": str(e),
+            }
 
-                # Save the UPDATED emotional state, not the old one
-                self.emotion_persistence.save_state(processed.emotional_state_after)
-                
-                # Reset interaction timer (user just interacted)
-                self._last_interaction_time = time.time()
-                
-                # ===== RESPONSE REVISION (Phase 2b) =====
-                # Try to improve the response before delivering
+    async def request_inference_for_platform_stream(
+        self,
+        platform: str,
+        user_id: str,
+        content: str,
+        context: Optional[Dict[str, Any]] = None,
+        priority: Optional[RequestPriority] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streaming variant of request_inference_for_platform.
+
+        Yields {"type": "chunk", "content": ...} dicts as text is generated,
+        then one {"type": "final", ...} dict with the same fields as
+        request_inference_for_platform. The final content is authoritative:
+        it is cleaned and may have been revised, so it can differ from the
+        concatenated chunks.
+
+        Args:
+            platform: Platform identifier (e.g., "android", "discord")
+            user_id: User identifier for emotion state lookup
+            content: User's message content
+            context: Additional context dict
+            priority: Scheduling lane (derived from platform/context if omitted)
+
+        Yields:
+            Chunk dicts followed by a single final response dict
+        """
+        if not self.llm_available:
+            self._logger.warning("LLM inference requested but Ollama unavailable")
+            yield {
+                "type": "final",
+                "content": "I'm not ready to talk right now... wait a sec?",
+                "emotion_state": {},
+                "platform": platform,
+                "error": "LLM unavailable",
+            }
+            return
+
+        try:
+            emotion_state, messages = self._prepare_platform_inference(content)
+
+            inference_start = time.time()
+            response_content = ""
+            async for chunk in self.llm.chat_stream(
+                messages=messages,
+                priority=priority or RequestPriority.for_platform(platform, context),
+            ):
+                if chunk.done:
+                    response_content = chunk.text
+                else:
+                    yield {"type": "chunk", "content": chunk.delta, "platform": platform}
+            inference_time = time.time() - inference_start
+
+            result = await self._finalize_platform_response(
+                platform=platform,
+                content=content,
+                context=context,
+                emotion_state=emotion_state,
+                response_content=response_content,
+                inference_time=inference_time,
+            )
+            result["type"] = "final"
+            yield result
+
+        except LLMOverloadedError as e:
+            self._logger.warning(f"Streamed platform inference shed: {str(e)}")
+            yield {
+                "type": "final",
+                "content": OVERLOADED_RESPONSE,
+                "emotion_state": emotion_state.to_dict(),
+                "platform": platform,
+                "error": "LLM overloaded",
+            }
+        except Exception as e:
+            self._logger.exception(f"Error during streamed platform inference: {str(e)}")
+            yield {
+                "type": "final",
+                "content": "I'm having trouble thinking right now... can you try again?",
+                "emotion_state": emotion_state.to_dict()
+                if "emotion_state" in locals()
+                else {},
+                "platform": platform,
+                "error": str(e),
+            }
+
+    def _prepare_platform_inference(self, content: str):
+        """
+        Load emotional state and build the prompt for a platform message.
+
+        Args:
+            content: User's message content
+
+        Returns:
+            Tuple of (EmotionalState, message list for the LLM)
+        """
+        # Demi's current emotional state (in memory, no DB read)
+        emotion_state = self.emotion_store.get()
+
+        # Get modulation parameters based on emotional state
+        modulation = self.personality_modulator.modulate(emotion_state)
+
+        # Build conversation history with current message
+        conversation_history = [{"role": "user", "content": content}]
+
+        # Build complete message list with system prompt and emotional modulation
+        messages = self.prompt_builder.build(
+            emotional_state=emotion_state,
+            modulation=modulation,
+            conversation_history=conversation_history,
+        )
+        return emotion_state, messages
+
+    async def _finalize_platform_response(
+        self,
+        platform: str,
+        content: str,
+        context: Optional[Dict[str, Any]],
+        emotion_state: EmotionalState,
+        response_content: str,
+        inference_time: float,
+    ) -> Dict[str, Any]:
+        """
+        Post-process a generated response: emotions, revision and self-evolution.
+
+        Args:
+            platform: Platform identifier
+            content: User's message content
+            context: Additional context dict
+            emotion_state: Emotional state before the interaction
+            response_content: Raw response text from the LLM
+            inference_time: Inference duration in seconds
+
+        Returns:
+            Response dict with content, emotion_state, and metadata
+        """
+        # Process response and update emotions
+        if self.response_processor:
+            processed = self.response_processor.process_response(
+                response_text=response_content,
+                inference_time_sec=inference_time,
+                emotional_state_before=emotion_state,
+                interaction_type="successful_response",
+            )
+            emotion_state_after = processed.emotional_state_after
+            response_content = processed.text
+
+            # Log emotion changes
+            emotions_before = emotion_state.get_all_emotions()
+            emotions_after = emotion_state_after.get_all_emotions()
+            self._logger.info(
+                "Emotions updated",
+                loneliness_delta=round(emotions_after["loneliness"] - emotions_before["loneliness"], 2),
+                excitement_delta=round(emotions_after["excitement"] - emotions_before["excitement"], 2),
+                frustration_delta=round(emotions_after["frustration"] - emotions_before["frustration"], 2),
+            )
+
+            # Store the UPDATED emotional state, not the old one
+            await self.emotion_store.set(processed.emotional_state_after)
+            
+            # Reset interaction timer (user just interacted)
+            self._last_interaction_time = time.time()
+            
+            emotion_obj = (
+                emotion_state_after if hasattr(emotion_state_after, 'to_dict') else emotion_state
+            )
+            job = EvolutionJob(
+                user_message=content,
+                response=response_content,
+                emotional_state=emotion_obj,
+                conversation_id=context.get("conversation_id", "") if context else "",
+            )
+
+            # ===== RESPONSE REVISION (Phase 2b) =====
+            # Only revision may block delivery, and only when configured to
+            if self.evolution_pipeline.blocking_revision:
                 try:
-                    best_response, was_revised, improvement = self.response_revisor.get_best_response(
+                    session = self.response_revisor.revise_response(
                         original_response=response_content,
                         user_message=content,
-                        emotional_state=emotion_state_after if hasattr(emotion_state_after, 'to_dict') else emotion_state,
-                        min_improvement=0.5,
+                        emotional_state=emotion_obj,
+                        persist=False,
+                    )
+                    job.revision_session = session
+                    best_response, was_revised, improvement = self.response_revisor.pick_best(
+                        session, min_improvement=0.5
                     )
-                    
+
                     if was_revised:
                         old_response = response_content
                         response_content = best_response
-                        
+                        job.response = best_response
+                        job.was_revised = True
+                        job.revision_improvement = improvement
+
                         self._logger.info(
                             "Response improved by revision",
                             improvement=round(improvement, 2),
                             original_length=len(old_response),
                             revised_length=len(response_content),
                         )
-                        
-                        # Record this as a successful improvement
-                        self.change_tracker.record_change(
-                            category="quality_improvement",
-                            files_modified=[],
-                            description="Auto-revised response for better quality",
-                            rationale=f"Self-critique identified improvement opportunity (+{improvement:.1f} score)",
-                            auto_commit=False,
-                            auto_approve=True,
-                        )
                 except Exception as e:
                     self._logger.warning(f"Response revision failed: {e}")
-                # ===== END RESPONSE REVISION =====
-                
-                # ===== SELF-EVOLUTION ANALYSIS =====
-                # Run error analysis on response (potentially revised)
-                errors = self.error_analyzer.analyze_conversation(
-                    user_message=content,
-                    demi_response=response_content,
-                    emotional_state=emotion_state_after.to_dict() if hasattr(emotion_state_after, 'to_dict') else emotion_state_after,
-                )
-                if errors:
-                    self._logger.info(
-                        f"Detected {len(errors)} issues in response",
-                        error_categories=[e.category.value for e in errors]
-                    )
-                
-                # Analyze conversation quality
-                quality = self.quality_analyzer.analyze_response(
-                    response=response_content,
-                    user_message=content,
-                    emotional_state=emotion_state_after.to_dict() if hasattr(emotion_state_after, 'to_dict') else emotion_state_after,
-                    conversation_id=context.get("conversation_id", "") if context else "",
-                )
-                self._logger.debug(
-                    "Quality metrics",
-                    overall=round(quality.overall_score, 2),
-                    persona=round(quality.persona_consistency, 2),
-                    emotional=round(quality.emotional_appropriateness, 2),
-                )
-                
-                # Self-critique for high-value learning
-                critique = self.self_critique.critique_response(
-                    response=response_content,
-                    user_message=content,
-                    emotional_state=emotion_state_after if hasattr(emotion_state_after, 'to_dict') else emotion_state,
-                    generate_revision=False,  # Don't regenerate, just analyze
-                )
-                if critique.issues:
-                    self._logger.debug(
-                        "Self-critique identified issues",
-                        issues_count=len(critique.issues),
-                        avg_score=round((critique.consistency_score + 
-                                        critique.emotional_alignment_score +
-                                        critique.appropriateness_score +
-                                        critique.engagement_score) / 4, 2)
-                    )
-                
-                # Generate reward signal
-                reward = self.self_rewarder.compute_reward(
-                    response=response_content,
-                    user_message=content,
-                    emotional_state=emotion_state_after if hasattr(emotion_state_after, 'to_dict') else emotion_state,
-                    conversation_id=context.get("conversation_id", "") if context else "",
-                )
-                self._logger.debug(
-                    "Reward signal computed",
-                    final_score=round(reward.final_score, 2),
-                    rule_score=round(reward.rule_based_score, 2),
-                )
-                # ===== END SELF-EVOLUTION ANALYSIS =====
-                
-            else:
-                # Fallback: just get default emotion state
-                emotion_state_after = emotion_state.to_dict()
-                # Save unchanged state
-                self.emotion_persistence.save_state(emotion_state)
-                
-                # Reset interaction timer (user just interacted)
-                self._last_interaction_time = time.time()
+            # ===== END RESPONSE REVISION =====
 
-            return {
-                "content": response_content,
-                "emotion_state": emotion_state_after,
-                "platform": platform,
-                "context": context or {},
-            }
+            # ===== SELF-EVOLUTION ANALYSIS =====
+            # Runs in the background after delivery (batched, load-shed)
+            self.evolution_pipeline.submit(job)
+            # ===== END SELF-EVOLUTION ANALYSIS =====
+            
+        else:
+            # Fallback: just get default emotion state
+            emotion_state_after = emotion_state.to_dict()
+            # Store unchanged state
+            await self.emotion_store.set(emotion_state)
+            
+            # Reset interaction timer (user just interacted)
+            self._last_interaction_time = time.time()
 
-        except Exception as e:
-            self._logger.exception(f"Error during platform inference: {str(e)}")
-            return {
-                "content": "I'm having trouble thinking right now... can you try again?",
-                "emotion_state": emotion_state.to_dict()
-                if "emotion_state" in locals()
-                else {},
-                "platform": platform,
-                "error": str(e),
-            }
+        return {
+            "content": response_content,
+            "emotion_state": emotion_state_after,
+            "platform": platform,
+            "context": context or {},
+        }
 
     async def shutdown(self) -> None:
         """
@@ -795,7 +930,7 @@ class Conductor:
         1. Stop accepting new requests
         2. Disable all plugins
         3. Stop background loops (health, scaling)
-        4. Close database connections
+        4. Close LLM connection pools and database connections
         5. Cleanup remaining resources
         """
         try:
@@ -857,10 +992,39 @@ class Conductor:
             except Exception as e:
                 self._logger.error(f"background_task_shutdown_failed: {str(e)}")
 
+            # Step 4.0: Drain background self-evolution analysis
+            self._logger.info("Draining evolution pipeline...")
+            try:
+                await self.evolution_pipeline.stop()
+            except Exception as e:
+                self._logger.error(f"evolution_pipeline_shutdown_failed: {str(e)}")
+
+            # Step 4.0.1: Flush in-memory emotional state
+            self._logger.info("Flushing emotional state...")
+            try:
+                await self.emotion_store.close()
+            except Exception as e:
+                self._logger.error(f"emotion_store_shutdown_failed: {str(e)}")
+
+            # Step 4.1: Close LLM provider connection pools
+            self._logger.info("Closing LLM connection pools...")
+            try:
+                await self.llm.close()
+            except Exception as e:
+                self._logger.error(f"llm_pool_shutdown_failed: {str(e)}")
+
+            # Step 4.2: Flush buffered metrics before databases close
+            self._logger.info("Flushing buffered metrics...")
+            try:
+                close_metrics_collector()
+            except Exception as e:
+                self._logger.error(f"metrics_flush_failed: {str(e)}")
+
             # Step 4: Close database connections
             self._logger.info("Closing database...")
             try:
                 self._db_manager.close()
+                close_all_databases()
                 self._logger.info("Database closed")
             except Exception as e:
                 self._logger.error(f"database_shutdown_failed: {str(e)}")
@@ -1054,26 +1218,18 @@ class Conductor:
                 if not self._running:
                     break
                 
-                # Load current emotional state
-                current_state = self.emotion_persistence.load_latest_state()
-                if not current_state:
-                    # Initialize with default state if none exists
-                    current_state = EmotionalState()
-                    self._last_interaction_time = time.time()
+                # Current emotional state (in memory)
+                current_state = self.emotion_store.get()
                 
                 # Calculate idle time (time since last interaction)
                 idle_time_seconds = time.time() - self._last_interaction_time
                 
-                # Apply decay
-                decayed_state = self.decay_system.apply_decay(
-                    current_state,
-                    idle_time_seconds=int(idle_time_seconds)
-                )
-                
-                # Save the decayed state
-                self.emotion_persistence.save_state(
-                    decayed_state,
-                    notes=f"Decay applied (idle: {idle_time_seconds/60:.1f}min)"
+                # Apply decay atomically; persisted by the store's next flush
+                decayed_state = await self.emotion_store.modify(
+                    lambda state: self.decay_system.apply_decay(
+                        state, idle_time_seconds=int(idle_time_seconds)
+                    ),
+                    notes=f"Decay applied (idle: {idle_time_seconds/60:.1f}min)",
                 )
                 
                 # Log the changes
@@ -1332,6 +1488,7 @@ class Conductor:
                 "self_reward": self.self_rewarder.get_reward_stats(),
                 "changes": self.change_tracker.get_change_stats(),
                 "response_revision": self.response_revisor.get_revision_stats(),
+                "pipeline": self.evolution_pipeline.get_stats(),
                 "pattern_learning": self.pattern_learning.get_learning_summary(),
             }
         except Exception as e:
@@ -0,0 +1,331 @@
+"""
+Shared SQLite access layer.
+
+Every SQLite file used by Demi is opened through get_database(), which hands
+out one SQLiteDatabase per file. A database keeps:
+
+- Persistent, per-thread reader connections (WAL mode, so readers never
+  wait on the writer).
+- A single writer thread that owns the only write connection. Writes are
+  queued to it and each one runs in its own transaction.
+
+Connections are tuned with WAL journaling, synchronous=NORMAL, memory-mapped
+I/O and a larger page cache. Since connections live for the lifetime of the
+process, sqlite3's per-connection statement cache turns repeated SQL into
+prepared-statement reuse.
+
+Usage:
+    db = get_database("~/.demi/metrics.db")
+    db.executescript("CREATE TABLE IF NOT EXISTS t (x INTEGER)")
+    db.execute("INSERT INTO t (x) VALUES (?)", (1,))
+    rows = db.query("SELECT x FROM t")
+
+    def move(conn):
+        conn.execute("DELETE FROM t WHERE x = ?", (1,))
+        conn.execute("INSERT INTO t (x) VALUES (?)", (2,))
+    db.write(move)  # one transaction on the writer thread
+"""
+
+import asyncio
+import os
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, TypeVar
+
+from src.core.logger import get_logger
+
+logger = get_logger()
+
+T = TypeVar("T")
+
+# Connection tuning
+BUSY_TIMEOUT_MS = 30000
+CACHE_SIZE_KIB = 8192  # Page cache per connection
+MMAP_SIZE_BYTES = 64 * 1024 * 1024
+STATEMENT_CACHE_SIZE = 256  # Prepared statements kept per connection
+WRITER_IDLE_SECONDS = 60.0  # Writer thread exits after this long without work
+
+_STOP = object()
+
+
+class SQLiteDatabase:
+    """
+    Persistent connections to one SQLite file.
+
+    Reads run on the calling thread using a thread-local connection. Writes
+    are executed in order by the database's writer thread.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Database file path (``~`` is expanded)
+        """
+        self.path = str(Path(path).expanduser())
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._local = threading.local()
+        self._readers: List[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        self._closed = False
+
+        self.writes = 0
+
+    # ------------------------------------------------------------------
+    # Connections
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.path,
+            timeout=BUSY_TIMEOUT_MS / 1000,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+        conn.execute(f"PRAGMA cache_size=-{CACHE_SIZE_KIB}")
+        conn.execute(f"PRAGMA mmap_size={MMAP_SIZE_BYTES}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
+    def _reader(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            if self._closed:
+                raise sqlite3.ProgrammingError(f"Database is closed: {self.path}")
+            conn = self._connect()
+            self._local.conn = conn
+            with self._readers_lock:
+                self._readers.append(conn)
+        return conn
+
+    @contextmanager
+    def read(self, row_factory: Optional[Callable] = None) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow this thread's reader connection.
+
+        The row factory is reset on every borrow, so setting
+        ``conn.row_factory`` inside the block only affects that block.
+        Don't write through this connection; use write() instead.
+
+        Args:
+            row_factory: Optional row factory (e.g. sqlite3.Row)
+        """
+        if self.path == ":memory:":
+            # Each connection to :memory: is a separate database
+            raise sqlite3.ProgrammingError("Use write() for in-memory databases")
+        conn = self._reader()
+        conn.row_factory = row_factory
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def submit(self, fn: Callable[..., T], *args: Any) -> "Future[T]":
+        """
+        Queue fn(conn, *args) to run in a transaction on the writer thread.
+
+        The transaction commits if fn returns and rolls back if it raises.
+
+        Returns:
+            Future resolving to fn's return value
+        """
+        if self._closed:
+            raise sqlite3.ProgrammingError(f"Database is closed: {self.path}")
+        future: "Future[T]" = Future()
+        self._queue.put((fn, args, future))
+        self._ensure_writer()
+        return future
+
+    def write(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run fn(conn, *args) in a write transaction and wait for the result."""
+        if threading.current_thread() is self._writer:
+            # Nested write from inside a write: run in the open transaction
+            return fn(self._local.conn, *args)
+        return self.submit(fn, *args).result()
+
+    async def write_async(self, fn: Callable[..., T], *args: Any) -> T:
+        """Awaitable write() that doesn't block the event loop."""
+        return await asyncio.wrap_future(self.submit(fn, *args))
+
+    def execute(self, sql: str, params: Sequence = ()) -> sqlite3.Cursor:
+        """Execute one write statement in its own transaction."""
+        return self.write(lambda conn: conn.execute(sql, params))
+
+    async def execute_async(self, sql: str, params: Sequence = ()) -> sqlite3.Cursor:
+        """Awaitable execute() that doesn't block the event loop."""
+        return await self.write_async(lambda conn: conn.execute(sql, params))
+
+    def executemany(self, sql: str, seq_of_params: Iterable[Sequence]) -> sqlite3.Cursor:
+        """Execute a write statement for many parameter sets in one transaction."""
+        rows = list(seq_of_params)
+        return self.write(lambda conn: conn.executemany(sql, rows))
+
+    def executescript(self, script: str) -> None:
+        """Run a schema script (CREATE TABLE/INDEX ...) on the writer connection."""
+        self.write(lambda conn: conn.executescript(script))
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def query(
+        self, sql: str, params: Sequence = (), row_factory: Optional[Callable] = None
+    ) -> List[Any]:
+        """Run a read query and return all rows."""
+        if self.path == ":memory:":
+            return self.write(lambda conn: self._fetch(conn, sql, params, row_factory, True))
+        with self.read(row_factory) as conn:
+            return conn.execute(sql, params).fetchall()
+
+    def query_one(
+        self, sql: str, params: Sequence = (), row_factory: Optional[Callable] = None
+    ) -> Optional[Any]:
+        """Run a read query and return the first row, or None."""
+        if self.path == ":memory:":
+            return self.write(lambda conn: self._fetch(conn, sql, params, row_factory, False))
+        with self.read(row_factory) as conn:
+            return conn.execute(sql, params).fetchone()
+
+    @staticmethod
+    def _fetch(conn, sql, params, row_factory, fetch_all):
+        previous = conn.row_factory
+        conn.row_factory = row_factory
+        try:
+            cursor = conn.execute(sql, params)
+            return cursor.fetchall() if fetch_all else cursor.fetchone()
+        finally:
+            conn.row_factory = previous
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+
+    def _ensure_writer(self) -> None:
+        with self._writer_lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(
+                    target=self._writer_loop,
+                    name=f"sqlite-writer:{os.path.basename(self.path)}",
+                    daemon=True,
+                )
+                self._writer.start()
+
+    def _writer_loop(self) -> None:
+        conn = self._connect()
+        self._local.conn = conn
+        try:
+            while True:
+                try:
+                    item = self._queue.get(timeout=WRITER_IDLE_SECONDS)
+                except queue.Empty:
+                    with self._writer_lock:
+                        if self._queue.empty():
+                            self._writer = None
+                            return
+                    continue
+
+                if item is _STOP:
+                    return
+                fn, args, future = item
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    with conn:
+                        result = fn(conn, *args)
+                    self.writes += 1
+                    future.set_result(result)
+                except BaseException as e:
+                    future.set_exception(e)
+        finally:
+            conn.close()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def close(self) -> None:
+        """Finish queued writes, stop the writer and close every connection."""
+        with self._writer_lock:
+            self._closed = True
+            writer = self._writer
+        if writer is not None and writer.is_alive():
+            self._queue.put(_STOP)
+            writer.join(timeout=10)
+        with self._readers_lock:
+            for conn in self._readers:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._readers.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "writes": self.writes,
+            "pending_writes": self._queue.qsize(),
+            "readers": len(self._readers),
+            "writer_running": self._writer is not None and self._writer.is_alive(),
+        }
+
+
+_databases: Dict[str, SQLiteDatabase] = {}
+_databases_lock = threading.Lock()
+
+
+def get_database(path) -> SQLiteDatabase:
+    """
+    Get the shared SQLiteDatabase for a file, opening it on first use.
+
+    Args:
+        path: Database file path (str or Path, ``~`` is expanded)
+    """
+    key = str(Path(path).expanduser().resolve()) if str(path) != ":memory:" else ":memory:"
+    with _databases_lock:
+        db = _databases.get(key)
+        # A file deleted behind our back (e.g. test cleanup) gets fresh connections
+        if db is not None and key != ":memory:" and not os.path.exists(key):
+            db.close()
+            db = None
+        if db is None or db._closed:
+            db = SQLiteDatabase(key)
+            _databases[key] = db
+        return db
+
+
+def close_database(path) -> None:
+    """Close and forget the shared database for a file, if open."""
+    key = str(Path(path).expanduser().resolve()) if str(path) != ":memory:" else ":memory:"
+    with _databases_lock:
+        db = _databases.pop(key, None)
+    if db is not None:
+        db.close()
+
+
+def close_all_databases() -> None:
+    """Close every shared database (call on shutdown)."""
+    with _databases_lock:
+        databases = list(_databases.values())
+        _databases.clear()
+    for db in databases:
+        try:
+            db.close()
+        except Exception as e:
+            logger.warning(f"Error closing database {db.path}: {e}")
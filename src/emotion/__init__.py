@@ -8,6 +8,7 @@ from .interactions import (
 )
 from .modulation import PersonalityModulator, ModulationParameters
 from .persistence import EmotionPersistence
+from .state_store import EmotionStateStore
 
 __all__ = [
     "EmotionalState",
@@ -19,4 +20,5 @@ __all__ = [
     "PersonalityModulator",
     "ModulationParameters",
     "EmotionPersistence",
+    "EmotionStateStore",
 ]
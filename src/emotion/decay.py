@@ -1,7 +1,7 @@
 # src/emotion/decay.py
 import asyncio
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Optional, Callable
+from typing import Dict, Optional, Callable, Tuple
 import math
 from src.emotion.models import EmotionalState
 
@@ -102,46 +102,15 @@ class DecaySystem:
         time_delta = min(time_delta, self.tick_interval * 2)
         tick_multiplier = time_delta / self.tick_interval
 
-        # Apply base decay to all emotions
-        for emotion_name, base_rate in self.base_decay_rates.items():
-            current = getattr(state, emotion_name)
-
-            # Decay rate varies by current emotion level
-            # High emotions (>0.8) decay 50% slower
-            if current > 0.8:
-                adjusted_rate = base_rate * 0.5
-            else:
-                adjusted_rate = base_rate
-
-            # Apply logarithmic decay (fast at high values, slow at low)
-            # Formula: emotion -= (adjusted_rate * current) * tick_multiplier
-            decay_amount = adjusted_rate * current * tick_multiplier
-
-            new_value = current - decay_amount
-            state.set_emotion(emotion_name, new_value)
-
         # Apply idle effects if idle_time_seconds threshold exceeded
         idle_threshold_seconds = 300  # 5 minutes of no interaction = idle
         is_idle = (idle_time_seconds > idle_threshold_seconds) or force_idle
 
-        if is_idle:
-            for emotion_name, idle_delta in self.idle_effects.items():
-                current = getattr(state, emotion_name)
-
-                # Idle effects grow with idle time
-                # More idle = stronger effect
-                idle_multiplier = min(
-                    idle_time_seconds / (3600 * 12), 3.0
-                )  # Max 3x after 12 hours
-
-                idle_effect = idle_delta * idle_multiplier * tick_multiplier
-                new_value = current + idle_effect
-
-                # Loneliness can go higher (with momentum if needed)
-                if emotion_name == "loneliness" and new_value > 1.0:
-                    state.set_emotion(emotion_name, new_value, momentum_override=True)
-                else:
-                    state.set_emotion(emotion_name, new_value)
+        self._apply_tick(
+            state,
+            tick_multiplier,
+            self._idle_multiplier(idle_time_seconds) if is_idle else 0.0,
+        )
 
         if self.on_decay_applied:
             self.on_decay_applied(state)
@@ -149,39 +118,229 @@ class DecaySystem:
         return state
 
     def simulate_offline_decay(
-        self, state: EmotionalState, offline_duration_seconds: int
+        self,
+        state: EmotionalState,
+        offline_duration_seconds: int,
+        fast_forward: bool = True,
     ) -> EmotionalState:
         """
         Simulate emotion decay for a period of offline time.
         Called when Demi restarts to "age" the emotions appropriately.
 
+        Every full tick is treated as an idle tick of exactly tick_interval
+        seconds, followed by one fractional tick for the remainder. With
+        fast_forward the result is computed in closed form per emotion, so a
+        week offline costs the same as five minutes; fast_forward=False
+        replays the ticks one by one (reference implementation).
+
         Args:
             state: State from last shutdown (with timestamp)
             offline_duration_seconds: How long Demi was offline
+            fast_forward: Use the closed-form fast-forward instead of per-tick replay
 
         Returns:
             Decayed state as if she was idle the whole time
         """
-        # Calculate how many ticks occurred during offline time
-        num_ticks = offline_duration_seconds / self.tick_interval
-
-        # Apply decay incrementally over the offline period
-        for _ in range(int(num_ticks)):
-            state = self.apply_decay(
-                state,
-                idle_time_seconds=self.tick_interval,  # Each tick treats as idle
-                force_idle=True,  # Force idle effects
-            )
+        num_ticks = int(offline_duration_seconds // self.tick_interval)
+        remaining_seconds = offline_duration_seconds % self.tick_interval
+        tick_idle = self._idle_multiplier(self.tick_interval)  # Each tick treats as idle
+
+        if fast_forward:
+            for emotion_name, base_rate in self.base_decay_rates.items():
+                value, overflow = self._fast_forward_value(
+                    getattr(state, emotion_name),
+                    base_rate,
+                    self.idle_effects.get(emotion_name, 0.0) * tick_idle,
+                    state._EMOTION_FLOORS[emotion_name],
+                    num_ticks,
+                    allow_overflow=emotion_name == "loneliness",
+                )
+                if overflow > 0:
+                    # Momentum is the last tick's excess, not the largest one seen
+                    state.momentum[emotion_name] = 0.0
+                    state.set_emotion(emotion_name, 1.0 + overflow, momentum_override=True)
+                elif num_ticks:
+                    state.set_emotion(emotion_name, value)
+        else:
+            for _ in range(num_ticks):
+                self._apply_tick(state, 1.0, tick_idle)
 
         # Handle fractional tick
-        remaining_seconds = offline_duration_seconds % self.tick_interval
         if remaining_seconds > 0:
-            state = self.apply_decay(
-                state, idle_time_seconds=remaining_seconds, force_idle=True
+            self._apply_tick(
+                state,
+                remaining_seconds / self.tick_interval,
+                self._idle_multiplier(remaining_seconds),
             )
 
+        if self.on_decay_applied:
+            self.on_decay_applied(state)
+
         return state
 
+    @staticmethod
+    def _idle_multiplier(idle_time_seconds: float) -> float:
+        """Idle effects grow with idle time (max 3x after 12 hours)."""
+        return min(idle_time_seconds / (3600 * 12), 3.0)
+
+    def _apply_tick(
+        self, state: EmotionalState, tick_multiplier: float, idle_multiplier: float
+    ) -> None:
+        """
+        Apply one tick of decay (and idle effects, if idle_multiplier > 0) in place.
+
+        Args:
+            state: Emotional state to update
+            tick_multiplier: Fraction of a full tick that elapsed
+            idle_multiplier: Idle effect strength (0 when not idle)
+        """
+        for emotion_name, base_rate in self.base_decay_rates.items():
+            value, overflow = self._step_value(
+                getattr(state, emotion_name),
+                base_rate,
+                self.idle_effects.get(emotion_name, 0.0) * idle_multiplier,
+                state._EMOTION_FLOORS[emotion_name],
+                tick_multiplier,
+                allow_overflow=emotion_name == "loneliness",
+            )
+            if overflow > 0:
+                # Momentum is this tick's excess, not the largest one seen
+                state.momentum[emotion_name] = 0.0
+                state.set_emotion(emotion_name, 1.0 + overflow, momentum_override=True)
+            else:
+                state.set_emotion(emotion_name, value)
+
+    @staticmethod
+    def _step_value(
+        current: float,
+        base_rate: float,
+        idle_step: float,
+        floor: float,
+        tick_multiplier: float = 1.0,
+        allow_overflow: bool = False,
+    ) -> Tuple[float, float]:
+        """
+        Advance a single emotion by one tick.
+
+        Args:
+            current: Current emotion value
+            base_rate: Decay rate per full tick
+            idle_step: Idle effect per full tick (already scaled by idle time)
+            floor: Emotion floor
+            tick_multiplier: Fraction of a full tick that elapsed
+            allow_overflow: Whether the idle effect may push past 1.0 (momentum)
+
+        Returns:
+            Tuple of (new value, overflow above 1.0)
+        """
+        # High emotions (>0.8) decay 50% slower
+        adjusted_rate = base_rate * 0.5 if current > 0.8 else base_rate
+
+        # Apply logarithmic decay (fast at high values, slow at low)
+        # Formula: emotion -= (adjusted_rate * current) * tick_multiplier
+        value = current - adjusted_rate * current * tick_multiplier
+        value = max(floor, min(1.0, value))
+
+        if idle_step:
+            value += idle_step * tick_multiplier
+            # Loneliness can go higher (with momentum if needed)
+            if allow_overflow and value > 1.0:
+                return 1.0, value - 1.0
+            value = max(floor, min(1.0, value))
+
+        return value, 0.0
+
+    def _fast_forward_value(
+        self,
+        current: float,
+        base_rate: float,
+        idle_step: float,
+        floor: float,
+        ticks: int,
+        allow_overflow: bool = False,
+    ) -> Tuple[float, float]:
+        """
+        Advance a single emotion by many full ticks in closed form.
+
+        Between clamps and the 0.8 slow-decay threshold a tick is the affine
+        map x -> a*x + c (a = 1 - rate, c = idle step), so n ticks give
+        x_n = x* + (x_0 - x*) * a**n with fixed point x* = c / rate. The
+        trajectory is monotone, so the longest stretch where that formula is
+        exact is found by bisection; the tick that crosses a boundary is then
+        stepped exactly. Only a handful of such phases ever occur.
+
+        Args:
+            current: Starting emotion value
+            base_rate: Decay rate per full tick
+            idle_step: Idle effect per full tick
+            floor: Emotion floor
+            ticks: Number of full ticks to advance
+            allow_overflow: Whether the idle effect may push past 1.0 (momentum)
+
+        Returns:
+            Tuple of (value after all ticks, overflow on the final tick)
+        """
+        overflow = 0.0
+        while ticks > 0:
+            rate = base_rate * 0.5 if current > 0.8 else base_rate
+            span = self._affine_span(current, rate, idle_step, floor, ticks)
+            if span:
+                current = self._affine_jump(current, rate, idle_step, span)
+                overflow = 0.0
+                ticks -= span
+                continue
+
+            # Boundary tick: step exactly
+            value, overflow = self._step_value(
+                current, base_rate, idle_step, floor, allow_overflow=allow_overflow
+            )
+            ticks -= 1
+            if value == current:
+                break  # Pinned at a clamp; further ticks change nothing
+            current = value
+
+        return current, overflow
+
+    @staticmethod
+    def _affine_jump(current: float, rate: float, idle_step: float, ticks: int) -> float:
+        """Value after `ticks` unclamped ticks of x -> (1 - rate)*x + idle_step."""
+        if rate <= 0:
+            return current + idle_step * ticks
+        fixed_point = idle_step / rate
+        return fixed_point + (current - fixed_point) * (1.0 - rate) ** ticks
+
+    def _affine_span(
+        self, current: float, rate: float, idle_step: float, floor: float, ticks: int
+    ) -> int:
+        """
+        Longest run of ticks (<= ticks) the affine formula reproduces exactly.
+
+        A tick starting from x is affine if x stays on the same side of 0.8
+        and neither the decay nor the idle step gets clamped.
+        """
+        high = current > 0.8
+
+        def exact_from(x: float) -> bool:
+            decayed = x - rate * x
+            return (
+                (x > 0.8) == high
+                and floor <= decayed <= 1.0
+                and floor <= decayed + idle_step <= 1.0
+            )
+
+        if not exact_from(current):
+            return 0
+
+        # Largest n such that the tick starting at x_(n-1) is still exact
+        lo, hi = 1, ticks
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if exact_from(self._affine_jump(current, rate, idle_step, mid - 1)):
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo
+
 
 class DecayTuner:
     """
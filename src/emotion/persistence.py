@@ -1,5 +1,4 @@
 # src/emotion/persistence.py
-import sqlite3
 import json
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, List
@@ -7,6 +6,7 @@ from pathlib import Path
 from src.emotion.models import EmotionalState
 from src.emotion.decay import DecaySystem
 from src.emotion.interactions import InteractionType
+from src.core.storage import get_database
 
 try:
     from src.monitoring.metrics import get_emotion_metrics
@@ -21,6 +21,20 @@ class EmotionPersistence:
     Integrates with DecaySystem to simulate offline emotion progression.
     """
 
+    _INSERT_STATE_SQL = """
+        INSERT INTO emotional_state
+        (timestamp, loneliness, excitement, frustration, jealousy, vulnerability,
+         confidence, curiosity, affection, defensiveness, momentum_json, notes)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    _INSERT_INTERACTION_SQL = """
+        INSERT INTO interaction_log
+        (timestamp, interaction_type, user_message, state_before_json,
+         state_after_json, effects_json, confidence_level, notes)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
     def __init__(self, db_path: str = "~/.demi/emotions.db", db_manager=None, logger=None):
         """
         Initialize persistence layer.
@@ -34,13 +48,17 @@ class EmotionPersistence:
         self.logger = logger
         self.db_path = Path(db_path).expanduser()
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = get_database(self.db_path)
 
         # Initialize database schema if needed
         self._init_schema()
 
     def _init_schema(self):
         """Create database tables if they don't exist."""
-        conn = sqlite3.connect(self.db_path)
+        self._db.write(self._create_tables)
+
+    @staticmethod
+    def _create_tables(conn):
         cursor = conn.cursor()
 
         # Main emotional state table
@@ -113,9 +131,6 @@ class EmotionPersistence:
             )
         """)
 
-        conn.commit()
-        conn.close()
-
     def save_state(self, state: EmotionalState, notes: Optional[str] = None) -> bool:
         """
         Save current emotional state to database.
@@ -128,54 +143,113 @@ class EmotionPersistence:
             True if saved successfully
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            self._db.execute(
+                self._INSERT_STATE_SQL,
+                self._state_row(state, notes, datetime.now(timezone.utc)),
+            )
+
+            self._record_state_metrics(state)
+            return True
+        except Exception as e:
+            print(f"Failed to save emotional state: {e}")
+            return False
 
+    def save_batch(
+        self,
+        state: Optional[EmotionalState],
+        interactions: Optional[List[Dict]] = None,
+        notes: Optional[str] = None,
+    ) -> bool:
+        """
+        Save a state and buffered interaction logs in a single transaction.
+
+        Either everything is committed or nothing is, so a crash mid-write
+        never leaves an interaction log without the state it produced.
+
+        Args:
+            state: EmotionalState to persist (None to write only interactions)
+            interactions: List of log_interaction() keyword dicts
+            notes: Optional notes about what triggered this state
+
+        Returns:
+            True if saved successfully
+        """
+        interactions = interactions or []
+        if state is None and not interactions:
+            return True
+
+        try:
             now = datetime.now(timezone.utc)
+            rows = [self._interaction_row(now=now, **entry) for entry in interactions]
 
-            cursor.execute(
-                """
-                INSERT INTO emotional_state
-                (timestamp, loneliness, excitement, frustration, jealousy, vulnerability,
-                 confidence, curiosity, affection, defensiveness, momentum_json, notes)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    now.isoformat(),
-                    state.loneliness,
-                    state.excitement,
-                    state.frustration,
-                    state.jealousy,
-                    state.vulnerability,
-                    state.confidence,
-                    state.curiosity,
-                    state.affection,
-                    state.defensiveness,
-                    json.dumps(state.momentum),
-                    notes,
-                ),
-            )
+            def write(conn):
+                if rows:
+                    conn.executemany(self._INSERT_INTERACTION_SQL, rows)
+                if state is not None:
+                    conn.execute(self._INSERT_STATE_SQL, self._state_row(state, notes, now))
 
-            conn.commit()
-            conn.close()
-
-            # Record emotion metrics if available
-            if HAS_METRICS:
-                try:
-                    emotion_metrics = get_emotion_metrics()
-                    emotion_metrics.record_emotion_state(
-                        state.get_all_emotions()
-                    )
-                except Exception as e:
-                    if self.logger:
-                        self.logger.debug(f"Failed to record emotion metrics: {e}")
-                    # Silently continue if metrics recording fails
+            self._db.write(write)
 
+            if state is not None:
+                self._record_state_metrics(state)
             return True
         except Exception as e:
-            print(f"Failed to save emotional state: {e}")
+            print(f"Failed to save emotional state batch: {e}")
             return False
 
+    @staticmethod
+    def _state_row(state: EmotionalState, notes: Optional[str], now: datetime) -> tuple:
+        """Build the emotional_state row for a state."""
+        return (
+            now.isoformat(),
+            state.loneliness,
+            state.excitement,
+            state.frustration,
+            state.jealousy,
+            state.vulnerability,
+            state.confidence,
+            state.curiosity,
+            state.affection,
+            state.defensiveness,
+            json.dumps(state.momentum),
+            notes,
+        )
+
+    @staticmethod
+    def _interaction_row(
+        interaction_type: InteractionType,
+        state_before: EmotionalState,
+        state_after: EmotionalState,
+        effects: Dict,
+        user_message: Optional[str] = None,
+        confidence_level: float = 1.0,
+        notes: Optional[str] = None,
+        now: Optional[datetime] = None,
+    ) -> tuple:
+        """Build the interaction_log row for one interaction."""
+        return (
+            (now or datetime.now(timezone.utc)).isoformat(),
+            interaction_type.value,
+            user_message,
+            json.dumps(state_before.to_dict()),
+            json.dumps(state_after.to_dict()),
+            json.dumps(effects),
+            confidence_level,
+            notes,
+        )
+
+    def _record_state_metrics(self, state: EmotionalState) -> None:
+        """Record emotion metrics for a saved state, if available."""
+        if not HAS_METRICS:
+            return
+        try:
+            emotion_metrics = get_emotion_metrics()
+            emotion_metrics.record_emotion_state(state.get_all_emotions())
+        except Exception as e:
+            if self.logger:
+                self.logger.debug(f"Failed to record emotion metrics: {e}")
+            # Silently continue if metrics recording fails
+
     def load_latest_state(self) -> Optional[EmotionalState]:
         """
         Load the most recent saved emotional state.
@@ -184,10 +258,7 @@ class EmotionPersistence:
             EmotionalState or None if not found
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
+            row = self._db.query_one("""
                 SELECT loneliness, excitement, frustration, jealousy, vulnerability,
                        confidence, curiosity, affection, defensiveness, momentum_json, timestamp
                 FROM emotional_state
@@ -195,9 +266,6 @@ class EmotionPersistence:
                 LIMIT 1
             """)
 
-            row = cursor.fetchone()
-            conn.close()
-
             if not row:
                 return None
 
@@ -238,10 +306,7 @@ class EmotionPersistence:
             Aged emotional state, or None if no saved state
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
+            row = self._db.query_one("""
                 SELECT loneliness, excitement, frustration, jealousy, vulnerability,
                        confidence, curiosity, affection, defensiveness, momentum_json, timestamp
                 FROM emotional_state
@@ -249,9 +314,6 @@ class EmotionPersistence:
                 LIMIT 1
             """)
 
-            row = cursor.fetchone()
-            conn.close()
-
             if not row:
                 return None
 
@@ -309,32 +371,18 @@ class EmotionPersistence:
             True if logged successfully
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            now = datetime.now(timezone.utc)
-
-            cursor.execute(
-                """
-                INSERT INTO interaction_log
-                (timestamp, interaction_type, user_message, state_before_json, 
-                 state_after_json, effects_json, confidence_level, notes)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    now.isoformat(),
-                    interaction_type.value,
-                    user_message,
-                    json.dumps(state_before.to_dict()),
-                    json.dumps(state_after.to_dict()),
-                    json.dumps(effects),
-                    confidence_level,
-                    notes,
+            self._db.execute(
+                self._INSERT_INTERACTION_SQL,
+                self._interaction_row(
+                    interaction_type,
+                    state_before,
+                    state_after,
+                    effects,
+                    user_message=user_message,
+                    confidence_level=confidence_level,
+                    notes=notes,
                 ),
             )
-
-            conn.commit()
-            conn.close()
             return True
         except Exception as e:
             print(f"Failed to log interaction: {e}")
@@ -354,11 +402,8 @@ class EmotionPersistence:
             List of interaction dictionaries
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
             if interaction_type:
-                cursor.execute(
+                rows = self._db.query(
                     """
                     SELECT timestamp, interaction_type, user_message, state_before_json,
                            state_after_json, effects_json, confidence_level, notes
@@ -370,7 +415,7 @@ class EmotionPersistence:
                     (interaction_type, limit),
                 )
             else:
-                cursor.execute(
+                rows = self._db.query(
                     """
                     SELECT timestamp, interaction_type, user_message, state_before_json,
                            state_after_json, effects_json, confidence_level, notes
@@ -381,9 +426,6 @@ class EmotionPersistence:
                     (limit,),
                 )
 
-            rows = cursor.fetchall()
-            conn.close()
-
             return [
                 {
                     "timestamp": row[0],
@@ -413,12 +455,9 @@ class EmotionPersistence:
             snapshot_type: one of 'hourly', 'manual', 'startup', 'shutdown'
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
             now = datetime.now(timezone.utc)
 
-            cursor.execute(
+            self._db.execute(
                 """
                 INSERT INTO state_snapshots (timestamp, state_json, snapshot_type)
                 VALUES (?, ?, ?)
@@ -429,9 +468,6 @@ class EmotionPersistence:
                     snapshot_type,
                 ),
             )
-
-            conn.commit()
-            conn.close()
         except Exception as e:
             print(f"Failed to create backup snapshot: {e}")
 
@@ -449,12 +485,9 @@ class EmotionPersistence:
             EmotionalState from backup, or None if not found
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
             cutoff_time = datetime.now(timezone.utc) - timedelta(hours=backup_age_hours)
 
-            cursor.execute(
+            row = self._db.query_one(
                 """
                 SELECT state_json FROM state_snapshots
                 WHERE timestamp >= ?
@@ -464,9 +497,6 @@ class EmotionPersistence:
                 (cutoff_time.isoformat(),),
             )
 
-            row = cursor.fetchone()
-            conn.close()
-
             if not row:
                 return None
 
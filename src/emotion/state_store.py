@@ -0,0 +1,312 @@
+# src/emotion/state_store.py
+"""
+In-memory authoritative emotional state with write-behind persistence.
+
+The Conductor keeps exactly one live EmotionalState here. Reads are plain
+memory copies; writes replace the state under an asyncio lock and mark it
+dirty. A background flusher coalesces dirty states and buffered interaction
+logs into a single SQLite transaction, run off the event loop.
+
+Durability: every flush commits the latest state together with all buffered
+interaction logs atomically, so the database always holds a consistent
+snapshot. Changes larger than ``flush_delta`` on any emotion are flushed
+right away; smaller drift is flushed every ``flush_interval_sec``, which
+bounds what a hard crash can lose. close() flushes everything that is left.
+"""
+
+import asyncio
+import copy
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from src.emotion.interactions import InteractionType
+from src.emotion.models import EmotionalState
+from src.emotion.persistence import EmotionPersistence
+
+
+class EmotionStateStore:
+    """
+    Single owner of Demi's live emotional state.
+
+    Callers never touch SQLite: get() returns a copy of the in-memory state,
+    set()/modify() update it, and log_interaction() buffers audit records
+    until the next flush.
+    """
+
+    def __init__(
+        self,
+        persistence: EmotionPersistence,
+        flush_interval_sec: float = 30.0,
+        flush_delta: float = 0.15,
+        max_pending_interactions: int = 256,
+        logger=None,
+    ):
+        """
+        Initialize state store.
+
+        Args:
+            persistence: EmotionPersistence used for loading and flushing
+            flush_interval_sec: Maximum time a dirty state stays unflushed
+            flush_delta: Emotion change (vs. last flush) that forces a flush
+            max_pending_interactions: Buffered interaction logs that force a flush
+            logger: Optional logger instance
+        """
+        if flush_interval_sec <= 0:
+            raise ValueError("flush_interval_sec must be greater than 0")
+
+        self.persistence = persistence
+        self.flush_interval_sec = flush_interval_sec
+        self.flush_delta = flush_delta
+        self.max_pending_interactions = max_pending_interactions
+        self.logger = logger
+
+        self._state = EmotionalState()
+        self._persisted: Dict[str, float] = self._state.get_all_emotions()
+        self._notes: Optional[str] = None
+        self._version = 0
+        self._persisted_version = 0
+        self._pending_interactions: List[Dict[str, Any]] = []
+
+        self._lock = asyncio.Lock()
+        self._flush_lock = asyncio.Lock()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flusher: Optional[asyncio.Task] = None
+
+        self._flushes = 0
+        self._failed_flushes = 0
+        self._coalesced_writes = 0
+        self._last_flush_ms = 0.0
+
+    @classmethod
+    def from_config(
+        cls, settings: Dict[str, Any], persistence: EmotionPersistence, logger=None
+    ) -> "EmotionStateStore":
+        """
+        Build a store from the conductor 'emotion_store' config section.
+
+        Args:
+            settings: Dict with flush_interval_sec, flush_delta, max_pending_interactions
+            persistence: EmotionPersistence instance
+            logger: Optional logger instance
+
+        Returns:
+            EmotionStateStore instance
+        """
+        return cls(
+            persistence,
+            flush_interval_sec=settings.get("flush_interval_sec", 30.0),
+            flush_delta=settings.get("flush_delta", 0.15),
+            max_pending_interactions=settings.get("max_pending_interactions", 256),
+            logger=logger,
+        )
+
+    @property
+    def dirty(self) -> bool:
+        """True if the in-memory state has changes not yet flushed."""
+        return self._version != self._persisted_version or bool(self._pending_interactions)
+
+    def load(self) -> EmotionalState:
+        """
+        Load the latest persisted state into memory (called once at startup).
+
+        Returns:
+            Copy of the loaded state (defaults if nothing was saved)
+        """
+        state = self.persistence.load_latest_state() or EmotionalState()
+        self._state = state
+        self._persisted = state.get_all_emotions()
+        self._persisted_version = self._version
+        return self.get()
+
+    def get(self) -> EmotionalState:
+        """
+        Return a copy of the current state. No I/O.
+
+        Returns:
+            EmotionalState the caller may freely mutate
+        """
+        return copy.deepcopy(self._state)
+
+    async def set(self, state: EmotionalState, notes: Optional[str] = None) -> None:
+        """
+        Replace the current state; persisted by the next flush.
+
+        Args:
+            state: New emotional state
+            notes: Optional notes stored with the flushed state
+        """
+        async with self._lock:
+            self._replace(copy.deepcopy(state), notes)
+
+    async def modify(
+        self,
+        fn: Callable[[EmotionalState], EmotionalState],
+        notes: Optional[str] = None,
+    ) -> EmotionalState:
+        """
+        Atomically read-modify-write the current state.
+
+        Args:
+            fn: Receives a copy of the current state, returns the new state
+            notes: Optional notes stored with the flushed state
+
+        Returns:
+            Copy of the new state
+        """
+        async with self._lock:
+            new_state = fn(copy.deepcopy(self._state))
+            self._replace(new_state, notes)
+            return copy.deepcopy(new_state)
+
+    def log_interaction(
+        self,
+        interaction_type: InteractionType,
+        state_before: EmotionalState,
+        state_after: EmotionalState,
+        effects: Dict,
+        user_message: Optional[str] = None,
+        confidence_level: float = 1.0,
+        notes: Optional[str] = None,
+    ) -> bool:
+        """
+        Buffer an interaction log entry; written with the next flush.
+
+        Same signature as EmotionPersistence.log_interaction so either can be
+        used as the interaction sink.
+
+        Returns:
+            True (the entry is always accepted)
+        """
+        self._pending_interactions.append(
+            {
+                "interaction_type": interaction_type,
+                "state_before": copy.deepcopy(state_before),
+                "state_after": copy.deepcopy(state_after),
+                "effects": effects,
+                "user_message": user_message,
+                "confidence_level": confidence_level,
+                "notes": notes,
+            }
+        )
+        if len(self._pending_interactions) >= self.max_pending_interactions:
+            self._request_flush()
+        return True
+
+    async def flush(self) -> bool:
+        """
+        Write the latest state and buffered interactions in one transaction.
+
+        Intermediate states since the last flush are coalesced; only the most
+        recent one is written. On failure everything stays pending.
+
+        Returns:
+            True if nothing was pending or the write succeeded
+        """
+        async with self._flush_lock:
+            async with self._lock:
+                if not self.dirty:
+                    return True
+                version = self._version
+                state = (
+                    copy.deepcopy(self._state)
+                    if version != self._persisted_version
+                    else None
+                )
+                notes = self._notes
+                interactions = self._pending_interactions
+                self._pending_interactions = []
+
+            start = time.perf_counter()
+            ok = await asyncio.to_thread(
+                self.persistence.save_batch, state, interactions, notes
+            )
+            self._last_flush_ms = (time.perf_counter() - start) * 1000
+
+            if not ok:
+                self._failed_flushes += 1
+                self._pending_interactions[:0] = interactions
+                if self.logger:
+                    self.logger.warning("Emotion state flush failed; will retry")
+                return False
+
+            self._flushes += 1
+            self._persisted_version = version
+            if state is not None:
+                self._persisted = state.get_all_emotions()
+                if self._notes == notes:
+                    self._notes = None
+            return True
+
+    async def start(self) -> None:
+        """Start the background flusher task."""
+        if self._flusher and not self._flusher.done():
+            return
+        self._wakeup = asyncio.Event()
+        self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def close(self) -> None:
+        """Stop the flusher and flush whatever is still pending."""
+        if self._flusher:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+            self._wakeup = None
+        await self.flush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Return store statistics.
+
+        Returns:
+            Dict with flush counts, pending work and last flush latency
+        """
+        return {
+            "dirty": self.dirty,
+            "pending_interactions": len(self._pending_interactions),
+            "flushes": self._flushes,
+            "failed_flushes": self._failed_flushes,
+            "coalesced_writes": self._coalesced_writes,
+            "last_flush_ms": round(self._last_flush_ms, 2),
+            "flush_interval_sec": self.flush_interval_sec,
+        }
+
+    def _replace(self, state: EmotionalState, notes: Optional[str]) -> None:
+        """Install a new state (caller holds the lock)."""
+        if self._version != self._persisted_version:
+            self._coalesced_writes += 1
+        self._state = state
+        self._version += 1
+        if notes is not None:
+            self._notes = notes
+        if self._significant_change(state):
+            self._request_flush()
+
+    def _significant_change(self, state: EmotionalState) -> bool:
+        """True if any emotion moved at least flush_delta since the last flush."""
+        current = state.get_all_emotions()
+        return any(
+            abs(current[name] - self._persisted.get(name, value)) >= self.flush_delta
+            for name, value in current.items()
+        )
+
+    def _request_flush(self) -> None:
+        """Wake the flusher early, if it is running."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _flush_loop(self) -> None:
+        """Flush on the interval, or sooner when woken."""
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval_sec)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(f"Emotion state flush error: {e}")
@@ -21,6 +21,7 @@ from src.evolution.self_reward import SelfRewarder, RewardSignal
 from src.evolution.change_tracker import ChangeTracker, ChangeRecord
 from src.evolution.response_revisor import ResponseRevisor, RevisionSession, RevisionStrategy
 from src.evolution.pattern_learning import PatternLearningDB, LearnedPattern, MistakeEntry
+from src.evolution.pipeline import EvolutionPipeline, EvolutionJob
 
 __all__ = [
     "ErrorAnalyzer",
@@ -40,4 +41,6 @@ __all__ = [
     "PatternLearningDB",
     "LearnedPattern",
     "MistakeEntry",
+    "EvolutionPipeline",
+    "EvolutionJob",
 ]
@@ -21,6 +21,7 @@ from typing import Optional, List, Dict, Any
 from pathlib import Path
 
 from src.core.logger import get_logger
+from src.core.storage import get_database
 from src.autonomy.git_manager import GitManager
 
 logger = get_logger()
@@ -66,6 +67,7 @@ class ChangeTracker:
         """
         self.project_root = Path(project_root or self._detect_project_root())
         self.db_path = db_path or self._get_default_db_path()
+        self._db = get_database(self.db_path)
         self.git = GitManager(str(self.project_root))
         
         self._init_database()
@@ -94,25 +96,23 @@ class ChangeTracker:
     
     def _init_database(self):
         """Initialize change tracking database."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS changes (
-                    change_id TEXT PRIMARY KEY,
-                    timestamp TEXT NOT NULL,
-                    category TEXT NOT NULL,
-                    files_modified TEXT NOT NULL,
-                    description TEXT NOT NULL,
-                    rationale TEXT,
-                    before_metrics TEXT,
-                    after_metrics TEXT,
-                    git_commit_hash TEXT,
-                    git_branch TEXT,
-                    approved BOOLEAN DEFAULT 0,
-                    approved_by TEXT,
-                    reverted BOOLEAN DEFAULT 0
-                )
-            """)
-            conn.commit()
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS changes (
+                change_id TEXT PRIMARY KEY,
+                timestamp TEXT NOT NULL,
+                category TEXT NOT NULL,
+                files_modified TEXT NOT NULL,
+                description TEXT NOT NULL,
+                rationale TEXT,
+                before_metrics TEXT,
+                after_metrics TEXT,
+                git_commit_hash TEXT,
+                git_branch TEXT,
+                approved BOOLEAN DEFAULT 0,
+                approved_by TEXT,
+                reverted BOOLEAN DEFAULT 0
+            )
+        """)
     
     def _init_changelog(self):
         """Initialize CHANGELOG.md if it doesn't exist."""
@@ -294,32 +294,30 @@ and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0
     
     def _store_change(self, change: ChangeRecord):
         """Store change in database."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                INSERT INTO changes 
-                (change_id, timestamp, category, files_modified, description,
-                 rationale, before_metrics, after_metrics, git_commit_hash,
-                 git_branch, approved, approved_by, reverted)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    change.change_id,
-                    change.timestamp,
-                    change.category,
-                    json.dumps(change.files_modified),
-                    change.description,
-                    change.rationale,
-                    json.dumps(change.before_metrics) if change.before_metrics else None,
-                    json.dumps(change.after_metrics) if change.after_metrics else None,
-                    change.git_commit_hash,
-                    change.git_branch,
-                    change.approved,
-                    change.approved_by,
-                    change.reverted,
-                )
+        self._db.execute(
+            """
+            INSERT INTO changes 
+            (change_id, timestamp, category, files_modified, description,
+             rationale, before_metrics, after_metrics, git_commit_hash,
+             git_branch, approved, approved_by, reverted)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                change.change_id,
+                change.timestamp,
+                change.category,
+                json.dumps(change.files_modified),
+                change.description,
+                change.rationale,
+                json.dumps(change.before_metrics) if change.before_metrics else None,
+                json.dumps(change.after_metrics) if change.after_metrics else None,
+                change.git_commit_hash,
+                change.git_branch,
+                change.approved,
+                change.approved_by,
+                change.reverted,
             )
-            conn.commit()
+        )
     
     def _update_changelog(self, change: ChangeRecord):
         """Update CHANGELOG.md with the change."""
@@ -387,7 +385,7 @@ and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0
         Returns:
             List of change records
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db.read() as conn:
             conn.row_factory = sqlite3.Row
             
             query = "SELECT * FROM changes WHERE 1=1"
@@ -427,7 +425,7 @@ and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0
     
     def get_change_stats(self) -> Dict[str, Any]:
         """Get change statistics."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db.read() as conn:
             # Total changes
             total = conn.execute("SELECT COUNT(*) FROM changes").fetchone()[0]
             
@@ -459,16 +457,14 @@ and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0
     
     def approve_change(self, change_id: str, approved_by: str = "human"):
         """Approve a pending change."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                UPDATE changes 
-                SET approved = 1, approved_by = ?
-                WHERE change_id = ?
-                """,
-                (approved_by, change_id)
-            )
-            conn.commit()
+        self._db.execute(
+            """
+            UPDATE changes 
+            SET approved = 1, approved_by = ?
+            WHERE change_id = ?
+            """,
+            (approved_by, change_id)
+        )
     
     def revert_change(self, change_id: str) -> bool:
         """
@@ -480,40 +476,38 @@ and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0
         Returns:
             True if reverted successfully
         """
-        with sqlite3.connect(self.db_path) as conn:
-            row = conn.execute(
-                "SELECT git_commit_hash FROM changes WHERE change_id = ?",
-                (change_id,)
-            ).fetchone()
-            
-            if not row or not row[0]:
-                logger.error(f"No commit hash found for change {change_id}")
-                return False
-            
-            commit_hash = row[0]
-            
-            try:
-                # Revert the commit
-                subprocess.run(
-                    ["git", "revert", "--no-edit", commit_hash],
-                    cwd=self.project_root,
-                    check=True,
-                    capture_output=True
-                )
+        row = self._db.query_one(
+            "SELECT git_commit_hash FROM changes WHERE change_id = ?",
+            (change_id,)
+        )
+            
+        if not row or not row[0]:
+            logger.error(f"No commit hash found for change {change_id}")
+            return False
+            
+        commit_hash = row[0]
+            
+        try:
+            # Revert the commit
+            subprocess.run(
+                ["git", "revert", "--no-edit", commit_hash],
+                cwd=self.project_root,
+                check=True,
+                capture_output=True
+            )
                 
-                # Mark as reverted
-                conn.execute(
-                    "UPDATE changes SET reverted = 1 WHERE change_id = ?",
-                    (change_id,)
-                )
-                conn.commit()
+            # Mark as reverted
+            self._db.execute(
+                "UPDATE changes SET reverted = 1 WHERE change_id = ?",
+                (change_id,)
+            )
                 
-                logger.info(f"Reverted change {change_id} (commit {commit_hash[:8]})")
-                return True
+            logger.info(f"Reverted change {change_id} (commit {commit_hash[:8]})")
+            return True
                 
-            except subprocess.CalledProcessError as e:
-                logger.error(f"Revert failed: {e.stderr}")
-                return False
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Revert failed: {e.stderr}")
+            return False
     
     def generate_report(self, days: int = 7) -> str:
         """
@@ -529,7 +523,7 @@ and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0
         
         cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db.read() as conn:
             conn.row_factory = sqlite3.Row
             rows = conn.execute(
                 "SELECT * FROM changes WHERE timestamp > ? ORDER BY timestamp DESC",
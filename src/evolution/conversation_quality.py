@@ -16,10 +16,11 @@ import json
 import sqlite3
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from pathlib import Path
 
 from src.core.logger import get_logger
+from src.core.storage import get_database
 from src.core.config import DemiConfig
 
 logger = get_logger()
@@ -81,6 +82,7 @@ class ConversationQualityAnalyzer:
     def __init__(self, db_path: Optional[str] = None):
         """Initialize quality analyzer."""
         self.db_path = db_path or self._get_default_db_path()
+        self._db = get_database(self.db_path)
         self._init_database()
         logger.info("ConversationQualityAnalyzer initialized")
     
@@ -92,24 +94,22 @@ class ConversationQualityAnalyzer:
     
     def _init_database(self):
         """Initialize quality metrics database."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS quality_metrics (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp TEXT NOT NULL,
-                    conversation_id TEXT,
-                    response_text TEXT,
-                    persona_consistency REAL,
-                    emotional_appropriateness REAL,
-                    coherence REAL,
-                    engagement REAL,
-                    authenticity REAL,
-                    overall_score REAL,
-                    emotional_state TEXT,
-                    metadata TEXT
-                )
-            """)
-            conn.commit()
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS quality_metrics (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TEXT NOT NULL,
+                conversation_id TEXT,
+                response_text TEXT,
+                persona_consistency REAL,
+                emotional_appropriateness REAL,
+                coherence REAL,
+                engagement REAL,
+                authenticity REAL,
+                overall_score REAL,
+                emotional_state TEXT,
+                metadata TEXT
+            )
+        """)
     
     def analyze_response(
         self,
@@ -118,6 +118,7 @@ class ConversationQualityAnalyzer:
         emotional_state: Optional[Dict[str, float]] = None,
         conversation_history: Optional[List[Dict]] = None,
         conversation_id: str = "",
+        persist: bool = True,
     ) -> QualityMetrics:
         """
         Analyze a single response for quality.
@@ -128,6 +129,8 @@ class ConversationQualityAnalyzer:
             emotional_state: Demi's emotional state
             conversation_history: Prior conversation
             conversation_id: Conversation identifier
+            persist: Store metrics now (False lets the caller batch them via
+                store_metrics_batch)
             
         Returns:
             QualityMetrics with scores
@@ -157,7 +160,8 @@ class ConversationQualityAnalyzer:
         )
         
         # Store metrics
-        self._store_metrics(metrics, response, emotional_state)
+        if persist:
+            self.store_metrics_batch([(metrics, response, emotional_state)])
         
         return metrics
     
@@ -361,23 +365,21 @@ class ConversationQualityAnalyzer:
         
         return max(0.0, min(10.0, score))
     
-    def _store_metrics(
+    def store_metrics_batch(
         self,
-        metrics: QualityMetrics,
-        response: str,
-        emotional_state: Optional[Dict[str, float]]
+        entries: List[Tuple[QualityMetrics, str, Optional[Dict[str, float]]]],
     ):
-        """Store metrics in database."""
+        """Store several (metrics, response, emotional_state) entries in one transaction."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
-                    """
-                    INSERT INTO quality_metrics 
-                    (timestamp, conversation_id, response_text, persona_consistency,
-                     emotional_appropriateness, coherence, engagement, authenticity,
-                     overall_score, emotional_state, metadata)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
+            self._db.executemany(
+                """
+                INSERT INTO quality_metrics 
+                (timestamp, conversation_id, response_text, persona_consistency,
+                 emotional_appropriateness, coherence, engagement, authenticity,
+                 overall_score, emotional_state, metadata)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
                     (
                         metrics.timestamp,
                         metrics.conversation_id,
@@ -391,8 +393,9 @@ class ConversationQualityAnalyzer:
                         json.dumps(emotional_state) if emotional_state else None,
                         json.dumps({"response_length": metrics.response_length}),
                     )
-                )
-                conn.commit()
+                    for metrics, response, emotional_state in entries
+                ],
+            )
         except Exception as e:
             logger.error(f"Failed to store quality metrics: {e}")
     
@@ -410,7 +413,7 @@ class ConversationQualityAnalyzer:
         
         cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db.read() as conn:
             conn.row_factory = sqlite3.Row
             
             rows = conn.execute(
@@ -23,6 +23,7 @@ from typing import Optional, List, Dict, Any, Tuple
 from pathlib import Path
 
 from src.core.logger import get_logger
+from src.core.storage import get_database
 from src.core.config import DemiConfig
 
 logger = get_logger()
@@ -87,6 +88,7 @@ class ErrorAnalyzer:
             db_path: Path to SQLite database for error storage
         """
         self.db_path = db_path or self._get_default_db_path()
+        self._db = get_database(self.db_path)
         self._init_database()
         
         # Error patterns for detection
@@ -103,34 +105,29 @@ class ErrorAnalyzer:
     
     def _init_database(self):
         """Initialize error database."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS errors (
-                    error_id TEXT PRIMARY KEY,
-                    timestamp TEXT NOT NULL,
-                    category TEXT NOT NULL,
-                    severity INTEGER NOT NULL,
-                    user_message TEXT NOT NULL,
-                    demi_response TEXT NOT NULL,
-                    error_description TEXT NOT NULL,
-                    root_cause TEXT,
-                    proposed_correction TEXT,
-                    corrected_response TEXT,
-                    context TEXT,
-                    resolved BOOLEAN DEFAULT 0
-                )
-            """)
-            
-            # Index for querying
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_errors_category 
-                ON errors(category)
-            """)
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_errors_timestamp 
-                ON errors(timestamp)
-            """)
-            conn.commit()
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS errors (
+                error_id TEXT PRIMARY KEY,
+                timestamp TEXT NOT NULL,
+                category TEXT NOT NULL,
+                severity INTEGER NOT NULL,
+                user_message TEXT NOT NULL,
+                demi_response TEXT NOT NULL,
+                error_description TEXT NOT NULL,
+                root_cause TEXT,
+                proposed_correction TEXT,
+                corrected_response TEXT,
+                context TEXT,
+                resolved BOOLEAN DEFAULT 0
+            );
+        
+            -- Index for querying
+            CREATE INDEX IF NOT EXISTS idx_errors_category 
+            ON errors(category);
+
+            CREATE INDEX IF NOT EXISTS idx_errors_timestamp 
+            ON errors(timestamp);
+        """)
     
     def _init_patterns(self):
         """Initialize error detection patterns."""
@@ -156,6 +153,7 @@ class ErrorAnalyzer:
         demi_response: str,
         conversation_history: Optional[List[Dict]] = None,
         emotional_state: Optional[Dict] = None,
+        persist: bool = True,
     ) -> List[ErrorRecord]:
         """
         Analyze a conversation for errors.
@@ -165,6 +163,8 @@ class ErrorAnalyzer:
             demi_response: What Demi responded
             conversation_history: Prior messages
             emotional_state: Demi's emotional state during response
+            persist: Store detected errors now (False lets the caller batch
+                them via store_errors)
             
         Returns:
             List of detected errors (empty if none)
@@ -196,8 +196,8 @@ class ErrorAnalyzer:
                 errors.append(emotional)
         
         # Store detected errors
-        for error in errors:
-            self._store_error(error)
+        if persist and errors:
+            self.store_errors(errors)
         
         return errors
     
@@ -371,17 +371,17 @@ class ErrorAnalyzer:
         import uuid
         return f"err_{uuid.uuid4().hex[:12]}"
     
-    def _store_error(self, error: ErrorRecord):
-        """Store error in database."""
+    def store_errors(self, errors: List[ErrorRecord]):
+        """Store several errors in a single transaction."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
-                    """
-                    INSERT INTO errors 
-                    (error_id, timestamp, category, severity, user_message, 
-                     demi_response, error_description, root_cause, context, resolved)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
+            self._db.executemany(
+                """
+                INSERT INTO errors 
+                (error_id, timestamp, category, severity, user_message, 
+                 demi_response, error_description, root_cause, context, resolved)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
                     (
                         error.error_id,
                         error.timestamp,
@@ -394,8 +394,9 @@ class ErrorAnalyzer:
                         json.dumps(error.context) if error.context else None,
                         error.resolved,
                     )
-                )
-                conn.commit()
+                    for error in errors
+                ],
+            )
         except Exception as e:
             logger.error(f"Failed to store error: {e}")
     
@@ -416,7 +417,7 @@ class ErrorAnalyzer:
         Returns:
             List of error records
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db.read() as conn:
             conn.row_factory = sqlite3.Row
             
             query = "SELECT * FROM errors WHERE 1=1"
@@ -455,7 +456,7 @@ class ErrorAnalyzer:
     
     def get_error_stats(self) -> Dict[str, Any]:
         """Get error statistics."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db.read() as conn:
             # Total errors
             total = conn.execute("SELECT COUNT(*) FROM errors").fetchone()[0]
             
@@ -490,13 +491,11 @@ class ErrorAnalyzer:
     
     def mark_resolved(self, error_id: str, corrected_response: Optional[str] = None):
         """Mark an error as resolved."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                UPDATE errors 
-                SET resolved = 1, corrected_response = ?
-                WHERE error_id = ?
-                """,
-                (corrected_response, error_id)
-            )
-            conn.commit()
+        self._db.execute(
+            """
+            UPDATE errors 
+            SET resolved = 1, corrected_response = ?
+            WHERE error_id = ?
+            """,
+            (corrected_response, error_id)
+        )
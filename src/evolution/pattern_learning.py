@@ -8,20 +8,74 @@ Used to:
 1. Predict which strategies will work for specific issues
 2. Build "mistake notebook" for common errors
 3. Improve strategy selection over time
+
+Lookups go through a keyword -> entry inverted index (persisted in the
+pattern_keywords / mistake_keywords tables, cached in memory), so they
+touch only the patterns and mistakes that share a keyword with the query.
 """
 
 import json
 import sqlite3
+import threading
+from array import array
 from dataclasses import dataclass, asdict
-from typing import Optional, List, Dict, Any, Set
+from typing import Optional, List, Dict, Any, Set, Tuple
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 from src.core.logger import get_logger
+from src.core.storage import get_database
 
 logger = get_logger()
 
+STOP_WORDS = {'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been',
+              'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+              'could', 'should', 'may', 'might', 'can', 'this', 'that',
+              'these', 'those', 'and', 'or', 'but', 'in', 'on', 'at',
+              'to', 'for', 'of', 'with', 'by', 'from', 'as', 'it', 'its'}
+
+
+class KeywordIndex:
+    """
+    In-memory keyword -> entry inverted index.
+
+    Entry ids are mapped to dense integer slots so postings can be stored
+    as compact arrays. Entries are only ever added, never removed.
+    """
+
+    def __init__(self):
+        self.ids: List[str] = []  # slot -> entry id
+        self._slots: Dict[str, int] = {}
+        self._postings: Dict[str, array] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, entry_id: str) -> bool:
+        return entry_id in self._slots
+
+    def add(self, entry_id: str, keywords):
+        """Index an entry under each of its keywords (no-op if already indexed)."""
+        if entry_id in self._slots:
+            return
+        slot = self._slots[entry_id] = len(self.ids)
+        self.ids.append(entry_id)
+        for keyword in set(keywords):
+            postings = self._postings.get(keyword)
+            if postings is None:
+                postings = self._postings[keyword] = array("l")
+            postings.append(slot)
+
+    def match(self, keywords) -> Dict[str, int]:
+        """Return {entry_id: number of the given keywords it is indexed under}."""
+        counts: Counter = Counter()
+        for keyword in set(keywords):
+            postings = self._postings.get(keyword)
+            if postings:
+                counts.update(postings)
+        return {self.ids[slot]: count for slot, count in counts.items()}
+
 
 @dataclass
 class LearnedPattern:
@@ -87,11 +141,20 @@ class PatternLearningDB:
     def __init__(self, db_path: Optional[str] = None):
         """Initialize pattern learning database."""
         self.db_path = db_path or self._get_default_db_path()
+        self._db = get_database(self.db_path)
         self._init_database()
         
         # Cache frequently used patterns
         self._pattern_cache: Dict[str, LearnedPattern] = {}
         self._mistake_cache: Dict[str, MistakeEntry] = {}
+
+        # Inverted indexes, loaded from SQLite on first lookup
+        self._index_lock = threading.Lock()
+        self._index_loaded = False
+        self._pattern_index = KeywordIndex()
+        self._mistake_index = KeywordIndex()
+        self._pattern_by_issue: Dict[str, str] = {}  # lowercased issue -> id
+        self._mistake_by_key: Dict[Tuple[str, str], str] = {}  # (type, description) -> id
         
         logger.info("PatternLearningDB initialized")
     
@@ -103,7 +166,7 @@ class PatternLearningDB:
     
     def _init_database(self):
         """Initialize database tables."""
-        with sqlite3.connect(self.db_path) as conn:
+        def create_tables(conn):
             # Learned patterns table
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS patterns (
@@ -137,6 +200,22 @@ class PatternLearningDB:
                 )
             """)
             
+            # Inverted keyword indexes
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS pattern_keywords (
+                    keyword TEXT NOT NULL,
+                    pattern_id TEXT NOT NULL,
+                    PRIMARY KEY (keyword, pattern_id)
+                ) WITHOUT ROWID
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS mistake_keywords (
+                    keyword TEXT NOT NULL,
+                    entry_id TEXT NOT NULL,
+                    PRIMARY KEY (keyword, entry_id)
+                ) WITHOUT ROWID
+            """)
+
             # Pattern application log
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS pattern_applications (
@@ -148,8 +227,8 @@ class PatternLearningDB:
                     improvement_score REAL
                 )
             """)
-            
-            conn.commit()
+
+        self._db.write(create_tables)
     
     def learn_from_revision(
         self,
@@ -251,16 +330,14 @@ class PatternLearningDB:
         
         if existing:
             # Update count
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
-                    """
-                    UPDATE mistakes 
-                    SET times_encountered = times_encountered + 1
-                    WHERE entry_id = ?
-                    """,
-                    (existing.entry_id,)
-                )
-                conn.commit()
+            self._db.execute(
+                """
+                UPDATE mistakes 
+                SET times_encountered = times_encountered + 1
+                WHERE entry_id = ?
+                """,
+                (existing.entry_id,)
+            )
             
             existing.times_encountered += 1
             return existing.entry_id
@@ -305,13 +382,15 @@ class PatternLearningDB:
             List of relevant patterns, sorted by effectiveness
         """
         keywords = self._extract_keywords(issue_description)
+        self._ensure_index()
+        overlaps = self._pattern_index.match(keywords)
         
         # Score patterns by keyword overlap
         scored_patterns = []
         
-        for pattern in self._get_all_patterns():
+        for pattern in self._get_patterns(list(overlaps)):
             # Keyword overlap score
-            overlap = len(set(keywords) & set(pattern.trigger_keywords))
+            overlap = overlaps[pattern.pattern_id]
             
             # Success rate weight
             success_weight = pattern.success_rate()
@@ -347,29 +426,22 @@ class PatternLearningDB:
         Returns:
             List of relevant prevention tips
         """
-        response_lower = response_text.lower()
-        relevant = []
+        # Mistakes indexed under the description and example keywords
+        # that also appear as words in the response
+        self._ensure_index()
+        matches = self._mistake_index.match(self._tokenize(response_text))
         
-        for mistake in self._get_all_mistakes():
-            # Check if this mistake pattern appears in response
-            mistake_keywords = self._extract_keywords(mistake.mistake_description)
-            
-            # Or if the example is similar
-            example_keywords = self._extract_keywords(mistake.example_response)
-            
-            all_keywords = set(mistake_keywords + example_keywords)
-            matches = sum(1 for kw in all_keywords if kw in response_lower)
-            
-            if matches >= 2:  # At least 2 keyword matches
-                relevant.append((matches, mistake))
-        
-        # Sort by relevance and return
-        relevant.sort(key=lambda x: x[0], reverse=True)
-        return [m for _, m in relevant[:5]]
+        # At least 2 keyword matches, most relevant first
+        relevant = sorted(
+            ((count, entry_id) for entry_id, count in matches.items() if count >= 2),
+            reverse=True,
+        )[:5]
+        mistakes = {m.entry_id: m for m in self._get_mistakes([e for _, e in relevant])}
+        return [mistakes[e] for _, e in relevant if e in mistakes]
     
     def get_learning_summary(self) -> Dict[str, Any]:
         """Get summary of what has been learned."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db.read() as conn:
             # Pattern stats
             pattern_count = conn.execute(
                 "SELECT COUNT(*) FROM patterns"
@@ -470,35 +542,45 @@ class PatternLearningDB:
     def _extract_keywords(self, text: str) -> List[str]:
         """Extract meaningful keywords from text."""
         # Simple keyword extraction
-        stop_words = {'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been',
-                      'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-                      'could', 'should', 'may', 'might', 'can', 'this', 'that',
-                      'these', 'those', 'and', 'or', 'but', 'in', 'on', 'at',
-                      'to', 'for', 'of', 'with', 'by', 'from', 'as', 'it', 'its'}
-        
         words = text.lower().split()
         keywords = [w.strip('.,!?;:') for w in words 
-                   if len(w) > 3 and w.lower() not in stop_words]
+                   if len(w) > 3 and w.lower() not in STOP_WORDS]
         
         return keywords[:10]  # Limit to top 10
     
+    def _tokenize(self, text: str) -> Set[str]:
+        """All words of a text, normalized like keywords."""
+        return {w.strip('.,!?;:') for w in text.lower().split()}
+    
+    def _mistake_keywords(self, entry: MistakeEntry) -> Set[str]:
+        """Keywords a mistake is indexed under."""
+        return set(
+            self._extract_keywords(entry.mistake_description)
+            + self._extract_keywords(entry.example_response or "")
+        )
+    
     def _find_similar_pattern(
         self,
         issue: str,
         keywords: List[str]
     ) -> Optional[LearnedPattern]:
         """Find existing pattern similar to issue."""
-        for pattern in self._get_all_patterns():
-            # Check issue similarity
-            if issue.lower() == pattern.trigger_issue.lower():
-                return pattern
-            
-            # Check keyword overlap
-            overlap = len(set(keywords) & set(pattern.trigger_keywords))
-            if overlap >= 3:  # Significant overlap
-                return pattern
+        self._ensure_index()
         
-        return None
+        # Check issue similarity
+        pattern_id = self._pattern_by_issue.get(issue.lower())
+        
+        # Check keyword overlap
+        if pattern_id is None:
+            overlaps = self._pattern_index.match(keywords)
+            best = max(overlaps.items(), key=lambda item: item[1], default=None)
+            if best and best[1] >= 3:  # Significant overlap
+                pattern_id = best[0]
+        
+        if pattern_id is None:
+            return None
+        patterns = self._get_patterns([pattern_id])
+        return patterns[0] if patterns else None
     
     def _find_similar_mistake(
         self,
@@ -506,16 +588,18 @@ class PatternLearningDB:
         description: str
     ) -> Optional[MistakeEntry]:
         """Find existing mistake entry similar to new one."""
-        for entry in self._get_all_mistakes():
-            if (entry.mistake_type == mistake_type and
-                entry.mistake_description.lower() == description.lower()):
-                return entry
-        
-        return None
+        self._ensure_index()
+        entry_id = self._mistake_by_key.get((mistake_type, description.lower()))
+        if entry_id is None:
+            return None
+        mistakes = self._get_mistakes([entry_id])
+        return mistakes[0] if mistakes else None
     
     def _store_pattern(self, pattern: LearnedPattern):
-        """Store pattern in database."""
-        with sqlite3.connect(self.db_path) as conn:
+        """Store pattern and its keyword postings in database and index."""
+        keywords = set(pattern.trigger_keywords)
+        
+        def store(conn):
             conn.execute(
                 """
                 INSERT INTO patterns 
@@ -537,11 +621,22 @@ class PatternLearningDB:
                     pattern.avg_improvement,
                 )
             )
-            conn.commit()
+            conn.executemany(
+                "INSERT OR IGNORE INTO pattern_keywords (keyword, pattern_id) VALUES (?, ?)",
+                [(kw, pattern.pattern_id) for kw in keywords]
+            )
+        
+        self._db.write(store)
+        with self._index_lock:
+            if self._index_loaded:
+                self._pattern_index.add(pattern.pattern_id, keywords)
+                self._pattern_by_issue.setdefault(pattern.trigger_issue.lower(), pattern.pattern_id)
     
     def _store_mistake(self, entry: MistakeEntry):
-        """Store mistake entry in database."""
-        with sqlite3.connect(self.db_path) as conn:
+        """Store mistake entry and its keyword postings in database and index."""
+        keywords = self._mistake_keywords(entry)
+        
+        def store(conn):
             conn.execute(
                 """
                 INSERT INTO mistakes 
@@ -564,7 +659,91 @@ class PatternLearningDB:
                     entry.successfully_prevented,
                 )
             )
-            conn.commit()
+            conn.executemany(
+                "INSERT OR IGNORE INTO mistake_keywords (keyword, entry_id) VALUES (?, ?)",
+                [(kw, entry.entry_id) for kw in keywords]
+            )
+        
+        self._db.write(store)
+        with self._index_lock:
+            if self._index_loaded:
+                self._mistake_index.add(entry.entry_id, keywords)
+                self._mistake_by_key.setdefault(
+                    (entry.mistake_type, entry.mistake_description.lower()), entry.entry_id
+                )
+    
+    def _ensure_index(self):
+        """Load the inverted indexes into memory on first use.
+        
+        Patterns and mistakes stored before the keyword tables existed are
+        indexed (and persisted) here as well.
+        """
+        if self._index_loaded:
+            return
+        with self._index_lock:
+            if self._index_loaded:
+                return
+            
+            def backfill(conn):
+                missing = conn.execute(
+                    """
+                    SELECT pattern_id, trigger_keywords FROM patterns
+                    WHERE pattern_id NOT IN (SELECT pattern_id FROM pattern_keywords)
+                    """
+                ).fetchall()
+                conn.executemany(
+                    "INSERT OR IGNORE INTO pattern_keywords (keyword, pattern_id) VALUES (?, ?)",
+                    [(kw, pid) for pid, kws in missing for kw in set(json.loads(kws))]
+                )
+                missing = conn.execute(
+                    """
+                    SELECT * FROM mistakes
+                    WHERE entry_id NOT IN (SELECT entry_id FROM mistake_keywords)
+                    """
+                ).fetchall()
+                conn.executemany(
+                    "INSERT OR IGNORE INTO mistake_keywords (keyword, entry_id) VALUES (?, ?)",
+                    [
+                        (kw, row[0])
+                        for row in missing
+                        for kw in self._mistake_keywords(self._row_to_mistake(row))
+                    ]
+                )
+            
+            self._db.write(backfill)
+            
+            with self._db.read() as conn:
+                postings = defaultdict(list)
+                for keyword, pattern_id in conn.execute(
+                    "SELECT keyword, pattern_id FROM pattern_keywords"
+                ):
+                    postings[pattern_id].append(keyword)
+                for pattern_id, keywords in postings.items():
+                    self._pattern_index.add(pattern_id, keywords)
+                
+                postings = defaultdict(list)
+                for keyword, entry_id in conn.execute(
+                    "SELECT keyword, entry_id FROM mistake_keywords"
+                ):
+                    postings[entry_id].append(keyword)
+                for entry_id, keywords in postings.items():
+                    self._mistake_index.add(entry_id, keywords)
+                
+                for pattern_id, issue in conn.execute(
+                    "SELECT pattern_id, trigger_issue FROM patterns ORDER BY rowid"
+                ):
+                    self._pattern_by_issue.setdefault(issue.lower(), pattern_id)
+                for entry_id, mistake_type, description in conn.execute(
+                    "SELECT entry_id, mistake_type, mistake_description FROM mistakes ORDER BY rowid"
+                ):
+                    self._mistake_by_key.setdefault((mistake_type, description.lower()), entry_id)
+            
+            self._index_loaded = True
+            logger.debug(
+                "Pattern keyword index loaded",
+                patterns=len(self._pattern_index),
+                mistakes=len(self._mistake_index),
+            )
     
     def _update_pattern_stats(
         self,
@@ -573,62 +752,80 @@ class PatternLearningDB:
         improvement_score: float
     ):
         """Update pattern statistics."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                UPDATE patterns 
-                SET times_applied = times_applied + 1,
-                    times_successful = times_successful + ?,
-                    avg_improvement = (avg_improvement * times_applied + ?) / (times_applied + 1)
-                WHERE pattern_id = ?
-                """,
-                (1 if was_successful else 0, improvement_score, pattern_id)
-            )
-            conn.commit()
+        self._db.execute(
+            """
+            UPDATE patterns 
+            SET times_applied = times_applied + 1,
+                times_successful = times_successful + ?,
+                avg_improvement = (avg_improvement * times_applied + ?) / (times_applied + 1)
+            WHERE pattern_id = ?
+            """,
+            (1 if was_successful else 0, improvement_score, pattern_id)
+        )
     
     def _get_all_patterns(self) -> List[LearnedPattern]:
         """Get all patterns from database."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db.read() as conn:
             rows = conn.execute("SELECT * FROM patterns").fetchall()
-            
-            patterns = []
-            for row in rows:
-                patterns.append(LearnedPattern(
-                    pattern_id=row['pattern_id'],
-                    timestamp=row['timestamp'],
-                    trigger_issue=row['trigger_issue'],
-                    trigger_keywords=json.loads(row['trigger_keywords']),
-                    effective_strategy=row['effective_strategy'],
-                    before_example=row['before_example'],
-                    after_example=row['after_example'],
-                    times_applied=row['times_applied'],
-                    times_successful=row['times_successful'],
-                    avg_improvement=row['avg_improvement'],
-                ))
-            
-            return patterns
+        return [self._row_to_pattern(row) for row in rows]
     
     def _get_all_mistakes(self) -> List[MistakeEntry]:
         """Get all mistake entries from database."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db.read() as conn:
             rows = conn.execute("SELECT * FROM mistakes").fetchall()
-            
-            mistakes = []
-            for row in rows:
-                mistakes.append(MistakeEntry(
-                    entry_id=row['entry_id'],
-                    timestamp=row['timestamp'],
-                    mistake_type=row['mistake_type'],
-                    mistake_description=row['mistake_description'],
-                    example_response=row['example_response'],
-                    correction_strategy=row['correction_strategy'],
-                    corrected_response=row['corrected_response'],
-                    root_cause=row['root_cause'],
-                    prevention_tip=row['prevention_tip'],
-                    times_encountered=row['times_encountered'],
-                    successfully_prevented=row['successfully_prevented'],
-                ))
-            
-            return mistakes
+        return [self._row_to_mistake(row) for row in rows]
+    
+    def _get_patterns(self, pattern_ids: List[str]) -> List[LearnedPattern]:
+        """Get patterns by ID."""
+        rows = self._fetch_by_ids("patterns", "pattern_id", pattern_ids)
+        return [self._row_to_pattern(row) for row in rows]
+    
+    def _get_mistakes(self, entry_ids: List[str]) -> List[MistakeEntry]:
+        """Get mistake entries by ID."""
+        rows = self._fetch_by_ids("mistakes", "entry_id", entry_ids)
+        return [self._row_to_mistake(row) for row in rows]
+    
+    def _fetch_by_ids(self, table: str, id_column: str, ids: List[str]) -> List[sqlite3.Row]:
+        """Fetch rows by primary key, in chunks that fit SQLite's variable limit."""
+        rows = []
+        with self._db.read(sqlite3.Row) as conn:
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                rows.extend(conn.execute(
+                    f"SELECT * FROM {table} WHERE {id_column} IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall())
+        return rows
+    
+    @staticmethod
+    def _row_to_pattern(row) -> LearnedPattern:
+        """Convert a patterns row to a LearnedPattern."""
+        return LearnedPattern(
+            pattern_id=row[0],
+            timestamp=row[1],
+            trigger_issue=row[2],
+            trigger_keywords=json.loads(row[3]),
+            effective_strategy=row[4],
+            before_example=row[5],
+            after_example=row[6],
+            times_applied=row[7],
+            times_successful=row[8],
+            avg_improvement=row[9],
+        )
+    
+    @staticmethod
+    def _row_to_mistake(row) -> MistakeEntry:
+        """Convert a mistakes row to a MistakeEntry."""
+        return MistakeEntry(
+            entry_id=row[0],
+            timestamp=row[1],
+            mistake_type=row[2],
+            mistake_description=row[3],
+            example_response=row[4],
+            correction_strategy=row[5],
+            corrected_response=row[6],
+            root_cause=row[7],
+            prevention_tip=row[8],
+            times_encountered=row[9],
+            successfully_prevented=row[10],
+        )
@@ -0,0 +1,453 @@
+"""
+Asynchronous Self-Evolution Pipeline
+
+Runs the self-evolution analyzers after a response has been delivered
+instead of on the request hot path:
+1. Bounded in-process queue (drops or samples work when saturated)
+2. Worker task(s) that process queued jobs in batches off the event loop
+3. One database transaction per store per batch instead of one per record
+4. Per-stage latency breakdown for monitoring
+
+Only the revision step may stay on the user-facing path, and only when
+configured as blocking (it can change the delivered response).
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from src.core.logger import get_logger
+from src.emotion.models import EmotionalState
+from src.evolution.change_tracker import ChangeTracker
+from src.evolution.conversation_quality import ConversationQualityAnalyzer
+from src.evolution.error_analyzer import ErrorAnalyzer
+from src.evolution.response_revisor import ResponseRevisor, RevisionSession
+from src.evolution.self_critique import SelfCritique
+from src.evolution.self_reward import SelfRewarder
+from src.monitoring.metrics import MetricType, get_metrics_collector
+
+logger = get_logger()
+
+STAGES = ("revision", "error_analysis", "quality", "critique", "reward", "persist")
+
+
+@dataclass
+class EvolutionJob:
+    """A delivered response waiting for self-evolution analysis."""
+
+    user_message: str
+    response: str
+    emotional_state: Optional[EmotionalState] = None
+    conversation_id: str = ""
+
+    # Set when revision already ran on the hot path (blocking mode)
+    revision_session: Optional[RevisionSession] = None
+    was_revised: bool = False
+    revision_improvement: float = 0.0
+
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class StageStats:
+    """Latency accumulator for one pipeline stage."""
+
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def add(self, elapsed_ms: float):
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "total_ms": round(self.total_ms, 3),
+        }
+
+
+class EvolutionPipeline:
+    """
+    Background queue that runs self-evolution analysis after delivery.
+
+    Features:
+    - Bounded queue; sheds load by sampling above a high-water mark and
+      dropping when full
+    - Batched processing in a worker thread so analyzers never block the loop
+    - Batched SQLite writes via the analyzers' bulk store methods
+    - Per-stage latency stats (get_stats) and metrics
+    """
+
+    def __init__(
+        self,
+        error_analyzer: ErrorAnalyzer,
+        quality_analyzer: ConversationQualityAnalyzer,
+        self_critique: SelfCritique,
+        self_rewarder: SelfRewarder,
+        change_tracker: ChangeTracker,
+        response_revisor: ResponseRevisor,
+        blocking_revision: bool = True,
+        max_queue_size: int = 256,
+        batch_size: int = 16,
+        workers: int = 1,
+        sample_threshold: float = 0.75,
+        sample_every: int = 4,
+    ):
+        """
+        Initialize evolution pipeline.
+
+        Args:
+            error_analyzer: ErrorAnalyzer instance
+            quality_analyzer: ConversationQualityAnalyzer instance
+            self_critique: SelfCritique instance
+            self_rewarder: SelfRewarder instance
+            change_tracker: ChangeTracker for recording applied revisions
+            response_revisor: ResponseRevisor instance
+            blocking_revision: Revision runs on the hot path (and may change the
+                delivered response); otherwise it runs here as analysis only
+            max_queue_size: Jobs queued before new work is dropped
+            batch_size: Maximum jobs processed (and persisted) per batch
+            workers: Number of worker tasks (batches still run one at a time;
+                extra workers only collect the next batch while one runs)
+            sample_threshold: Queue fill fraction above which work is sampled
+            sample_every: Keep one in N jobs while above the threshold
+        """
+        if max_queue_size <= 0:
+            raise ValueError("max_queue_size must be greater than 0")
+        if batch_size <= 0:
+            raise ValueError("batch_size must be greater than 0")
+        if workers <= 0:
+            raise ValueError("workers must be greater than 0")
+
+        self.error_analyzer = error_analyzer
+        self.quality_analyzer = quality_analyzer
+        self.self_critique = self_critique
+        self.self_rewarder = self_rewarder
+        self.change_tracker = change_tracker
+        self.response_revisor = response_revisor
+
+        self.blocking_revision = blocking_revision
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.num_workers = workers
+        self.sample_threshold = sample_threshold
+        self.sample_every = max(1, sample_every)
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._workers: List[asyncio.Task] = []
+        # Analyzers, stage stats and counters are not thread-safe
+        self._batch_lock = threading.Lock()
+
+        self._stage_stats: Dict[str, StageStats] = {s: StageStats() for s in STAGES}
+        self._queue_wait = StageStats()
+        self._submitted = 0
+        self._processed = 0
+        self._dropped = 0
+        self._sampled_out = 0
+        self._batches = 0
+        self._sample_counter = 0
+
+    @classmethod
+    def from_config(cls, settings: Dict[str, Any], **analyzers) -> "EvolutionPipeline":
+        """
+        Build a pipeline from the conductor 'evolution' config section.
+
+        Args:
+            settings: Dict with blocking_revision, queue_size, batch_size, workers
+            **analyzers: Analyzer instances passed through to __init__
+
+        Returns:
+            EvolutionPipeline instance
+        """
+        return cls(
+            blocking_revision=settings.get("blocking_revision", True),
+            max_queue_size=settings.get("queue_size", 256),
+            batch_size=settings.get("batch_size", 16),
+            workers=settings.get("workers", 1),
+            **analyzers,
+        )
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of jobs waiting to be processed."""
+        return self._queue.qsize() if self._queue else 0
+
+    def submit(self, job: EvolutionJob) -> bool:
+        """
+        Queue a job for background analysis.
+
+        Processes the job inline if no event loop is running.
+
+        Args:
+            job: EvolutionJob to analyze
+
+        Returns:
+            True if accepted, False if dropped or sampled out
+        """
+        self._submitted += 1
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._process_batch([job])
+            return True
+
+        self._ensure_started(loop)
+        depth = self._queue.qsize()
+
+        if depth >= self.max_queue_size:
+            self._dropped += 1
+            logger.warning("Evolution queue full, dropping analysis job")
+            return False
+
+        if depth >= self.max_queue_size * self.sample_threshold:
+            self._sample_counter += 1
+            if self._sample_counter % self.sample_every:
+                self._sampled_out += 1
+                return False
+
+        self._queue.put_nowait(job)
+        return True
+
+    def start(self):
+        """Start worker tasks on the running event loop."""
+        self._ensure_started(asyncio.get_running_loop())
+
+    async def stop(self, drain_timeout: float = 5.0):
+        """
+        Stop workers, first giving queued jobs a chance to finish.
+
+        Args:
+            drain_timeout: Seconds to wait for the queue to drain
+        """
+        if not self._workers:
+            return
+
+        if self._loop is asyncio.get_running_loop():
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout=drain_timeout)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"Evolution pipeline stopped with {self.queue_depth} jobs pending"
+                )
+
+            for task in self._workers:
+                task.cancel()
+            await asyncio.gather(*self._workers, return_exceptions=True)
+
+        self._workers = []
+        self._queue = None
+        self._loop = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pipeline statistics.
+
+        Returns:
+            Dict with queue counters, batch count and per-stage latency
+        """
+        return {
+            "blocking_revision": self.blocking_revision,
+            "queue_depth": self.queue_depth,
+            "max_queue_size": self.max_queue_size,
+            "submitted": self._submitted,
+            "processed": self._processed,
+            "dropped": self._dropped,
+            "sampled_out": self._sampled_out,
+            "batches": self._batches,
+            "queue_wait": self._queue_wait.to_dict(),
+            "stages": {name: stats.to_dict() for name, stats in self._stage_stats.items()},
+        }
+
+    def _ensure_started(self, loop: asyncio.AbstractEventLoop):
+        """Create the queue and workers for this event loop if needed."""
+        if self._loop is loop and self._workers:
+            return
+
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._workers = [
+            loop.create_task(self._worker(i)) for i in range(self.num_workers)
+        ]
+        logger.debug(f"Evolution pipeline started ({self.num_workers} workers)")
+
+    async def _worker(self, worker_id: int):
+        """Pull batches from the queue and analyze them in a thread."""
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            try:
+                await asyncio.to_thread(self._process_batch, batch)
+            except Exception as e:
+                logger.error(f"Evolution worker {worker_id} batch failed: {e}")
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    def _process_batch(self, jobs: List[EvolutionJob]):
+        """Run all analysis stages for a batch and persist results together."""
+        with self._batch_lock:
+            self._analyze_batch(jobs)
+
+    def _analyze_batch(self, jobs: List[EvolutionJob]):
+        now = time.monotonic()
+        errors = []
+        quality_entries = []
+        rewards = []
+        sessions = []
+        timings: Dict[str, List[float]] = {s: [] for s in STAGES}
+
+        for job in jobs:
+            self._queue_wait.add((now - job.enqueued_at) * 1000)
+            emotion_dict = job.emotional_state.to_dict() if job.emotional_state else None
+
+            if job.revision_session is not None:
+                sessions.append(job.revision_session)
+            elif not self.blocking_revision:
+                start = time.perf_counter()
+                try:
+                    sessions.append(self.response_revisor.revise_response(
+                        original_response=job.response,
+                        user_message=job.user_message,
+                        emotional_state=job.emotional_state,
+                        persist=False,
+                    ))
+                except Exception as e:
+                    logger.warning(f"Background revision failed: {e}")
+                timings["revision"].append((time.perf_counter() - start) * 1000)
+
+            start = time.perf_counter()
+            job_errors = self.error_analyzer.analyze_conversation(
+                user_message=job.user_message,
+                demi_response=job.response,
+                emotional_state=emotion_dict,
+                persist=False,
+            )
+            timings["error_analysis"].append((time.perf_counter() - start) * 1000)
+            if job_errors:
+                errors.extend(job_errors)
+                logger.info(
+                    f"Detected {len(job_errors)} issues in response",
+                    error_categories=[e.category.value for e in job_errors]
+                )
+
+            start = time.perf_counter()
+            quality = self.quality_analyzer.analyze_response(
+                response=job.response,
+                user_message=job.user_message,
+                emotional_state=emotion_dict,
+                conversation_id=job.conversation_id,
+                persist=False,
+            )
+            timings["quality"].append((time.perf_counter() - start) * 1000)
+            quality_entries.append((quality, job.response, emotion_dict))
+            logger.debug(
+                "Quality metrics",
+                overall=round(quality.overall_score, 2),
+                persona=round(quality.persona_consistency, 2),
+                emotional=round(quality.emotional_appropriateness, 2),
+            )
+
+            start = time.perf_counter()
+            critique = self.self_critique.critique_response(
+                response=job.response,
+                user_message=job.user_message,
+                emotional_state=job.emotional_state,
+                generate_revision=False,  # Don't regenerate, just analyze
+            )
+            timings["critique"].append((time.perf_counter() - start) * 1000)
+            if critique.issues:
+                self._log_critique(critique)
+
+            start = time.perf_counter()
+            reward = self.self_rewarder.compute_reward(
+                response=job.response,
+                user_message=job.user_message,
+                emotional_state=job.emotional_state,
+                conversation_id=job.conversation_id,
+                persist=False,
+            )
+            timings["reward"].append((time.perf_counter() - start) * 1000)
+            rewards.append(reward)
+            logger.debug(
+                "Reward signal computed",
+                final_score=round(reward.final_score, 2),
+                rule_score=round(reward.rule_based_score, 2),
+            )
+
+        start = time.perf_counter()
+        self._persist(jobs, errors, quality_entries, rewards, sessions)
+        timings["persist"].append((time.perf_counter() - start) * 1000)
+
+        self._processed += len(jobs)
+        self._batches += 1
+        self._record_timings(timings)
+
+    def _persist(self, jobs, errors, quality_entries, rewards, sessions):
+        """Write a batch's results with one transaction per store."""
+        if errors:
+            self.error_analyzer.store_errors(errors)
+        if quality_entries:
+            self.quality_analyzer.store_metrics_batch(quality_entries)
+        if rewards:
+            self.self_rewarder.store_rewards(rewards)
+        if sessions:
+            self.response_revisor.store_sessions(sessions)
+
+        for job in jobs:
+            if job.was_revised:
+                # Record this as a successful improvement
+                self.change_tracker.record_change(
+                    category="quality_improvement",
+                    files_modified=[],
+                    description="Auto-revised response for better quality",
+                    rationale=(
+                        "Self-critique identified improvement opportunity "
+                        f"(+{job.revision_improvement:.1f} score)"
+                    ),
+                    auto_commit=False,
+                    auto_approve=True,
+                )
+
+    def _record_timings(self, timings: Dict[str, List[float]]):
+        """Fold batch timings into stage stats and export them as metrics."""
+        collector = None
+        try:
+            collector = get_metrics_collector()
+        except Exception as e:
+            logger.debug(f"Metrics unavailable for evolution pipeline: {e}")
+
+        for stage, values in timings.items():
+            for elapsed_ms in values:
+                self._stage_stats[stage].add(elapsed_ms)
+                if collector:
+                    collector.record(
+                        "evolution_stage_ms",
+                        elapsed_ms,
+                        MetricType.HISTOGRAM,
+                        labels={"stage": stage},
+                    )
+
+    @staticmethod
+    def _log_critique(critique):
+        logger.debug(
+            "Self-critique identified issues",
+            issues_count=len(critique.issues),
+            avg_score=round((critique.consistency_score +
+                            critique.emotional_alignment_score +
+                            critique.appropriateness_score +
+                            critique.engagement_score) / 4, 2)
+        )
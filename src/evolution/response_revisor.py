@@ -19,6 +19,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 from src.core.logger import get_logger
+from src.core.storage import get_database
 from src.emotion.models import EmotionalState
 from src.evolution.self_critique import SelfCritique, CritiqueResult
 
@@ -141,6 +142,7 @@ Make it unmistakably ME.
             db_path: Path to SQLite database for storing revision history
         """
         self.db_path = db_path or self._get_default_db_path()
+        self._db = get_database(self.db_path)
         self.critique = SelfCritique()
         self._init_database()
         
@@ -157,7 +159,7 @@ Make it unmistakably ME.
     
     def _init_database(self):
         """Initialize revision database."""
-        with sqlite3.connect(self.db_path) as conn:
+        def create_tables(conn):
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS revisions (
                     session_id TEXT PRIMARY KEY,
@@ -181,7 +183,8 @@ Make it unmistakably ME.
                     avg_improvement REAL DEFAULT 0
                 )
             """)
-            conn.commit()
+
+        self._db.write(create_tables)
     
     def revise_response(
         self,
@@ -190,6 +193,7 @@ Make it unmistakably ME.
         emotional_state: Optional[EmotionalState] = None,
         max_variants: int = 3,
         use_wait_token: bool = True,
+        persist: bool = True,
     ) -> RevisionSession:
         """
         Revise a response to improve quality.
@@ -200,6 +204,8 @@ Make it unmistakably ME.
             emotional_state: Current emotional state
             max_variants: How many variants to generate
             use_wait_token: Use "Wait," technique for better self-correction
+            persist: Store the session now (False lets the caller batch it via
+                store_sessions)
             
         Returns:
             RevisionSession with all variants and selection
@@ -256,11 +262,9 @@ Make it unmistakably ME.
             session.selected_variant_id = best_variant.variant_id
             session.improvement_delta = best_variant.overall_score - original_score
         
-        # Step 5: Store session
-        self._store_session(session)
-        
-        # Step 6: Update strategy effectiveness
-        self._update_strategy_stats(session)
+        # Step 5: Store session and update strategy effectiveness
+        if persist:
+            self.store_sessions([session])
         
         logger.debug(
             f"Revision complete: {session.session_id}",
@@ -504,11 +508,11 @@ Make it unmistakably ME.
         # If scores are similar, prefer original (avoid over-optimization)
         return None
     
-    def _store_session(self, session: RevisionSession):
-        """Store revision session in database."""
+    def store_sessions(self, sessions: List[RevisionSession]):
+        """Store revision sessions and their strategy stats in one transaction."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
+            def store(conn):
+                conn.executemany(
                     """
                     INSERT INTO revisions 
                     (session_id, timestamp, original_response, user_message,
@@ -516,72 +520,75 @@ Make it unmistakably ME.
                      improvement_delta, used_revision)
                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
                     """,
-                    (
-                        session.session_id,
-                        session.timestamp,
-                        session.original_response,
-                        session.user_message,
-                        json.dumps(session.emotional_state) if session.emotional_state else None,
-                        json.dumps([v.to_dict() for v in session.variants]),
-                        session.selected_variant_id,
-                        session.improvement_delta,
-                        bool(session.selected_variant_id),
-                    )
+                    [
+                        (
+                            session.session_id,
+                            session.timestamp,
+                            session.original_response,
+                            session.user_message,
+                            json.dumps(session.emotional_state) if session.emotional_state else None,
+                            json.dumps([v.to_dict() for v in session.variants]),
+                            session.selected_variant_id,
+                            session.improvement_delta,
+                            bool(session.selected_variant_id),
+                        )
+                        for session in sessions
+                    ],
                 )
-                conn.commit()
+                for session in sessions:
+                    self._update_strategy_stats(session, conn)
+
+            self._db.write(store)
         except Exception as e:
             logger.error(f"Failed to store revision session: {e}")
     
-    def _update_strategy_stats(self, session: RevisionSession):
-        """Update strategy effectiveness statistics."""
+    def _update_strategy_stats(self, session: RevisionSession, conn: sqlite3.Connection):
+        """Update strategy effectiveness statistics (caller commits)."""
         for variant in session.variants:
             strategy = variant.strategy
             
-            with sqlite3.connect(self.db_path) as conn:
-                # Get current stats
-                row = conn.execute(
-                    "SELECT * FROM strategy_stats WHERE strategy = ?",
-                    (strategy.value,)
-                ).fetchone()
+            # Get current stats
+            row = conn.execute(
+                "SELECT * FROM strategy_stats WHERE strategy = ?",
+                (strategy.value,)
+            ).fetchone()
+            
+            if row:
+                times_used = row[1] + 1
+                times_selected = row[2] + (1 if variant.selected else 0)
                 
-                if row:
-                    times_used = row[1] + 1
-                    times_selected = row[2] + (1 if variant.selected else 0)
-                    
-                    # Update average improvement
-                    if session.selected_variant_id == variant.variant_id:
-                        old_avg = row[3] or 0
-                        new_avg = (old_avg * (times_used - 1) + session.improvement_delta) / times_used
-                    else:
-                        new_avg = row[3] or 0
-                    
-                    conn.execute(
-                        """
-                        UPDATE strategy_stats 
-                        SET times_used = ?, times_selected = ?, avg_improvement = ?
-                        WHERE strategy = ?
-                        """,
-                        (times_used, times_selected, new_avg, strategy.value)
-                    )
+                # Update average improvement
+                if session.selected_variant_id == variant.variant_id:
+                    old_avg = row[3] or 0
+                    new_avg = (old_avg * (times_used - 1) + session.improvement_delta) / times_used
                 else:
-                    conn.execute(
-                        """
-                        INSERT INTO strategy_stats 
-                        (strategy, times_used, times_selected, avg_improvement)
-                        VALUES (?, 1, ?, ?)
-                        """,
-                        (
-                            strategy.value,
-                            1 if variant.selected else 0,
-                            session.improvement_delta if variant.selected else 0,
-                        )
-                    )
+                    new_avg = row[3] or 0
                 
-                conn.commit()
+                conn.execute(
+                    """
+                    UPDATE strategy_stats 
+                    SET times_used = ?, times_selected = ?, avg_improvement = ?
+                    WHERE strategy = ?
+                    """,
+                    (times_used, times_selected, new_avg, strategy.value)
+                )
+            else:
+                conn.execute(
+                    """
+                    INSERT INTO strategy_stats 
+                    (strategy, times_used, times_selected, avg_improvement)
+                    VALUES (?, 1, ?, ?)
+                    """,
+                    (
+                        strategy.value,
+                        1 if variant.selected else 0,
+                        session.improvement_delta if variant.selected else 0,
+                    )
+                )
     
     def get_strategy_effectiveness(self) -> Dict[str, Any]:
         """Get effectiveness stats for each strategy."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db.read() as conn:
             conn.row_factory = sqlite3.Row
             rows = conn.execute(
                 "SELECT * FROM strategy_stats ORDER BY avg_improvement DESC"
@@ -604,7 +611,7 @@ Make it unmistakably ME.
     
     def get_revision_stats(self) -> Dict[str, Any]:
         """Get overall revision statistics."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db.read() as conn:
             # Total sessions
             total = conn.execute("SELECT COUNT(*) FROM revisions").fetchone()[0]
             
@@ -659,7 +666,21 @@ Make it unmistakably ME.
             emotional_state=emotional_state,
             max_variants=3,
         )
+        return self.pick_best(session, min_improvement)
+    
+    def pick_best(
+        self, session: RevisionSession, min_improvement: float = 0.5
+    ) -> Tuple[str, bool, float]:
+        """
+        Choose between the original and the selected variant of a session.
         
+        Args:
+            session: Completed revision session
+            min_improvement: Minimum improvement threshold
+            
+        Returns:
+            Tuple of (best_response, was_revised, improvement_score)
+        """
         if session.selected_variant_id and session.improvement_delta >= min_improvement:
             # Find the selected variant
             for variant in session.variants:
@@ -667,4 +688,4 @@ Make it unmistakably ME.
                     return variant.response_text, True, session.improvement_delta
         
         # Return original if no improvement
-        return original_response, False, 0.0
+        return session.original_response, False, 0.0
@@ -19,6 +19,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 from src.core.logger import get_logger
+from src.core.storage import get_database
 from src.emotion.models import EmotionalState
 
 logger = get_logger()
@@ -94,6 +95,7 @@ class SelfRewarder:
     def __init__(self, db_path: Optional[str] = None):
         """Initialize self-rewarder."""
         self.db_path = db_path or self._get_default_db_path()
+        self._db = get_database(self.db_path)
         self._init_database()
         
         # Statistics
@@ -109,23 +111,21 @@ class SelfRewarder:
     
     def _init_database(self):
         """Initialize reward database."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS rewards (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp TEXT NOT NULL,
-                    conversation_id TEXT,
-                    response_text TEXT,
-                    user_message TEXT,
-                    rule_based_score REAL,
-                    llm_based_score REAL,
-                    meta_judged_score REAL,
-                    final_score REAL,
-                    reasoning TEXT,
-                    emotional_state TEXT
-                )
-            """)
-            conn.commit()
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS rewards (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TEXT NOT NULL,
+                conversation_id TEXT,
+                response_text TEXT,
+                user_message TEXT,
+                rule_based_score REAL,
+                llm_based_score REAL,
+                meta_judged_score REAL,
+                final_score REAL,
+                reasoning TEXT,
+                emotional_state TEXT
+            )
+        """)
     
     def compute_reward(
         self,
@@ -133,6 +133,7 @@ class SelfRewarder:
         user_message: str,
         emotional_state: Optional[EmotionalState] = None,
         conversation_id: str = "",
+        persist: bool = True,
     ) -> RewardSignal:
         """
         Compute reward signal for a response.
@@ -142,6 +143,8 @@ class SelfRewarder:
             user_message: User's message
             emotional_state: Current emotional state
             conversation_id: Conversation identifier
+            persist: Store the reward now (False lets the caller batch it via
+                store_rewards)
             
         Returns:
             RewardSignal with composite score
@@ -175,7 +178,8 @@ class SelfRewarder:
         signal.reasoning = self._generate_reasoning(signal)
         
         # Store reward
-        self._store_reward(signal)
+        if persist:
+            self.store_rewards([signal])
         self.reward_history.append(signal)
         
         return signal
@@ -356,18 +360,18 @@ class SelfRewarder:
         
         return "\n".join(parts)
     
-    def _store_reward(self, signal: RewardSignal):
-        """Store reward in database."""
+    def store_rewards(self, signals: List[RewardSignal]):
+        """Store several rewards in a single transaction."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
-                    """
-                    INSERT INTO rewards 
-                    (timestamp, conversation_id, response_text, user_message,
-                     rule_based_score, llm_based_score, meta_judged_score,
-                     final_score, reasoning, emotional_state)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
+            self._db.executemany(
+                """
+                INSERT INTO rewards 
+                (timestamp, conversation_id, response_text, user_message,
+                 rule_based_score, llm_based_score, meta_judged_score,
+                 final_score, reasoning, emotional_state)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
                     (
                         signal.timestamp,
                         signal.conversation_id,
@@ -380,8 +384,9 @@ class SelfRewarder:
                         signal.reasoning,
                         json.dumps(signal.emotional_state) if signal.emotional_state else None,
                     )
-                )
-                conn.commit()
+                    for signal in signals
+                ],
+            )
         except Exception as e:
             logger.error(f"Failed to store reward: {e}")
     
@@ -410,7 +415,7 @@ class SelfRewarder:
     
     def get_reward_stats(self) -> Dict[str, Any]:
         """Get reward statistics."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db.read() as conn:
             conn.row_factory = sqlite3.Row
             
             # Overall stats
@@ -464,7 +469,7 @@ class SelfRewarder:
         Returns:
             List of preference pairs
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db.read() as conn:
             conn.row_factory = sqlite3.Row
             
             # Find pairs from same conversation context
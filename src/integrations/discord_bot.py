@@ -1086,6 +1086,14 @@ class DiscordBot(BasePlatform):
                 await self.voice_client.leave_all_channels()
                 self.logger.info("Voice client shutdown")
 
+                # Let in-flight transcriptions finish off the event loop
+                from src.voice.stt_engine import close_stt_engine
+                await asyncio.to_thread(close_stt_engine)
+
+            # Flush voice transcripts to disk
+            from src.integrations.voice_transcript_logger import close_voice_logger
+            close_voice_logger()
+
             # Shutdown ramble task
             if self.ramble_task:
                 self.ramble_task.stop()
@@ -11,6 +11,9 @@ Environment Variables:
     DISCORD_VOICE_ENABLED: Enable voice features (default: "false")
     DISCORD_WAKE_WORD: Wake word to activate (default: "Demi")
     DISCORD_VOICE_TIMEOUT_SEC: Seconds of silence before leaving (default: 300)
+    DISCORD_MAX_UTTERANCE_SEC: Longest utterance before it is split (default: 10)
+    DISCORD_VAD_HANGOVER_MS: Silence that ends an utterance (default: 500)
+    DISCORD_STT_INTERIM_MS: Interim transcript interval, 0 to disable (default: 0)
 """
 
 import os
@@ -28,15 +31,19 @@ import discord
 from discord.ext import commands
 
 from src.core.logger import get_logger
+from src.llm.scheduler import RequestPriority
+from src.voice.pcm_buffer import PCMRingBuffer, PCM_BYTES_PER_SECOND
 
 # Import voice components (may be implemented in parallel)
 try:
     from src.voice.stt import SpeechToText, TranscriptionResult
+    from src.voice.interim import InterimTranscriber
     HAS_STT = True
 except ImportError:
     HAS_STT = False
     SpeechToText = None
     TranscriptionResult = None
+    InterimTranscriber = None
 
 try:
     from src.voice.tts import TextToSpeech
@@ -46,11 +53,12 @@ except ImportError:
     TextToSpeech = None
 
 try:
-    from src.voice.vad import VoiceActivityDetector
+    from src.voice.vad import VoiceActivityDetector, SpeechSegmenter
     HAS_VAD = True
 except ImportError:
     HAS_VAD = False
     VoiceActivityDetector = None
+    SpeechSegmenter = None
 
 try:
     from src.models.emotional_state import EmotionalState
@@ -144,12 +152,23 @@ class STTSink(discord.sinks.Sink if HAS_VOICE_RECEIVE else object):
     MAX_ERRORS_PER_MINUTE = 60
     CIRCUIT_BREAKER_COOLDOWN = 30  # seconds
     
+    # Audio forwarded per call: one 30 ms VAD frame when the voice client
+    # segments speech itself, otherwise fixed 1 second chunks
+    SEGMENTED_FORWARD_BYTES = 960
+    CHUNKED_FORWARD_BYTES = PCM_BYTES_PER_SECOND
+    
     def __init__(self, voice_client: "DiscordVoiceClient", guild_id: int, *, filters=None):
         super().__init__(filters=filters)
         self.voice_client = voice_client
         self.guild_id = guild_id
         self.logger = get_logger()
-        self.audio_data: Dict[int, bytes] = {}
+        # Per-speaker ring buffers, written from the decode thread
+        self.audio_data: Dict[int, PCMRingBuffer] = {}
+        self._audio_lock = threading.Lock()
+        self._buffer_capacity = int(voice_client.max_utterance_sec * PCM_BYTES_PER_SECOND)
+        self._forward_bytes = (
+            self.SEGMENTED_FORWARD_BYTES if voice_client.vad else self.CHUNKED_FORWARD_BYTES
+        )
         self._loop = asyncio.get_event_loop()
         
         # Error tracking
@@ -182,9 +201,11 @@ class STTSink(discord.sinks.Sink if HAS_VOICE_RECEIVE else object):
             self._track_error("empty_packet")
             return
             
-        if user_id not in self.audio_data:
-            self.audio_data[user_id] = b""
-        self.audio_data[user_id] += data
+        with self._audio_lock:
+            buffer = self.audio_data.get(user_id)
+            if buffer is None:
+                buffer = self.audio_data[user_id] = PCMRingBuffer(self._buffer_capacity)
+            buffer.append(data)
         
         # Process audio for this user (use threadsafe since called from DecodeManager thread)
         asyncio.run_coroutine_threadsafe(self._process_user_audio(user_id), self._loop)
@@ -232,19 +253,15 @@ class STTSink(discord.sinks.Sink if HAS_VOICE_RECEIVE else object):
         Args:
             user_id: Discord user ID
         """
-        if user_id not in self.audio_data:
-            return
-            
-        audio = self.audio_data[user_id]
-        if len(audio) < 16000 * 2 * 1:  # At least 1 second of audio
-            return
+        with self._audio_lock:
+            buffer = self.audio_data.get(user_id)
+            if buffer is None or len(buffer) < self._forward_bytes:
+                return
             
-        # Clear buffer
-        self.audio_data[user_id] = b""
+            # Copy out and clear buffer
+            audio = buffer.take()
         
-        # Get user info from bot
-        user = self.voice_client.bot.get_user(user_id)
-        username = user.name if user else f"User_{user_id}"
+        username = self.voice_client._get_username(user_id)
         
         # Process through voice client
         await self.voice_client._handle_incoming_audio(
@@ -253,7 +270,8 @@ class STTSink(discord.sinks.Sink if HAS_VOICE_RECEIVE else object):
         
     def cleanup(self):
         """Cleanup when recording stops."""
-        self.audio_data.clear()
+        with self._audio_lock:
+            self.audio_data.clear()
         
         # Log final stats
         if self._total_packets_received > 0:
@@ -287,6 +305,8 @@ class VoiceSession:
         is_listening: Whether currently listening for commands
         is_speaking: Whether currently speaking/playing audio
         wake_word_detected: Whether wake word has been detected
+        wake_ack_user_id: User whose wake word was already acknowledged from
+            an interim transcript, before their utterance finished
         pending_audio_buffer: Accumulated audio data for processing
         user_speaking_start: When current user started speaking
         current_user_id: ID of user currently speaking
@@ -300,6 +320,7 @@ class VoiceSession:
     is_listening: bool = True
     is_speaking: bool = False
     wake_word_detected: bool = False
+    wake_ack_user_id: Optional[int] = None
     pending_audio_buffer: bytes = field(default_factory=bytes)
     user_speaking_start: Optional[datetime] = None
     current_user_id: Optional[int] = None
@@ -307,10 +328,14 @@ class VoiceSession:
 
 
 class AudioBuffer:
-    """Thread-safe audio buffer for voice data."""
+    """Thread-safe audio buffer for one speaker's voice data.
+    
+    Backed by a preallocated ring, so appending a packet is O(packet) and
+    audio beyond max_size drops the oldest bytes.
+    """
     
     def __init__(self, max_size: int = 16000 * 2 * 10):  # 10 seconds at 16kHz
-        self._buffer = b""
+        self._buffer = PCMRingBuffer(max_size)
         self._lock = threading.Lock()
         self.max_size = max_size
         self.user_id: Optional[int] = None
@@ -328,11 +353,7 @@ class AudioBuffer:
                 self.speech_start = datetime.now()
                 self.user_id = user_id
             
-            self._buffer += data
-            
-            # Trim if exceeds max size
-            if len(self._buffer) > self.max_size:
-                self._buffer = self._buffer[-self.max_size:]
+            self._buffer.append(data)
             
             return is_new_speech
     
@@ -343,9 +364,8 @@ class AudioBuffer:
             Tuple of (audio_data, user_id)
         """
         with self._lock:
-            data = self._buffer
+            data = self._buffer.take()
             user_id = self.user_id or 0
-            self._buffer = b""
             self.speech_start = None
             self.user_id = None
             return data, user_id
@@ -353,15 +373,14 @@ class AudioBuffer:
     def clear(self):
         """Clear buffer."""
         with self._lock:
-            self._buffer = b""
+            self._buffer.clear()
             self.speech_start = None
             self.user_id = None
     
     @property
     def duration_ms(self) -> float:
         """Get duration of buffered audio in milliseconds."""
-        # 16kHz, 16-bit = 32000 bytes per second
-        return (len(self._buffer) / 32000) * 1000
+        return self._buffer.duration_ms
     
     def __len__(self) -> int:
         with self._lock:
@@ -406,7 +425,11 @@ class DiscordVoiceClient:
         
         # Initialize voice components if available
         if HAS_STT:
-            self.stt = SpeechToText()
+            # Utterances are transcribed in memory; set a directory to also
+            # keep them as WAV files for debugging
+            self.stt = SpeechToText(
+                debug_capture_dir=os.getenv("DISCORD_STT_CAPTURE_DIR") or None
+            )
         else:
             self.stt = None
             self.logger.warning("STT not available - voice transcription disabled")
@@ -426,12 +449,32 @@ class DiscordVoiceClient:
         # Active voice sessions by guild_id
         self.sessions: Dict[int, VoiceSession] = {}
         
-        # Audio buffers per guild
-        self._audio_buffers: Dict[int, AudioBuffer] = {}
+        # Audio buffers per guild, one per speaker (used without VAD)
+        self._audio_buffers: Dict[int, Dict[int, AudioBuffer]] = {}
+        
+        # Streaming speech segmenters per guild, one per speaker
+        self._segmenters: Dict[int, Dict[int, SpeechSegmenter]] = {}
+        
+        # Per-speaker timers finishing an utterance when packets stop arriving
+        self._segment_timers: Dict[int, Dict[int, asyncio.TimerHandle]] = {}
+        
+        # Per-speaker interim transcription of the utterance in progress
+        self._interims: Dict[int, Dict[int, InterimTranscriber]] = {}
+        
+        # Finished utterances per guild, in the order they ended:
+        # (user_id, username, transcription task)
+        self._utterance_queues: Dict[int, asyncio.Queue] = {}
         
         # Configuration
         self.wake_word = os.getenv("DISCORD_WAKE_WORD", "Demi")
         self.voice_timeout_sec = int(os.getenv("DISCORD_VOICE_TIMEOUT_SEC", "300"))
+        # Longest utterance per speaker; longer speech is split at this length
+        self.max_utterance_sec = float(os.getenv("DISCORD_MAX_UTTERANCE_SEC", "10"))
+        # Trailing silence after which an utterance is finished
+        self.vad_hangover_ms = int(os.getenv("DISCORD_VAD_HANGOVER_MS", "500"))
+        # Re-decode interval for interim transcripts while a user is still
+        # speaking (0 disables them)
+        self.stt_interim_ms = int(os.getenv("DISCORD_STT_INTERIM_MS", "0"))
         self.listen_after_response = True  # Always-listening mode
         
         # Opus decoder (initialized lazily)
@@ -439,6 +482,7 @@ class DiscordVoiceClient:
         
         # Running tasks for cleanup
         self._listen_tasks: Dict[int, asyncio.Task] = {}
+        self._utterance_workers: Dict[int, asyncio.Task] = {}
         
         # Voice recording sinks per guild
         self._voice_sinks: Dict[int, STTSink] = {}
@@ -496,7 +540,11 @@ class DiscordVoiceClient:
             )
             
             self.sessions[guild_id] = session
-            self._audio_buffers[guild_id] = AudioBuffer()
+            self._audio_buffers[guild_id] = {}
+            self._segmenters[guild_id] = {}
+            self._segment_timers[guild_id] = {}
+            self._interims[guild_id] = {}
+            self._start_utterance_worker(guild_id)
             
             # Start voice listening
             await self._on_voice_connect(voice_client)
@@ -721,9 +769,16 @@ class DiscordVoiceClient:
         if guild_id in self.sessions:
             del self.sessions[guild_id]
         
-        # Clean up audio buffer
+        # Clean up audio buffers and segmenters
         if guild_id in self._audio_buffers:
             del self._audio_buffers[guild_id]
+        self._segmenters.pop(guild_id, None)
+        for timer in self._segment_timers.pop(guild_id, {}).values():
+            timer.cancel()
+        for interim in self._interims.pop(guild_id, {}).values():
+            interim.reset()
+        
+        await self._stop_utterance_worker(guild_id)
     
     async def _voice_listen_loop(self, voice_client: discord.VoiceClient):
         """Main listening loop for voice channel.
@@ -811,31 +866,193 @@ class DiscordVoiceClient:
             if not pcm_data:
                 return
             
-            # Get or create audio buffer for guild
-            buffer = self._audio_buffers.get(guild_id)
-            if not buffer:
-                return
-            
-            # Add to buffer
-            is_new_speech = buffer.append(pcm_data, user_id)
-            
-            if is_new_speech:
-                session.last_activity = datetime.now()
+            session.last_activity = datetime.now()
+            self._segment_audio(session, user_id, self._get_username(user_id), pcm_data)
             
-            # Run VAD on latest frame if available
-            if HAS_VAD and self.vad:
-                is_speech = self._detect_speech(pcm_data)
-                
-                if is_speech:
-                    session.last_activity = datetime.now()
-                else:
-                    # Speech ended - process buffer
-                    if buffer.speech_start and buffer.duration_ms > 500:
-                        await self._process_utterance(session, buffer)
-                        
         except Exception as e:
             self.logger.error(f"Error processing audio: {e}")
     
+    def _segment_audio(
+        self,
+        session: VoiceSession,
+        user_id: int,
+        username: str,
+        pcm_data: bytes
+    ):
+        """Feed a speaker's PCM into segmentation and queue finished utterances.
+        
+        With VAD, each 30 ms frame is classified once as it arrives and an
+        utterance is queued as soon as its trailing silence (or the maximum
+        length) is reached; while it is in progress, interim transcripts
+        are produced if enabled. Without VAD, audio is queued in 2 second
+        chunks.
+        
+        Args:
+            session: Active voice session
+            user_id: Discord user ID
+            username: Discord username
+            pcm_data: 16kHz mono 16-bit PCM
+        """
+        segmenter = self._get_segmenter(session.guild_id, user_id)
+        if segmenter is not None:
+            interim = self._get_interim(session.guild_id, user_id)
+            for segment in segmenter.feed(pcm_data):
+                self._enqueue_utterance(session, user_id, username, segment, interim)
+            
+            if interim and segmenter.is_speech_active:
+                speech = segmenter.buffer
+                partial = interim.poll(speech.pending_ms, speech.pending_audio)
+                if partial:
+                    self._on_interim_transcript(session, user_id, username, partial)
+            
+            self._schedule_segment_flush(session, user_id, username)
+            return
+        
+        buffer = self._get_audio_buffer(session.guild_id, user_id)
+        if buffer is None:
+            return
+        
+        buffer.append(pcm_data, user_id)
+        if buffer.duration_ms >= 2000:  # 2 seconds of audio
+            audio_data, _ = buffer.get_and_clear()
+            self._enqueue_utterance(session, user_id, username, audio_data)
+    
+    def _schedule_segment_flush(self, session: VoiceSession, user_id: int, username: str):
+        """(Re)arm the timer that finishes a speaker's utterance when their audio stops.
+        
+        Discord stops sending packets when a user stops transmitting, so the
+        trailing silence that would end the segment may never be fed.
+        """
+        timers = self._segment_timers.get(session.guild_id)
+        if timers is None:
+            return
+        
+        timer = timers.pop(user_id, None)
+        if timer:
+            timer.cancel()
+        timers[user_id] = asyncio.get_running_loop().call_later(
+            self.vad_hangover_ms / 1000,
+            self._flush_segmenter, session, user_id, username,
+        )
+    
+    def _flush_segmenter(self, session: VoiceSession, user_id: int, username: str):
+        """Finish a speaker's active utterance after their audio stopped."""
+        self._segment_timers.get(session.guild_id, {}).pop(user_id, None)
+        segmenter = self._segmenters.get(session.guild_id, {}).get(user_id)
+        if segmenter is None:
+            return
+        
+        interim = self._get_interim(session.guild_id, user_id)
+        segment = segmenter.flush()
+        if segment:
+            self._enqueue_utterance(session, user_id, username, segment, interim)
+        elif interim:
+            interim.reset()
+    
+    def _get_interim(self, guild_id: int, user_id: int) -> Optional[InterimTranscriber]:
+        """Get or create a speaker's interim transcriber.
+        
+        Args:
+            guild_id: Discord guild ID
+            user_id: Discord user ID
+            
+        Returns:
+            InterimTranscriber, or None if interim transcripts are disabled
+        """
+        if not self.stt_interim_ms or not HAS_STT or not self.stt:
+            return None
+        
+        interims = self._interims.get(guild_id)
+        if interims is None:
+            return None
+        
+        interim = interims.get(user_id)
+        if interim is None:
+            interim = InterimTranscriber.for_stt(
+                self.stt,
+                interval_ms=self.stt_interim_ms,
+                max_window_ms=int(self.max_utterance_sec * 1000),
+            )
+            interims[user_id] = interim
+        return interim
+    
+    def _on_interim_transcript(
+        self,
+        session: VoiceSession,
+        user_id: int,
+        username: str,
+        result: "TranscriptionResult"
+    ):
+        """Act on a transcript of speech still in progress.
+        
+        Acknowledges the wake word as soon as it is heard, instead of once
+        the whole utterance has ended and been transcribed.
+        
+        Args:
+            session: Active voice session
+            user_id: Discord user ID
+            username: Discord username
+            result: Interim transcription (is_final=False)
+        """
+        self.logger.debug(f"[VOICE interim] {username}: {result.text}")
+        
+        if self.listen_after_response or session.wake_word_detected:
+            return
+        if session.wake_ack_user_id is not None:
+            return
+        
+        if self._check_wake_word(result.text):
+            self.logger.info(f"Wake word heard from {username} (interim)")
+            session.wake_ack_user_id = user_id
+            asyncio.create_task(self._play_wake_acknowledgment(session.voice_client))
+    
+    def _get_segmenter(self, guild_id: int, user_id: int) -> Optional[SpeechSegmenter]:
+        """Get or create a speaker's speech segmenter.
+        
+        Args:
+            guild_id: Discord guild ID
+            user_id: Discord user ID
+            
+        Returns:
+            SpeechSegmenter, or None without VAD or an active session
+        """
+        if not HAS_VAD or not self.vad:
+            return None
+        
+        segmenters = self._segmenters.get(guild_id)
+        if segmenters is None:
+            return None
+        
+        segmenter = segmenters.get(user_id)
+        if segmenter is None:
+            segmenter = SpeechSegmenter(
+                self.vad,
+                hangover_ms=self.vad_hangover_ms,
+                max_utterance_ms=int(self.max_utterance_sec * 1000),
+            )
+            segmenters[user_id] = segmenter
+        return segmenter
+    
+    def _get_audio_buffer(self, guild_id: int, user_id: int) -> Optional[AudioBuffer]:
+        """Get or create a speaker's audio buffer.
+        
+        Args:
+            guild_id: Discord guild ID
+            user_id: Discord user ID
+            
+        Returns:
+            AudioBuffer, or None if the guild has no active session
+        """
+        buffers = self._audio_buffers.get(guild_id)
+        if buffers is None:
+            return None
+        
+        buffer = buffers.get(user_id)
+        if buffer is None:
+            buffer = AudioBuffer(int(self.max_utterance_sec * PCM_BYTES_PER_SECOND))
+            buffers[user_id] = buffer
+        return buffer
+    
     async def _handle_incoming_audio(
         self,
         guild_id: int,
@@ -862,63 +1079,113 @@ class DiscordVoiceClient:
         if not pcm_data:
             return
         
-        # Add to buffer
-        buffer = self._audio_buffers.get(guild_id)
-        if not buffer:
-            return
-        
-        is_new_speech = buffer.append(pcm_data, user_id)
-        
         # Update session activity
         session.last_activity = datetime.now()
         
-        # Check if we should process (enough audio accumulated)
-        if buffer.duration_ms >= 2000:  # 2 seconds of audio
-            await self._process_audio_buffer(session, buffer, user_id, username)
+        self._segment_audio(session, user_id, username, pcm_data)
     
-    async def _process_audio_buffer(
+    def _enqueue_utterance(
         self,
         session: VoiceSession,
-        buffer: AudioBuffer,
         user_id: int,
-        username: str
+        username: str,
+        audio_data: bytes,
+        interim: Optional[InterimTranscriber] = None
     ):
-        """Process audio buffer and transcribe.
+        """Start transcribing a finished utterance and queue it for a reply.
+        
+        Transcription starts immediately (utterances from different speakers
+        decode in parallel on the STT engine); the guild's utterance worker
+        handles the results in the order the utterances ended.
         
         Args:
             session: Active voice session
-            buffer: Audio buffer
             user_id: Discord user ID
             username: Discord username
+            audio_data: Utterance PCM audio
+            interim: Speaker's interim transcriber; only the audio it has
+                not committed yet is decoded
         """
-        audio_data, _ = buffer.get_and_clear()
-        
-        if len(audio_data) < 6400:  # Min 200ms
+        queue = self._utterance_queues.get(session.guild_id)
+        if len(audio_data) < 6400 or queue is None:  # Min 200ms
+            if interim:
+                interim.reset()
             return
         
-        # Transcribe
-        transcription = await self._transcribe_audio(audio_data)
-        if not transcription or not transcription.text:
-            return
-        
-        text = transcription.text.strip()
-        if not text:
+        if interim:
+            task = asyncio.ensure_future(interim.finish(audio_data))
+        else:
+            task = asyncio.create_task(self._transcribe_audio(audio_data))
+        queue.put_nowait((user_id, username, task))
+    
+    def _start_utterance_worker(self, guild_id: int):
+        """Create a guild's utterance queue and start its worker."""
+        if guild_id in self._utterance_workers:
             return
-        
-        # Log user speech
-        self.transcript_logger.log_user_speech(
-            text=text,
-            guild_id=session.guild_id,
-            channel_id=session.channel_id,
-            user_id=user_id,
-            username=username,
-            session_id=session.session_id
+        queue: asyncio.Queue = asyncio.Queue()
+        self._utterance_queues[guild_id] = queue
+        self._utterance_workers[guild_id] = asyncio.create_task(
+            self._utterance_worker(guild_id, queue)
         )
+    
+    async def _stop_utterance_worker(self, guild_id: int):
+        """Stop a guild's utterance worker and drop queued utterances."""
+        queue = self._utterance_queues.pop(guild_id, None)
+        task = self._utterance_workers.pop(guild_id, None)
+        
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
         
-        self.logger.info(f"[VOICE] {username}: {text}")
+        while queue is not None and not queue.empty():
+            _, _, transcription_task = queue.get_nowait()
+            transcription_task.cancel()
+    
+    async def _utterance_worker(self, guild_id: int, queue: asyncio.Queue):
+        """Reply to a guild's utterances one at a time, in order.
         
-        # Process command
-        await self._process_utterance_text(session, user_id, username, text)
+        Args:
+            guild_id: Discord guild ID
+            queue: Queue of (user_id, username, transcription task)
+        """
+        while True:
+            user_id, username, transcription_task = await queue.get()
+            try:
+                transcription = await transcription_task
+                session = self.sessions.get(guild_id)
+                if not session:
+                    continue
+                
+                text = transcription.text.strip() if transcription else ""
+                if not text:
+                    # Nothing to answer; drop an early wake acknowledgment
+                    if session.wake_ack_user_id == user_id:
+                        session.wake_ack_user_id = None
+                    continue
+                
+                # Log user speech
+                self.transcript_logger.log_user_speech(
+                    text=text,
+                    guild_id=session.guild_id,
+                    channel_id=session.channel_id,
+                    user_id=user_id,
+                    username=username,
+                    session_id=session.session_id
+                )
+                
+                self.logger.info(f"[VOICE] {username}: {text}")
+                
+                # Process command
+                await self._process_utterance_text(session, user_id, username, text)
+                
+            except asyncio.CancelledError:
+                transcription_task.cancel()
+                raise
+            except Exception as e:
+                self.logger.error(f"Error processing utterance: {e}")
     
     async def _process_utterance_text(
         self,
@@ -935,6 +1202,11 @@ class DiscordVoiceClient:
             username: Discord username
             text: Transcribed text
         """
+        # Wake word already acknowledged while this utterance was in progress
+        acknowledged = session.wake_ack_user_id == user_id
+        if acknowledged:
+            session.wake_ack_user_id = None
+        
         # Safety check first
         allowed, reason = self.safety_guard.check_safety(
             user_id=user_id,
@@ -949,10 +1221,11 @@ class DiscordVoiceClient:
         
         # Check for wake word (unless in always-listening mode)
         if not session.wake_word_detected and not self.listen_after_response:
-            if self._check_wake_word(text):
+            if acknowledged or self._check_wake_word(text):
                 self.logger.info(f"Wake word detected from {username}")
                 session.wake_word_detected = True
-                await self._play_wake_acknowledgment(session.voice_client)
+                if not acknowledged:
+                    await self._play_wake_acknowledgment(session.voice_client)
                 
                 # If only wake word, wait for more
                 if len(text.split()) <= 2:
@@ -1001,7 +1274,9 @@ class DiscordVoiceClient:
                 "content": f"[Voice from {username}] {text}"
             }]
             
-            response = await self.conductor.request_inference(messages)
+            response = await self.conductor.request_inference(
+                messages, priority=RequestPriority.VOICE
+            )
             
             if isinstance(response, dict):
                 return response.get("content", "")
@@ -1087,61 +1362,6 @@ class DiscordVoiceClient:
             # Clear speaking state
             self.safety_guard.set_speaking_state(False)
     
-    async def _process_utterance(self, session: VoiceSession, buffer: AudioBuffer):
-        """Process completed utterance through STT.
-        
-        Args:
-            session: Active voice session
-            buffer: Audio buffer containing utterance
-        """
-        # Get buffer contents and clear
-        audio_data, user_id = buffer.get_and_clear()
-        
-        # Skip if buffer too small
-        if len(audio_data) < 3200:  # Min 100ms
-            return
-        
-        # Skip if STT not available
-        if not HAS_STT or not self.stt:
-            return
-        
-        try:
-            # Transcribe audio
-            transcription = await self._transcribe_audio(audio_data)
-            
-            if not transcription or not transcription.text:
-                return
-            
-            text = transcription.text.strip()
-            self.logger.info(f"Transcribed: '{text}' from user {user_id}")
-            
-            # Check for wake word if not already active
-            if not session.wake_word_detected:
-                if self._check_wake_word(text):
-                    self.logger.info(f"Wake word detected from user {user_id}")
-                    session.wake_word_detected = True
-                    
-                    # Play acknowledgment sound
-                    await self._play_wake_acknowledgment(session.voice_client)
-                    
-                    # If only wake word spoken, wait for more
-                    if len(text.split()) <= 2:
-                        return
-                else:
-                    # No wake word, ignore (unless always-listening mode)
-                    if not self.listen_after_response:
-                        return
-            
-            # Process through Conductor
-            await self._process_voice_command(session, user_id, text)
-            
-            # Reset wake word detection for next interaction
-            if not self.listen_after_response:
-                session.wake_word_detected = False
-                
-        except Exception as e:
-            self.logger.error(f"Error processing utterance: {e}")
-    
     async def _transcribe_audio(self, audio_buffer: bytes) -> Optional["TranscriptionResult"]:
         """Transcribe audio buffer using STT.
         
@@ -1155,29 +1375,8 @@ class DiscordVoiceClient:
             return None
         
         try:
-            # Create temporary WAV file for STT
-            import wave
-            
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-                tmp_path = tmp.name
-                
-                # Write WAV file
-                with wave.open(tmp_path, 'wb') as wav_file:
-                    wav_file.setnchannels(1)  # Mono
-                    wav_file.setsampwidth(2)  # 16-bit
-                    wav_file.setframerate(16000)  # 16kHz
-                    wav_file.writeframes(audio_buffer)
-            
-            # Transcribe using STT
-            result = await self.stt.transcribe_file(tmp_path)
-            
-            # Clean up temp file
-            try:
-                os.remove(tmp_path)
-            except Exception:
-                pass
-            
-            return result
+            # PCM goes to the model in memory (16kHz mono 16-bit)
+            return await self.stt.transcribe_audio_bytes(audio_buffer, 16000)
             
         except Exception as e:
             self.logger.error(f"Transcription error: {e}")
@@ -1224,7 +1423,9 @@ class DiscordVoiceClient:
             
             # Request inference from Conductor
             if self.conductor:
-                response = await self.conductor.request_inference(messages)
+                response = await self.conductor.request_inference(
+                    messages, priority=RequestPriority.VOICE
+                )
             else:
                 response = "I'm not connected to my brain right now."
             
@@ -1410,6 +1611,11 @@ class DiscordVoiceClient:
         except Exception as e:
             self.logger.warning(f"Failed to clean up audio file: {e}")
     
+    def _get_username(self, user_id: int) -> str:
+        """Get a Discord user's name, or a placeholder if not cached."""
+        user = self.bot.get_user(user_id)
+        return user.name if user else f"User_{user_id}"
+    
     def _check_wake_word(self, text: str) -> bool:
         """Check if text contains wake word (case-insensitive).
         
@@ -1483,36 +1689,6 @@ class DiscordVoiceClient:
             self.logger.debug(f"Opus decode error: {e}")
             return b""
     
-    def _detect_speech(self, pcm_data: bytes) -> bool:
-        """Run VAD on PCM audio.
-        
-        Args:
-            pcm_data: PCM audio data
-            
-        Returns:
-            True if speech detected
-        """
-        if not HAS_VAD or not self.vad:
-            # Fallback: assume speech if we have enough data
-            return len(pcm_data) > 1600  # > 50ms at 16kHz
-        
-        try:
-            # VAD expects 30ms frames at 16kHz = 480 samples = 960 bytes (16-bit)
-            frame_duration_ms = 30
-            frame_size = int(16000 * frame_duration_ms / 1000) * 2
-            
-            if len(pcm_data) < frame_size:
-                return False
-            
-            # Take last frame
-            frame = pcm_data[-frame_size:]
-            
-            return self.vad.is_speech(frame, 16000)
-            
-        except Exception as e:
-            self.logger.debug(f"VAD error: {e}")
-            return False
-    
     async def _play_join_sound(self, voice_client: discord.VoiceClient):
         """Play optional join sound when entering channel.
         
@@ -30,6 +30,7 @@ from telegram.error import TelegramError
 
 from src.platforms.base import BasePlatform, PluginHealth
 from src.core.logger import get_logger
+from src.llm.scheduler import RequestPriority
 from src.integrations.telegram_formatters import (
     escape_markdown_v2,
     format_telegram_response,
@@ -145,7 +146,9 @@ class TelegramRambleTask:
                     prompt = self._get_ramble_prompt(trigger)
                     messages = [{"role": "user", "content": prompt}]
 
-                    response = await self.conductor.request_inference(messages)
+                    response = await self.conductor.request_inference(
+                        messages, priority=RequestPriority.AUTONOMOUS
+                    )
 
                     # Extract content from response
                     if isinstance(response, dict):
@@ -5,19 +5,39 @@ Logs:
 - What Demi says (TTS responses)
 - Timestamps and speaker identification
 - Guild/channel context
+
+Transcripts are stored as append-only JSONL segments, one or more per day
+(a new segment starts when the current one reaches max_segment_bytes).
+Each segment has a sidecar ".idx" file with the offset, length, guild,
+session and speaker of every entry, so recent-entry and per-session
+lookups seek straight to the lines they need instead of parsing the whole
+day. Segments from previous days are gzip-compressed.
 """
 
+import gzip
 import json
 import os
+import re
+import shutil
+import threading
+import time
+from array import array
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass, asdict
 
 from src.core.logger import get_logger
 
 logger = get_logger()
 
+# Start a new segment once the current one reaches this size
+DEFAULT_MAX_SEGMENT_BYTES = 16 * 1024 * 1024
+
+# Appends are flushed to the OS immediately and fsynced at most this often
+DEFAULT_FSYNC_INTERVAL_SECONDS = 2.0
+
+_SEGMENT_PATTERN = re.compile(r"^voice_transcript_(\d{4}-\d{2}-\d{2})(?:\.(\d+))?\.jsonl$")
 
 @dataclass
 class VoiceTranscriptEntry:
@@ -35,18 +55,136 @@ class VoiceTranscriptEntry:
         return asdict(self)
 
 
+class _TranscriptSegment:
+    """One JSONL segment file and its in-memory index."""
+
+    def __init__(self, path: Path, part: int):
+        self.path = path
+        self.part = part
+        self.index_path = path.with_name(path.name + ".idx")
+
+        # Per-entry columns, by position in the segment
+        self.offsets = array("q")
+        self.lengths = array("l")
+        self.guilds: List[int] = []
+        self.sessions: List[Optional[str]] = []
+        self.speakers: List[str] = []
+
+        # Positions of entries per guild and per session
+        self.by_guild: Dict[int, array] = {}
+        self.by_session: Dict[str, array] = {}
+
+        # End of the last indexed entry
+        self.indexed_size = 0
+
+    def add(
+        self,
+        offset: int,
+        length: int,
+        guild_id: int,
+        session_id: Optional[str],
+        speaker_type: str,
+    ):
+        """Index an entry stored at offset."""
+        position = len(self.offsets)
+        self.offsets.append(offset)
+        self.lengths.append(length)
+        self.guilds.append(guild_id)
+        self.sessions.append(session_id)
+        self.speakers.append(speaker_type)
+        self.by_guild.setdefault(guild_id, array("l")).append(position)
+        if session_id:
+            self.by_session.setdefault(session_id, array("l")).append(position)
+        self.indexed_size = offset + length
+
+    @staticmethod
+    def index_line(
+        offset: int,
+        length: int,
+        guild_id: int,
+        session_id: Optional[str],
+        speaker_type: str,
+    ) -> str:
+        """Sidecar index line for an entry."""
+        return json.dumps([offset, length, guild_id, session_id, speaker_type]) + "\n"
+
+    def load(self):
+        """Load the sidecar index, re-indexing entries it is missing.
+
+        Index lines are written after their data line, so after a crash the
+        index can only lag behind the data; the missing tail is recovered by
+        scanning the segment from the last indexed offset.
+        """
+        data_size = self.path.stat().st_size if self.path.exists() else 0
+        rewrite = False
+
+        if self.index_path.exists():
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        offset, length, guild_id, session_id, speaker_type = json.loads(line)
+                    except (ValueError, TypeError):
+                        rewrite = True
+                        break
+                    if offset + length > data_size:
+                        rewrite = True
+                        break
+                    self.add(offset, length, guild_id, session_id, speaker_type)
+
+        if self.indexed_size < data_size:
+            rewrite = True
+            with open(self.path, "rb") as f:
+                f.seek(self.indexed_size)
+                offset = self.indexed_size
+                for raw in f:
+                    if not raw.endswith(b"\n"):
+                        break  # Partial line from an interrupted write
+                    try:
+                        entry = json.loads(raw)
+                        self.add(
+                            offset,
+                            len(raw),
+                            entry.get("guild_id"),
+                            entry.get("session_id"),
+                            entry.get("speaker_type", ""),
+                        )
+                    except (ValueError, AttributeError):
+                        pass
+                    offset += len(raw)
+
+        if rewrite:
+            with open(self.index_path, "w", encoding="utf-8") as f:
+                for position, offset in enumerate(self.offsets):
+                    f.write(self.index_line(
+                        offset,
+                        self.lengths[position],
+                        self.guilds[position],
+                        self.sessions[position],
+                        self.speakers[position],
+                    ))
+
+
 class VoiceTranscriptLogger:
     """Logger for voice channel conversations.
     
     Logs both user speech (via STT) and Demi's responses (TTS).
-    Creates daily log files for easy organization.
+    Creates daily log files for easy organization, split into segments of
+    at most max_segment_bytes. Writes go through a persistent handle;
+    lookups use the per-segment index and read only the entries returned.
     """
     
-    def __init__(self, log_dir: Optional[str] = None):
+    def __init__(
+        self,
+        log_dir: Optional[str] = None,
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+        fsync_interval_seconds: float = DEFAULT_FSYNC_INTERVAL_SECONDS,
+    ):
         """Initialize transcript logger.
         
         Args:
             log_dir: Directory to store transcript logs. Defaults to ~/.demi/voice_logs
+            max_segment_bytes: Size at which a new segment is started
+            fsync_interval_seconds: Minimum time between fsyncs of the log
         """
         if log_dir:
             self.log_dir = Path(log_dir)
@@ -54,15 +192,138 @@ class VoiceTranscriptLogger:
             self.log_dir = Path.home() / ".demi" / "voice_logs"
         
         self.log_dir.mkdir(parents=True, exist_ok=True)
-        self._current_file: Optional[Path] = None
-        self._entries: list = []
+        self.max_segment_bytes = max_segment_bytes
+        self.fsync_interval_seconds = fsync_interval_seconds
+
+        self._lock = threading.Lock()
+        self._date: Optional[str] = None
+        self._segments: List[_TranscriptSegment] = []  # Today's, oldest first
+
+        # Append handles for the newest segment, opened on first write
+        self._data_file = None
+        self._index_file = None
+        self._data_size = 0
+        self._last_fsync = 0.0
+        self._compress_thread: Optional[threading.Thread] = None
+
+        with self._lock:
+            self._check_date()
         
         logger.info(f"VoiceTranscriptLogger initialized: {self.log_dir}")
     
     def _get_log_file(self) -> Path:
-        """Get log file for current date."""
+        """Get the segment new entries are appended to."""
+        with self._lock:
+            self._check_date()
+            if self._segments:
+                return self._segments[-1].path
+            return self._segment_path(self._date, 0)
+
+    def _segment_path(self, date_str: str, part: int) -> Path:
+        if part == 0:
+            return self.log_dir / f"voice_transcript_{date_str}.jsonl"
+        return self.log_dir / f"voice_transcript_{date_str}.{part}.jsonl"
+
+    def _check_date(self):
+        """Switch to today's segments when the date changes (lock held)."""
         date_str = datetime.now().strftime("%Y-%m-%d")
-        return self.log_dir / f"voice_transcript_{date_str}.jsonl"
+        if date_str == self._date:
+            return
+
+        self._close_files()
+        self._date = date_str
+        self._segments = []
+        for path in self.log_dir.glob(f"voice_transcript_{date_str}*.jsonl"):
+            match = _SEGMENT_PATTERN.match(path.name)
+            if match and match.group(1) == date_str:
+                self._segments.append(_TranscriptSegment(path, int(match.group(2) or 0)))
+        self._segments.sort(key=lambda segment: segment.part)
+
+        for segment in self._segments:
+            try:
+                segment.load()
+            except Exception as e:
+                logger.error(f"Failed to load voice transcript index {segment.index_path}: {e}")
+
+        self._compress_thread = threading.Thread(
+            target=self._compress_old_segments,
+            args=(date_str,),
+            name="voice-transcript-compress",
+            daemon=True,
+        )
+        self._compress_thread.start()
+
+    def _compress_old_segments(self, today: str):
+        """Gzip segments from previous days and drop their indexes."""
+        for path in sorted(self.log_dir.glob("voice_transcript_*.jsonl")):
+            match = _SEGMENT_PATTERN.match(path.name)
+            if not match or match.group(1) >= today:
+                continue
+            try:
+                compressed = path.with_name(path.name + ".gz")
+                with open(path, "rb") as src, gzip.open(compressed, "wb") as dst:
+                    shutil.copyfileobj(src, dst)
+                path.unlink()
+                path.with_name(path.name + ".idx").unlink(missing_ok=True)
+                logger.debug(f"Compressed voice transcript segment {path.name}")
+            except Exception as e:
+                logger.error(f"Failed to compress voice transcript {path}: {e}")
+
+    def _open_for_append(self, length: int):
+        """Make sure an append handle with room for length bytes is open (lock held)."""
+        if self._data_file is not None:
+            if self._data_size == 0 or self._data_size + length <= self.max_segment_bytes:
+                return
+            self._close_files()
+            part = self._segments[-1].part + 1
+            self._segments.append(_TranscriptSegment(self._segment_path(self._date, part), part))
+        elif not self._segments:
+            self._segments.append(_TranscriptSegment(self._segment_path(self._date, 0), 0))
+
+        segment = self._segments[-1]
+        self._data_file = open(segment.path, "ab")
+        self._index_file = open(segment.index_path, "a", encoding="utf-8")
+        self._data_size = self._data_file.seek(0, os.SEEK_END)
+
+        # Terminate a partial line left by an interrupted write
+        if self._data_size:
+            with open(segment.path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    self._data_file.write(b"\n")
+                    self._data_size += 1
+
+        if self._data_size + length > self.max_segment_bytes and segment.offsets:
+            # Current segment is already full: start the next one
+            self._open_for_append(length)
+
+    def _close_files(self):
+        """Flush, fsync and close the append handles (lock held)."""
+        for f in (self._data_file, self._index_file):
+            if f is not None:
+                try:
+                    f.flush()
+                    os.fsync(f.fileno())
+                    f.close()
+                except Exception as e:
+                    logger.error(f"Failed to close voice transcript file: {e}")
+        self._data_file = None
+        self._index_file = None
+        self._data_size = 0
+
+    def flush(self):
+        """Fsync pending transcript writes."""
+        with self._lock:
+            for f in (self._data_file, self._index_file):
+                if f is not None:
+                    f.flush()
+                    os.fsync(f.fileno())
+            self._last_fsync = time.monotonic()
+
+    def close(self):
+        """Flush and close the transcript files."""
+        with self._lock:
+            self._close_files()
     
     def log_user_speech(
         self,
@@ -125,14 +386,53 @@ class VoiceTranscriptLogger:
         logger.info(f"[VOICE LOG] Demi: {text[:50]}...")
     
     def _write_entry(self, entry: VoiceTranscriptEntry):
-        """Write entry to log file."""
-        log_file = self._get_log_file()
+        """Append entry to the current segment and its index."""
+        line = (json.dumps(entry.to_dict(), ensure_ascii=False) + "\n").encode("utf-8")
         
         try:
-            with open(log_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(entry.to_dict(), ensure_ascii=False) + "\n")
+            with self._lock:
+                self._check_date()
+                self._open_for_append(len(line))
+                segment = self._segments[-1]
+                offset = self._data_size
+
+                # Data before index: a crash can only leave the index behind
+                self._data_file.write(line)
+                self._data_file.flush()
+                self._index_file.write(segment.index_line(
+                    offset, len(line), entry.guild_id, entry.session_id, entry.speaker_type
+                ))
+                self._index_file.flush()
+
+                self._data_size += len(line)
+                segment.add(offset, len(line), entry.guild_id, entry.session_id, entry.speaker_type)
+
+                now = time.monotonic()
+                if now - self._last_fsync >= self.fsync_interval_seconds:
+                    os.fsync(self._data_file.fileno())
+                    os.fsync(self._index_file.fileno())
+                    self._last_fsync = now
         except Exception as e:
             logger.error(f"Failed to write voice transcript: {e}")
+
+    def _read_entries(self, locations: List[Tuple[Path, int, int]]) -> List[Dict[str, Any]]:
+        """Read and parse entries at (path, offset, length) locations, in order."""
+        entries = []
+        handles: Dict[Path, Any] = {}
+        try:
+            for path, offset, length in locations:
+                f = handles.get(path)
+                if f is None:
+                    f = handles[path] = open(path, "rb")
+                f.seek(offset)
+                try:
+                    entries.append(json.loads(f.read(length)))
+                except json.JSONDecodeError:
+                    continue
+        finally:
+            for f in handles.values():
+                f.close()
+        return entries
     
     def get_recent_transcripts(
         self,
@@ -150,28 +450,31 @@ class VoiceTranscriptLogger:
         Returns:
             List of VoiceTranscriptEntry dicts
         """
-        entries = []
-        log_file = self._get_log_file()
-        
-        if not log_file.exists():
-            return entries
+        # Walk the index newest-first and stop as soon as limit is reached
+        locations = []
+        with self._lock:
+            self._check_date()
+            for segment in reversed(self._segments):
+                if guild_id:
+                    positions = segment.by_guild.get(guild_id, ())
+                else:
+                    positions = range(len(segment.offsets))
+                for position in reversed(positions):
+                    if speaker_type and segment.speakers[position] != speaker_type:
+                        continue
+                    locations.append(
+                        (segment.path, segment.offsets[position], segment.lengths[position])
+                    )
+                    if len(locations) == limit:
+                        break
+                if len(locations) == limit:
+                    break
         
         try:
-            with open(log_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    try:
-                        entry = json.loads(line.strip())
-                        if guild_id and entry.get("guild_id") != guild_id:
-                            continue
-                        if speaker_type and entry.get("speaker_type") != speaker_type:
-                            continue
-                        entries.append(entry)
-                    except json.JSONDecodeError:
-                        continue
+            return self._read_entries(locations[::-1])
         except Exception as e:
             logger.error(f"Failed to read voice transcripts: {e}")
-        
-        return entries[-limit:]
+            return []
     
     def get_session_context(
         self,
@@ -187,28 +490,29 @@ class VoiceTranscriptLogger:
         Returns:
             Formatted conversation context string
         """
-        entries = []
-        log_file = self._get_log_file()
-        
-        if not log_file.exists():
-            return ""
+        wanted = context_turns * 2  # *2 for user+demi pairs
+        locations = []
+        with self._lock:
+            self._check_date()
+            for segment in reversed(self._segments):
+                for position in reversed(segment.by_session.get(session_id, ())):
+                    locations.append(
+                        (segment.path, segment.offsets[position], segment.lengths[position])
+                    )
+                    if len(locations) == wanted:
+                        break
+                if len(locations) == wanted:
+                    break
         
         try:
-            with open(log_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    try:
-                        entry = json.loads(line.strip())
-                        if entry.get("session_id") == session_id:
-                            entries.append(entry)
-                    except json.JSONDecodeError:
-                        continue
+            entries = self._read_entries(locations[::-1])
         except Exception as e:
             logger.error(f"Failed to read session context: {e}")
             return ""
         
         # Format as conversation
         lines = []
-        for entry in entries[-context_turns * 2:]:  # *2 for user+demi pairs
+        for entry in entries:
             speaker = entry.get("username", "Unknown")
             text = entry.get("text", "")
             lines.append(f"{speaker}: {text}")
@@ -226,3 +530,9 @@ def get_voice_logger() -> VoiceTranscriptLogger:
     if _voice_logger is None:
         _voice_logger = VoiceTranscriptLogger()
     return _voice_logger
+
+
+def close_voice_logger():
+    """Flush and close the global voice transcript logger, if one was created."""
+    if _voice_logger is not None:
+        _voice_logger.close()
@@ -12,11 +12,15 @@ from src.llm.inference import (
     UnifiedLLMInference,
     InferenceError,
     ContextOverflowError,
+    LLMOverloadedError,
+    StreamChunk,
 )
 from src.llm.prompt_builder import PromptBuilder, BASE_DEMI_PROMPT
 from src.llm.history_manager import ConversationHistory, Message
-from src.llm.response_processor import ResponseProcessor, ProcessedResponse
+from src.llm.response_processor import ResponseProcessor, ProcessedResponse, ProcessedText
 from src.llm.codebase_reader import CodebaseReader, CodeSnippet
+from src.llm.tokenizer import TokenCounter, get_token_counter
+from src.llm.scheduler import LLMScheduler, RequestPriority
 
 __all__ = [
     "LLMConfig",
@@ -25,12 +29,19 @@ __all__ = [
     "UnifiedLLMInference",
     "InferenceError",
     "ContextOverflowError",
+    "LLMOverloadedError",
+    "StreamChunk",
     "PromptBuilder",
     "BASE_DEMI_PROMPT",
     "ConversationHistory",
     "Message",
     "ResponseProcessor",
     "ProcessedResponse",
+    "ProcessedText",
     "CodebaseReader",
     "CodeSnippet",
+    "TokenCounter",
+    "get_token_counter",
+    "LLMScheduler",
+    "RequestPriority",
 ]
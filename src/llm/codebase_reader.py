@@ -5,13 +5,74 @@ Enables Demi to read and understand her own source code,
 supporting semantic code retrieval and self-awareness features.
 """
 
+import ast
+import json
+import math
 import os
+import threading
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Callable
+from functools import lru_cache
+from typing import Optional, List, Dict, Callable, Tuple
 from pathlib import Path
 import re
 from src.core.logger import DemiLogger
 
+# BM25 parameters. Length normalization is lighter than the usual 0.75 so
+# large core classes are not buried under small helpers that mention a term.
+BM25_K1 = 1.2
+BM25_B = 0.5
+
+# Name and module path tokens count this many times in a snippet's term frequencies
+NAME_WEIGHT = 3
+PATH_WEIGHT = 2
+
+# Bump when the cache layout or tokenization changes
+CODE_INDEX_CACHE_VERSION = 1
+
+# How long lookups wait for a background build when there was no cache
+INDEX_WAIT_SECONDS = 10.0
+
+_IDENTIFIER_PATTERN = re.compile(r"[A-Za-z][A-Za-z0-9]*")
+_CAMEL_PATTERN = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+")
+
+
+def _normalize(token: str) -> str:
+    """Lowercase a token and fold plurals and "-al" (emotions, emotional -> emotion)."""
+    token = token.lower()
+    if len(token) > 4 and token.endswith("s") and not token.endswith("ss"):
+        token = token[:-1]
+    if len(token) > 6 and token.endswith("al"):
+        token = token[:-2]
+    return token
+
+
+@lru_cache(maxsize=65536)
+def _identifier_terms(identifier: str) -> Tuple[str, ...]:
+    """Terms for one identifier (cached: identifiers repeat heavily in code)."""
+    parts = _CAMEL_PATTERN.findall(identifier)
+    terms = [_normalize(identifier)] if len(parts) > 1 else []
+    terms.extend(_normalize(part) for part in parts if len(part) > 1)
+    return tuple(terms)
+
+
+def tokenize_code(text: str) -> List[str]:
+    """
+    Split code or prose into search terms.
+
+    Identifiers are split on underscores and camelCase boundaries, so
+    "EmotionalState" yields "emotionalstate", "emotion" and "state".
+
+    Args:
+        text: Source code or natural language
+
+    Returns:
+        List of normalized terms (with repeats, for term frequencies)
+    """
+    terms: List[str] = []
+    for identifier in _IDENTIFIER_PATTERN.findall(text):
+        terms.extend(_identifier_terms(identifier))
+    return terms
+
 
 @dataclass
 class CodeSnippet:
@@ -31,7 +92,10 @@ class CodebaseReader:
     Reads and indexes Demi's source code for semantic retrieval.
 
     Enables self-awareness by allowing access to codebase information
-    to be injected into prompts.
+    to be injected into prompts. Snippets are held in a BM25 inverted
+    index; refresh() re-indexes only files whose mtime or size changed.
+    With a cache_path the index is persisted between runs, so startup only
+    has to stat the tree instead of parsing it.
     """
 
     def __init__(
@@ -39,6 +103,8 @@ class CodebaseReader:
         logger: DemiLogger,
         codebase_root: str = "src/",
         token_counter: Optional[Callable[[str], int]] = None,
+        cache_path: Optional[str] = None,
+        background: bool = False,
     ):
         """
         Initialize CodebaseReader.
@@ -47,62 +113,294 @@ class CodebaseReader:
             logger: DemiLogger instance for logging
             codebase_root: Root directory of source code
             token_counter: Optional function to count tokens (defaults to char-based estimation)
+            cache_path: Optional index cache file, loaded at startup and rewritten after changes
+            background: Validate the cache / build the index in a background thread
         """
         self.logger = logger
         self.codebase_root = codebase_root
         self.token_counter = token_counter or self._default_token_counter
+        self.cache_path = Path(cache_path).expanduser() if cache_path else None
+
+        self._lock = threading.RLock()  # Guards the index structures
+        self._refresh_lock = threading.Lock()  # Serializes refresh() calls
+        self._ready = threading.Event()  # Set once the index is usable
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._reset_index()
+
+        # Cached index is trusted at startup and validated by the first refresh
+        if self.cache_path and self._load_cache():
+            self._ready.set()
+
+        if background:
+            self._refresh_thread = threading.Thread(
+                target=self._load_codebase, name="codebase-index", daemon=True
+            )
+            self._refresh_thread.start()
+        else:
+            self._load_codebase()
+
+    def _reset_index(self):
+        """Clear all index structures."""
         self._file_cache: Dict[str, str] = {}
         self._code_index: Dict[str, CodeSnippet] = {}
 
-        # Load and parse codebase
-        self._load_codebase()
+        # Incremental indexing state
+        self._file_stats: Dict[str, Tuple[int, int]] = {}  # path -> (mtime_ns, size)
+        self._file_blocks: Dict[str, List[str]] = {}  # path -> snippet keys
+
+        # Inverted index: term -> {snippet key: weighted term frequency}
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._doc_terms: Dict[str, Dict[str, int]] = {}
+        self._doc_lengths: Dict[str, int] = {}
+        self._total_length = 0
+
+        # Exact lookups: class/function name -> snippet keys
+        self._by_name: Dict[str, List[str]] = {}
 
     def _load_codebase(self):
         """Load all Python files from codebase root."""
-        # Find all Python files
-        python_files = []
         try:
-            for root, dirs, files in os.walk(self.codebase_root):
-                # Skip __pycache__ and other hidden directories
-                dirs[:] = [
-                    d for d in dirs if not d.startswith(".") and d != "__pycache__"
-                ]
-
-                for file in files:
-                    if file.endswith(".py"):
-                        filepath = os.path.join(root, file)
-                        python_files.append(filepath)
-        except Exception as e:
-            self.logger.error(f"Error walking codebase: {e}")
-            return
-
-        # Read each file
-        file_count = 0
-        class_count = 0
-        for filepath in python_files:
-            try:
-                with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
-                    content = f.read()
-                    self._file_cache[filepath] = content
-                    file_count += 1
+            changed = self.refresh()
+        finally:
+            self._ready.set()
+        self.logger.info(
+            f"Loaded codebase: {len(self._file_cache)} files, "
+            f"{len(self._code_index)} classes/functions ({changed} re-indexed)"
+        )
+
+    def wait_until_ready(self, timeout: Optional[float] = INDEX_WAIT_SECONDS) -> bool:
+        """
+        Block until the index can serve lookups.
+
+        Only waits when there was no usable cache and the index is still
+        being built in the background.
 
-                    # Extract code blocks
-                    blocks = self._extract_code_blocks(filepath, content)
-                    class_count += len(blocks)
-                    self._code_index.update(blocks)
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if the index is ready
+        """
+        return self._ready.wait(timeout)
+
+    def _scan_files(self) -> Dict[str, Tuple[int, int]]:
+        """Find Python files under the codebase root with their (mtime_ns, size)."""
+        stats = {}
+        for root, dirs, files in os.walk(self.codebase_root):
+            # Skip __pycache__ and other hidden directories
+            dirs[:] = [
+                d for d in dirs if not d.startswith(".") and d != "__pycache__"
+            ]
+
+            for file in files:
+                if file.endswith(".py"):
+                    filepath = os.path.join(root, file)
+                    try:
+                        st = os.stat(filepath)
+                    except OSError:
+                        continue
+                    stats[filepath] = (st.st_mtime_ns, st.st_size)
+        return stats
+
+    def refresh(self) -> int:
+        """
+        Re-index files that were added, changed or deleted since the last scan.
 
+        Files are read and parsed without holding the index lock, so lookups
+        keep being served while a refresh runs. The cache file (if any) is
+        rewritten when something changed.
+
+        Returns:
+            Number of files re-indexed or removed
+        """
+        with self._refresh_lock:
+            try:
+                current = self._scan_files()
             except Exception as e:
-                self.logger.warning(f"Error reading {filepath}: {e}")
+                self.logger.error(f"Error walking codebase: {e}")
+                return 0
+
+            removed = [path for path in self._file_stats if path not in current]
+            updates = []
+            for filepath, stat in current.items():
+                if self._file_stats.get(filepath) == stat:
+                    continue
+                try:
+                    with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
+                        content = f.read()
+                except Exception as e:
+                    self.logger.warning(f"Error reading {filepath}: {e}")
+                    continue
+
+                blocks = self._extract_code_blocks(filepath, content)
+                terms = {key: self._snippet_terms(snippet) for key, snippet in blocks.items()}
+                updates.append((filepath, stat, content, blocks, terms))
+
+            if not removed and not updates:
+                return 0
+
+            with self._lock:
+                for filepath in removed:
+                    self._remove_file(filepath)
+                for filepath, stat, content, blocks, terms in updates:
+                    self._remove_file(filepath)
+                    self._add_file(filepath, stat, content, blocks, terms)
+
+            changed = len(removed) + len(updates)
+            self.logger.debug(f"Re-indexed {changed} codebase files")
+
+            if self.cache_path:
+                self._save_cache()
+            return changed
+
+    def _snippet_terms(self, snippet: CodeSnippet) -> Dict[str, int]:
+        """Weighted term frequencies for a snippet (content, name and module path)."""
+        terms: Dict[str, int] = {}
+        for term in tokenize_code(snippet.content):
+            terms[term] = terms.get(term, 0) + 1
+        for term in tokenize_code(snippet.class_or_function):
+            terms[term] = terms.get(term, 0) + NAME_WEIGHT
+        for term in tokenize_code(self._module_path(snippet.file_path)):
+            terms[term] = terms.get(term, 0) + PATH_WEIGHT
+        return terms
+
+    def _add_file(
+        self,
+        filepath: str,
+        stat: Tuple[int, int],
+        content: str,
+        blocks: Dict[str, CodeSnippet],
+        terms: Dict[str, Dict[str, int]],
+    ):
+        """Add a file's parsed code blocks to the index."""
+        self._file_cache[filepath] = content
+        self._file_stats[filepath] = stat
+        self._file_blocks[filepath] = list(blocks)
+
+        for key, snippet in blocks.items():
+            self._code_index[key] = snippet
+            self._by_name.setdefault(snippet.class_or_function, []).append(key)
+
+            doc_terms = terms[key]
+            length = sum(doc_terms.values())
+            self._doc_terms[key] = doc_terms
+            self._doc_lengths[key] = length
+            self._total_length += length
+            for term, tf in doc_terms.items():
+                self._postings.setdefault(term, {})[key] = tf
+
+    def _remove_file(self, filepath: str):
+        """Drop a file and its code blocks from the index."""
+        self._file_cache.pop(filepath, None)
+        self._file_stats.pop(filepath, None)
+
+        for key in self._file_blocks.pop(filepath, []):
+            snippet = self._code_index.pop(key, None)
+            if snippet is not None:
+                keys = self._by_name.get(snippet.class_or_function, [])
+                if key in keys:
+                    keys.remove(key)
+                if not keys:
+                    self._by_name.pop(snippet.class_or_function, None)
+
+            for term in self._doc_terms.pop(key, {}):
+                postings = self._postings.get(term)
+                if postings is not None:
+                    postings.pop(key, None)
+                    if not postings:
+                        del self._postings[term]
+            self._total_length -= self._doc_lengths.pop(key, 0)
+
+    def _load_cache(self) -> bool:
+        """
+        Load the index from the cache file without touching the source tree.
 
-        self.logger.info(
-            f"Loaded codebase: {file_count} files, {class_count} classes/functions"
-        )
+        Returns:
+            True if a cache for this codebase root was loaded
+        """
+        try:
+            with open(self.cache_path, "rb") as f:
+                data = json.loads(f.read())
+
+            if data.get("version") != CODE_INDEX_CACHE_VERSION:
+                return False
+            if data.get("root") != os.path.abspath(self.codebase_root):
+                return False
+
+            for filepath, entry in data["files"].items():
+                content = entry["content"]
+                lines = content.split("\n")
+                blocks = {}
+                terms = {}
+                for name, start_line, end_line, tokens, doc_terms in entry["blocks"]:
+                    key = f"{filepath}:{name}"
+                    blocks[key] = CodeSnippet(
+                        file_path=filepath,
+                        class_or_function=name,
+                        start_line=start_line,
+                        end_line=end_line,
+                        content="\n".join(lines[start_line - 1 : end_line]),
+                        tokens=tokens,
+                    )
+                    terms[key] = doc_terms
+                self._add_file(filepath, tuple(entry["stat"]), content, blocks, terms)
+
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.logger.warning(f"Ignoring unreadable code index cache {self.cache_path}: {e}")
+            self._reset_index()
+            return False
+
+        self.logger.debug(f"Loaded code index cache: {len(self._file_cache)} files")
+        return True
+
+    def _save_cache(self):
+        """Write the index to the cache file (atomically replaced)."""
+        with self._lock:
+            files = {}
+            for filepath, keys in self._file_blocks.items():
+                blocks = []
+                for key in keys:
+                    snippet = self._code_index[key]
+                    blocks.append([
+                        snippet.class_or_function,
+                        snippet.start_line,
+                        snippet.end_line,
+                        snippet.tokens,
+                        self._doc_terms[key],
+                    ])
+                files[filepath] = {
+                    "stat": list(self._file_stats[filepath]),
+                    "content": self._file_cache[filepath],
+                    "blocks": blocks,
+                }
+
+        data = {
+            "version": CODE_INDEX_CACHE_VERSION,
+            "root": os.path.abspath(self.codebase_root),
+            "files": files,
+        }
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+            tmp_path.write_bytes(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            self.logger.warning(f"Could not write code index cache {self.cache_path}: {e}")
+
+    def _module_path(self, filepath: str) -> str:
+        """File path relative to the codebase root, without extension."""
+        return os.path.splitext(os.path.relpath(filepath, self.codebase_root))[0]
 
     def _extract_code_blocks(
         self, filepath: str, content: str
     ) -> Dict[str, CodeSnippet]:
         """
-        Extract class and function definitions from file content.
+        Extract top-level class and function definitions from file content.
+
+        Uses the AST for exact block boundaries; files that do not parse
+        (e.g. mid-edit) fall back to indentation scanning.
 
         Args:
             filepath: Path to the file
@@ -111,60 +409,62 @@ class CodebaseReader:
         Returns:
             Dictionary mapping class/function names to CodeSnippet objects
         """
+        try:
+            tree = ast.parse(content, filename=filepath)
+        except (SyntaxError, ValueError):
+            return self._extract_code_blocks_by_indent(filepath, content)
+
         blocks = {}
         lines = content.split("\n")
+        for node in tree.body:
+            if not isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
 
-        # Find class definitions
-        class_pattern = re.compile(r"^class\s+(\w+)\s*[\(:]")
-        function_pattern = re.compile(r"^def\s+(\w+)\s*\(")
+            block_content = "\n".join(lines[node.lineno - 1 : node.end_lineno])
+            blocks[f"{filepath}:{node.name}"] = CodeSnippet(
+                file_path=filepath,
+                class_or_function=node.name,
+                start_line=node.lineno,
+                end_line=node.end_lineno,
+                content=block_content,
+                tokens=self.token_counter(block_content),
+            )
+
+        return blocks
+
+    def _extract_code_blocks_by_indent(
+        self, filepath: str, content: str
+    ) -> Dict[str, CodeSnippet]:
+        """
+        Extract class and function definitions by scanning indentation.
+
+        Args:
+            filepath: Path to the file
+            content: File content
+
+        Returns:
+            Dictionary mapping class/function names to CodeSnippet objects
+        """
+        blocks = {}
+        lines = content.split("\n")
+        block_pattern = re.compile(r"^(?:class\s+(\w+)\s*[\(:]|(?:async\s+)?def\s+(\w+)\s*\()")
 
-        current_indent = 0
         for i, line in enumerate(lines):
-            # Check for class definition
-            class_match = class_pattern.match(line)
-            if class_match:
-                class_name = class_match.group(1)
-                start_line = i + 1  # 1-indexed for display
-
-                # Find end of class (next class/def at same or lower indent level)
-                end_line = self._find_end_of_block(lines, i)
-
-                # Extract class content
-                class_content = "\n".join(lines[i : end_line + 1])
-                snippet_tokens = self.token_counter(class_content)
-
-                key = f"{filepath}:{class_name}"
-                blocks[key] = CodeSnippet(
-                    file_path=filepath,
-                    class_or_function=class_name,
-                    start_line=start_line,
-                    end_line=end_line + 1,
-                    content=class_content,
-                    tokens=snippet_tokens,
-                )
-
-            # Check for top-level function definition
-            func_match = function_pattern.match(line)
-            if func_match and line.startswith("def "):  # Top-level only
-                func_name = func_match.group(1)
-                start_line = i + 1
-
-                # Find end of function
-                end_line = self._find_end_of_block(lines, i)
-
-                # Extract function content
-                func_content = "\n".join(lines[i : end_line + 1])
-                snippet_tokens = self.token_counter(func_content)
-
-                key = f"{filepath}:{func_name}"
-                blocks[key] = CodeSnippet(
-                    file_path=filepath,
-                    class_or_function=func_name,
-                    start_line=start_line,
-                    end_line=end_line + 1,
-                    content=func_content,
-                    tokens=snippet_tokens,
-                )
+            match = block_pattern.match(line)
+            if not match:
+                continue
+
+            name = match.group(1) or match.group(2)
+            end_line = self._find_end_of_block(lines, i)
+            block_content = "\n".join(lines[i : end_line + 1])
+            blocks[f"{filepath}:{name}"] = CodeSnippet(
+                file_path=filepath,
+                class_or_function=name,
+                start_line=i + 1,  # 1-indexed for display
+                end_line=end_line + 1,
+                content=block_content,
+                tokens=self.token_counter(block_content),
+            )
 
         return blocks
 
@@ -256,19 +556,34 @@ Message Processing Workflow:
             self.logger.debug(f"No keywords extracted from query: {query}")
             return []
 
-        # Score all code snippets
-        scored_snippets = []
-        for key, snippet in self._code_index.items():
-            score = self._calculate_relevance(keywords, snippet)
-            if score > 0:
-                snippet.relevance_score = score
-                scored_snippets.append(snippet)
+        terms = self._query_terms(keywords)
+        if not terms:
+            return []
 
-        # Sort by relevance score (descending)
-        scored_snippets.sort(key=lambda s: s.relevance_score, reverse=True)
+        self.wait_until_ready()
+        with self._lock:
+            # Accumulate BM25 scores over the postings of the query terms only
+            avg_length = self._total_length / max(1, len(self._doc_lengths))
+            scores: Dict[str, float] = {}
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = self._idf(term)
+                for key, tf in postings.items():
+                    scores[key] = scores.get(key, 0.0) + self._bm25_term(
+                        idf, tf, self._doc_lengths[key], avg_length
+                    )
+
+            # Return top N
+            upper_bound = self._score_upper_bound(terms)
+            ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+            results = []
+            for key, score in ranked[:max_results]:
+                snippet = self._code_index[key]
+                snippet.relevance_score = min(score / upper_bound, 1.0)
+                results.append(snippet)
 
-        # Return top N
-        results = scored_snippets[:max_results]
         self.logger.debug(f"Retrieved {len(results)} code snippets for query: {query}")
         return results
 
@@ -282,10 +597,11 @@ Message Processing Workflow:
         Returns:
             CodeSnippet with full content, or None if not found
         """
-        # Search for exact match
-        for key, snippet in self._code_index.items():
-            if snippet.class_or_function == module_name:
-                return snippet
+        self.wait_until_ready()
+        with self._lock:
+            keys = self._by_name.get(module_name)
+            if keys:
+                return self._code_index[keys[0]]
 
         self.logger.debug(f"Module not found: {module_name}")
         return None
@@ -337,12 +653,40 @@ Message Processing Workflow:
 
         return keywords  # Remove empty strings
 
+    def _query_terms(self, query_keywords: List[str]) -> List[str]:
+        """Tokenize query keywords into unique index terms."""
+        terms = []
+        for keyword in query_keywords:
+            for term in tokenize_code(keyword):
+                if term not in terms:
+                    terms.append(term)
+        return terms
+
+    def _idf(self, term: str) -> float:
+        """BM25 inverse document frequency of a term."""
+        n = len(self._doc_lengths)
+        df = len(self._postings.get(term, ()))
+        return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+    @staticmethod
+    def _bm25_term(idf: float, tf: int, length: int, avg_length: float) -> float:
+        """BM25 contribution of one term to one snippet."""
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * length / max(avg_length, 1.0))
+        return idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+    def _score_upper_bound(self, terms: List[str]) -> float:
+        """Largest possible BM25 score for the terms, used to scale scores to 0-1."""
+        return max(sum(self._idf(term) * (BM25_K1 + 1) for term in terms), 1e-9)
+
     def _calculate_relevance(
         self, query_keywords: List[str], snippet: CodeSnippet
     ) -> float:
         """
         Calculate relevance score between query keywords and code snippet.
 
+        Scores a single snippet with the same BM25 formula used by
+        get_relevant_code, against the current index statistics.
+
         Args:
             query_keywords: List of query keywords
             snippet: CodeSnippet to score
@@ -350,38 +694,21 @@ Message Processing Workflow:
         Returns:
             Relevance score (0-1)
         """
-        if not query_keywords:
+        terms = self._query_terms(query_keywords)
+        if not terms:
             return 0.0
 
-        # Check keyword matches in:
-        # 1. Class/function name
-        # 2. Content (docstring and code)
-        matches = 0
-
-        snippet_text = (snippet.class_or_function + " " + snippet.content).lower()
-
-        for keyword in query_keywords:
-            if keyword.lower() in snippet_text:
-                matches += 1
-
-        # Base relevance: match ratio
-        base_score = matches / len(query_keywords)
-
-        # Bonus for exact class/function name match
-        if any(
-            keyword.lower() in snippet.class_or_function.lower()
-            for keyword in query_keywords
-        ):
-            base_score += 0.1
-
-        # Apply length penalty: prefer shorter, more targeted snippets
-        max_snippet_length = 2000
-        length_penalty = (
-            1.0 - (min(snippet.tokens, max_snippet_length) / max_snippet_length) * 0.3
-        )
-
-        final_score = base_score * length_penalty
-        return min(final_score, 1.0)  # Clamp to 0-1
+        doc_terms = self._snippet_terms(snippet)
+        length = sum(doc_terms.values())
+
+        with self._lock:
+            avg_length = self._total_length / max(1, len(self._doc_lengths))
+            score = sum(
+                self._bm25_term(self._idf(term), doc_terms[term], length, avg_length)
+                for term in terms
+                if term in doc_terms
+            )
+            return min(score / self._score_upper_bound(terms), 1.0)
 
     def _default_token_counter(self, text: str) -> int:
         """
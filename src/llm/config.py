@@ -35,6 +35,24 @@ class LLMConfig:
     enable_lmstudio_fallback: bool = True
     """Enable automatic fallback to LMStudio if Ollama is unavailable."""
 
+    pool_max_connections: int = 10
+    """Maximum open HTTP connections per provider connection pool."""
+
+    pool_max_connections_per_host: int = 8
+    """Maximum open HTTP connections to a single provider host."""
+
+    pool_max_keepalive: int = 4
+    """Maximum idle keep-alive connections retained per provider."""
+
+    pool_keepalive_sec: float = 30.0
+    """Seconds an idle keep-alive connection is retained before closing."""
+
+    max_concurrent_requests: int = 2
+    """Maximum inference requests sent to providers at once (others queue)."""
+
+    max_queue_depth: int = 32
+    """Maximum requests waiting for a slot before load shedding kicks in."""
+
     def __post_init__(self):
         """Validate configuration after initialization."""
         self._validate()
@@ -57,6 +75,28 @@ class LLMConfig:
         if self.timeout_sec <= 0:
             raise ValueError("timeout_sec must be greater than 0")
 
+        # Validate connection pool settings
+        if self.pool_max_connections <= 0:
+            raise ValueError("pool_max_connections must be greater than 0")
+
+        if not (0 < self.pool_max_connections_per_host <= self.pool_max_connections):
+            raise ValueError(
+                "pool_max_connections_per_host must be in range [1, pool_max_connections]"
+            )
+
+        if self.pool_max_keepalive < 0:
+            raise ValueError("pool_max_keepalive must be non-negative")
+
+        if self.pool_keepalive_sec <= 0:
+            raise ValueError("pool_keepalive_sec must be greater than 0")
+
+        # Validate scheduler settings
+        if self.max_concurrent_requests <= 0:
+            raise ValueError("max_concurrent_requests must be greater than 0")
+
+        if self.max_queue_depth < 0:
+            raise ValueError("max_queue_depth must be non-negative")
+
     @classmethod
     def from_global_config(cls, config: DemiConfig) -> "LLMConfig":
         """
@@ -71,6 +111,8 @@ class LLMConfig:
         lm_settings = config.lm or {}
         ollama_settings = lm_settings.get("ollama", {})
         lmstudio_settings = lm_settings.get("lmstudio", {})
+        pool_settings = lm_settings.get("pool", {})
+        scheduler_settings = lm_settings.get("scheduler", {})
 
         return cls(
             model_name=ollama_settings.get("model", "llama3.2:1b"),
@@ -86,4 +128,12 @@ class LLMConfig:
             enable_lmstudio_fallback=lm_settings.get(
                 "enable_fallback", True
             ),
+            pool_max_connections=pool_settings.get("max_connections", 10),
+            pool_max_connections_per_host=pool_settings.get(
+                "max_connections_per_host", 8
+            ),
+            pool_max_keepalive=pool_settings.get("max_keepalive", 4),
+            pool_keepalive_sec=pool_settings.get("keepalive_sec", 30.0),
+            max_concurrent_requests=scheduler_settings.get("max_concurrent", 2),
+            max_queue_depth=scheduler_settings.get("max_queue_depth", 32),
         )
@@ -0,0 +1,214 @@
+"""
+Persistent HTTP connection pools for LLM providers.
+
+Keeps one long-lived client per provider (httpx via ollama.AsyncClient for
+Ollama, aiohttp.ClientSession for LMStudio) so chat requests and health checks
+reuse keep-alive connections instead of paying TCP setup on every message.
+Tracks pool utilization for reporting through the LLM metrics collector.
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Optional
+
+from src.llm.config import LLMConfig
+from src.core.logger import DemiLogger
+
+
+@dataclass
+class PoolStats:
+    """Snapshot of connection pool utilization for one provider."""
+
+    provider: str
+    max_connections: int
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    total_requests: int = 0
+    clients_created: int = 0
+    is_open: bool = False
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of the connection limit currently in use (0.0-1.0)."""
+        if self.max_connections <= 0:
+            return 0.0
+        return min(1.0, self.in_flight / self.max_connections)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert stats to dictionary."""
+        return {
+            "provider": self.provider,
+            "max_connections": self.max_connections,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "total_requests": self.total_requests,
+            "clients_created": self.clients_created,
+            "utilization": round(self.utilization, 3),
+            "is_open": self.is_open,
+        }
+
+
+class ProviderConnectionPool(ABC):
+    """
+    Long-lived client holder for a single LLM provider.
+
+    The underlying client is created lazily on first use so it binds to the
+    running event loop, and is recreated if the loop changes (e.g. between
+    separate asyncio.run() calls). Subclasses implement client creation and
+    teardown for their HTTP library.
+    """
+
+    provider = "unknown"
+
+    def __init__(self, config: LLMConfig, logger: DemiLogger):
+        """
+        Initialize provider pool.
+
+        Args:
+            config: LLMConfig with pool sizing and keep-alive settings
+            logger: DemiLogger instance for logging
+        """
+        self.config = config
+        self.logger = logger
+        self._client = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.stats = PoolStats(
+            provider=self.provider, max_connections=config.pool_max_connections
+        )
+
+    async def get_client(self):
+        """
+        Return the pooled client, creating it on first use.
+
+        Returns:
+            Provider-specific client bound to the running event loop
+
+        Raises:
+            ImportError: If the provider's HTTP library is not installed
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._client_loop is loop:
+            return self._client
+
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+
+        async with self._lock:
+            if self._client is not None and self._client_loop is loop:
+                return self._client
+
+            if self._client is not None:
+                # Client belongs to a previous event loop and cannot be reused
+                await self._discard_client()
+
+            self._client = self._create_client()
+            self._client_loop = loop
+            self.stats.clients_created += 1
+            self.stats.is_open = True
+            self.logger.debug(
+                f"{self.provider} connection pool opened "
+                f"(max={self.config.pool_max_connections}, "
+                f"per_host={self.config.pool_max_connections_per_host}, "
+                f"keepalive={self.config.pool_keepalive_sec}s)"
+            )
+            return self._client
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Any]:
+        """
+        Lease the pooled client for one request, tracking utilization.
+
+        Yields:
+            Provider-specific client
+        """
+        client = await self.get_client()
+        self.stats.in_flight += 1
+        self.stats.total_requests += 1
+        self.stats.peak_in_flight = max(self.stats.peak_in_flight, self.stats.in_flight)
+        try:
+            yield client
+        finally:
+            self.stats.in_flight = max(0, self.stats.in_flight - 1)
+
+    async def close(self) -> None:
+        """Close the pooled client and release all connections."""
+        if self._client is None:
+            return
+        await self._discard_client()
+        self.logger.debug(f"{self.provider} connection pool closed")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return current pool utilization stats."""
+        return self.stats.to_dict()
+
+    async def _discard_client(self) -> None:
+        """Close the current client, ignoring errors from a dead event loop."""
+        client = self._client
+        self._client = None
+        self._client_loop = None
+        self.stats.is_open = False
+        try:
+            await self._close_client(client)
+        except Exception as e:
+            self.logger.debug(
+                f"{self.provider} pool close error: {type(e).__name__}: {e}"
+            )
+
+    @abstractmethod
+    def _create_client(self):
+        """Create the provider-specific client."""
+
+    @abstractmethod
+    async def _close_client(self, client) -> None:
+        """Close the provider-specific client."""
+
+
+class OllamaConnectionPool(ProviderConnectionPool):
+    """Pooled ollama.AsyncClient backed by a single httpx connection pool."""
+
+    provider = "ollama"
+
+    def _create_client(self):
+        import httpx
+        import ollama
+
+        # Ollama is a single host, so the per-host limit caps idle keep-alives
+        limits = httpx.Limits(
+            max_connections=self.config.pool_max_connections,
+            max_keepalive_connections=min(
+                self.config.pool_max_keepalive, self.config.pool_max_connections_per_host
+            ),
+            keepalive_expiry=self.config.pool_keepalive_sec,
+        )
+        return ollama.AsyncClient(host=self.config.ollama_base_url, limits=limits)
+
+    async def _close_client(self, client) -> None:
+        if hasattr(client, "close"):
+            await client.close()
+        elif hasattr(client, "_client"):
+            await client._client.aclose()
+
+
+class LMStudioConnectionPool(ProviderConnectionPool):
+    """Pooled aiohttp.ClientSession with a keep-alive TCP connector."""
+
+    provider = "lmstudio"
+
+    def _create_client(self):
+        import aiohttp
+
+        connector = aiohttp.TCPConnector(
+            limit=self.config.pool_max_connections,
+            limit_per_host=self.config.pool_max_connections_per_host,
+            keepalive_timeout=self.config.pool_keepalive_sec,
+        )
+        return aiohttp.ClientSession(connector=connector)
+
+    async def _close_client(self, client) -> None:
+        if not client.closed:
+            await client.close()
@@ -0,0 +1,69 @@
+"""
+Context window planning for LLM inference.
+
+Decides which suffix of a conversation fits into a token budget. Each message
+is counted exactly once and the cut point is found in a single backward pass
+over cumulative (suffix) token sums, so trimming is O(n) in history length.
+Shared by the inference providers and ConversationHistory.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+
+@dataclass
+class ContextPlan:
+    """Result of planning a context window over a message sequence."""
+
+    start: int  # Index of first kept message
+    kept_tokens: int  # Tokens in messages[start:]
+    total_tokens: int  # Tokens in all messages
+
+    @property
+    def dropped(self) -> int:
+        """Number of oldest messages dropped."""
+        return self.start
+
+    def apply(self, messages: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """Return the kept suffix of messages."""
+        return messages[self.start :]
+
+
+def plan_context_window(
+    token_counts: Sequence[int],
+    budget: int,
+    pinned_index: Optional[int] = None,
+    min_keep: int = 0,
+) -> ContextPlan:
+    """
+    Find the longest suffix of a conversation that fits within a token budget.
+
+    Walks backwards accumulating suffix sums and stops at the first message
+    that would overflow the budget. The pinned message (e.g. the current
+    user turn) is always kept even if it alone exceeds the budget, and at
+    least min_keep trailing messages are kept regardless of size.
+
+    Args:
+        token_counts: Token count of each message, oldest first
+        budget: Maximum tokens allowed for the kept messages
+        pinned_index: Optional index of a message that must never be dropped
+        min_keep: Minimum number of trailing messages to keep
+
+    Returns:
+        ContextPlan describing the cut point
+    """
+    n = len(token_counts)
+    total = sum(token_counts)
+    if total <= budget:
+        return ContextPlan(start=0, kept_tokens=total, total_tokens=total)
+
+    kept = 0
+    start = 0
+    for i in range(n - 1, -1, -1):
+        suffix = kept + token_counts[i]
+        if suffix > budget and i != pinned_index and n - i > min_keep:
+            start = i + 1
+            break
+        kept = suffix
+
+    return ContextPlan(start=start, kept_tokens=kept, total_tokens=total)
@@ -9,6 +9,7 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Callable, List, Optional, Dict
 from src.emotion.models import EmotionalState
+from src.llm.context_planner import plan_context_window
 from src.core.logger import DemiLogger
 
 
@@ -113,39 +114,28 @@ class ConversationHistory:
             {"role": msg.role, "content": msg.content} for msg in self._messages
         ]
 
-        # Calculate total tokens
-        total_tokens = sum(token_counter(msg["content"]) for msg in message_dicts)
+        # Count each message once, then plan the cut in a single pass
+        token_counts = [token_counter(msg["content"]) for msg in message_dicts]
 
-        # If under limit, return all
-        if total_tokens <= available_tokens:
-            return message_dicts
-
-        # Otherwise, trim from start, preserving last user message
-        trimmed_messages = []
-        current_tokens = 0
+        # Find last user message index (always kept)
         last_user_message_idx = None
-
-        # Find last user message index
         for i in range(len(message_dicts) - 1, -1, -1):
             if message_dicts[i]["role"] == "user":
                 last_user_message_idx = i
                 break
 
-        # Build trimmed list starting from end
-        for i in range(len(message_dicts) - 1, -1, -1):
-            msg = message_dicts[i]
-            msg_tokens = token_counter(msg["content"])
-
-            # Always keep last user message
-            if i == last_user_message_idx:
-                trimmed_messages.insert(0, msg)
-                current_tokens += msg_tokens
-            elif current_tokens + msg_tokens <= available_tokens:
-                trimmed_messages.insert(0, msg)
-                current_tokens += msg_tokens
-            else:
-                # Stop adding when we exceed limit
-                break
+        plan = plan_context_window(
+            token_counts, available_tokens, pinned_index=last_user_message_idx
+        )
+
+        # If under limit, return all
+        if plan.dropped == 0:
+            return message_dicts
+
+        # Otherwise, keep the newest messages that fit
+        trimmed_messages = plan.apply(message_dicts)
+        total_tokens = plan.total_tokens
+        current_tokens = plan.kept_tokens
 
         if self.logger:
             before_count = len(self._messages)
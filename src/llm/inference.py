@@ -7,10 +7,17 @@ Automatically falls back to LMStudio if Ollama is unavailable.
 """
 
 import asyncio
+import json
 import os
 import time
-from typing import Optional, List, Dict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Optional, List, Dict
 from src.llm.config import LLMConfig
+from src.llm.connection_pool import OllamaConnectionPool, LMStudioConnectionPool
+from src.llm.tokenizer import get_token_counter
+from src.llm.context_planner import plan_context_window
+from src.llm.scheduler import LLMScheduler, RequestPriority, SchedulerOverloadedError
 from src.core.logger import DemiLogger
 from src.monitoring.metrics import get_llm_metrics
 
@@ -27,6 +34,32 @@ class ContextOverflowError(InferenceError):
     pass
 
 
+class LLMOverloadedError(InferenceError):
+    """Request shed by admission control because the LLM queue is full."""
+
+    pass
+
+
+@dataclass
+class StreamChunk:
+    """Incremental piece of a streamed response from UnifiedLLMInference."""
+
+    delta: str = ""
+    """Newly generated text since the previous chunk."""
+
+    done: bool = False
+    """True on the final chunk, which carries the complete response."""
+
+    text: str = ""
+    """Complete response text (cleaned if processed); set on the final chunk."""
+
+    provider: Optional[str] = None
+    """Provider that generated the response ("ollama" or "lmstudio")."""
+
+    processed: Optional[Any] = None
+    """ProcessedResponse from the response processor; set on the final chunk."""
+
+
 class OllamaInference:
     """
     Async interface to Ollama for LLM inference.
@@ -41,6 +74,7 @@ class OllamaInference:
         logger: DemiLogger,
         response_processor=None,
         codebase_reader=None,
+        connection_pool: Optional[OllamaConnectionPool] = None,
     ):
         """
         Initialize OllamaInference client.
@@ -50,13 +84,14 @@ class OllamaInference:
             logger: DemiLogger instance for logging
             response_processor: Optional ResponseProcessor for post-processing responses
             codebase_reader: Optional CodebaseReader for code context injection
+            connection_pool: Optional shared pool (a private one is created if omitted)
         """
         self.config = config
         self.logger = logger
-        self._tokenizer = None
-        self._tokenizer_attempted = False
+        self.token_counter = get_token_counter()
         self.response_processor = response_processor
         self.codebase_reader = codebase_reader
+        self.connection_pool = connection_pool or OllamaConnectionPool(config, logger)
         self.logger.debug(
             f"OllamaInference initialized with model: {config.model_name}"
         )
@@ -71,16 +106,16 @@ class OllamaInference:
             True if Ollama is online and responding, False otherwise
         """
         try:
-            import ollama
-
-            client = ollama.AsyncClient(host=self.config.ollama_base_url)
             try:
                 # Call tags endpoint to check health
-                response = await asyncio.wait_for(
-                    client.list(), timeout=self.config.timeout_sec
-                )
+                async with self.connection_pool.acquire() as client:
+                    response = await asyncio.wait_for(
+                        client.list(), timeout=self.config.timeout_sec
+                    )
                 self.logger.debug("Ollama health check: OK")
                 return True
+            except ImportError:
+                raise
             except asyncio.TimeoutError:
                 self.logger.warning("Ollama health check: timeout")
                 return False
@@ -120,7 +155,9 @@ class OllamaInference:
         self._validate_messages(messages)
 
         # Count initial context
-        initial_token_count = sum(self._count_tokens(m["content"]) for m in messages)
+        initial_token_count = sum(
+            self.token_counter.count_messages(messages, model=self.config.model_name)
+        )
         self.logger.debug(
             f"Chat request: {len(messages)} messages, ~{initial_token_count} tokens"
         )
@@ -136,25 +173,22 @@ class OllamaInference:
 
         # Call Ollama with timing
         try:
-            import ollama
-
-            client = ollama.AsyncClient(host=self.config.ollama_base_url)
-
             # Record start time
             start_time = time.time()
 
-            response = await asyncio.wait_for(
-                client.chat(
-                    model=self.config.model_name,
-                    messages=trimmed_messages,
-                    stream=False,
-                    options={
-                        "temperature": self.config.temperature,
-                        "num_predict": self.config.max_tokens,
-                    },
-                ),
-                timeout=self.config.timeout_sec,
-            )
+            async with self.connection_pool.acquire() as client:
+                response = await asyncio.wait_for(
+                    client.chat(
+                        model=self.config.model_name,
+                        messages=trimmed_messages,
+                        stream=False,
+                        options={
+                            "temperature": self.config.temperature,
+                            "num_predict": self.config.max_tokens,
+                        },
+                    ),
+                    timeout=self.config.timeout_sec,
+                )
 
             # Calculate inference time
             inference_time_sec = time.time() - start_time
@@ -172,7 +206,7 @@ class OllamaInference:
                     emotional_state_before=emotional_state_before,
                     interaction_type="successful_response",
                 )
-                return processed.text
+                return processed.as_text()
 
             return response_text
 
@@ -188,6 +222,89 @@ class OllamaInference:
             self.logger.error(f"Ollama inference error: {type(e).__name__}: {e}")
             raise InferenceError(f"Inference failed: {e}")
 
+    async def chat_stream(
+        self,
+        messages: List[Dict[str, str]],
+        max_context_tokens: int = 8000,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat response from Ollama as incremental text chunks.
+
+        Applies the same validation and context trimming as chat(). The
+        timeout applies to the wait for each chunk rather than the whole
+        generation. Response post-processing is left to the caller.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            max_context_tokens: Maximum tokens allowed in context window
+
+        Yields:
+            Non-empty text chunks as the model generates them
+
+        Raises:
+            InferenceError: On HTTP errors, timeouts, or Ollama unavailable
+            ContextOverflowError: If context exceeds limit
+            ValueError: If messages format is invalid
+        """
+        self._validate_messages(messages)
+
+        initial_token_count = sum(
+            self.token_counter.count_messages(messages, model=self.config.model_name)
+        )
+        if initial_token_count > max_context_tokens:
+            raise ContextOverflowError(
+                f"Context exceeds limit: {initial_token_count} > {max_context_tokens}"
+            )
+
+        trimmed_messages = self._trim_context(messages, max_context_tokens)
+
+        try:
+            start_time = time.time()
+            chunk_count = 0
+
+            async with self.connection_pool.acquire() as client:
+                stream = await asyncio.wait_for(
+                    client.chat(
+                        model=self.config.model_name,
+                        messages=trimmed_messages,
+                        stream=True,
+                        options={
+                            "temperature": self.config.temperature,
+                            "num_predict": self.config.max_tokens,
+                        },
+                    ),
+                    timeout=self.config.timeout_sec,
+                )
+                iterator = stream.__aiter__()
+                while True:
+                    try:
+                        chunk = await asyncio.wait_for(
+                            iterator.__anext__(), timeout=self.config.timeout_sec
+                        )
+                    except StopAsyncIteration:
+                        break
+
+                    content = chunk.message.content if chunk.message else None
+                    if content:
+                        chunk_count += 1
+                        yield content
+
+            self.logger.debug(
+                f"Chat stream: {chunk_count} chunks in {time.time() - start_time:.2f}s"
+            )
+
+        except asyncio.TimeoutError:
+            raise InferenceError(
+                f"Ollama stream timeout (>{self.config.timeout_sec}s between chunks)"
+            )
+        except ImportError:
+            raise InferenceError("ollama package not installed")
+        except ConnectionError as e:
+            raise InferenceError(f"Failed to connect to Ollama: {e}")
+        except Exception as e:
+            self.logger.error(f"Ollama stream error: {type(e).__name__}: {e}")
+            raise InferenceError(f"Inference failed: {e}")
+
     def _validate_messages(self, messages: List[Dict[str, str]]):
         """
         Validate message format.
@@ -221,41 +338,17 @@ class OllamaInference:
         """
         Count tokens in text.
 
-        Attempts to use transformers library for accurate tokenization,
-        falls back to character-based estimation if unavailable.
+        Delegates to the shared TokenCounter, which uses the transformers
+        tokenizer when available (character estimate otherwise) and
+        memoizes counts so repeated prompts are tokenized once.
 
         Args:
             text: Text to count tokens for
 
         Returns:
-            Estimated token count
+            Token count
         """
-        # Try transformers tokenizer
-        if not self._tokenizer_attempted:
-            try:
-                from transformers import AutoTokenizer
-
-                self._tokenizer = AutoTokenizer.from_pretrained(
-                    "meta-llama/Llama-2-7b-hf"
-                )
-                self._tokenizer_attempted = True
-                self.logger.debug("Loaded transformers tokenizer for token counting")
-            except Exception as e:
-                self._tokenizer_attempted = True
-                self.logger.debug(
-                    f"Tokenizer unavailable, using fallback estimation: {type(e).__name__}"
-                )
-
-        # Use tokenizer if available
-        if self._tokenizer:
-            try:
-                tokens = self._tokenizer.encode(text, add_special_tokens=False)
-                return len(tokens)
-            except Exception as e:
-                self.logger.warning(f"Tokenizer encoding failed: {e}, using fallback")
-
-        # Fallback: rough estimation (1 token ≈ 4 characters)
-        return len(text) // 4
+        return self.token_counter.count(text, model=self.config.model_name)
 
     def _trim_context(
         self, messages: List[Dict[str, str]], max_tokens: int
@@ -286,7 +379,9 @@ class OllamaInference:
         conversation = [m for m in messages if m["role"] != "system"]
 
         # Count tokens in system prompt
-        system_tokens = sum(self._count_tokens(m["content"]) for m in system_messages)
+        system_tokens = sum(
+            self.token_counter.count_messages(system_messages, model=self.config.model_name)
+        )
 
         # Available tokens for conversation
         available_tokens = max_tokens - reserved - system_tokens
@@ -296,18 +391,12 @@ class OllamaInference:
                 f"System prompt uses {system_tokens} tokens, limited room for conversation"
             )
 
-        # Trim conversation history from oldest first
-        trimmed_conversation = conversation
-        while True:
-            conv_tokens = sum(
-                self._count_tokens(m["content"]) for m in trimmed_conversation
-            )
-            if conv_tokens <= available_tokens or len(trimmed_conversation) <= 1:
-                break
-
-            # Remove oldest message (first in list)
-            if trimmed_conversation:
-                trimmed_conversation = trimmed_conversation[1:]
+        # Trim conversation history from oldest first (always keep the latest)
+        conv_counts = self.token_counter.count_messages(
+            conversation, model=self.config.model_name
+        )
+        plan = plan_context_window(conv_counts, available_tokens, min_keep=1)
+        trimmed_conversation = plan.apply(conversation)
 
         # If we trimmed, log it
         if len(trimmed_conversation) < len(conversation):
@@ -334,6 +423,7 @@ class LMStudioInference:
         logger: DemiLogger,
         response_processor=None,
         codebase_reader=None,
+        connection_pool: Optional[LMStudioConnectionPool] = None,
     ):
         """
         Initialize LMStudioInference client.
@@ -343,13 +433,14 @@ class LMStudioInference:
             logger: DemiLogger instance for logging
             response_processor: Optional ResponseProcessor for post-processing responses
             codebase_reader: Optional CodebaseReader for code context injection
+            connection_pool: Optional shared pool (a private one is created if omitted)
         """
         self.config = config
         self.logger = logger
-        self._tokenizer = None
-        self._tokenizer_attempted = False
+        self.token_counter = get_token_counter()
         self.response_processor = response_processor
         self.codebase_reader = codebase_reader
+        self.connection_pool = connection_pool or LMStudioConnectionPool(config, logger)
         self.logger.debug(
             f"LMStudioInference initialized with endpoint: {config.lmstudio_base_url}"
         )
@@ -364,7 +455,7 @@ class LMStudioInference:
         try:
             import aiohttp
 
-            async with aiohttp.ClientSession() as session:
+            async with self.connection_pool.acquire() as session:
                 try:
                     # Try the /api/tags endpoint (compatible with Ollama format)
                     url = f"{self.config.lmstudio_base_url}/api/tags"
@@ -424,7 +515,7 @@ class LMStudioInference:
             # Call LMStudio API with timing
             start_time = time.time()
 
-            async with aiohttp.ClientSession() as session:
+            async with self.connection_pool.acquire() as session:
                 url = f"{self.config.lmstudio_base_url}/v1/chat/completions"
                 payload = {
                     "model": self.config.model_name,
@@ -461,7 +552,7 @@ class LMStudioInference:
                                 emotional_state_before=emotional_state_before,
                                 interaction_type="successful_response",
                             )
-                            return processed.text
+                            return processed.as_text()
 
                         return response_text
 
@@ -480,6 +571,85 @@ class LMStudioInference:
             self.logger.error(f"LMStudio inference error: {type(e).__name__}: {e}")
             raise InferenceError(f"Inference failed: {e}")
 
+    async def chat_stream(
+        self,
+        messages: List[Dict[str, str]],
+        max_context_tokens: int = 8000,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat response from LMStudio as incremental text chunks.
+
+        Uses the OpenAI-compatible server-sent events stream. The timeout
+        applies to each socket read rather than the whole generation.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            max_context_tokens: Maximum tokens allowed in context window
+
+        Yields:
+            Non-empty text chunks as the model generates them
+
+        Raises:
+            InferenceError: On HTTP errors, timeouts, or LMStudio unavailable
+        """
+        try:
+            import aiohttp
+
+            self._validate_messages(messages)
+            trimmed_messages = self._trim_context(messages, max_context_tokens)
+
+            async with self.connection_pool.acquire() as session:
+                url = f"{self.config.lmstudio_base_url}/v1/chat/completions"
+                payload = {
+                    "model": self.config.model_name,
+                    "messages": trimmed_messages,
+                    "temperature": self.config.temperature,
+                    "max_tokens": self.config.max_tokens,
+                    "stream": True,
+                }
+                timeout = aiohttp.ClientTimeout(
+                    total=None,
+                    sock_connect=self.config.timeout_sec,
+                    sock_read=self.config.timeout_sec,
+                )
+
+                try:
+                    async with session.post(url, json=payload, timeout=timeout) as resp:
+                        if resp.status != 200:
+                            error_text = await resp.text()
+                            raise InferenceError(
+                                f"LMStudio returned HTTP {resp.status}: {error_text}"
+                            )
+
+                        async for raw_line in resp.content:
+                            line = raw_line.decode("utf-8").strip()
+                            if not line.startswith("data:"):
+                                continue
+                            data = line[len("data:"):].strip()
+                            if data == "[DONE]":
+                                break
+
+                            event = json.loads(data)
+                            choices = event.get("choices") or [{}]
+                            content = choices[0].get("delta", {}).get("content")
+                            if content:
+                                yield content
+
+                except asyncio.TimeoutError:
+                    raise InferenceError(
+                        f"LMStudio stream timeout (>{self.config.timeout_sec}s between chunks)"
+                    )
+                except ConnectionError as e:
+                    raise InferenceError(f"Failed to connect to LMStudio: {e}")
+
+        except InferenceError:
+            raise
+        except ImportError:
+            raise InferenceError("aiohttp package not installed")
+        except Exception as e:
+            self.logger.error(f"LMStudio stream error: {type(e).__name__}: {e}")
+            raise InferenceError(f"Inference failed: {e}")
+
     def _validate_messages(self, messages: List[Dict[str, str]]):
         """Validate message format."""
         if not isinstance(messages, list):
@@ -503,38 +673,15 @@ class LMStudioInference:
 
     def _count_tokens(self, text: str) -> int:
         """
-        Count tokens in text (same logic as OllamaInference).
+        Count tokens in text via the shared TokenCounter (same as OllamaInference).
 
         Args:
             text: Text to count tokens for
 
         Returns:
-            Estimated token count
+            Token count
         """
-        if not self._tokenizer_attempted:
-            try:
-                from transformers import AutoTokenizer
-
-                self._tokenizer = AutoTokenizer.from_pretrained(
-                    "meta-llama/Llama-2-7b-hf"
-                )
-                self._tokenizer_attempted = True
-                self.logger.debug("Loaded transformers tokenizer for token counting")
-            except Exception as e:
-                self._tokenizer_attempted = True
-                self.logger.debug(
-                    f"Tokenizer unavailable, using fallback estimation: {type(e).__name__}"
-                )
-
-        if self._tokenizer:
-            try:
-                tokens = self._tokenizer.encode(text, add_special_tokens=False)
-                return len(tokens)
-            except Exception as e:
-                self.logger.warning(f"Tokenizer encoding failed: {e}, using fallback")
-
-        # Fallback: rough estimation (1 token ≈ 4 characters)
-        return len(text) // 4
+        return self.token_counter.count(text, model=self.config.model_name)
 
     def _trim_context(
         self, messages: List[Dict[str, str]], max_tokens: int
@@ -559,7 +706,9 @@ class LMStudioInference:
         system_messages = [m for m in messages if m["role"] == "system"]
         conversation = [m for m in messages if m["role"] != "system"]
 
-        system_tokens = sum(self._count_tokens(m["content"]) for m in system_messages)
+        system_tokens = sum(
+            self.token_counter.count_messages(system_messages, model=self.config.model_name)
+        )
         available_tokens = max_tokens - reserved - system_tokens
 
         if available_tokens <= 0:
@@ -567,16 +716,11 @@ class LMStudioInference:
                 f"System prompt uses {system_tokens} tokens, limited room for conversation"
             )
 
-        trimmed_conversation = conversation
-        while True:
-            conv_tokens = sum(
-                self._count_tokens(m["content"]) for m in trimmed_conversation
-            )
-            if conv_tokens <= available_tokens or len(trimmed_conversation) <= 1:
-                break
-
-            if trimmed_conversation:
-                trimmed_conversation = trimmed_conversation[1:]
+        conv_counts = self.token_counter.count_messages(
+            conversation, model=self.config.model_name
+        )
+        plan = plan_context_window(conv_counts, available_tokens, min_keep=1)
+        trimmed_conversation = plan.apply(conversation)
 
         if len(trimmed_conversation) < len(conversation):
             self.logger.debug(
@@ -616,17 +760,29 @@ class UnifiedLLMInference:
         self.response_processor = response_processor
         self.codebase_reader = codebase_reader
 
+        # Long-lived connection pools, one per provider (closed via close())
+        self.ollama_pool = OllamaConnectionPool(config, logger)
+        self.lmstudio_pool = LMStudioConnectionPool(config, logger)
+
         # Initialize both providers
-        self.ollama = OllamaInference(config, logger, response_processor, codebase_reader)
+        self.ollama = OllamaInference(
+            config, logger, response_processor, codebase_reader, self.ollama_pool
+        )
         self.lmstudio = LMStudioInference(
-            config, logger, response_processor, codebase_reader
+            config, logger, response_processor, codebase_reader, self.lmstudio_pool
         )
 
         self._active_provider = None
         self._last_health_check = 0
         self._health_check_interval = 60  # seconds
-        self._tokenizer = None
-        self._tokenizer_attempted = False
+        self.token_counter = get_token_counter()
+
+        # Admission control: concurrency limit, priority lanes, load shedding
+        self.scheduler = LLMScheduler(
+            max_concurrent=config.max_concurrent_requests,
+            max_queue_depth=config.max_queue_depth,
+            logger=logger,
+        )
 
         # Request tracking for performance monitoring
         self._active_requests = 0
@@ -684,6 +840,7 @@ class UnifiedLLMInference:
         messages: List[Dict[str, str]],
         max_context_tokens: int = 8000,
         emotional_state_before=None,
+        priority: RequestPriority = RequestPriority.TEXT,
     ) -> str:
         """
         Generate response using available provider.
@@ -694,154 +851,253 @@ class UnifiedLLMInference:
             messages: List of message dicts with 'role' and 'content'
             max_context_tokens: Maximum tokens allowed
             emotional_state_before: Optional emotional state for response processing
+            priority: Scheduling lane (e.g. VOICE is admitted before TEXT when busy)
 
         Returns:
             Response text from the model
 
         Raises:
+            LLMOverloadedError: If the request was shed by admission control
             InferenceError: If both providers are unavailable
         """
         self._active_requests += 1
         self._total_requests += 1
 
         try:
-            start_time = time.time()
-            response_text = None
-            error_type = None
+            async with self._admit(priority):
+                return await self._chat(
+                    messages, max_context_tokens, emotional_state_before
+                )
+        finally:
+            self._active_requests = max(0, self._active_requests - 1)
 
-            # Check if user prefers LM Studio
-            prefer_lmstudio = os.getenv("PREFER_LMSTUDIO", "false").lower() in ("true", "1", "yes")
+    async def _chat(
+        self,
+        messages: List[Dict[str, str]],
+        max_context_tokens: int,
+        emotional_state_before,
+    ) -> str:
+        """Run chat() against providers in fallback order (slot already held)."""
+        start_time = time.time()
+        response_text = None
+        error_type = None
 
-            if prefer_lmstudio:
-                # Try LM Studio first if preferred
-                try:
-                    self._active_provider = "lmstudio"
-                    self.logger.debug("Using LMStudio provider (preferred)")
-                    response_text = await self.lmstudio.chat(
-                        messages, max_context_tokens, emotional_state_before
-                    )
-                    # Record success metrics
-                    if response_text:
-                        response_time_ms = (time.time() - start_time) * 1000
-                        tokens_generated = self._count_tokens(response_text)
-                        prompt_tokens = sum(self._count_tokens(m["content"]) for m in messages)
-
-                        metrics = get_llm_metrics()
-                        metrics.record_inference(
-                            response_time_ms=response_time_ms,
-                            tokens_generated=tokens_generated,
-                            inference_latency_ms=response_time_ms,
-                            prompt_tokens=prompt_tokens,
-                            model="lmstudio"
-                        )
-                    return response_text
-                except InferenceError as e:
-                    self.logger.warning(f"LMStudio inference failed: {e}")
-                    # Fall back to Ollama
-                    pass
+        # Check if user prefers LM Studio
+        prefer_lmstudio = os.getenv("PREFER_LMSTUDIO", "false").lower() in ("true", "1", "yes")
 
-                # Fall back to Ollama if LM Studio failed
-                try:
-                    self._active_provider = "ollama"
-                    self.logger.info("Using Ollama as fallback")
-                    response_text = await self.ollama.chat(
-                        messages, max_context_tokens, emotional_state_before
+        if prefer_lmstudio:
+            # Try LM Studio first if preferred
+            try:
+                self._active_provider = "lmstudio"
+                self.logger.debug("Using LMStudio provider (preferred)")
+                response_text = await self.lmstudio.chat(
+                    messages, max_context_tokens, emotional_state_before
+                )
+                # Record success metrics
+                if response_text:
+                    self._record_success_metrics(
+                        "lmstudio", messages, response_text, start_time
                     )
-                    if response_text:
-                        response_time_ms = (time.time() - start_time) * 1000
-                        tokens_generated = self._count_tokens(response_text)
-                        prompt_tokens = sum(self._count_tokens(m["content"]) for m in messages)
-
-                        metrics = get_llm_metrics()
-                        metrics.record_inference(
-                            response_time_ms=response_time_ms,
-                            tokens_generated=tokens_generated,
-                            inference_latency_ms=response_time_ms,
-                            prompt_tokens=prompt_tokens,
-                            model="ollama"
-                        )
-                    return response_text
-                except InferenceError as e:
-                    self.logger.error(f"Both providers failed: {e}")
-                    metrics = get_llm_metrics()
-                    metrics.record_error("both_providers_failed", model="unified")
-                    raise InferenceError("Both LMStudio and Ollama failed")
-
-            # Default: Try Ollama first
+                return response_text
+            except InferenceError as e:
+                self.logger.warning(f"LMStudio inference failed: {e}")
+                # Fall back to Ollama
+                pass
+
+            # Fall back to Ollama if LM Studio failed
             try:
                 self._active_provider = "ollama"
-                self.logger.debug("Using Ollama provider")
+                self.logger.info("Using Ollama as fallback")
                 response_text = await self.ollama.chat(
                     messages, max_context_tokens, emotional_state_before
                 )
-                # Record success metrics
                 if response_text:
-                    response_time_ms = (time.time() - start_time) * 1000
-                    tokens_generated = self._count_tokens(response_text)
-                    prompt_tokens = sum(self._count_tokens(m["content"]) for m in messages)
-
-                    metrics = get_llm_metrics()
-                    metrics.record_inference(
-                        response_time_ms=response_time_ms,
-                        tokens_generated=tokens_generated,
-                        inference_latency_ms=response_time_ms,
-                        prompt_tokens=prompt_tokens,
-                        model="ollama"
+                    self._record_success_metrics(
+                        "ollama", messages, response_text, start_time
                     )
                 return response_text
             except InferenceError as e:
-                self.logger.warning(f"Ollama inference failed: {e}")
-                error_type = "ollama_failed"
-                if not self.config.enable_lmstudio_fallback:
-                    # Record error
-                    metrics = get_llm_metrics()
-                    metrics.record_error("ollama_unavailable", model="ollama")
-                    raise
+                self.logger.error(f"Both providers failed: {e}")
+                metrics = get_llm_metrics()
+                metrics.record_error("both_providers_failed", model="unified")
+                raise InferenceError("Both LMStudio and Ollama failed")
 
-            # Fall back to LMStudio if enabled
-            if self.config.enable_lmstudio_fallback:
-                try:
-                    self._active_provider = "lmstudio"
-                    self.logger.info("Switched to LMStudio provider")
-                    response_text = await self.lmstudio.chat(
-                        messages, max_context_tokens, emotional_state_before
+        # Default: Try Ollama first
+        try:
+            self._active_provider = "ollama"
+            self.logger.debug("Using Ollama provider")
+            response_text = await self.ollama.chat(
+                messages, max_context_tokens, emotional_state_before
+            )
+            # Record success metrics
+            if response_text:
+                self._record_success_metrics(
+                    "ollama", messages, response_text, start_time
+                )
+            return response_text
+        except InferenceError as e:
+            self.logger.warning(f"Ollama inference failed: {e}")
+            error_type = "ollama_failed"
+            if not self.config.enable_lmstudio_fallback:
+                # Record error
+                metrics = get_llm_metrics()
+                metrics.record_error("ollama_unavailable", model="ollama")
+                raise
+
+        # Fall back to LMStudio if enabled
+        if self.config.enable_lmstudio_fallback:
+            try:
+                self._active_provider = "lmstudio"
+                self.logger.info("Switched to LMStudio provider")
+                response_text = await self.lmstudio.chat(
+                    messages, max_context_tokens, emotional_state_before
+                )
+                # Record success metrics
+                if response_text:
+                    self._record_success_metrics(
+                        "lmstudio", messages, response_text, start_time
                     )
-                    # Record success metrics
+                return response_text
+            except InferenceError as e:
+                self.logger.error(f"LMStudio inference also failed: {e}")
+                # Record error for both providers
+                metrics = get_llm_metrics()
+                metrics.record_error("lmstudio_failed", model="lmstudio")
+                metrics.record_error("both_providers_failed", model="unified")
+                raise InferenceError(
+                    "Both Ollama and LMStudio providers failed. "
+                    "Please ensure at least one is running."
+                )
+
+        # Record error if no provider available
+        metrics = get_llm_metrics()
+        metrics.record_error("no_provider_available", model="unified")
+        raise InferenceError(
+            "Ollama provider failed and fallback is disabled. "
+            "Please ensure Ollama is running or enable LMStudio fallback."
+        )
+
+    async def chat_stream(
+        self,
+        messages: List[Dict[str, str]],
+        max_context_tokens: int = 8000,
+        emotional_state_before=None,
+        priority: RequestPriority = RequestPriority.TEXT,
+    ) -> AsyncIterator[StreamChunk]:
+        """
+        Stream a response from the available provider.
+
+        Providers are tried in the same order as chat(). A provider that
+        fails before emitting its first token is skipped in favour of the
+        next one; a failure after tokens have been delivered is raised,
+        since the partial output cannot be retracted.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            max_context_tokens: Maximum tokens allowed
+            emotional_state_before: Optional emotional state for response processing
+            priority: Scheduling lane; the slot is held until the stream ends
+
+        Yields:
+            StreamChunk per text delta, then a final chunk with done=True
+            carrying the full (processed, if a processor is configured) text
+
+        Raises:
+            LLMOverloadedError: If the request was shed by admission control
+            InferenceError: If no provider could produce a response
+        """
+        self._active_requests += 1
+        self._total_requests += 1
+
+        try:
+            async with self._admit(priority):
+                start_time = time.time()
+                metrics = get_llm_metrics()
+                providers = self._provider_order()
+
+                for provider_name in providers:
+                    provider = self.ollama if provider_name == "ollama" else self.lmstudio
+                    self._active_provider = provider_name
+                    parts: List[str] = []
+
+                    try:
+                        async for delta in provider.chat_stream(messages, max_context_tokens):
+                            if not parts:
+                                metrics.record_time_to_first_token(
+                                    (time.time() - start_time) * 1000, model=provider_name
+                                )
+                            parts.append(delta)
+                            yield StreamChunk(delta=delta, provider=provider_name)
+                    except InferenceError as e:
+                        if parts:
+                            self.logger.error(
+                                f"{provider_name} stream interrupted after first token: {e}"
+                            )
+                            metrics.record_error("stream_interrupted", model=provider_name)
+                            raise InferenceError(f"Response stream interrupted: {e}")
+
+                        self.logger.warning(
+                            f"{provider_name} stream failed before first token: {e}"
+                        )
+                        metrics.record_error(f"{provider_name}_failed", model=provider_name)
+                        continue
+
+                    response_text = "".join(parts)
                     if response_text:
-                        response_time_ms = (time.time() - start_time) * 1000
-                        tokens_generated = self._count_tokens(response_text)
-                        prompt_tokens = sum(self._count_tokens(m["content"]) for m in messages)
-
-                        metrics = get_llm_metrics()
-                        metrics.record_inference(
-                            response_time_ms=response_time_ms,
-                            tokens_generated=tokens_generated,
-                            inference_latency_ms=response_time_ms,
-                            prompt_tokens=prompt_tokens,
-                            model="lmstudio"
+                        self._record_success_metrics(
+                            provider_name, messages, response_text, start_time
                         )
-                    return response_text
-                except InferenceError as e:
-                    self.logger.error(f"LMStudio inference also failed: {e}")
-                    # Record error for both providers
-                    metrics = get_llm_metrics()
-                    metrics.record_error("lmstudio_failed", model="lmstudio")
-                    metrics.record_error("both_providers_failed", model="unified")
-                    raise InferenceError(
-                        "Both Ollama and LMStudio providers failed. "
-                        "Please ensure at least one is running."
+
+                    processed = None
+                    if self.response_processor and emotional_state_before:
+                        processed = self.response_processor.process_response(
+                            response_text=response_text,
+                            inference_time_sec=time.time() - start_time,
+                            emotional_state_before=emotional_state_before,
+                            interaction_type="successful_response",
+                        )
+                        response_text = processed.as_text()
+
+                    yield StreamChunk(
+                        done=True,
+                        text=response_text,
+                        provider=provider_name,
+                        processed=processed,
                     )
+                    return
 
-            # Record error if no provider available
-            metrics = get_llm_metrics()
-            metrics.record_error("no_provider_available", model="unified")
-            raise InferenceError(
-                "Ollama provider failed and fallback is disabled. "
-                "Please ensure Ollama is running or enable LMStudio fallback."
-            )
+                metrics.record_error(
+                    "both_providers_failed" if len(providers) > 1 else "no_provider_available",
+                    model="unified",
+                )
+                raise InferenceError(
+                    f"All LLM providers failed to stream a response ({', '.join(providers)}). "
+                    "Please ensure at least one is running."
+                )
         finally:
             self._active_requests = max(0, self._active_requests - 1)
 
+    @asynccontextmanager
+    async def _admit(self, priority: RequestPriority) -> AsyncIterator[None]:
+        """Hold a scheduler slot, converting load shedding into LLMOverloadedError."""
+        try:
+            await self.scheduler.acquire(priority)
+        except SchedulerOverloadedError as e:
+            raise LLMOverloadedError(str(e)) from e
+        try:
+            yield
+        finally:
+            self.scheduler.release()
+
+    def _provider_order(self) -> List[str]:
+        """Return provider names in the order chat() tries them."""
+        prefer_lmstudio = os.getenv("PREFER_LMSTUDIO", "false").lower() in ("true", "1", "yes")
+        if prefer_lmstudio:
+            return ["lmstudio", "ollama"]
+        if self.config.enable_lmstudio_fallback:
+            return ["ollama", "lmstudio"]
+        return ["ollama"]
+
     def get_active_requests(self) -> int:
         """Return the number of currently active requests."""
         return self._active_requests
@@ -850,39 +1106,71 @@ class UnifiedLLMInference:
         """Return the total number of requests processed."""
         return self._total_requests
 
+    def get_scheduler_stats(self) -> Dict[str, Any]:
+        """Return admission control stats (active, queued, waits, shed counts)."""
+        return self.scheduler.get_stats()
+
+    def get_pool_stats(self) -> Dict[str, Dict]:
+        """Return connection pool utilization stats keyed by provider."""
+        return {
+            "ollama": self.ollama_pool.get_stats(),
+            "lmstudio": self.lmstudio_pool.get_stats(),
+        }
+
+    async def close(self) -> None:
+        """Close both provider connection pools."""
+        for pool in (self.ollama_pool, self.lmstudio_pool):
+            try:
+                await pool.close()
+            except Exception as e:
+                self.logger.warning(f"Failed to close {pool.provider} pool: {e}")
+        self.logger.info("LLM connection pools closed")
+
+    def _record_success_metrics(
+        self,
+        provider: str,
+        messages: List[Dict[str, str]],
+        response_text: str,
+        start_time: float,
+    ) -> None:
+        """
+        Record inference and pool utilization metrics for a successful request.
+
+        Args:
+            provider: Provider that produced the response ("ollama" or "lmstudio")
+            messages: Prompt messages sent to the provider
+            response_text: Generated response text
+            start_time: Request start time from time.time()
+        """
+        response_time_ms = (time.time() - start_time) * 1000
+        tokens_generated = self._count_tokens(response_text)
+        prompt_tokens = sum(
+            self.token_counter.count_messages(messages, model=self.config.model_name)
+        )
+
+        metrics = get_llm_metrics()
+        metrics.record_inference(
+            response_time_ms=response_time_ms,
+            tokens_generated=tokens_generated,
+            inference_latency_ms=response_time_ms,
+            prompt_tokens=prompt_tokens,
+            model=provider,
+        )
+        pool = self.ollama_pool if provider == "ollama" else self.lmstudio_pool
+        metrics.record_pool_stats(pool.get_stats())
+
     def _count_tokens(self, text: str) -> int:
         """
-        Count tokens in text (delegates to active provider or uses fallback estimation).
+        Count tokens in text via the shared TokenCounter.
 
         Args:
             text: Text to count tokens for
 
         Returns:
-            Estimated token count
+            Token count
         """
-        # Try to use transformers tokenizer
-        if not self._tokenizer_attempted:
-            try:
-                from transformers import AutoTokenizer
-
-                self._tokenizer = AutoTokenizer.from_pretrained(
-                    "meta-llama/Llama-2-7b-hf"
-                )
-                self._tokenizer_attempted = True
-                self.logger.debug("Loaded transformers tokenizer for token counting")
-            except Exception as e:
-                self._tokenizer_attempted = True
-                self.logger.debug(
-                    f"Tokenizer unavailable, using fallback estimation: {type(e).__name__}"
-                )
-
-        # Use tokenizer if available
-        if self._tokenizer:
-            try:
-                tokens = self._tokenizer.encode(text, add_special_tokens=False)
-                return len(tokens)
-            except Exception as e:
-                self.logger.warning(f"Tokenizer encoding failed: {e}, using fallback")
+        return self.token_counter.count(text, model=self.config.model_name)
 
-        # Fallback: rough estimation (1 token ≈ 4 characters)
-        return len(text) // 4
+    def get_token_stats(self) -> Dict[str, Any]:
+        """Return shared token counter cache and per-model statistics."""
+        return self.token_counter.get_stats()
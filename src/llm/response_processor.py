@@ -6,11 +6,13 @@ and conversation persistence after Ollama inference.
 """
 
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass, field, asdict
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 from datetime import datetime, timezone
 
 from src.core.logger import DemiLogger
+from src.llm.tokenizer import get_token_counter
 from src.emotion.models import EmotionalState
 from src.emotion.interactions import InteractionHandler, InteractionType
 from src.emotion.persistence import EmotionPersistence
@@ -36,16 +38,42 @@ class ProcessedResponse:
     refusal_detected: bool = False
     refusal_category: Optional[str] = None
     refusal_reason: Optional[str] = None
+    stage_timings_ms: Dict[str, float] = field(default_factory=dict)  # Per-stage latency
+
+    def as_text(self) -> "ProcessedText":
+        """Return the cleaned text tagged as already processed."""
+        return ProcessedText(self)
+
+
+class ProcessedText(str):
+    """
+    Response text that has already been through ResponseProcessor.
+
+    Behaves like the cleaned text, but carries its ProcessedResponse so that a
+    later process_response() call (e.g. from the conductor after the inference
+    layer already processed it) returns the existing result instead of
+    cleaning, updating emotions and persisting a second time.
+    """
+
+    processed: ProcessedResponse
+
+    def __new__(cls, processed: ProcessedResponse):
+        obj = super().__new__(cls, processed.text)
+        obj.processed = processed
+        return obj
 
 
 class ResponseProcessor:
     """
     Post-processes LLM responses from Ollama.
 
-    Cleans response text, counts tokens, logs interactions,
-    updates emotional state, and persists data.
+    Runs a fixed pipeline of timed stages exactly once per response:
+    refusal check, clean (text cleanup and token count), emotion update,
+    persist, metrics.
     """
 
+    STAGES = ("refusal", "clean", "emotion", "persist", "metrics")
+
     # Special tokens to remove
     SPECIAL_TOKENS = {
         "<|end|>",
@@ -71,6 +99,7 @@ class ResponseProcessor:
         db_session,
         interaction_handler: InteractionHandler,
         refusal_system: Optional[RefusalSystem] = None,
+        emotion_store=None,
     ):
         """
         Initialize response processor.
@@ -80,23 +109,33 @@ class ResponseProcessor:
             db_session: SQLAlchemy session for database operations
             interaction_handler: InteractionHandler for emotional updates
             refusal_system: Optional RefusalSystem for boundary enforcement
+            emotion_store: Optional EmotionStateStore; interaction logs are
+                buffered there and written with its next flush instead of
+                hitting SQLite on the response path
         """
         self.logger = logger
         self.db_session = db_session
         self.interaction_handler = interaction_handler
         self.emotion_persistence = EmotionPersistence()
+        self.emotion_store = emotion_store
         self.refusal_system = refusal_system or RefusalSystem(logger)
 
         # Refusal tracking
         self.refusal_attempts = {}  # Track refusal attempts by user/session
 
+        # Per-stage latency totals across all processed responses
+        self._stage_stats: Dict[str, Dict[str, float]] = {
+            stage: {"count": 0, "total_ms": 0.0, "max_ms": 0.0} for stage in self.STAGES
+        }
+        self._skipped_reprocessing = 0
+
         self.logger.debug("ResponseProcessor initialized")
 
     def process_response(
         self,
         response_text: str,
         inference_time_sec: float,
-        emotional_state_before: EmotionalState,
+        emotional_state_before: Union[EmotionalState, Dict[str, Any]],
         interaction_type: str = "successful_response",
         should_check_refusal: bool = True,
         request_context: Optional[Dict[str, Any]] = None,
@@ -104,22 +143,37 @@ class ResponseProcessor:
         """
         Process raw response from Ollama.
 
+        If response_text is a ProcessedText (already processed by another
+        layer), its existing ProcessedResponse is returned and no stage runs
+        again.
+
         Args:
             response_text: Raw text from Ollama or user request
             inference_time_sec: Time taken for inference
-            emotional_state_before: Emotional state before interaction
+            emotional_state_before: Emotional state (or its dict form) before interaction
             interaction_type: Type of interaction (for logging)
             should_check_refusal: Whether to check for refusal before processing
             request_context: Context about the request (for refusal detection)
 
         Returns:
-            ProcessedResponse with cleaned text and logs
+            ProcessedResponse with cleaned text, logs and stage timings
         """
-        # Step 1: Check for refusal if enabled and this is a user request
+        if isinstance(response_text, ProcessedText):
+            self._skipped_reprocessing += 1
+            self.logger.debug("Response already processed, skipping pipeline")
+            return response_text.processed
+
+        if isinstance(emotional_state_before, dict):
+            emotional_state_before = EmotionalState.from_dict(emotional_state_before)
+
+        timings: Dict[str, float] = {}
+
+        # Stage: refusal check (user requests only)
         if should_check_refusal and interaction_type == "user_request":
-            refusal_analysis = self.refusal_system.should_refuse(
-                response_text, request_context
-            )
+            with self._stage("refusal", timings):
+                refusal_analysis = self.refusal_system.should_refuse(
+                    response_text, request_context
+                )
             if refusal_analysis.should_refuse:
                 # Category should never be None when should_refuse is True
                 return self._handle_refusal(
@@ -127,15 +181,14 @@ class ResponseProcessor:
                     emotional_state_before,
                     inference_time_sec,
                     request_context,
+                    timings,
                 )
 
-        # Step 2: Clean response text
-        cleaned_text = self._clean_text(response_text)
-
-        # Step 2: Count tokens in cleaned response
-        tokens_generated = self._count_tokens(cleaned_text)
+        # Stage: clean response text and count tokens
+        with self._stage("clean", timings):
+            cleaned_text = self._clean_text(response_text)
+            tokens_generated = self._count_tokens(cleaned_text)
 
-        # Step 3: Log interaction
         interaction_log = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "interaction_type": interaction_type,
@@ -145,50 +198,87 @@ class ResponseProcessor:
             "response_length": len(cleaned_text),
         }
 
-        # Step 4: Update emotional state
-        emotional_state_after = self._update_emotional_state(
-            emotional_state_before, cleaned_text, interaction_type
-        )
+        # Stage: update emotional state
+        with self._stage("emotion", timings):
+            emotional_state_after = self._update_emotional_state(
+                emotional_state_before, cleaned_text, interaction_type
+            )
+
+        # Stage: persist to database
+        with self._stage("persist", timings):
+            self._persist_interaction(
+                interaction_log, emotional_state_before, emotional_state_after
+            )
+
+        # Stage: record conversation metrics if available
+        with self._stage("metrics", timings):
+            self._record_conversation_metrics(cleaned_text)
 
-        # Step 5: Persist to database
-        self._persist_interaction(
-            interaction_log, emotional_state_before, emotional_state_after
+        self.logger.info(
+            f"Processed response ({tokens_generated} tokens) in {inference_time_sec:.2f}sec. "
+            f"Emotion delta: loneliness {emotional_state_before.loneliness:.1f} → "
+            f"{emotional_state_after.loneliness:.1f}"
         )
 
-        # Step 6: Create ProcessedResponse
-        processed = ProcessedResponse(
+        return ProcessedResponse(
             text=cleaned_text,
             tokens_generated=tokens_generated,
             inference_time_sec=inference_time_sec,
             interaction_log=interaction_log,
             emotional_state_before=emotional_state_before,
             emotional_state_after=emotional_state_after,
+            stage_timings_ms=timings,
         )
 
-        # Step 7: Record conversation metrics if available
-        if HAS_CONVERSATION_METRICS:
-            try:
-                conv_metrics = get_conversation_metrics()
-                # Estimate user message length (not always available, use 0 as placeholder)
-                # This gets updated by platform integrations
-                conv_metrics.record_conversation(
-                    user_message_length=0,  # Updated by platform integrations
-                    bot_response_length=len(cleaned_text),
-                    conversation_turn=1,  # Simplified, should track per user
-                    sentiment_score=0.5  # Simplified, could calculate from response
-                )
-            except Exception as e:
-                self.logger.debug(f"Failed to record conversation metrics: {e}")
+    def get_stage_stats(self) -> Dict[str, Any]:
+        """
+        Get per-stage latency statistics.
 
-        # Step 8: Log at INFO level
-        self.logger.info(
-            f"Processed response ({tokens_generated} tokens) in {inference_time_sec:.2f}sec. "
-            f"Emotion delta: loneliness {emotional_state_before.loneliness:.1f} → "
-            f"{emotional_state_after.loneliness:.1f}"
-        )
+        Returns:
+            Dict of stage -> {count, avg_ms, max_ms}, plus skipped_reprocessing
+        """
+        stages = {
+            stage: {
+                "count": int(stats["count"]),
+                "avg_ms": round(stats["total_ms"] / stats["count"], 3)
+                if stats["count"]
+                else 0.0,
+                "max_ms": round(stats["max_ms"], 3),
+            }
+            for stage, stats in self._stage_stats.items()
+        }
+        return {"stages": stages, "skipped_reprocessing": self._skipped_reprocessing}
 
-        # Step 9: Return
-        return processed
+    @contextmanager
+    def _stage(self, name: str, timings: Dict[str, float]):
+        """Time one pipeline stage into the request timings and totals."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            timings[name] = elapsed_ms
+            stats = self._stage_stats[name]
+            stats["count"] += 1
+            stats["total_ms"] += elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+
+    def _record_conversation_metrics(self, cleaned_text: str) -> None:
+        """Record conversation metrics for a processed response."""
+        if not HAS_CONVERSATION_METRICS:
+            return
+        try:
+            conv_metrics = get_conversation_metrics()
+            # Estimate user message length (not always available, use 0 as placeholder)
+            # This gets updated by platform integrations
+            conv_metrics.record_conversation(
+                user_message_length=0,  # Updated by platform integrations
+                bot_response_length=len(cleaned_text),
+                conversation_turn=1,  # Simplified, should track per user
+                sentiment_score=0.5  # Simplified, could calculate from response
+            )
+        except Exception as e:
+            self.logger.debug(f"Failed to record conversation metrics: {e}")
 
     def _handle_refusal(
         self,
@@ -196,6 +286,7 @@ class ResponseProcessor:
         emotional_state_before: EmotionalState,
         inference_time_sec: float,
         request_context: Optional[Dict[str, Any]] = None,
+        timings: Optional[Dict[str, float]] = None,
     ) -> ProcessedResponse:
         """
         Handle a refused request by generating a personality-appropriate refusal.
@@ -205,19 +296,24 @@ class ResponseProcessor:
             emotional_state_before: Emotional state before interaction
             inference_time_sec: Time taken for processing
             request_context: Request context for attempt tracking
+            timings: Stage timings collected so far for this request
 
         Returns:
             ProcessedResponse with refusal text and metadata
         """
+        timings = {} if timings is None else timings
+
         # Track refusal attempts
         attempt_count = self._track_refusal_attempt(request_context)
 
         # Generate personality-appropriate refusal
         # Ensure category is not None (it should never be None when should_refuse is True)
         category = refusal_analysis.category or RefusalCategory.HARMFUL_REQUESTS
-        refusal_text, refusal_metadata = self.refusal_system.generate_refusal(
-            category, emotional_state_before, attempt_count
-        )
+        with self._stage("clean", timings):
+            refusal_text, refusal_metadata = self.refusal_system.generate_refusal(
+                category, emotional_state_before, attempt_count
+            )
+            token_count = self._count_tokens(refusal_text)
 
         # Create interaction log for refusal
         interaction_log = {
@@ -225,7 +321,7 @@ class ResponseProcessor:
             "interaction_type": "refusal",
             "response_text": refusal_text,
             "inference_time_sec": inference_time_sec,
-            "token_count": self._count_tokens(refusal_text),
+            "token_count": token_count,
             "response_length": len(refusal_text),
             "refusal_category": category.value,
             "refusal_confidence": refusal_analysis.confidence,
@@ -235,25 +331,25 @@ class ResponseProcessor:
 
         # Update emotional state for refusal interaction
         # Use USER_REFUSAL interaction type instead of SUCCESSFUL_HELP
-        from src.emotion.interactions import InteractionType
-
-        emotional_state_after = self._update_emotional_state_refusal(
-            emotional_state_before, refusal_analysis, interaction_type="refusal"
-        )
+        with self._stage("emotion", timings):
+            emotional_state_after = self._update_emotional_state_refusal(
+                emotional_state_before, refusal_analysis, interaction_type="refusal"
+            )
 
         # Persist refusal to database
-        self._persist_refusal_interaction(
-            interaction_log,
-            emotional_state_before,
-            emotional_state_after,
-            refusal_analysis,
-            category,
-        )
+        with self._stage("persist", timings):
+            self._persist_refusal_interaction(
+                interaction_log,
+                emotional_state_before,
+                emotional_state_after,
+                refusal_analysis,
+                category,
+            )
 
         # Create ProcessedResponse with refusal data
         processed = ProcessedResponse(
             text=refusal_text,
-            tokens_generated=self._count_tokens(refusal_text),
+            tokens_generated=token_count,
             inference_time_sec=inference_time_sec,
             interaction_log=interaction_log,
             emotional_state_before=emotional_state_before,
@@ -261,6 +357,7 @@ class ResponseProcessor:
             refusal_detected=True,
             refusal_category=category.value,
             refusal_reason=refusal_analysis.reason,
+            stage_timings_ms=timings,
         )
 
         # Log refusal at INFO level
@@ -350,6 +447,10 @@ class ResponseProcessor:
             self.logger.debug(f"Manual refusal emotion adjustments applied")
             return state
 
+    def _interaction_sink(self):
+        """Return where interaction logs go: the state store if wired, else SQLite."""
+        return self.emotion_store or self.emotion_persistence
+
     def _persist_refusal_interaction(
         self,
         interaction_log: Dict[str, Any],
@@ -372,7 +473,7 @@ class ResponseProcessor:
         """
         try:
             # Save to emotion persistence with refusal-specific data
-            self.emotion_persistence.log_interaction(
+            self._interaction_sink().log_interaction(
                 interaction_type=InteractionType.USER_REFUSAL,
                 state_before=emotional_state_before,
                 state_after=emotional_state_after,
@@ -607,15 +708,16 @@ class ResponseProcessor:
         """
         Count tokens in text.
 
-        Uses fallback estimation: 1 token ≈ 4 characters.
+        Uses the shared TokenCounter, so a response already counted by the
+        inference layer is served from cache. Never returns less than 1.
 
         Args:
             text: Text to count tokens for
 
         Returns:
-            Estimated token count
+            Token count (minimum 1)
         """
-        return max(1, len(text) // 4)
+        return max(1, get_token_counter().count(text))
 
     def _update_emotional_state(
         self, state_before: EmotionalState, response_text: str, interaction_type: str
@@ -680,7 +782,7 @@ class ResponseProcessor:
         """
         try:
             # Save to emotion persistence
-            self.emotion_persistence.log_interaction(
+            self._interaction_sink().log_interaction(
                 interaction_type=InteractionType.SUCCESSFUL_HELP,
                 state_before=emotional_state_before,
                 state_after=emotional_state_after,
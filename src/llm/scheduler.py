@@ -0,0 +1,265 @@
+"""
+Admission control and priority scheduling for LLM inference.
+
+Limits how many requests hit the model provider at once and orders waiting
+requests by priority lane, so an interactive voice turn is never stuck behind
+a batch of rambles or a self-improvement code review. The wait queue is
+bounded: when it is full, the lowest-priority waiter is shed (or the new
+request is rejected) so callers fail fast instead of piling up.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from src.core.logger import DemiLogger, get_logger
+from src.monitoring.metrics import get_llm_metrics
+
+
+class RequestPriority(IntEnum):
+    """Priority lanes for LLM requests (lower value is served first)."""
+
+    VOICE = 0
+    TEXT = 1
+    AUTONOMOUS = 2
+    SELF_IMPROVEMENT = 3
+
+    @classmethod
+    def for_platform(
+        cls, platform: str, context: Optional[Dict[str, Any]] = None
+    ) -> "RequestPriority":
+        """
+        Classify a platform request into a priority lane.
+
+        Args:
+            platform: Platform identifier (e.g., "discord", "voice", "android_autonomy")
+            context: Optional request context (rambles set "is_ramble")
+
+        Returns:
+            RequestPriority for the request
+        """
+        context = context or {}
+        if context.get("is_ramble") or platform.endswith("_autonomy"):
+            return cls.AUTONOMOUS
+        if platform.startswith("voice") or context.get("is_voice"):
+            return cls.VOICE
+        return cls.TEXT
+
+
+class SchedulerOverloadedError(Exception):
+    """Request rejected or shed because the LLM queue is full."""
+
+    def __init__(self, priority: RequestPriority, queue_depth: int):
+        self.priority = priority
+        self.queue_depth = queue_depth
+        super().__init__(
+            f"LLM queue full ({queue_depth} waiting), "
+            f"{priority.name.lower()} request shed"
+        )
+
+
+@dataclass(order=True)
+class _Waiter:
+    """Queued request waiting for a concurrency slot."""
+
+    priority: int
+    seq: int
+    future: asyncio.Future = field(compare=False)
+    enqueued_at: float = field(compare=False, default=0.0)
+
+
+class LLMScheduler:
+    """
+    Concurrency limiter with priority lanes and bounded queue depth.
+
+    Slots are handed directly from a finishing request to the highest-priority
+    waiter (FIFO within a lane), so a new arrival can never jump the queue.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 2,
+        max_queue_depth: int = 32,
+        logger: Optional[DemiLogger] = None,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            max_concurrent: Maximum requests running against providers at once
+            max_queue_depth: Maximum requests waiting for a slot before shedding
+            logger: Optional DemiLogger (defaults to global logger)
+        """
+        if max_concurrent <= 0:
+            raise ValueError("max_concurrent must be greater than 0")
+        if max_queue_depth < 0:
+            raise ValueError("max_queue_depth must be non-negative")
+
+        self.max_concurrent = max_concurrent
+        self.max_queue_depth = max_queue_depth
+        self.logger = logger or get_logger()
+
+        self._active = 0
+        self._queue: List[_Waiter] = []
+        self._seq = itertools.count()
+
+        self._admitted = 0
+        self._shed_by_priority: Dict[str, int] = {p.name.lower(): 0 for p in RequestPriority}
+        self._total_wait_ms = 0.0
+        self._max_wait_ms = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests currently waiting for a slot."""
+        return sum(1 for w in self._queue if not w.future.done())
+
+    @property
+    def active(self) -> int:
+        """Number of requests currently holding a slot."""
+        return self._active
+
+    @asynccontextmanager
+    async def slot(
+        self, priority: RequestPriority = RequestPriority.TEXT
+    ) -> AsyncIterator[float]:
+        """
+        Hold a concurrency slot for the duration of one request.
+
+        Args:
+            priority: Priority lane of the request
+
+        Yields:
+            Time spent waiting in the queue, in milliseconds
+
+        Raises:
+            SchedulerOverloadedError: If the request was rejected or shed
+        """
+        wait_ms = await self.acquire(priority)
+        try:
+            yield wait_ms
+        finally:
+            self.release()
+
+    async def acquire(self, priority: RequestPriority = RequestPriority.TEXT) -> float:
+        """
+        Wait for a concurrency slot.
+
+        Args:
+            priority: Priority lane of the request
+
+        Returns:
+            Time spent waiting in the queue, in milliseconds
+
+        Raises:
+            SchedulerOverloadedError: If the request was rejected or shed
+        """
+        priority = RequestPriority(priority)
+        metrics = get_llm_metrics()
+
+        if self._active < self.max_concurrent and self.queue_depth == 0:
+            self._active += 1
+            self._admitted += 1
+            metrics.record_queue_wait(0.0, priority.name.lower())
+            return 0.0
+
+        if self.queue_depth >= self.max_queue_depth:
+            self._shed_for(priority)
+
+        waiter = _Waiter(
+            priority=int(priority),
+            seq=next(self._seq),
+            future=asyncio.get_running_loop().create_future(),
+            enqueued_at=time.monotonic(),
+        )
+        heapq.heappush(self._queue, waiter)
+        metrics.record_queue_depth(self.queue_depth, self._active)
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Slot was handed over just as we were cancelled: pass it on
+                if waiter.future.exception() is None:
+                    self.release()
+            else:
+                waiter.future.cancel()
+            raise
+
+        wait_ms = (time.monotonic() - waiter.enqueued_at) * 1000
+        self._admitted += 1
+        self._total_wait_ms += wait_ms
+        self._max_wait_ms = max(self._max_wait_ms, wait_ms)
+        metrics.record_queue_wait(wait_ms, priority.name.lower())
+        return wait_ms
+
+    def release(self) -> None:
+        """Release a slot, handing it to the highest-priority waiter if any."""
+        while self._queue:
+            waiter = heapq.heappop(self._queue)
+            if waiter.future.done():
+                continue  # Cancelled or shed while waiting
+            waiter.future.set_result(None)
+            get_llm_metrics().record_queue_depth(self.queue_depth, self._active)
+            return  # Slot transferred; active count unchanged
+
+        self._active = max(0, self._active - 1)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Return scheduler statistics.
+
+        Returns:
+            Dict with limits, active/queued counts, wait times and shed totals
+        """
+        waiting: Dict[str, int] = {p.name.lower(): 0 for p in RequestPriority}
+        for w in self._queue:
+            if not w.future.done():
+                waiting[RequestPriority(w.priority).name.lower()] += 1
+
+        return {
+            "max_concurrent": self.max_concurrent,
+            "max_queue_depth": self.max_queue_depth,
+            "active": self._active,
+            "queue_depth": sum(waiting.values()),
+            "waiting_by_priority": waiting,
+            "admitted": self._admitted,
+            "shed": sum(self._shed_by_priority.values()),
+            "shed_by_priority": dict(self._shed_by_priority),
+            "avg_wait_ms": round(self._total_wait_ms / self._admitted, 2)
+            if self._admitted
+            else 0.0,
+            "max_wait_ms": round(self._max_wait_ms, 2),
+        }
+
+    def _shed_for(self, priority: RequestPriority) -> None:
+        """
+        Make room in a full queue for a request of the given priority.
+
+        Sheds the newest waiter of the lowest lane if it is strictly lower
+        priority than the incoming request; otherwise rejects the incoming one.
+
+        Raises:
+            SchedulerOverloadedError: If the incoming request is rejected
+        """
+        pending = [w for w in self._queue if not w.future.done()]
+        victim = max(pending, key=lambda w: (w.priority, w.seq), default=None)
+
+        if victim is None or victim.priority <= priority:
+            self._record_shed(priority)
+            raise SchedulerOverloadedError(priority, len(pending))
+
+        victim_priority = RequestPriority(victim.priority)
+        victim.future.set_exception(SchedulerOverloadedError(victim_priority, len(pending)))
+        self._record_shed(victim_priority)
+
+    def _record_shed(self, priority: RequestPriority) -> None:
+        """Count a shed request and report it."""
+        name = priority.name.lower()
+        self._shed_by_priority[name] += 1
+        self.logger.warning(f"LLM queue full, shedding {name} request")
+        get_llm_metrics().record_load_shed(name)
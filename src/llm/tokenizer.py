@@ -0,0 +1,230 @@
+"""
+Shared token counting service for Demi's LLM layer.
+
+Loads the tokenizer once per process and memoizes token counts in a bounded
+LRU cache keyed by content hash, so the same system prompt or message is
+tokenized at most once no matter how many components ask for its length.
+Falls back to character-based estimation when transformers is unavailable.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any
+
+from src.core.logger import DemiLogger, get_logger
+
+
+DEFAULT_TOKENIZER_NAME = "meta-llama/Llama-2-7b-hf"
+
+
+class TokenCounter:
+    """
+    Process-wide token counter with LRU memoization.
+
+    Thread-safe: counts may be requested from the event loop and from worker
+    threads (e.g. voice pipelines) concurrently.
+    """
+
+    def __init__(
+        self,
+        tokenizer_name: str = DEFAULT_TOKENIZER_NAME,
+        cache_size: int = 4096,
+        logger: Optional[DemiLogger] = None,
+    ):
+        """
+        Initialize token counter.
+
+        Args:
+            tokenizer_name: Hugging Face tokenizer to load lazily on first use
+            cache_size: Maximum number of memoized counts kept in the LRU cache
+            logger: Optional DemiLogger (defaults to global logger)
+        """
+        if cache_size <= 0:
+            raise ValueError("cache_size must be greater than 0")
+
+        self.tokenizer_name = tokenizer_name
+        self.cache_size = cache_size
+        self.logger = logger or get_logger()
+
+        self._tokenizer = None
+        self._tokenizer_attempted = False
+        self._cache: "OrderedDict[bytes, int]" = OrderedDict()
+        self._lock = threading.RLock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._counts_by_model: Dict[str, Dict[str, int]] = {}
+
+    @property
+    def backend(self) -> str:
+        """Name of the active counting backend ("transformers" or "estimate")."""
+        return "transformers" if self._tokenizer is not None else "estimate"
+
+    def count(self, text: str, model: Optional[str] = None) -> int:
+        """
+        Count tokens in text, using the cache when possible.
+
+        Args:
+            text: Text to count tokens for
+            model: Optional model name the count is attributed to in stats
+
+        Returns:
+            Token count
+        """
+        return self.count_many([text], model=model)[0]
+
+    def count_messages(
+        self, messages: List[Dict[str, str]], model: Optional[str] = None
+    ) -> List[int]:
+        """
+        Count tokens for each message's content in one batch.
+
+        Args:
+            messages: Message dicts with a 'content' field
+            model: Optional model name the counts are attributed to in stats
+
+        Returns:
+            Token counts aligned with the input messages
+        """
+        return self.count_many([m["content"] for m in messages], model=model)
+
+    def count_many(self, texts: List[str], model: Optional[str] = None) -> List[int]:
+        """
+        Count tokens for several texts, batch-encoding only cache misses.
+
+        Args:
+            texts: Texts to count tokens for
+            model: Optional model name the counts are attributed to in stats
+
+        Returns:
+            Token counts aligned with the input texts
+        """
+        keys = [self._key(text) for text in texts]
+        counts: List[Optional[int]] = [None] * len(texts)
+        missing: Dict[bytes, List[int]] = {}
+
+        with self._lock:
+            for i, key in enumerate(keys):
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    self._hits += 1
+                    counts[i] = cached
+                else:
+                    missing.setdefault(key, []).append(i)
+
+        if missing:
+            miss_keys = list(missing)
+            miss_texts = [texts[missing[key][0]] for key in miss_keys]
+            encoded = self._encode_batch(miss_texts)
+
+            with self._lock:
+                for key, token_count in zip(miss_keys, encoded):
+                    self._misses += 1
+                    self._store(key, token_count)
+                    for i in missing[key]:
+                        counts[i] = token_count
+
+        if model:
+            with self._lock:
+                model_stats = self._counts_by_model.setdefault(
+                    model, {"requests": 0, "tokens": 0}
+                )
+                model_stats["requests"] += len(texts)
+                model_stats["tokens"] += sum(counts)
+
+        return counts
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Return cache and per-model counting statistics.
+
+        Returns:
+            Dict with hits, misses, hit_rate, cache size and per-model totals
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "backend": self.backend,
+                "tokenizer": self.tokenizer_name,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "cache_entries": len(self._cache),
+                "cache_size": self.cache_size,
+                "by_model": {
+                    name: dict(stats) for name, stats in self._counts_by_model.items()
+                },
+            }
+
+    def clear_cache(self) -> None:
+        """Drop all memoized counts and reset statistics."""
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self._counts_by_model.clear()
+
+    def _store(self, key: bytes, token_count: int) -> None:
+        """Insert a count into the LRU cache, evicting the oldest if full."""
+        self._cache[key] = token_count
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+            self._evictions += 1
+
+    def _encode_batch(self, texts: List[str]) -> List[int]:
+        """Tokenize texts in one call, falling back to estimation on failure."""
+        tokenizer = self._get_tokenizer()
+        if tokenizer is not None:
+            try:
+                encoded = tokenizer(texts, add_special_tokens=False)["input_ids"]
+                return [len(ids) for ids in encoded]
+            except Exception as e:
+                self.logger.warning(f"Tokenizer encoding failed: {e}, using fallback")
+
+        # Fallback: rough estimation (1 token ≈ 4 characters)
+        return [len(text) // 4 for text in texts]
+
+    def _get_tokenizer(self):
+        """Load the transformers tokenizer once per process."""
+        if self._tokenizer_attempted:
+            return self._tokenizer
+
+        with self._lock:
+            if not self._tokenizer_attempted:
+                try:
+                    from transformers import AutoTokenizer
+
+                    self._tokenizer = AutoTokenizer.from_pretrained(self.tokenizer_name)
+                    self.logger.debug("Loaded transformers tokenizer for token counting")
+                except Exception as e:
+                    self.logger.debug(
+                        f"Tokenizer unavailable, using fallback estimation: {type(e).__name__}"
+                    )
+                self._tokenizer_attempted = True
+
+        return self._tokenizer
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        """Content hash used as the cache key (avoids retaining large prompts)."""
+        return hashlib.blake2b(
+            text.encode("utf-8", errors="surrogatepass"), digest_size=16
+        ).digest()
+
+
+# Global token counter instance
+_token_counter_instance: Optional[TokenCounter] = None
+
+
+def get_token_counter() -> TokenCounter:
+    """Get global token counter instance."""
+    global _token_counter_instance
+    if _token_counter_instance is None:
+        _token_counter_instance = TokenCounter()
+    return _token_counter_instance
@@ -146,7 +146,7 @@ class MobileAPIServer:
                     return {"emotions": {}, "timestamp": datetime.now().isoformat()}
 
                 # Get emotion state from conductor (global emotion state)
-                emotion_state = self.conductor.emotion_persistence.load_latest_state()
+                emotion_state = self.conductor.emotion_store.get()
 
                 return {
                     "emotions": emotion_state.to_dict() if emotion_state else {},
@@ -449,9 +449,7 @@ class MobileAPIServer:
                             await websocket.send_json(message_response)
 
                             # Send emotional state
-                            emotion_state = (
-                                self.conductor.emotion_persistence.load_latest_state()
-                            )
+                            emotion_state = self.conductor.emotion_store.get()
                             if emotion_state:
                                 await websocket.send_json(
                                     {
@@ -7,9 +7,10 @@ from dataclasses import dataclass, asdict, field
 from datetime import datetime, timezone
 from typing import Dict, Optional
 import json
-import sqlite3
 import uuid
 
+from src.core.storage import get_database
+
 
 @dataclass
 class Ramble:
@@ -49,22 +50,21 @@ class RambleStore:
             db_path: Path to SQLite database file
         """
         self.db_path = db_path
+        self._db = get_database(db_path)
         self.ensure_table()
 
     def ensure_table(self):
         """Create rambles table if not exists"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-            CREATE TABLE IF NOT EXISTS discord_rambles (
-                ramble_id TEXT PRIMARY KEY,
-                channel_id TEXT NOT NULL,
-                content TEXT NOT NULL,
-                emotion_state JSON NOT NULL,
-                trigger TEXT NOT NULL,
-                created_at TIMESTAMP NOT NULL
-            )
-            """)
-            conn.commit()
+        self._db.execute("""
+        CREATE TABLE IF NOT EXISTS discord_rambles (
+            ramble_id TEXT PRIMARY KEY,
+            channel_id TEXT NOT NULL,
+            content TEXT NOT NULL,
+            emotion_state JSON NOT NULL,
+            trigger TEXT NOT NULL,
+            created_at TIMESTAMP NOT NULL
+        )
+        """)
 
     async def save(self, ramble: Ramble) -> None:
         """Save ramble to database
@@ -72,20 +72,18 @@ class RambleStore:
         Args:
             ramble: Ramble instance to persist
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-            INSERT INTO discord_rambles
-            (ramble_id, channel_id, content, emotion_state, trigger, created_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                ramble.ramble_id,
-                ramble.channel_id,
-                ramble.content,
-                json.dumps(ramble.emotion_state),
-                ramble.trigger,
-                ramble.created_at.isoformat()
-            ))
-            conn.commit()
+        await self._db.execute_async("""
+        INSERT INTO discord_rambles
+        (ramble_id, channel_id, content, emotion_state, trigger, created_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """, (
+            ramble.ramble_id,
+            ramble.channel_id,
+            ramble.content,
+            json.dumps(ramble.emotion_state),
+            ramble.trigger,
+            ramble.created_at.isoformat()
+        ))
 
     async def get_recent_rambles(self, hours: int = 24) -> list:
         """Get rambles from last N hours
@@ -96,7 +94,7 @@ class RambleStore:
         Returns:
             List of Ramble objects, ordered newest first
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db.read() as conn:
             rows = conn.execute("""
             SELECT ramble_id, channel_id, content, emotion_state, trigger, created_at
             FROM discord_rambles
@@ -8,6 +8,7 @@ from src.monitoring.metrics import (
     Metric,
     MetricsCollector,
     get_metrics_collector,
+    close_metrics_collector,
 )
 from src.monitoring.alerts import (
     AlertLevel,
@@ -26,6 +27,7 @@ __all__ = [
     "Metric",
     "MetricsCollector",
     "get_metrics_collector",
+    "close_metrics_collector",
     # Alerts
     "AlertLevel",
     "AlertRule",
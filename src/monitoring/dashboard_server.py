@@ -27,6 +27,7 @@ from src.monitoring.metrics import (
     get_discord_metrics,
 )
 from src.monitoring.alerts import AlertManager, get_alert_manager, AlertLevel
+from src.monitoring.latency import get_latency_registry
 
 logger = get_logger()
 security = HTTPBearer(auto_error=False)
@@ -238,11 +239,15 @@ class DashboardServer:
                 raise HTTPException(status_code=500, detail=str(e))
 
         @self.app.get("/api/emotions/history")
-        async def get_emotions_history(hours: int = 24):
+        async def get_emotions_history(hours: int = 24, max_points: int = 1500):
             """Get emotional state history.
 
+            Long ranges are served from rollups, so each emotion returns at
+            most max_points points.
+
             Args:
                 hours: Hours of history to retrieve
+                max_points: Maximum points per emotion
             """
             try:
                 # Query emotion metrics from collector
@@ -261,19 +266,19 @@ class DashboardServer:
                     "defensiveness",
                 ]
 
+                resolutions = {}
                 for emotion in emotion_names:
-                    metrics = self.metrics_collector.get_metric(
-                        f"emotion_{emotion}", timedelta(hours=hours)
+                    series = self.metrics_collector.get_series(
+                        f"emotion_{emotion}", timedelta(hours=hours), max_points
                     )
-                    if metrics:
-                        emotions_data[emotion] = [
-                            {"timestamp": m.timestamp, "value": m.value}
-                            for m in metrics
-                        ]
+                    if series["points"]:
+                        emotions_data[emotion] = series["points"]
+                        resolutions[emotion] = series["resolution"]
 
                 return {
                     "hours": hours,
                     "emotions": emotions_data,
+                    "resolutions": resolutions,
                 }
             except Exception as e:
                 logger.error("Emotions history error", error=str(e))
@@ -317,41 +322,36 @@ class DashboardServer:
             try:
                 from datetime import timedelta
                 from src.monitoring.metrics import get_llm_metrics
+                from src.llm.tokenizer import get_token_counter
 
                 llm_metrics = get_llm_metrics()
 
-                # Get recent metrics
-                response_times = self.metrics_collector.get_metric(
+                # Get recent metrics (served from the in-memory ring buffers)
+                response_times = self.metrics_collector.get_recent(
                     "llm_response_time_ms", timedelta(hours=1), limit=100
                 )
-                tokens = self.metrics_collector.get_metric(
+                tokens = self.metrics_collector.get_recent(
                     "llm_tokens_generated", timedelta(hours=1), limit=100
                 )
-                latencies = self.metrics_collector.get_metric(
+                latencies = self.metrics_collector.get_recent(
                     "llm_inference_latency_ms", timedelta(hours=1), limit=100
                 )
 
                 return {
                     "response_times": [
                         {
-                            "timestamp": m.timestamp,
-                            "value": round(m.value, 2),
+                            "timestamp": p["timestamp"],
+                            "value": round(p["value"], 2),
                         }
-                        for m in response_times
-                    ],
-                    "tokens_generated": [
-                        {
-                            "timestamp": m.timestamp,
-                            "value": m.value,
-                        }
-                        for m in tokens
+                        for p in response_times
                     ],
+                    "tokens_generated": tokens,
                     "latencies": [
                         {
-                            "timestamp": m.timestamp,
-                            "value": round(m.value, 2),
+                            "timestamp": p["timestamp"],
+                            "value": round(p["value"], 2),
                         }
-                        for m in latencies
+                        for p in latencies
                     ],
                     "stats": {
                         "avg_response_time": round(
@@ -372,11 +372,24 @@ class DashboardServer:
                             ) or 0
                         ),
                     },
+                    "percentiles": get_latency_registry().snapshot("llm_"),
+                    "tokenizer": get_token_counter().get_stats(),
                 }
             except Exception as e:
                 logger.error("LLM metrics endpoint error", error=str(e))
                 raise HTTPException(status_code=500, detail=str(e))
 
+        @self.app.get("/api/metrics/latency")
+        async def get_latency_metrics_endpoint():
+            """Get p50/p95/p99 latency over 1, 5 and 60 minute windows.
+
+            Served from in-memory histograms (LLM, STT, TTS, platforms).
+            """
+            return {
+                "histograms": get_latency_registry().snapshot(),
+                "timestamp": datetime.now().isoformat(),
+            }
+
         @self.app.get("/api/processing")
         async def get_processing_state():
             """Get current processing state (active requests, etc)."""
@@ -547,7 +560,7 @@ class DashboardServer:
                 quality = conv_metrics.get_quality_metrics(timedelta(hours=1))
 
                 # Get recent messages for context
-                recent_turns = self.metrics_collector.get_metric(
+                recent_turns = self.metrics_collector.get_recent(
                     "conversation_turn_number", timedelta(hours=1), limit=20
                 )
 
@@ -555,10 +568,10 @@ class DashboardServer:
                     "quality": quality,
                     "recent_turns": [
                         {
-                            "timestamp": m.timestamp,
-                            "turn": int(m.value),
+                            "timestamp": p["timestamp"],
+                            "turn": int(p["value"]),
                         }
-                        for m in recent_turns
+                        for p in recent_turns
                     ],
                     "timestamp": datetime.now().isoformat(),
                 }
@@ -638,6 +651,7 @@ class DashboardServer:
 
                 return {
                     "tts": tts_stats,
+                    "latency_percentiles": get_latency_registry().snapshot("tts_"),
                     "timestamp": datetime.now().isoformat(),
                 }
             except Exception as e:
@@ -657,6 +671,7 @@ class DashboardServer:
             """Get Speech-to-Text metrics and status."""
             try:
                 from src.voice.stt import FasterWhisperSTT
+                from src.voice.stt_engine import get_stt_engine
 
                 # Try to get STT instance from conductor or create new one
                 stt_stats = {
@@ -681,6 +696,8 @@ class DashboardServer:
 
                 return {
                     "stt": stt_stats,
+                    "engine": get_stt_engine().get_stats(),
+                    "latency_percentiles": get_latency_registry().snapshot("stt_"),
                     "timestamp": datetime.now().isoformat(),
                 }
             except Exception as e:
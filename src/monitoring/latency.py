@@ -0,0 +1,162 @@
+"""In-process latency histograms with sliding-window percentiles.
+
+Latency samples (LLM inference, time to first token, STT, TTS, platform
+response time) are kept in memory so p50/p95/p99 can be reported without
+touching SQLite. Each histogram is a ring of 10-second slots, each slot a
+QuantileSketch; a window query merges the slots it covers.
+
+Recording takes no lock. Slots are replaced by a single reference swap, and
+concurrent writers to the same slot can at worst lose an increment, which is
+fine for monitoring data.
+
+Usage:
+    record_latency("stt_latency_ms", 412.0)
+    get_latency_registry().get("stt_latency_ms").snapshot(300)["p95"]
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+
+from src.monitoring.sketch import QuantileSketch
+
+SLOT_SECONDS = 10
+WINDOWS = {"1m": 60, "5m": 300, "60m": 3600}
+QUANTILES = {"p50": 0.5, "p95": 0.95, "p99": 0.99}
+
+
+class _Slot:
+    """Samples recorded during one SLOT_SECONDS interval."""
+
+    __slots__ = ("index", "sketch", "sum")
+
+    def __init__(self, index: int):
+        self.index = index
+        self.sketch = QuantileSketch()
+        self.sum = 0.0
+
+
+class LatencyHistogram:
+    """Sliding-window latency histogram for one metric."""
+
+    def __init__(
+        self,
+        name: str,
+        slot_seconds: int = SLOT_SECONDS,
+        horizon_seconds: int = max(WINDOWS.values()),
+    ):
+        """Initialize histogram.
+
+        Args:
+            name: Metric name (e.g. 'llm_response_time_ms')
+            slot_seconds: Width of each time slot
+            horizon_seconds: Longest window that can be queried
+        """
+        self.name = name
+        self.slot_seconds = slot_seconds
+        self._slots: List[Optional[_Slot]] = [None] * (horizon_seconds // slot_seconds + 1)
+        self.total_count = 0
+
+    def record(self, value_ms: float, now: Optional[float] = None):
+        """Record a latency sample.
+
+        Args:
+            value_ms: Latency in milliseconds
+            now: Sample time (default: current time)
+        """
+        index = int((now if now is not None else time.time()) // self.slot_seconds)
+        position = index % len(self._slots)
+        slot = self._slots[position]
+        if slot is None or slot.index != index:
+            slot = _Slot(index)
+            self._slots[position] = slot
+        slot.sketch.add(value_ms)
+        slot.sum += value_ms
+        self.total_count += 1
+
+    def snapshot(self, window_seconds: int, now: Optional[float] = None) -> Dict[str, Any]:
+        """Summarize samples from the last window_seconds.
+
+        Args:
+            window_seconds: Window length (at most the histogram horizon)
+            now: Reference time (default: current time)
+
+        Returns:
+            Dict with count, avg, min, max, p50, p95, p99 (None when empty)
+        """
+        current = int((now if now is not None else time.time()) // self.slot_seconds)
+        oldest = current - window_seconds // self.slot_seconds + 1
+
+        merged = QuantileSketch()
+        total = 0.0
+        for slot in list(self._slots):
+            if slot is not None and oldest <= slot.index <= current:
+                merged.merge(slot.sketch)
+                total += slot.sum
+
+        summary: Dict[str, Any] = {
+            "count": merged.count,
+            "avg": round(total / merged.count, 2) if merged.count else None,
+            "min": round(merged.min, 2) if merged.count else None,
+            "max": round(merged.max, 2) if merged.count else None,
+        }
+        for label, q in QUANTILES.items():
+            value = merged.quantile(q)
+            summary[label] = round(value, 2) if value is not None else None
+        return summary
+
+    def snapshots(self, now: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """Summaries for every standard window (1m, 5m, 60m)."""
+        return {label: self.snapshot(seconds, now) for label, seconds in WINDOWS.items()}
+
+
+class LatencyRegistry:
+    """Named latency histograms, created on first use."""
+
+    def __init__(self):
+        self._histograms: Dict[str, LatencyHistogram] = {}
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        """Get or create the histogram for a metric name."""
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            histogram = self._histograms.setdefault(name, LatencyHistogram(name))
+        return histogram
+
+    def get(self, name: str) -> Optional[LatencyHistogram]:
+        """Get an existing histogram, or None."""
+        return self._histograms.get(name)
+
+    def record(self, name: str, value_ms: float):
+        """Record a latency sample for a metric name."""
+        self.histogram(name).record(value_ms)
+
+    def names(self) -> List[str]:
+        """Names of all histograms."""
+        return sorted(self._histograms)
+
+    def snapshot(
+        self, prefix: str = "", now: Optional[float] = None
+    ) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Window summaries for every histogram whose name starts with prefix."""
+        return {
+            name: self._histograms[name].snapshots(now)
+            for name in self.names()
+            if name.startswith(prefix)
+        }
+
+
+# Global latency registry instance
+_latency_registry: Optional[LatencyRegistry] = None
+
+
+def get_latency_registry() -> LatencyRegistry:
+    """Get global latency registry instance."""
+    global _latency_registry
+    if _latency_registry is None:
+        _latency_registry = LatencyRegistry()
+    return _latency_registry
+
+
+def record_latency(name: str, value_ms: float):
+    """Record a latency sample in the global registry."""
+    get_latency_registry().record(name, value_ms)
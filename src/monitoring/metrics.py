@@ -7,9 +7,13 @@ for health monitoring and trend analysis.
 
 import asyncio
 import json
+import math
 import sqlite3
+import threading
 import time
 import uuid
+from array import array
+from collections import deque
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta
 from enum import Enum
@@ -17,9 +21,24 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any, Callable, Union
 
 from src.core.logger import get_logger
+from src.core.storage import get_database
+from src.monitoring.latency import record_latency
+from src.monitoring.sketch import QuantileSketch
 
 logger = get_logger()
 
+_INSERT_SQL = """
+    INSERT INTO metrics (id, name, value, metric_type, timestamp, labels)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+# Rollup resolutions, finest first: name -> bucket width in seconds
+ROLLUP_RESOLUTIONS = {"1m": 60, "1h": 3600}
+DEFAULT_ROLLUP_RETENTION_DAYS = {"1m": 30, "1h": 365}
+
+# aggregate() reads rollups instead of raw rows for ranges at least this long
+ROLLUP_AGGREGATE_MIN_SECONDS = 2 * 3600
+
 
 class MetricType(Enum):
     """Types of metrics supported."""
@@ -64,6 +83,157 @@ class Metric:
         )
 
 
+@dataclass
+class MetricRollup:
+    """Aggregated metric values for one time bucket."""
+
+    name: str
+    resolution: str
+    bucket: float  # Bucket start timestamp
+    count: int
+    sum: float
+    min: float
+    max: float
+    sketch: Optional[QuantileSketch] = None  # None for backfilled buckets
+
+    @property
+    def avg(self) -> float:
+        """Mean value in the bucket."""
+        return self.sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile of the bucket's values (None if unknown)."""
+        return self.sketch.quantile(q) if self.sketch else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert rollup to dictionary."""
+        return {
+            "name": self.name,
+            "resolution": self.resolution,
+            "timestamp": self.bucket,
+            "count": self.count,
+            "avg": self.avg,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+
+class MetricRingBuffer:
+    """The most recent samples of one metric, held in fixed-size arrays.
+
+    Also keeps running count/sum/min/max over every sample recorded since
+    the process started. Not thread-safe on its own; MetricsCollector
+    guards it with its buffer lock.
+    """
+
+    def __init__(self, capacity: int, covered_since: float):
+        """Initialize an empty buffer.
+
+        Args:
+            capacity: Number of samples retained
+            covered_since: Time from which every sample of this metric passes
+                through the buffer (the collector's start time)
+        """
+        self.capacity = capacity
+        self.covered_since = covered_since
+        self.timestamps = array("d", bytes(8 * capacity))
+        self.values = array("d", bytes(8 * capacity))
+        self.size = 0
+        self._head = 0  # Next write position
+        self.latest: Optional[Metric] = None
+
+        self.total_count = 0
+        self.total_sum = 0.0
+        self.total_min = math.inf
+        self.total_max = -math.inf
+
+    def append(self, metric: Metric):
+        """Add a sample, overwriting the oldest one when full."""
+        self.timestamps[self._head] = metric.timestamp
+        self.values[self._head] = metric.value
+        self._head = (self._head + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+        self.latest = metric
+
+        self.total_count += 1
+        self.total_sum += metric.value
+        self.total_min = min(self.total_min, metric.value)
+        self.total_max = max(self.total_max, metric.value)
+
+    @property
+    def oldest_timestamp(self) -> Optional[float]:
+        """Timestamp of the oldest retained sample (None if empty)."""
+        if not self.size:
+            return None
+        return self.timestamps[(self._head - self.size) % self.capacity]
+
+    def covers(self, cutoff_time: float) -> bool:
+        """True if every sample since cutoff_time is still in the buffer."""
+        if self.total_count > self.capacity:
+            return cutoff_time >= self.oldest_timestamp
+        return cutoff_time >= self.covered_since
+
+    def _window(self, cutoff_time: float) -> List[tuple]:
+        """Physical slice bounds [start, end) of samples since cutoff_time."""
+        first = self._head - self.size  # Logical index 0, may be negative
+        low, high = 0, self.size
+        while low < high:  # Binary search: timestamps are in record order
+            mid = (low + high) // 2
+            if self.timestamps[(first + mid) % self.capacity] < cutoff_time:
+                low = mid + 1
+            else:
+                high = mid
+        start = (first + low) % self.capacity
+        count = self.size - low
+        if start + count <= self.capacity:
+            return [(start, start + count)]
+        return [(start, self.capacity), (0, start + count - self.capacity)]
+
+    def samples(self, cutoff_time: float = 0.0, limit: Optional[int] = None) -> List[tuple]:
+        """Return (timestamp, value) pairs since cutoff_time, oldest first.
+
+        Args:
+            cutoff_time: Earliest timestamp to include
+            limit: Keep only the newest limit samples
+        """
+        result = []
+        for start, end in self._window(cutoff_time):
+            result.extend(zip(self.timestamps[start:end], self.values[start:end]))
+        if limit is not None:
+            result = result[-limit:] if limit > 0 else []
+        return result
+
+    def aggregate(self, sql_func: str, cutoff_time: float) -> Optional[float]:
+        """Aggregate retained samples since cutoff_time like the SQL function."""
+        parts = [self.values[start:end] for start, end in self._window(cutoff_time)]
+        count = sum(len(part) for part in parts)
+        if sql_func == "COUNT":
+            return count
+        if not count:
+            return None
+        if sql_func == "MIN":
+            return min(min(part) for part in parts if part)
+        if sql_func == "MAX":
+            return max(max(part) for part in parts if part)
+        total = sum(sum(part) for part in parts)
+        return total / count if sql_func == "AVG" else total
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Running aggregates over every sample recorded this run."""
+        return {
+            "buffered": self.size,
+            "capacity": self.capacity,
+            "oldest_timestamp": self.oldest_timestamp,
+            "total_count": self.total_count,
+            "total_avg": self.total_sum / self.total_count if self.total_count else None,
+            "total_min": self.total_min if self.total_count else None,
+            "total_max": self.total_max if self.total_count else None,
+        }
+
+
 class MetricsCollector:
     """Collects and stores metrics with SQLite persistence.
 
@@ -72,6 +242,15 @@ class MetricsCollector:
     - Automatic retention policy (configurable)
     - Aggregation functions for analysis
     - Real-time metrics collection loop
+    - Write-behind buffering: record() only appends to memory; a flusher
+      thread writes buffered rows with one executemany() per batch
+    - 1-minute and 1-hour rollups (count/sum/min/max and a quantile
+      sketch), updated in the same transaction as the raw rows
+    - A per-metric ring buffer of recent samples; get_latest(), get_recent()
+      and aggregate() over recent ranges are answered from memory
+
+    Queries that reach SQLite flush the write buffer first, so they always
+    see recorded metrics.
     """
 
     def __init__(
@@ -79,6 +258,11 @@ class MetricsCollector:
         db_path: Optional[str] = None,
         retention_days: int = 7,
         collection_interval: int = 30,
+        flush_interval_ms: int = 250,
+        flush_batch_size: int = 200,
+        max_buffered: int = 10000,
+        rollup_retention_days: Optional[Dict[str, int]] = None,
+        hot_buffer_size: int = 1024,
     ):
         """Initialize metrics collector.
 
@@ -86,20 +270,52 @@ class MetricsCollector:
             db_path: Path to SQLite database (default: ~/.demi/metrics.db)
             retention_days: Days to retain metrics data
             collection_interval: Seconds between automatic collections
+            flush_interval_ms: Maximum time a recorded metric stays buffered
+            flush_batch_size: Buffered rows that trigger an early flush
+            max_buffered: Buffer capacity; the oldest rows are dropped beyond it
+            rollup_retention_days: Days to retain each rollup resolution
+                (default: 30 for '1m', 365 for '1h')
+            hot_buffer_size: Recent samples kept in memory per metric name
         """
+        if flush_interval_ms <= 0:
+            raise ValueError("flush_interval_ms must be greater than 0")
+
         if db_path is None:
             data_dir = Path.home() / ".demi"
             data_dir.mkdir(parents=True, exist_ok=True)
             db_path = str(data_dir / "metrics.db")
 
         self.db_path = db_path
+        self._db = get_database(db_path)
         self.retention_days = retention_days
+        self.rollup_retention_days = {
+            **DEFAULT_ROLLUP_RETENTION_DAYS,
+            **(rollup_retention_days or {}),
+        }
         self.collection_interval = collection_interval
 
         self._running = False
         self._collection_task: Optional[asyncio.Task] = None
         self._callbacks: List[Callable[[Metric], None]] = []
 
+        # Write-behind buffer, drained by the flusher thread
+        self.flush_interval_ms = flush_interval_ms
+        self.flush_batch_size = max(1, flush_batch_size)
+        self._buffer: deque = deque(maxlen=max(1, max_buffered))
+        self._buffer_cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._flusher: Optional[threading.Thread] = None
+        self._closed = False
+
+        # Hot in-memory samples per metric name, guarded by _buffer_cond
+        self.hot_buffer_size = max(1, hot_buffer_size)
+        self._hot: Dict[str, MetricRingBuffer] = {}
+        self._started_at = time.time()
+
+        self.dropped = 0
+        self.flushes = 0
+        self.failed_flushes = 0
+
         # Initialize database
         self._init_db()
 
@@ -111,30 +327,57 @@ class MetricsCollector:
 
     def _init_db(self):
         """Initialize SQLite database with metrics table."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS metrics (
-                    id TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    value REAL NOT NULL,
-                    metric_type TEXT NOT NULL,
-                    timestamp REAL NOT NULL,
-                    labels TEXT DEFAULT '{}'
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS metrics (
+                id TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                value REAL NOT NULL,
+                metric_type TEXT NOT NULL,
+                timestamp REAL NOT NULL,
+                labels TEXT DEFAULT '{}'
+            );
+
+            -- Indexes for efficient queries
+            CREATE INDEX IF NOT EXISTS idx_metrics_name_time
+            ON metrics(name, timestamp);
+
+            CREATE INDEX IF NOT EXISTS idx_metrics_timestamp
+            ON metrics(timestamp);
+        """)
+
+        def create_rollups(conn):
+            for resolution, width in ROLLUP_RESOLUTIONS.items():
+                table = f"metrics_rollup_{resolution}"
+                exists = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                    (table,),
+                ).fetchone()
+                conn.execute(f"""
+                    CREATE TABLE IF NOT EXISTS {table} (
+                        name TEXT NOT NULL,
+                        bucket REAL NOT NULL,
+                        count INTEGER NOT NULL,
+                        sum REAL NOT NULL,
+                        min REAL NOT NULL,
+                        max REAL NOT NULL,
+                        sketch TEXT,
+                        PRIMARY KEY (name, bucket)
+                    ) WITHOUT ROWID
+                """)
+                conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_{table}_bucket ON {table}(bucket)"
                 )
-            """)
-
-            # Create indexes for efficient queries
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_metrics_name_time
-                ON metrics(name, timestamp)
-            """)
-
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_metrics_timestamp
-                ON metrics(timestamp)
-            """)
-
-            conn.commit()
+                if not exists:
+                    # Backfill rows written before rollups existed (no sketch)
+                    conn.execute(f"""
+                        INSERT INTO {table} (name, bucket, count, sum, min, max)
+                        SELECT name, CAST(timestamp / {width} AS INTEGER) * {width},
+                               COUNT(*), SUM(value), MIN(value), MAX(value)
+                        FROM metrics
+                        GROUP BY 1, 2
+                    """)
+
+        self._db.write(create_rollups)
 
     def record(
         self,
@@ -161,22 +404,28 @@ class MetricsCollector:
             labels=labels or {},
         )
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                INSERT INTO metrics (id, name, value, metric_type, timestamp, labels)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    metric.id,
-                    metric.name,
-                    metric.value,
-                    metric.metric_type.value,
-                    metric.timestamp,
-                    json.dumps(metric.labels),
-                ),
-            )
-            conn.commit()
+        row = (
+            metric.id,
+            metric.name,
+            metric.value,
+            metric.metric_type.value,
+            metric.timestamp,
+            json.dumps(metric.labels),
+        )
+        with self._buffer_cond:
+            ring = self._hot.get(name)
+            if ring is None:
+                ring = self._hot[name] = MetricRingBuffer(
+                    self.hot_buffer_size, self._started_at
+                )
+            ring.append(metric)
+
+            if len(self._buffer) == self._buffer.maxlen:
+                self.dropped += 1  # deque evicts the oldest row
+            self._buffer.append(row)
+            if len(self._buffer) == 1 or len(self._buffer) >= self.flush_batch_size:
+                self._buffer_cond.notify()
+        self._ensure_flusher()
 
         # Notify callbacks
         for callback in self._callbacks:
@@ -187,6 +436,126 @@ class MetricsCollector:
 
         return metric
 
+    def flush(self) -> int:
+        """Write all buffered metrics in a single transaction.
+
+        Returns:
+            Number of rows written
+        """
+        with self._flush_lock:
+            with self._buffer_cond:
+                rows = list(self._buffer)
+                self._buffer.clear()
+            if not rows:
+                return 0
+            try:
+                self._db.write(self._store_rows, rows)
+            except Exception as e:
+                self.failed_flushes += 1
+                self.dropped += len(rows)
+                logger.error("Metrics flush failed", error=str(e), rows=len(rows))
+                return 0
+            self.flushes += 1
+            return len(rows)
+
+    @staticmethod
+    def _store_rows(conn: sqlite3.Connection, rows: List[tuple]):
+        """Insert raw rows and fold them into every rollup resolution."""
+        conn.executemany(_INSERT_SQL, rows)
+
+        for resolution, width in ROLLUP_RESOLUTIONS.items():
+            table = f"metrics_rollup_{resolution}"
+            buckets: Dict[tuple, MetricRollup] = {}
+            for _, name, value, _, timestamp, _ in rows:
+                key = (name, float(int(timestamp // width) * width))
+                rollup = buckets.get(key)
+                if rollup is None:
+                    rollup = buckets[key] = MetricRollup(
+                        name, resolution, key[1], 0, 0.0, value, value, QuantileSketch()
+                    )
+                rollup.count += 1
+                rollup.sum += value
+                rollup.min = min(rollup.min, value)
+                rollup.max = max(rollup.max, value)
+                rollup.sketch.add(value)
+
+            for (name, bucket), rollup in buckets.items():
+                existing = conn.execute(
+                    f"SELECT count, sum, min, max, sketch FROM {table} "
+                    "WHERE name = ? AND bucket = ?",
+                    (name, bucket),
+                ).fetchone()
+                if existing:
+                    rollup.count += existing[0]
+                    rollup.sum += existing[1]
+                    rollup.min = min(rollup.min, existing[2])
+                    rollup.max = max(rollup.max, existing[3])
+                    if existing[4]:
+                        rollup.sketch.merge(QuantileSketch.from_dict(json.loads(existing[4])))
+                    else:
+                        rollup.sketch = None  # Backfilled bucket, quantiles unknown
+                conn.execute(
+                    f"INSERT OR REPLACE INTO {table} "
+                    "(name, bucket, count, sum, min, max, sketch) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        name,
+                        bucket,
+                        rollup.count,
+                        rollup.sum,
+                        rollup.min,
+                        rollup.max,
+                        json.dumps(rollup.sketch.to_dict()) if rollup.sketch else None,
+                    ),
+                )
+
+    def close(self):
+        """Stop the flusher thread and write everything still buffered."""
+        with self._buffer_cond:
+            self._closed = True
+            self._buffer_cond.notify()
+        flusher = self._flusher
+        if flusher is not None and flusher.is_alive():
+            flusher.join(timeout=10)
+        self.flush()
+
+    def get_buffer_stats(self) -> Dict[str, Any]:
+        """Get write-behind buffer statistics."""
+        return {
+            "buffered": len(self._buffer),
+            "capacity": self._buffer.maxlen,
+            "dropped": self.dropped,
+            "flushes": self.flushes,
+            "failed_flushes": self.failed_flushes,
+        }
+
+    def _ensure_flusher(self):
+        if self._flusher is not None or self._closed:
+            return
+        with self._buffer_cond:
+            if self._flusher is None and not self._closed:
+                self._flusher = threading.Thread(
+                    target=self._flush_loop, name="metrics-flusher", daemon=True
+                )
+                self._flusher.start()
+
+    def _flush_loop(self):
+        """Flush every flush_interval_ms, or early once a batch is full."""
+        interval = self.flush_interval_ms / 1000
+        while True:
+            with self._buffer_cond:
+                while not self._buffer and not self._closed:
+                    self._buffer_cond.wait()
+                if self._closed:
+                    return
+                deadline = time.monotonic() + interval
+                while len(self._buffer) < self.flush_batch_size and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._buffer_cond.wait(remaining)
+            self.flush()
+
     def get_metric(
         self,
         name: str,
@@ -203,11 +572,12 @@ class MetricsCollector:
         Returns:
             List of Metric objects
         """
+        self.flush()
         cutoff_time = 0.0
         if time_range:
             cutoff_time = time.time() - time_range.total_seconds()
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db.read() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.execute(
                 """
@@ -245,7 +615,13 @@ class MetricsCollector:
         Returns:
             Most recent Metric or None if no data
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._buffer_cond:
+            ring = self._hot.get(name)
+            if ring is not None:
+                return ring.latest
+
+        self.flush()
+        with self._db.read() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.execute(
                 """
@@ -283,6 +659,11 @@ class MetricsCollector:
             func: Aggregation function ('avg', 'min', 'max', 'sum', 'count')
             time_range: Optional time range to look back
 
+        Ranges still held in the metric's ring buffer are answered from
+        memory. Otherwise ranges of ROLLUP_AGGREGATE_MIN_SECONDS or more are
+        answered from rollups, with raw rows only for the partial minute at
+        the start.
+
         Returns:
             Aggregated value or None if no data
         """
@@ -302,7 +683,17 @@ class MetricsCollector:
         if not sql_func:
             raise ValueError(f"Unknown aggregation function: {func}")
 
-        with sqlite3.connect(self.db_path) as conn:
+        if time_range:
+            with self._buffer_cond:
+                ring = self._hot.get(name)
+                if ring is not None and ring.covers(cutoff_time):
+                    return ring.aggregate(sql_func, cutoff_time)
+        self.flush()
+
+        if time_range and time_range.total_seconds() >= ROLLUP_AGGREGATE_MIN_SECONDS:
+            return self._aggregate_rollups(name, sql_func, cutoff_time)
+
+        with self._db.read() as conn:
             cursor = conn.execute(
                 f"""
                 SELECT {sql_func}(value) FROM metrics
@@ -315,33 +706,247 @@ class MetricsCollector:
 
         return result
 
+    def _aggregate_rollups(
+        self, name: str, sql_func: str, cutoff_time: float
+    ) -> Optional[float]:
+        """Aggregate from raw rows, then 1m buckets, then 1h buckets."""
+        minute = math.ceil(cutoff_time / 60) * 60
+        hour = max(minute, math.ceil(cutoff_time / 3600) * 3600)
+
+        with self._db.read() as conn:
+            parts = [
+                conn.execute(
+                    """
+                    SELECT COUNT(*), SUM(value), MIN(value), MAX(value) FROM metrics
+                    WHERE name = ? AND timestamp >= ? AND timestamp < ?
+                    """,
+                    (name, cutoff_time, minute),
+                ).fetchone(),
+                conn.execute(
+                    """
+                    SELECT SUM(count), SUM(sum), MIN(min), MAX(max) FROM metrics_rollup_1m
+                    WHERE name = ? AND bucket >= ? AND bucket < ?
+                    """,
+                    (name, minute, hour),
+                ).fetchone(),
+                conn.execute(
+                    """
+                    SELECT SUM(count), SUM(sum), MIN(min), MAX(max) FROM metrics_rollup_1h
+                    WHERE name = ? AND bucket >= ?
+                    """,
+                    (name, hour),
+                ).fetchone(),
+            ]
+
+        parts = [p for p in parts if p[0]]
+        count = sum(p[0] for p in parts)
+        if sql_func == "COUNT":
+            return count
+        if not count:
+            return None
+        if sql_func == "MIN":
+            return min(p[2] for p in parts)
+        if sql_func == "MAX":
+            return max(p[3] for p in parts)
+        total = sum(p[1] for p in parts)
+        return total / count if sql_func == "AVG" else total
+
+    def get_rollups(
+        self,
+        name: str,
+        resolution: str,
+        time_range: Optional[timedelta] = None,
+        limit: int = 1000,
+    ) -> List[MetricRollup]:
+        """Query rollup buckets for a metric.
+
+        Args:
+            name: Metric name
+            resolution: Rollup resolution ('1m' or '1h')
+            time_range: Optional time range to look back
+            limit: Maximum number of buckets (most recent are kept)
+
+        Returns:
+            List of MetricRollup objects in chronological order
+        """
+        width = ROLLUP_RESOLUTIONS.get(resolution)
+        if width is None:
+            raise ValueError(f"Unknown rollup resolution: {resolution}")
+
+        cutoff_bucket = 0.0
+        if time_range:
+            cutoff_bucket = (time.time() - time_range.total_seconds()) // width * width
+        self.flush()
+
+        with self._db.read() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT bucket, count, sum, min, max, sketch
+                FROM metrics_rollup_{resolution}
+                WHERE name = ? AND bucket >= ?
+                ORDER BY bucket DESC
+                LIMIT ?
+                """,
+                (name, cutoff_bucket, limit),
+            ).fetchall()
+
+        return [
+            MetricRollup(
+                name=name,
+                resolution=resolution,
+                bucket=bucket,
+                count=count,
+                sum=total,
+                min=low,
+                max=high,
+                sketch=QuantileSketch.from_dict(json.loads(sketch)) if sketch else None,
+            )
+            for bucket, count, total, low, high, sketch in reversed(rows)
+        ]
+
+    def choose_resolution(
+        self, name: str, time_range: timedelta, max_points: int
+    ) -> str:
+        """Pick the finest resolution that fits a range within a point budget.
+
+        Args:
+            name: Metric name
+            time_range: Time range to look back
+            max_points: Maximum number of points wanted
+
+        Returns:
+            'raw', '1m' or '1h'
+        """
+        span = time_range.total_seconds()
+
+        if span <= self.retention_days * 86400:
+            # Estimate raw samples from the 1m rollup instead of counting raw rows
+            self.flush()
+            with self._db.read() as conn:
+                samples = conn.execute(
+                    "SELECT SUM(count) FROM metrics_rollup_1m WHERE name = ? AND bucket >= ?",
+                    (name, (time.time() - span) // 60 * 60),
+                ).fetchone()[0]
+            if (samples or 0) <= max_points:
+                return "raw"
+
+        for resolution, width in ROLLUP_RESOLUTIONS.items():
+            if (
+                span / width <= max_points
+                and span <= self.rollup_retention_days[resolution] * 86400
+            ):
+                return resolution
+        return list(ROLLUP_RESOLUTIONS)[-1]
+
+    def get_series(
+        self,
+        name: str,
+        time_range: timedelta,
+        max_points: int = 500,
+    ) -> Dict[str, Any]:
+        """Get a metric's history at a resolution that fits the point budget.
+
+        Raw samples are returned when there are few enough of them; otherwise
+        1-minute or 1-hour rollups, with 'value' holding each bucket's mean.
+
+        Args:
+            name: Metric name
+            time_range: Time range to look back
+            max_points: Maximum number of points to return
+
+        Returns:
+            Dict with name, resolution and chronological points
+        """
+        resolution = self.choose_resolution(name, time_range, max_points)
+
+        if resolution == "raw":
+            points = [
+                {"timestamp": m.timestamp, "value": m.value}
+                for m in self.get_metric(name, time_range, limit=max_points)
+            ]
+        else:
+            points = []
+            for rollup in self.get_rollups(name, resolution, time_range, limit=max_points):
+                point = rollup.to_dict()
+                point["value"] = point.pop("avg")
+                del point["name"], point["resolution"]
+                points.append(point)
+
+        return {"name": name, "resolution": resolution, "points": points}
+
+    def get_recent(
+        self,
+        name: str,
+        time_range: Optional[timedelta] = None,
+        limit: int = 100,
+    ) -> List[Dict[str, float]]:
+        """Get recent (timestamp, value) points, from memory when possible.
+
+        Falls back to SQLite when the ring buffer doesn't hold the whole
+        range (or fewer than limit samples when no range is given).
+
+        Args:
+            name: Metric name
+            time_range: Optional time range to look back
+            limit: Maximum number of points (most recent are kept)
+
+        Returns:
+            Chronological list of {"timestamp", "value"} dicts
+        """
+        cutoff_time = time.time() - time_range.total_seconds() if time_range else 0.0
+
+        with self._buffer_cond:
+            ring = self._hot.get(name)
+            samples = ring.samples(cutoff_time, limit) if ring is not None else []
+            if ring is not None and (len(samples) >= limit or ring.covers(cutoff_time)):
+                return [{"timestamp": t, "value": v} for t, v in samples]
+
+        return [
+            {"timestamp": m.timestamp, "value": m.value}
+            for m in self.get_metric(name, time_range, limit=limit)
+        ]
+
+    def get_hot_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Ring buffer and running aggregate stats for every metric name."""
+        with self._buffer_cond:
+            return {name: ring.get_stats() for name, ring in self._hot.items()}
+
     def get_all_metric_names(self) -> List[str]:
         """Get list of all unique metric names.
 
         Returns:
             List of metric names
         """
-        with sqlite3.connect(self.db_path) as conn:
+        self.flush()
+        with self._db.read() as conn:
             cursor = conn.execute(
                 "SELECT DISTINCT name FROM metrics ORDER BY name"
             )
             return [row[0] for row in cursor.fetchall()]
 
     def cleanup_old_data(self) -> int:
-        """Remove metrics older than retention period.
+        """Remove raw metrics and rollups older than their retention periods.
 
         Returns:
             Number of rows deleted
         """
-        cutoff_time = time.time() - (self.retention_days * 24 * 60 * 60)
+        now = time.time()
+        cutoff_time = now - (self.retention_days * 24 * 60 * 60)
+        self.flush()
 
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
+        def cleanup(conn):
+            deleted = conn.execute(
                 "DELETE FROM metrics WHERE timestamp < ?",
                 (cutoff_time,),
-            )
-            conn.commit()
-            deleted = cursor.rowcount
+            ).rowcount
+            for resolution in ROLLUP_RESOLUTIONS:
+                deleted += conn.execute(
+                    f"DELETE FROM metrics_rollup_{resolution} WHERE bucket < ?",
+                    (now - self.rollup_retention_days[resolution] * 24 * 60 * 60,),
+                ).rowcount
+            return deleted
+
+        deleted = self._db.write(cleanup)
 
         if deleted > 0:
             logger.info("Cleaned up old metrics", deleted=deleted)
@@ -426,6 +1031,7 @@ class MetricsCollector:
             except asyncio.CancelledError:
                 pass
 
+        self.flush()
         logger.info("Stopped metrics collection")
 
     async def _collection_loop(self):
@@ -459,6 +1065,12 @@ def get_metrics_collector() -> MetricsCollector:
     return _metrics_collector_instance
 
 
+def close_metrics_collector():
+    """Flush and stop the global metrics collector, if one was created."""
+    if _metrics_collector_instance is not None:
+        _metrics_collector_instance.close()
+
+
 class LLMMetricsCollector:
     """Collect and track LLM inference performance metrics."""
 
@@ -483,6 +1095,8 @@ class LLMMetricsCollector:
             prompt_tokens: Number of tokens in prompt
             model: Model name
         """
+        record_latency("llm_response_time_ms", response_time_ms)
+        record_latency("llm_inference_latency_ms", inference_latency_ms)
         self.metrics.record(
             "llm_response_time_ms",
             response_time_ms,
@@ -509,6 +1123,84 @@ class LLMMetricsCollector:
                 labels={"model": model},
             )
 
+    def record_time_to_first_token(self, ttft_ms: float, model: str = "unknown"):
+        """Record time from request start to the first streamed token.
+
+        Args:
+            ttft_ms: Time to first token in milliseconds
+            model: Model name
+        """
+        record_latency("llm_time_to_first_token_ms", ttft_ms)
+        self.metrics.record(
+            "llm_time_to_first_token_ms",
+            ttft_ms,
+            MetricType.HISTOGRAM,
+            labels={"model": model},
+        )
+
+    def record_pool_stats(self, stats: Dict[str, Any]):
+        """Record LLM provider connection pool utilization.
+
+        Args:
+            stats: Pool stats dict from ProviderConnectionPool.get_stats()
+        """
+        labels = {"provider": stats.get("provider", "unknown")}
+        self.metrics.record(
+            "llm_pool_in_flight",
+            stats.get("in_flight", 0),
+            MetricType.GAUGE,
+            labels=labels,
+        )
+        self.metrics.record(
+            "llm_pool_utilization",
+            stats.get("utilization", 0.0),
+            MetricType.GAUGE,
+            labels=labels,
+        )
+        self.metrics.record(
+            "llm_pool_requests_total",
+            stats.get("total_requests", 0),
+            MetricType.COUNTER,
+            labels=labels,
+        )
+
+    def record_queue_wait(self, wait_ms: float, priority: str):
+        """Record time a request waited for an LLM scheduler slot.
+
+        Args:
+            wait_ms: Queue wait time in milliseconds
+            priority: Priority lane name
+        """
+        self.metrics.record(
+            "llm_queue_wait_ms",
+            wait_ms,
+            MetricType.HISTOGRAM,
+            labels={"priority": priority},
+        )
+
+    def record_queue_depth(self, depth: int, active: int):
+        """Record LLM scheduler queue depth and active request count.
+
+        Args:
+            depth: Requests waiting for a slot
+            active: Requests currently holding a slot
+        """
+        self.metrics.record("llm_queue_depth", depth, MetricType.GAUGE)
+        self.metrics.record("llm_active_requests", active, MetricType.GAUGE)
+
+    def record_load_shed(self, priority: str):
+        """Record a request shed by the LLM scheduler.
+
+        Args:
+            priority: Priority lane name of the shed request
+        """
+        self.metrics.record(
+            "llm_requests_shed",
+            1,
+            MetricType.COUNTER,
+            labels={"priority": priority},
+        )
+
     def record_error(self, error_type: str, model: str = "unknown"):
         """Record LLM inference error.
 
@@ -548,6 +1240,7 @@ class PlatformMetricsCollector:
             success: Whether operation was successful
             error: Error message if failed
         """
+        record_latency(f"platform_{platform}_response_time_ms", response_time_ms)
         self.metrics.record(
             f"platform_{platform}_messages",
             1,
@@ -598,23 +1291,17 @@ class PlatformMetricsCollector:
             messages = self.metrics.aggregate(
                 f"platform_{platform}_messages", "count", time_range
             )
-            response_times = self.metrics.get_metric(
-                f"platform_{platform}_response_time_ms", time_range
+            avg_response = self.metrics.aggregate(
+                f"platform_{platform}_response_time_ms", "avg", time_range
             )
             errors = self.metrics.aggregate(
                 f"platform_{platform}_errors", "count", time_range
             )
 
             if messages:
-                avg_response = 0
-                if response_times:
-                    avg_response = sum(m.value for m in response_times) / len(
-                        response_times
-                    )
-
                 stats[platform] = {
                     "message_count": int(messages or 0),
-                    "avg_response_time_ms": round(avg_response, 2),
+                    "avg_response_time_ms": round(avg_response or 0, 2),
                     "error_count": int(errors or 0),
                     "error_rate": (
                         round((errors / messages * 100), 2) if messages else 0
@@ -740,10 +1427,7 @@ class EmotionMetricsCollector:
         Returns:
             List of emotion data points
         """
-        metrics = self.metrics.get_metric(f"emotion_{emotion}", limit=limit)
-        return [
-            {"timestamp": m.timestamp, "value": m.value} for m in metrics
-        ]
+        return self.metrics.get_recent(f"emotion_{emotion}", limit=limit)
 
     def get_current_emotions(self) -> Dict[str, float]:
         """Get current emotional state.
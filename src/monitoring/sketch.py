@@ -0,0 +1,150 @@
+"""Mergeable quantile sketch for metric distributions.
+
+Values are counted in logarithmically sized buckets, so any quantile can be
+answered with a bounded relative error (1% by default) from a few hundred
+integers, no matter how many samples were added. Two sketches with the same
+accuracy merge by adding bucket counts, which is what lets metric rollups
+be maintained incrementally.
+"""
+
+import math
+from typing import Any, Dict, Optional
+
+# Values closer to zero than this are counted in the zero bucket
+MIN_INDEXABLE_VALUE = 1e-9
+
+
+class QuantileSketch:
+    """Log-bucketed quantile sketch with bounded relative error."""
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        """Initialize an empty sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of quantile estimates
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+
+        self.positive: Dict[int, int] = {}
+        self.negative: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _key(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _bucket_value(self, key: int) -> float:
+        # Midpoint of (gamma^(key-1), gamma^key] with relative error <= accuracy
+        return 2 * self._gamma**key / (self._gamma + 1)
+
+    def add(self, value: float, count: int = 1):
+        """Add a value (count times).
+
+        Args:
+            value: Sample value
+            count: Number of occurrences
+        """
+        if count <= 0:
+            return
+        if value > MIN_INDEXABLE_VALUE:
+            key = self._key(value)
+            self.positive[key] = self.positive.get(key, 0) + count
+        elif value < -MIN_INDEXABLE_VALUE:
+            key = self._key(-value)
+            self.negative[key] = self.negative.get(key, 0) + count
+        else:
+            self.zero_count += count
+        self.count += count
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: "QuantileSketch"):
+        """Add another sketch's samples into this one.
+
+        Args:
+            other: Sketch built with the same relative accuracy
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different accuracy")
+        # Copy items first: the other sketch may still be receiving samples
+        for key, count in list(other.positive.items()):
+            self.positive[key] = self.positive.get(key, 0) + count
+        for key, count in list(other.negative.items()):
+            self.negative[key] = self.negative.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate the q-quantile.
+
+        Args:
+            q: Quantile in [0, 1] (e.g. 0.95 for p95)
+
+        Returns:
+            Estimated value, or None if the sketch is empty
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if self.count == 0:
+            return None
+        if q == 0:
+            return self.min
+        if q == 1:
+            return self.max
+
+        rank = q * (self.count - 1)
+        seen = 0
+
+        # Ascending order: large negative magnitudes first, then zero, then positives
+        for key in sorted(self.negative, reverse=True):
+            seen += self.negative[key]
+            if seen > rank:
+                return self._clamp(-self._bucket_value(key))
+        seen += self.zero_count
+        if seen > rank:
+            return self._clamp(0.0)
+        for key in sorted(self.positive):
+            seen += self.positive[key]
+            if seen > rank:
+                return self._clamp(self._bucket_value(key))
+        return self.max
+
+    def _clamp(self, value: float) -> float:
+        return max(self.min, min(self.max, value))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert sketch to a JSON-serializable dictionary."""
+        return {
+            "accuracy": self.relative_accuracy,
+            "positive": {str(k): v for k, v in self.positive.items()},
+            "negative": {str(k): v for k, v in self.negative.items()},
+            "zero": self.zero_count,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuantileSketch":
+        """Create sketch from dictionary."""
+        sketch = cls(data.get("accuracy", 0.01))
+        sketch.positive = {int(k): v for k, v in data.get("positive", {}).items()}
+        sketch.negative = {int(k): v for k, v in data.get("negative", {}).items()}
+        sketch.zero_count = data.get("zero", 0)
+        sketch.count = (
+            sum(sketch.positive.values())
+            + sum(sketch.negative.values())
+            + sketch.zero_count
+        )
+        if sketch.count:
+            sketch.min = data["min"]
+            sketch.max = data["max"]
+        return sketch
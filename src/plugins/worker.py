@@ -0,0 +1,227 @@
+"""
+Long-lived isolated plugin worker process.
+
+Started by the parent as ``python -c BOOTSTRAP <plugin_name>``. The worker
+discovers and loads its plugin once, then serves requests from the parent
+over stdin/stdout using length-prefixed JSON frames: a 4-byte big-endian
+payload length followed by a UTF-8 JSON object.
+
+Parent -> worker: {"id": int, "op": "request" | "ping" | "shutdown", ...}
+Worker -> parent: {"id": int, "ok": bool, "result": ..., "error": str}
+
+Anything the plugin prints goes to stderr so it can never corrupt a frame.
+"""
+
+import asyncio
+import json
+import os
+import struct
+import sys
+from typing import Any, BinaryIO, Dict, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+FRAME_HEADER = struct.Struct(">I")
+MAX_FRAME_BYTES = 64 * 1024 * 1024
+
+# Worker entry point. Importing anything from ``src`` can print to stdout
+# (src.core logs its database setup there), so fd 1 is pointed at stderr
+# before the first ``src`` import and frames go out on a saved copy of it.
+BOOTSTRAP = (
+    "import os, sys\n"
+    "frames_fd = os.dup(1)\n"
+    "os.dup2(2, 1)\n"
+    "from src.plugins.worker import main\n"
+    "sys.exit(main(frames_fd))\n"
+)
+
+
+class ProtocolError(Exception):
+    """Malformed or oversized frame on the worker pipe."""
+
+
+def encode_frame(message: Dict[str, Any]) -> bytes:
+    """Serialize a message as a length-prefixed JSON frame."""
+    payload = json.dumps(message, default=str).encode("utf-8")
+    if len(payload) > MAX_FRAME_BYTES:
+        raise ProtocolError(f"Frame too large: {len(payload)} bytes")
+    return FRAME_HEADER.pack(len(payload)) + payload
+
+
+def decode_payload(payload: bytes) -> Dict[str, Any]:
+    """Deserialize a frame payload."""
+    try:
+        message = json.loads(payload.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ProtocolError(f"Invalid frame payload: {e}") from e
+    if not isinstance(message, dict):
+        raise ProtocolError("Frame payload must be a JSON object")
+    return message
+
+
+def _check_length(length: int) -> None:
+    if length > MAX_FRAME_BYTES:
+        raise ProtocolError(f"Frame too large: {length} bytes")
+
+
+async def read_frame_async(reader: asyncio.StreamReader) -> Optional[Dict[str, Any]]:
+    """
+    Read one frame from an asyncio stream.
+
+    Returns:
+        Decoded message, or None on clean EOF
+    """
+    try:
+        header = await reader.readexactly(FRAME_HEADER.size)
+    except asyncio.IncompleteReadError as e:
+        if not e.partial:
+            return None
+        raise ProtocolError("Truncated frame header") from e
+    (length,) = FRAME_HEADER.unpack(header)
+    _check_length(length)
+    try:
+        payload = await reader.readexactly(length)
+    except asyncio.IncompleteReadError as e:
+        raise ProtocolError("Truncated frame payload") from e
+    return decode_payload(payload)
+
+
+def read_frame(stream: BinaryIO) -> Optional[Dict[str, Any]]:
+    """
+    Read one frame from a blocking binary stream.
+
+    Returns:
+        Decoded message, or None on clean EOF
+    """
+    header = stream.read(FRAME_HEADER.size)
+    if not header:
+        return None
+    if len(header) < FRAME_HEADER.size:
+        raise ProtocolError("Truncated frame header")
+    (length,) = FRAME_HEADER.unpack(header)
+    _check_length(length)
+    payload = stream.read(length)
+    if len(payload) < length:
+        raise ProtocolError("Truncated frame payload")
+    return decode_payload(payload)
+
+
+def write_frame(stream: BinaryIO, message: Dict[str, Any]) -> None:
+    """Write one frame to a blocking binary stream and flush it."""
+    stream.write(encode_frame(message))
+    stream.flush()
+
+
+def _cpu_seconds_used() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _set_cpu_budget(seconds: Optional[float]) -> None:
+    """
+    Give the next request its own CPU budget.
+
+    RLIMIT_CPU counts total CPU time for the process, so a long-lived worker
+    moves its soft limit forward before every request (never past the hard
+    limit set by the parent). Exceeding it raises SIGXCPU and ends the worker.
+    """
+    if resource is None or not seconds:
+        return
+    try:
+        _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+        soft = int(_cpu_seconds_used() + seconds) + 1
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+    except (ValueError, OSError):
+        pass
+
+
+async def _load_plugin(plugin_name: str):
+    from src.plugins.manager import PluginManager
+
+    manager = PluginManager()
+    await manager.discover_and_register()
+    return await manager.load_plugin(plugin_name)
+
+
+def serve(plugin_name: str, stdin: BinaryIO, stdout: BinaryIO) -> int:
+    """
+    Load the plugin and serve requests until shutdown or EOF.
+
+    Args:
+        plugin_name: Plugin to load
+        stdin: Binary stream of request frames
+        stdout: Binary stream for response frames
+
+    Returns:
+        Process exit code
+    """
+    cpu_budget = float(os.environ.get("DEMI_WORKER_CPU_BUDGET", "0") or 0)
+    plugin = asyncio.run(_load_plugin(plugin_name))
+    if plugin is None:
+        write_frame(stdout, {"id": 0, "ok": False, "error": f"Plugin not loaded: {plugin_name}"})
+        return 1
+    write_frame(stdout, {"id": 0, "ok": True, "result": {"ready": plugin_name, "pid": os.getpid()}})
+
+    while True:
+        message = read_frame(stdin)
+        if message is None:
+            break
+
+        msg_id = message.get("id", 0)
+        op = message.get("op")
+        if op == "shutdown":
+            write_frame(stdout, {"id": msg_id, "ok": True, "result": None})
+            break
+        if op == "ping":
+            health = plugin.health_check()
+            write_frame(
+                stdout,
+                {"id": msg_id, "ok": True, "result": {"status": getattr(health, "status", "ok")}},
+            )
+            continue
+        if op != "request":
+            write_frame(stdout, {"id": msg_id, "ok": False, "error": f"Unknown op: {op}"})
+            continue
+
+        _set_cpu_budget(cpu_budget)
+        try:
+            request = message.get("request") or {}
+            result = plugin.handle_request({"type": plugin_name, **request})
+            write_frame(stdout, {"id": msg_id, "ok": True, "result": result})
+        except Exception as e:
+            write_frame(stdout, {"id": msg_id, "ok": False, "error": f"{type(e).__name__}: {e}"})
+
+    try:
+        plugin.shutdown()
+    except Exception:
+        pass
+    return 0
+
+
+def main(frames_fd: Optional[int] = None) -> int:
+    """
+    Serve the plugin named on the command line.
+
+    Args:
+        frames_fd: Descriptor for response frames, set up by BOOTSTRAP. When
+            None (run with ``-m``), stdout is redirected here instead, after
+            the package imports have already had a chance to write to it.
+    """
+    if len(sys.argv) != 2:
+        print("usage: python -c BOOTSTRAP <plugin_name>", file=sys.stderr)
+        return 2
+
+    if frames_fd is None:
+        sys.stdout.flush()
+        frames_fd = os.dup(1)
+        os.dup2(2, 1)
+    return serve(sys.argv[1], sys.stdin.buffer, os.fdopen(frames_fd, "wb"))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -490,6 +490,61 @@ def resample_audio(
     return resampled.tobytes()
 
 
+def pcm16_to_float32(
+    audio_data: bytes,
+    sample_rate: int = 16000,
+    target_rate: int = 16000,
+) -> np.ndarray:
+    """Convert 16-bit PCM to normalized float32 samples for Whisper models.
+    
+    The PCM is read through a zero-copy int16 view and the float32 result is
+    allocated once and scaled in place. Any buffer type works (bytes,
+    bytearray, memoryview).
+    
+    Args:
+        audio_data: Raw audio bytes (16-bit PCM, mono).
+        sample_rate: Sample rate of audio_data.
+        target_rate: Sample rate the model expects.
+        
+    Returns:
+        float32 array in [-1, 1) at target_rate.
+    """
+    samples = np.frombuffer(audio_data, dtype=np.int16)
+
+    if sample_rate != target_rate and len(samples) > 1:
+        # Linear interpolation straight into float32
+        new_length = int(len(samples) * target_rate / sample_rate)
+        positions = np.linspace(0, len(samples) - 1, new_length, dtype=np.float32)
+        audio = np.interp(positions, np.arange(len(samples), dtype=np.float32), samples)
+        audio = audio.astype(np.float32, copy=False)
+    else:
+        audio = samples.astype(np.float32)
+
+    audio *= 1.0 / 32768.0
+    return audio
+
+
+def write_wav_file(
+    filepath: str,
+    audio_data: bytes,
+    sample_rate: int = 16000,
+    channels: int = 1,
+) -> None:
+    """Write 16-bit PCM to a WAV file.
+    
+    Args:
+        filepath: Destination path.
+        audio_data: Raw audio bytes (16-bit PCM).
+        sample_rate: Sample rate in Hz.
+        channels: Number of channels.
+    """
+    with wave.open(filepath, "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)  # 16-bit
+        wav.setframerate(sample_rate)
+        wav.writeframes(audio_data)
+
+
 def stereo_to_mono(audio_data: bytes) -> bytes:
     """Convert stereo audio to mono.
     
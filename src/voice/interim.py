@@ -0,0 +1,295 @@
+"""Interim transcripts for an utterance that is still being spoken.
+
+Every `interval_ms` of new audio the uncommitted part of the utterance is
+decoded again, with word timestamps, and an interim (is_final=False)
+result is produced. Words that two consecutive decodes agree on are
+committed: their text is fixed and the audio up to the end of the last
+committed word is never decoded again, so each decode only covers the
+recent, still-changing window. At the end of the utterance only that
+window is decoded for the final result.
+
+Without word timestamps nothing can be committed; interim decodes then
+stop once the window exceeds `max_window_ms` and only the final decode
+covers the rest.
+
+Usage:
+    interim = InterimTranscriber.for_stt(stt, sample_rate=16000)
+    for frame in frames:
+        ...
+        result = interim.poll(buffer.pending_ms, buffer.pending_audio)
+        if result:
+            show(result.text)
+    final = await interim.finish(segment)
+"""
+
+import asyncio
+import dataclasses
+import logging
+import re
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from src.voice.stt import TranscriptionResult
+
+logger = logging.getLogger(__name__)
+
+# Re-decode cadence while the speaker is talking
+DEFAULT_INTERVAL_MS = 500
+
+# Longest uncommitted window decoded for an interim result
+DEFAULT_MAX_WINDOW_MS = 10000
+
+# Decoders repeat the word a window starts in; such repeats within this
+# many seconds of the window start are dropped
+_REPEAT_WINDOW_S = 1.0
+
+_NON_WORD = re.compile(r"[^\w']+")
+
+# (normalized text, text, end offset in bytes, start in seconds); the
+# timings are None when the decoder gave no word timestamps
+_Word = Tuple[str, str, Optional[int], Optional[float]]
+
+
+def _normalize(word: str) -> str:
+    return _NON_WORD.sub("", word.lower())
+
+
+class InterimTranscriber:
+    """Incremental transcription of one utterance at a time.
+
+    Attributes:
+        sample_rate: Sample rate of the 16-bit mono PCM.
+        interval_ms: New audio required before another interim decode.
+        max_window_ms: Longest uncommitted window decoded for an interim.
+        decodes: Number of decodes run (interim and final).
+        decoded_ms: Total audio decoded, in milliseconds.
+    """
+
+    def __init__(
+        self,
+        decode: Callable[[bytes, bool], Awaitable["TranscriptionResult"]],
+        sample_rate: int = 16000,
+        interval_ms: int = DEFAULT_INTERVAL_MS,
+        max_window_ms: int = DEFAULT_MAX_WINDOW_MS,
+    ):
+        """Initialize transcriber.
+
+        Args:
+            decode: Coroutine function (pcm, interim) -> TranscriptionResult.
+                Interim decodes must return word timings in result.words.
+            sample_rate: Sample rate of the PCM.
+            interval_ms: New audio required before another interim decode.
+            max_window_ms: Longest uncommitted window decoded for an interim.
+        """
+        self._decode = decode
+        self.sample_rate = sample_rate
+        self.interval_ms = interval_ms
+        self.max_window_ms = max_window_ms
+        self.decodes = 0
+        self.decoded_ms = 0
+
+        self._task: Optional[asyncio.Task] = None
+        # Bumped on reset so a decode still in flight cannot touch new state
+        self._generation = 0
+        self.reset()
+
+    @classmethod
+    def for_stt(
+        cls,
+        stt: Any,
+        sample_rate: int = 16000,
+        interval_ms: int = DEFAULT_INTERVAL_MS,
+        max_window_ms: int = DEFAULT_MAX_WINDOW_MS,
+    ) -> "InterimTranscriber":
+        """Create a transcriber decoding through an STT engine.
+
+        Interim decodes go through stt.transcribe_interim, which keeps them
+        out of the transcription stats; only the final decode is counted.
+
+        Args:
+            stt: SpeechToText or FasterWhisperSTT instance.
+            sample_rate: Sample rate of the PCM.
+            interval_ms: New audio required before another interim decode.
+            max_window_ms: Longest uncommitted window decoded for an interim.
+        """
+
+        async def decode(audio: bytes, interim: bool) -> "TranscriptionResult":
+            if interim:
+                return await stt.transcribe_interim(audio, sample_rate)
+            return await stt.transcribe_audio_bytes(audio, sample_rate)
+
+        return cls(decode, sample_rate, interval_ms, max_window_ms)
+
+    def reset(self) -> None:
+        """Forget the current utterance and cancel any interim decode."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+        self._task = None
+        self._generation += 1
+        self._committed: List[str] = []
+        self._committed_bytes = 0
+        self._tentative: List[_Word] = []
+        self._decoded_ms = 0
+
+    @property
+    def committed_text(self) -> str:
+        """Text that will not change for the rest of the utterance."""
+        return " ".join(self._committed)
+
+    @property
+    def committed_ms(self) -> int:
+        """Duration of the utterance audio that is no longer decoded."""
+        return self._bytes_to_ms(self._committed_bytes)
+
+    def due(self, duration_ms: int) -> bool:
+        """True if an utterance of duration_ms is ready for another interim decode."""
+        return (
+            duration_ms - self._decoded_ms >= self.interval_ms
+            and duration_ms - self.committed_ms <= self.max_window_ms
+        )
+
+    def poll(
+        self,
+        duration_ms: int,
+        get_audio: Callable[[], bytes],
+    ) -> Optional["TranscriptionResult"]:
+        """Collect a finished interim decode and start the next one when due.
+
+        Never waits: at most one decode runs in the background, and its
+        result is returned by the first poll after it finishes.
+
+        Args:
+            duration_ms: Duration of the utterance so far.
+            get_audio: Returns the utterance audio so far (called only when
+                a decode starts).
+
+        Returns:
+            Interim result with non-empty text, or None.
+        """
+        result = None
+        if self._task and self._task.done():
+            task, self._task = self._task, None
+            if not task.cancelled() and task.exception() is None:
+                result = task.result()
+            elif not task.cancelled():
+                logger.warning(f"Interim decode failed: {task.exception()}")
+
+        if self._task is None and self.due(duration_ms):
+            self._task = asyncio.ensure_future(self.update(get_audio()))
+
+        return result if result and result.text else None
+
+    async def update(self, audio: bytes) -> Optional["TranscriptionResult"]:
+        """Decode the uncommitted window of the utterance so far.
+
+        Args:
+            audio: Utterance audio so far (16-bit mono PCM).
+
+        Returns:
+            Interim result, or None if the utterance was reset meanwhile.
+        """
+        generation = self._generation
+        start = self._committed_bytes
+        size = len(audio)
+        self._decoded_ms = self._bytes_to_ms(size)
+
+        result = await self._decode_window(audio[start:], interim=True)
+        if generation != self._generation:
+            return None
+
+        words = self._drop_repeats(self._words(result, start))
+        stable = 0
+        for old, new in zip(self._tentative, words):
+            if old[0] != new[0]:
+                break
+            stable += 1
+
+        # Agreed words are committed when their end in the audio is known
+        if stable and words[stable - 1][2] is not None:
+            self._committed.extend(word[1] for word in words[:stable])
+            self._committed_bytes = min(words[stable - 1][2], size)
+            words = words[stable:]
+        self._tentative = words
+
+        text = " ".join(self._committed + [word[1] for word in words])
+        return dataclasses.replace(
+            result,
+            text=text,
+            duration_ms=self._bytes_to_ms(size),
+            is_final=False,
+            words=[],
+        )
+
+    def finish(self, audio: bytes) -> Awaitable["TranscriptionResult"]:
+        """Decode the rest of a finished utterance and start a new one.
+
+        The utterance state is taken and reset immediately, so interim
+        decoding of the next utterance may start before this is awaited.
+
+        Args:
+            audio: The complete utterance (16-bit mono PCM).
+
+        Returns:
+            Awaitable final result: committed text plus the decoded remainder.
+        """
+        window = audio[self._committed_bytes:]
+        committed = list(self._committed)
+        self.reset()
+        return self._finish(window, self._bytes_to_ms(len(audio)), committed)
+
+    async def _finish(
+        self,
+        window: bytes,
+        duration_ms: int,
+        committed: List[str],
+    ) -> "TranscriptionResult":
+        result = await self._decode_window(window, interim=False)
+        text = " ".join(committed + [result.text.strip()]).strip()
+        return dataclasses.replace(
+            result,
+            text=text,
+            duration_ms=duration_ms,
+            is_final=True,
+        )
+
+    async def _decode_window(self, window: bytes, interim: bool) -> "TranscriptionResult":
+        # Windows are slices (copies), so a caller's bytearray may keep
+        # growing while the decode runs on the STT engine
+        self.decodes += 1
+        self.decoded_ms += self._bytes_to_ms(len(window))
+        return await self._decode(window, interim)
+
+    def _words(self, result: "TranscriptionResult", start: int) -> List[_Word]:
+        """Hypothesis words with absolute end offsets (None without timestamps)."""
+        if result.words:
+            return [
+                (
+                    _normalize(word.text),
+                    word.text.strip(),
+                    start + int(word.end * self.sample_rate) * 2,
+                    word.start,
+                )
+                for word in result.words
+                if _normalize(word.text)
+            ]
+        return [
+            (_normalize(text), text, None, None)
+            for text in result.text.split()
+            if _normalize(text)
+        ]
+
+    def _drop_repeats(self, words: List[_Word]) -> List[_Word]:
+        """Drop leading words that repeat the end of the committed text."""
+        committed = [_normalize(text) for text in self._committed[-3:]]
+        for n in range(min(len(committed), len(words)), 0, -1):
+            start_s = words[n - 1][3]
+            if (
+                start_s is not None
+                and start_s < _REPEAT_WINDOW_S
+                and committed[-n:] == [word[0] for word in words[:n]]
+            ):
+                return words[n:]
+        return words
+
+    def _bytes_to_ms(self, size: int) -> int:
+        return size * 1000 // (self.sample_rate * 2)
@@ -0,0 +1,119 @@
+"""Fixed-capacity ring buffer for streaming PCM audio.
+
+Voice receive appends a 20 ms packet at a time for every speaker. Growing an
+immutable bytes object per packet copies the whole utterance each time
+(quadratic in its length); this buffer preallocates one bytearray per
+speaker and copies each packet exactly once.
+
+When the buffer is full the oldest audio is overwritten, so it always holds
+the most recent `capacity` bytes. Reads return memoryviews into the buffer
+instead of copies.
+"""
+
+# 16 kHz mono 16-bit PCM
+PCM_BYTES_PER_SECOND = 16000 * 2
+
+
+class PCMRingBuffer:
+    """Preallocated ring buffer of raw PCM bytes.
+
+    Not thread-safe; callers sharing a buffer across threads must lock.
+    """
+
+    __slots__ = ("capacity", "_buffer", "_start", "_size")
+
+    def __init__(self, capacity: int):
+        """Initialize buffer.
+
+        Args:
+            capacity: Maximum bytes held (rounded down to whole 16-bit samples)
+        """
+        capacity -= capacity % 2
+        if capacity <= 0:
+            raise ValueError("capacity must hold at least one sample")
+        self.capacity = capacity
+        self._buffer = bytearray(capacity)
+        self._start = 0
+        self._size = 0
+
+    @classmethod
+    def for_duration(
+        cls, seconds: float, bytes_per_second: int = PCM_BYTES_PER_SECOND
+    ) -> "PCMRingBuffer":
+        """Create a buffer holding `seconds` of audio."""
+        return cls(int(seconds * bytes_per_second))
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def duration_ms(self) -> float:
+        """Duration of buffered 16 kHz mono audio in milliseconds."""
+        return self._size * 1000 / PCM_BYTES_PER_SECOND
+
+    def append(self, data: bytes) -> int:
+        """Append audio, overwriting the oldest bytes when full.
+
+        Args:
+            data: PCM bytes (any buffer type)
+
+        Returns:
+            Number of old bytes dropped to make room
+        """
+        data = memoryview(data).cast("B")
+        length = len(data)
+        if length >= self.capacity:
+            # Only the newest `capacity` bytes survive
+            dropped = self._size + length - self.capacity
+            self._buffer[:] = data[length - self.capacity:]
+            self._start = 0
+            self._size = self.capacity
+            return dropped
+
+        dropped = max(0, self._size + length - self.capacity)
+        if dropped:
+            self._start = (self._start + dropped) % self.capacity
+            self._size -= dropped
+
+        end = (self._start + self._size) % self.capacity
+        first = min(length, self.capacity - end)
+        self._buffer[end:end + first] = data[:first]
+        if first < length:
+            self._buffer[:length - first] = data[first:]
+        self._size += length
+        return dropped
+
+    def view(self) -> memoryview:
+        """Contiguous read-only view of the buffered audio (oldest first).
+
+        Zero-copy unless the data wraps around the end of the buffer, in
+        which case it is rotated to the front once. The view is invalidated
+        by the next append or clear.
+        """
+        if self._start + self._size > self.capacity:
+            self._linearize()
+        return memoryview(self._buffer)[self._start:self._start + self._size].toreadonly()
+
+    def tail(self, size: int) -> memoryview:
+        """View of the newest `size` bytes (or fewer if not buffered)."""
+        size = min(size, self._size)
+        view = self.view()
+        return view[len(view) - size:]
+
+    def take(self) -> bytes:
+        """Copy out the buffered audio and clear the buffer."""
+        data = bytes(self.view())
+        self.clear()
+        return data
+
+    def clear(self) -> None:
+        """Drop all buffered audio (the allocation is kept)."""
+        self._start = 0
+        self._size = 0
+
+    def _linearize(self) -> None:
+        head = self.capacity - self._start
+        wrapped = bytes(self._buffer[:self._size - head])
+        self._buffer[:head] = self._buffer[self._start:]
+        self._buffer[head:self._size] = wrapped
+        self._start = 0
@@ -6,8 +6,8 @@ with Voice Activity Detection (VAD) integration for efficient processing.
 
 import asyncio
 import io
+import os
 import time
-import wave
 from dataclasses import dataclass, field
 from typing import Optional, Callable, AsyncGenerator, Dict, List, Any, Tuple
 import logging
@@ -35,11 +35,29 @@ except ImportError:
     HAS_TORCH = False
     torch = None
 
+from src.monitoring.latency import record_latency
+from src.voice.stt_engine import STTEngine, get_stt_engine
+from src.voice.interim import InterimTranscriber
 from src.voice.vad import VoiceActivityDetector, VADConfig, SpeechBuffer
-from src.voice.audio_capture import AudioCapture, AudioConfig, AudioStream
+from src.voice.audio_capture import (
+    AudioCapture,
+    AudioConfig,
+    AudioStream,
+    pcm16_to_float32,
+    write_wav_file,
+)
 
 logger = logging.getLogger(__name__)
 
+# Loading a model downloads and initializes weights, far longer than a decode
+MODEL_LOAD_TIMEOUT_SECONDS = 600.0
+
+# Sample rate Whisper models take as array input
+WHISPER_SAMPLE_RATE = 16000
+
+# Buffer types accepted as raw 16-bit PCM
+PCM_TYPES = (bytes, bytearray, memoryview)
+
 
 def _detect_cuda_device() -> Tuple[str, int]:
     """Detect CUDA device and return (device, num_workers).
@@ -55,6 +73,27 @@ def _detect_cuda_device() -> Tuple[str, int]:
     return "cpu", 1
 
 
+def _capture_audio(capture_dir: str, audio_data: bytes, sample_rate: int) -> None:
+    """Save an utterance as WAV for debugging."""
+    try:
+        os.makedirs(capture_dir, exist_ok=True)
+        path = os.path.join(capture_dir, f"utterance_{time.time_ns()}.wav")
+        write_wav_file(path, audio_data, sample_rate)
+    except OSError as e:
+        logger.warning(f"Debug audio capture failed: {e}")
+
+
+def _create_interim(
+    stt: Any,
+    sample_rate: int,
+    interval_ms: Optional[int],
+) -> Optional[InterimTranscriber]:
+    """Create an InterimTranscriber decoding through stt, if interim results are enabled."""
+    if not interval_ms:
+        return None
+    return InterimTranscriber.for_stt(stt, sample_rate=sample_rate, interval_ms=interval_ms)
+
+
 @dataclass
 class TranscriptionResult:
     """Result of a speech transcription.
@@ -65,7 +104,9 @@ class TranscriptionResult:
         language: Detected language code (e.g., "en", "es").
         duration_ms: Audio duration in milliseconds.
         latency_ms: End-to-end processing latency in milliseconds.
-        is_final: True if this is a complete utterance.
+        is_final: True if this is a complete utterance, False for an
+            interim result of speech still in progress.
+        words: Word timings, when word timestamps were requested.
     """
     text: str
     confidence: float = 0.0
@@ -73,6 +114,7 @@ class TranscriptionResult:
     duration_ms: int = 0
     latency_ms: int = 0
     is_final: bool = True
+    words: List["FasterWhisperWord"] = field(default_factory=list)
 
 
 @dataclass
@@ -106,6 +148,17 @@ class STTStats:
             return 0.0
         return sum(self.confidence_scores) / len(self.confidence_scores)
 
+    def record_transcription(self, latency_ms: int, confidence: float):
+        """Count a completed transcription and feed the latency histogram."""
+        self.total_transcriptions += 1
+        self.total_latency_ms += latency_ms
+        self.confidence_scores.append(confidence)
+        record_latency("stt_latency_ms", latency_ms)
+
+    def record_interim(self, latency_ms: int):
+        """Record an interim decode; it is not a transcription of its own."""
+        record_latency("stt_interim_ms", latency_ms)
+
 
 class SpeechToText:
     """Speech-to-Text engine using Whisper backend.
@@ -130,6 +183,8 @@ class SpeechToText:
         compute_type: str = "int8",
         language: Optional[str] = None,
         vad_aggressiveness: int = 3,
+        engine: Optional[STTEngine] = None,
+        debug_capture_dir: Optional[str] = None,
     ):
         """Initialize SpeechToText engine.
         
@@ -139,6 +194,10 @@ class SpeechToText:
             compute_type: Computation type ("int8", "int16", "float16", "float32").
             language: Language code for transcription (None for auto-detect).
             vad_aggressiveness: VAD aggressiveness (0-3).
+            engine: Worker engine for model loading and decoding
+                (default: the shared engine from get_stt_engine()).
+            debug_capture_dir: If set, save every PCM utterance there as WAV
+                (debugging only; transcription never needs the file).
             
         Raises:
             ImportError: If neither faster-whisper nor openai-whisper is installed.
@@ -157,6 +216,9 @@ class SpeechToText:
         self._model: Optional[Any] = None
         self._model_loaded = False
         self._backend: Optional[str] = None
+        self._engine = engine or get_stt_engine()
+        self._load_lock = asyncio.Lock()
+        self.debug_capture_dir = debug_capture_dir
 
         # Initialize VAD (optional - graceful degradation if not available)
         try:
@@ -229,6 +291,20 @@ class SpeechToText:
         """
         return self._model_loaded and self._model is not None
 
+    async def _ensure_model(self) -> bool:
+        """Load the model on the STT engine if it is not loaded yet.
+        
+        Returns:
+            True if the model is ready.
+        """
+        if self.is_model_loaded():
+            return True
+        # Concurrent first calls share one load instead of each loading a copy
+        async with self._load_lock:
+            if self.is_model_loaded():
+                return True
+            return await self._engine.run(self.load_model, timeout=MODEL_LOAD_TIMEOUT_SECONDS)
+
     async def transcribe_file(self, audio_path: str) -> TranscriptionResult:
         """Transcribe an audio file.
         
@@ -238,8 +314,70 @@ class SpeechToText:
         Returns:
             TranscriptionResult with text and metadata.
         """
-        if not self.is_model_loaded():
-            if not self.load_model():
+        return await self._transcribe(audio_path)
+
+    async def transcribe_audio_bytes(
+        self,
+        audio_data: bytes,
+        sample_rate: int = WHISPER_SAMPLE_RATE,
+        word_timestamps: bool = False,
+    ) -> TranscriptionResult:
+        """Transcribe raw audio bytes in memory.
+        
+        Args:
+            audio_data: Raw audio bytes (16-bit PCM, mono).
+            sample_rate: Sample rate in Hz.
+            word_timestamps: Also return word timings in result.words.
+            
+        Returns:
+            TranscriptionResult with text and metadata.
+        """
+        result = await self._transcribe(audio_data, sample_rate, word_timestamps)
+        result.duration_ms = len(audio_data) * 1000 // (sample_rate * 2)
+        return result
+
+    async def transcribe_interim(
+        self,
+        audio_data: bytes,
+        sample_rate: int = WHISPER_SAMPLE_RATE,
+    ) -> TranscriptionResult:
+        """Decode speech still in progress, with word timings.
+        
+        Interim decodes repeat every few hundred ms of an utterance, so they
+        are kept out of the transcription stats, debug capture and INFO log;
+        their latency goes to the stt_interim_ms histogram.
+        
+        Args:
+            audio_data: Raw audio bytes (16-bit PCM, mono).
+            sample_rate: Sample rate in Hz.
+            
+        Returns:
+            TranscriptionResult with text, metadata and result.words.
+        """
+        result = await self._transcribe(audio_data, sample_rate, True, interim=True)
+        result.duration_ms = len(audio_data) * 1000 // (sample_rate * 2)
+        return result
+
+    async def _transcribe(
+        self,
+        audio_input: Any,
+        sample_rate: int = WHISPER_SAMPLE_RATE,
+        word_timestamps: bool = False,
+        interim: bool = False,
+    ) -> TranscriptionResult:
+        """Transcribe a file path or PCM buffer on the STT engine.
+        
+        Args:
+            audio_input: Path to audio file or raw 16-bit PCM.
+            sample_rate: Sample rate of PCM input.
+            word_timestamps: Also return word timings in result.words.
+            interim: Interim decode; not counted, captured or logged at INFO.
+            
+        Returns:
+            TranscriptionResult with text and metadata.
+        """
+        try:
+            if not await self._ensure_model():
                 return TranscriptionResult(
                     text="",
                     confidence=0.0,
@@ -247,23 +385,21 @@ class SpeechToText:
                     is_final=True,
                 )
 
-        start_time = time.time()
-
-        try:
-            if self._backend == "faster-whisper":
-                result = await self._transcribe_faster_whisper(audio_path)
-            elif self._backend == "openai-whisper":
-                result = await self._transcribe_openai_whisper(audio_path)
-            else:
-                raise RuntimeError("No backend available")
+            start_time = time.time()
+            result = await self._engine.run(
+                self._decode, audio_input, sample_rate, word_timestamps, not interim
+            )
 
             latency_ms = int((time.time() - start_time) * 1000)
             result.latency_ms = latency_ms
 
+            if interim:
+                self.stats.record_interim(latency_ms)
+                logger.debug(f"Interim: '{result.text[:50]}...' (latency={latency_ms}ms)")
+                return result
+
             # Update stats
-            self.stats.total_transcriptions += 1
-            self.stats.total_latency_ms += latency_ms
-            self.stats.confidence_scores.append(result.confidence)
+            self.stats.record_transcription(latency_ms, result.confidence)
             self.stats.languages_detected[result.language] = \
                 self.stats.languages_detected.get(result.language, 0) + 1
 
@@ -289,6 +425,7 @@ class SpeechToText:
         self,
         audio_stream: AudioStream,
         callback: Optional[Callable[[TranscriptionResult], None]] = None,
+        interim_interval_ms: Optional[int] = None,
     ) -> AsyncGenerator[TranscriptionResult, None]:
         """Transcribe audio stream in real-time.
         
@@ -297,14 +434,17 @@ class SpeechToText:
         Args:
             audio_stream: AudioStream providing audio chunks.
             callback: Optional callback for each final transcription.
+            interim_interval_ms: If set, also yield interim results
+                (is_final=False) for the segment in progress, re-decoding
+                its uncommitted part at this interval.
             
         Yields:
-            TranscriptionResult for each detected speech segment.
+            TranscriptionResult for each detected speech segment, preceded
+            by its interim results when enabled.
         """
-        if not self.is_model_loaded():
-            if not self.load_model():
-                logger.error("Cannot start stream transcription: model not loaded")
-                return
+        if not await self._ensure_model():
+            logger.error("Cannot start stream transcription: model not loaded")
+            return
 
         logger.info("Starting stream transcription")
 
@@ -313,62 +453,129 @@ class SpeechToText:
             logger.error("Cannot start stream transcription: VAD not available")
             return
         speech_buffer = self.vad.create_buffer()
+        sample_rate = audio_stream.sample_rate
+        interim = _create_interim(self, sample_rate, interim_interval_ms)
 
-        # Process audio chunks
-        async for chunk in audio_stream.iter_chunks():
-            if chunk is None:
-                break
+        async def transcribe_segment(segment: bytes) -> TranscriptionResult:
+            if interim:
+                return await interim.finish(segment)
+            return await self.transcribe_audio_bytes(segment, sample_rate)
 
-            # Run VAD on chunk
-            try:
-                is_speech = self.vad.is_speech(chunk, audio_stream.sample_rate)
-            except ValueError as e:
-                logger.warning(f"VAD error: {e}")
-                continue
+        try:
+            # Process audio chunks
+            async for chunk in audio_stream.iter_chunks():
+                if chunk is None:
+                    break
 
-            # Add to buffer
-            segment = speech_buffer.add_frame(chunk, is_speech)
+                # Run VAD on chunk
+                try:
+                    is_speech = self.vad.is_speech(chunk, sample_rate)
+                except ValueError as e:
+                    logger.warning(f"VAD error: {e}")
+                    continue
 
-            if segment:
-                # Speech segment complete, transcribe it
-                result = await self._transcribe_audio_bytes(segment, audio_stream.sample_rate)
+                # Add to buffer
+                segment = speech_buffer.add_frame(chunk, is_speech)
 
-                if callback:
-                    callback(result)
+                if segment:
+                    # Speech segment complete, transcribe it
+                    result = await transcribe_segment(segment)
 
-                if result.text.strip():  # Only yield non-empty results
-                    yield result
+                    if callback:
+                        callback(result)
 
-        # Handle any remaining speech in buffer
-        if speech_buffer.is_speech_active:
-            remaining = speech_buffer._finalize_segment()
-            if remaining:
-                result = await self._transcribe_audio_bytes(remaining, audio_stream.sample_rate)
-                if callback:
-                    callback(result)
-                if result.text.strip():
-                    yield result
+                    if result.text.strip():  # Only yield non-empty results
+                        yield result
+
+                elif interim and speech_buffer.is_speech_active:
+                    partial = interim.poll(
+                        speech_buffer.pending_ms, speech_buffer.pending_audio
+                    )
+                    if partial:
+                        yield partial
+
+            # Handle any remaining speech in buffer
+            if speech_buffer.is_speech_active:
+                remaining = speech_buffer.flush()
+                if remaining:
+                    result = await transcribe_segment(remaining)
+                    if callback:
+                        callback(result)
+                    if result.text.strip():
+                        yield result
+        finally:
+            if interim:
+                interim.reset()
 
         logger.info("Stream transcription ended")
 
-    async def _transcribe_faster_whisper(self, audio_path: str) -> TranscriptionResult:
-        """Transcribe using faster-whisper backend."""
+    def _decode(
+        self,
+        audio_input: Any,
+        sample_rate: int,
+        word_timestamps: bool = False,
+        capture: bool = True,
+    ) -> TranscriptionResult:
+        """Decode a file path or PCM buffer (blocking, runs on the engine).
+        
+        PCM is handed to the model as a float32 array; no temp file is written.
+        
+        Args:
+            audio_input: Path to audio file or raw 16-bit PCM.
+            sample_rate: Sample rate of PCM input.
+            word_timestamps: Also return word timings in result.words.
+            capture: Save PCM to debug_capture_dir when that is set.
+            
+        Returns:
+            TranscriptionResult.
+        """
+        if isinstance(audio_input, PCM_TYPES):
+            if capture and self.debug_capture_dir:
+                _capture_audio(self.debug_capture_dir, audio_input, sample_rate)
+            audio_input = pcm16_to_float32(audio_input, sample_rate, WHISPER_SAMPLE_RATE)
+
+        if self._backend == "faster-whisper":
+            return self._transcribe_faster_whisper(audio_input, word_timestamps)
+        if self._backend == "openai-whisper":
+            return self._transcribe_openai_whisper(audio_input, word_timestamps)
+        raise RuntimeError("No backend available")
+
+    def _transcribe_faster_whisper(
+        self,
+        audio_input: Any,
+        word_timestamps: bool = False,
+    ) -> TranscriptionResult:
+        """Transcribe using faster-whisper backend.
+        
+        Args:
+            audio_input: Path to audio file or float32 array at 16kHz.
+            word_timestamps: Also return word timings.
+        """
         segments, info = self._model.transcribe(
-            audio_path,
+            audio_input,
             language=self.language,
             beam_size=5,
             best_of=5,
             temperature=0.0,
             condition_on_previous_text=False,
+            word_timestamps=word_timestamps,
         )
 
         # Collect all segments
         texts = []
         confidences = []
+        words = []
         for segment in segments:
             texts.append(segment.text)
             # Use avg_logprob as confidence proxy
             confidences.append(getattr(segment, "avg_logprob", -1.0))
+            for word in getattr(segment, "words", None) or []:
+                words.append(FasterWhisperWord(
+                    text=word.word,
+                    start=word.start,
+                    end=word.end,
+                    probability=getattr(word, "probability", 0.0),
+                ))
 
         full_text = " ".join(texts).strip()
 
@@ -385,15 +592,26 @@ class SpeechToText:
             confidence=confidence,
             language=info.language if info else self.language or "unknown",
             is_final=True,
+            words=words,
         )
 
-    async def _transcribe_openai_whisper(self, audio_path: str) -> TranscriptionResult:
-        """Transcribe using openai-whisper backend."""
+    def _transcribe_openai_whisper(
+        self,
+        audio_input: Any,
+        word_timestamps: bool = False,
+    ) -> TranscriptionResult:
+        """Transcribe using openai-whisper backend.
+        
+        Args:
+            audio_input: Path to audio file or float32 array at 16kHz.
+            word_timestamps: Also return word timings.
+        """
         result = self._model.transcribe(
-            audio_path,
+            audio_input,
             language=self.language,
             temperature=0.0,
             condition_on_previous_text=False,
+            word_timestamps=word_timestamps,
         )
 
         text = result.get("text", "").strip()
@@ -409,118 +627,25 @@ class SpeechToText:
         else:
             confidence = 0.5
 
+        words = [
+            FasterWhisperWord(
+                text=word["word"],
+                start=word["start"],
+                end=word["end"],
+                probability=word.get("probability", 0.0),
+            )
+            for seg in segments
+            for word in seg.get("words", [])
+        ]
+
         return TranscriptionResult(
             text=text,
             confidence=confidence,
             language=detected_language,
             is_final=True,
+            words=words,
         )
 
-    async def _transcribe_audio_bytes(
-        self,
-        audio_data: bytes,
-        sample_rate: int,
-    ) -> TranscriptionResult:
-        """Transcribe raw audio bytes.
-        
-        Args:
-            audio_data: Raw audio bytes (16-bit PCM).
-            sample_rate: Sample rate in Hz.
-            
-        Returns:
-            TranscriptionResult.
-        """
-        start_time = time.time()
-
-        try:
-            # Convert bytes to numpy array
-            audio_array = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
-
-            if self._backend == "faster-whisper":
-                segments, info = self._model.transcribe(
-                    audio_array,
-                    language=self.language,
-                    beam_size=5,
-                    temperature=0.0,
-                    condition_on_previous_text=False,
-                )
-                texts = [seg.text for seg in segments]
-                text = " ".join(texts).strip()
-                language = info.language if info else self.language or "unknown"
-
-            elif self._backend == "openai-whisper":
-                # openai-whisper requires file path or mel spectrogram
-                # We'll use a temporary WAV file
-                text, language = await self._transcribe_via_temp_file(
-                    audio_data, sample_rate
-                )
-            else:
-                return TranscriptionResult(
-                    text="",
-                    confidence=0.0,
-                    language="error",
-                    is_final=True,
-                )
-
-            latency_ms = int((time.time() - start_time) * 1000)
-
-            return TranscriptionResult(
-                text=text,
-                confidence=0.8,  # Default confidence for stream transcription
-                language=language,
-                duration_ms=len(audio_data) * 1000 // (sample_rate * 2),
-                latency_ms=latency_ms,
-                is_final=True,
-            )
-
-        except Exception as e:
-            logger.error(f"Audio bytes transcription error: {e}")
-            self.stats.errors += 1
-            return TranscriptionResult(
-                text="",
-                confidence=0.0,
-                language="error",
-                is_final=True,
-            )
-
-    async def _transcribe_via_temp_file(
-        self,
-        audio_data: bytes,
-        sample_rate: int,
-    ) -> tuple[str, str]:
-        """Transcribe by writing to temporary WAV file.
-        
-        Args:
-            audio_data: Raw PCM audio bytes.
-            sample_rate: Sample rate.
-            
-        Returns:
-            Tuple of (text, language).
-        """
-        import tempfile
-        import os
-
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            temp_path = f.name
-            # Write WAV file
-            with wave.open(f, "wb") as wav:
-                wav.setnchannels(1)
-                wav.setsampwidth(2)  # 16-bit
-                wav.setframerate(sample_rate)
-                wav.writeframes(audio_data)
-
-        try:
-            result = self._model.transcribe(
-                temp_path,
-                language=self.language,
-                temperature=0.0,
-            )
-            text = result.get("text", "").strip()
-            language = result.get("language", self.language or "unknown")
-            return text, language
-        finally:
-            os.unlink(temp_path)
-
     def get_stats(self) -> Dict[str, Any]:
         """Get performance statistics.
         
@@ -608,7 +733,7 @@ class SpeechToText:
         audio_data = b"".join(audio_chunks)
         sample_rate = stream.sample_rate
 
-        result = await self._transcribe_audio_bytes(audio_data, sample_rate)
+        result = await self.transcribe_audio_bytes(audio_data, sample_rate)
         return result
 
 
@@ -694,6 +819,8 @@ class FasterWhisperSTT:
         num_workers: int = 1,
         download_root: Optional[str] = None,
         local_files_only: bool = False,
+        engine: Optional[STTEngine] = None,
+        debug_capture_dir: Optional[str] = None,
     ):
         """Initialize FasterWhisperSTT engine.
         
@@ -710,6 +837,10 @@ class FasterWhisperSTT:
             num_workers: Number of parallel workers for transcription (1 for RTX 3060 streaming).
             download_root: Root directory for model downloads.
             local_files_only: If True, only use local models (no download).
+            engine: Worker engine for model loading and decoding
+                (default: the shared engine from get_stt_engine()).
+            debug_capture_dir: If set, save every PCM utterance there as WAV
+                (debugging only; transcription never needs the file).
             
         Raises:
             ImportError: If faster-whisper is not installed.
@@ -744,6 +875,9 @@ class FasterWhisperSTT:
         
         self._model: Optional[WhisperModel] = None
         self._model_loaded = False
+        self._engine = engine or get_stt_engine()
+        self._load_lock = asyncio.Lock()
+        self.debug_capture_dir = debug_capture_dir
         
         # Auto-detect CUDA if device="auto"
         if self.device == "auto":
@@ -836,6 +970,20 @@ class FasterWhisperSTT:
         """
         return self._model_loaded and self._model is not None
     
+    async def _ensure_model(self) -> bool:
+        """Load the model on the STT engine if it is not loaded yet.
+        
+        Returns:
+            True if the model is ready.
+        """
+        if self.is_model_loaded():
+            return True
+        # Concurrent first calls share one load instead of each loading a copy
+        async with self._load_lock:
+            if self.is_model_loaded():
+                return True
+            return await self._engine.run(self.load_model, timeout=MODEL_LOAD_TIMEOUT_SECONDS)
+    
     def unload_model(self) -> None:
         """Unload the model to free VRAM."""
         if self._model is not None:
@@ -862,27 +1010,23 @@ class FasterWhisperSTT:
         Returns:
             TranscriptionResult with text and metadata.
         """
-        if not self.is_model_loaded():
-            if not self.load_model():
+        try:
+            if not await self._ensure_model():
                 return TranscriptionResult(
                     text="",
                     confidence=0.0,
                     language="error",
                     is_final=True,
                 )
-        
-        start_time = time.time()
-        
-        try:
+            
+            start_time = time.time()
             result = await self._transcribe_with_faster_whisper(audio_path, **kwargs)
             
             latency_ms = int((time.time() - start_time) * 1000)
             result.latency_ms = latency_ms
             
             # Update stats
-            self.stats.total_transcriptions += 1
-            self.stats.total_latency_ms += latency_ms
-            self.stats.confidence_scores.append(result.confidence)
+            self.stats.record_transcription(latency_ms, result.confidence)
             self.stats.languages_detected[result.language] = \
                 self.stats.languages_detected.get(result.language, 0) + 1
             
@@ -907,34 +1051,54 @@ class FasterWhisperSTT:
     async def _transcribe_with_faster_whisper(
         self,
         audio_input: Any,
+        sample_rate: int = WHISPER_SAMPLE_RATE,
         **kwargs
     ) -> TranscriptionResult:
         """Internal transcription using faster-whisper.
         
         Args:
-            audio_input: Path to audio file or numpy array.
+            audio_input: Path to audio file, numpy array or raw 16-bit PCM.
+            sample_rate: Sample rate of PCM input.
             **kwargs: Additional transcribe arguments.
             
         Returns:
             TranscriptionResult.
         """
-        loop = asyncio.get_event_loop()
-        
-        # Run transcription in thread pool (faster-whisper is CPU/GPU bound)
-        segments, info = await loop.run_in_executor(
-            None,
-            lambda: self._model.transcribe(
-                audio_input,
-                language=self.language,
-                beam_size=self.beam_size,
-                vad_filter=self.vad_filter,
-                word_timestamps=self.word_timestamps,
-                condition_on_previous_text=False,
-                **kwargs
-            )
+        # faster-whisper is CPU/GPU bound, run it on the STT engine
+        return await self._engine.run(self._decode, audio_input, sample_rate, **kwargs)
+    
+    def _decode(self, audio_input: Any, sample_rate: int, **kwargs) -> TranscriptionResult:
+        """Decode audio with faster-whisper (blocking, runs on the engine).
+        
+        PCM is handed to the model as a float32 array; no temp file is written.
+        
+        Args:
+            audio_input: Path to audio file, numpy array or raw 16-bit PCM.
+            sample_rate: Sample rate of PCM input.
+            **kwargs: Additional transcribe arguments (capture=False skips
+                the debug capture).
+            
+        Returns:
+            TranscriptionResult.
+        """
+        capture = kwargs.pop("capture", True)
+        if isinstance(audio_input, PCM_TYPES):
+            if capture and self.debug_capture_dir:
+                _capture_audio(self.debug_capture_dir, audio_input, sample_rate)
+            audio_input = pcm16_to_float32(audio_input, sample_rate, WHISPER_SAMPLE_RATE)
+        
+        want_words = kwargs.pop("word_timestamps", self.word_timestamps)
+        segments, info = self._model.transcribe(
+            audio_input,
+            language=self.language,
+            beam_size=self.beam_size,
+            vad_filter=self.vad_filter,
+            word_timestamps=want_words,
+            condition_on_previous_text=False,
+            **kwargs
         )
         
-        # Collect segments
+        # Collect segments (decoding happens lazily while iterating)
         texts = []
         confidences = []
         word_timestamps: List[FasterWhisperWord] = []
@@ -946,7 +1110,7 @@ class FasterWhisperSTT:
             confidences.append(getattr(segment, "avg_logprob", -1.0))
             
             # Extract word timestamps if available
-            if self.word_timestamps and hasattr(segment, "words"):
+            if want_words and getattr(segment, "words", None):
                 segment_words = []
                 for word in segment.words:
                     fw = FasterWhisperWord(
@@ -983,6 +1147,7 @@ class FasterWhisperSTT:
             confidence=confidence,
             language=info.language if info else self.language or "unknown",
             is_final=True,
+            words=word_timestamps,
         )
     
     async def transcribe_audio_array(
@@ -998,31 +1163,105 @@ class FasterWhisperSTT:
             sample_rate: Sample rate of the audio (default 16000).
             **kwargs: Additional arguments passed to transcribe().
             
+        Returns:
+            TranscriptionResult.
+        """
+        return await self._transcribe_samples(
+            audio_array, sample_rate, len(audio_array) * 1000 // sample_rate, **kwargs
+        )
+    
+    async def transcribe_audio_bytes(
+        self,
+        audio_data: bytes,
+        sample_rate: int = 16000,
+        **kwargs
+    ) -> TranscriptionResult:
+        """Transcribe raw audio bytes (16-bit PCM) in memory.
+        
+        Args:
+            audio_data: Raw audio bytes (16-bit PCM).
+            sample_rate: Sample rate in Hz.
+            **kwargs: Additional arguments passed to transcribe().
+            
+        Returns:
+            TranscriptionResult.
+        """
+        # Converted to float32 on the engine worker, straight from the buffer
+        return await self._transcribe_samples(
+            audio_data, sample_rate, len(audio_data) * 1000 // (sample_rate * 2), **kwargs
+        )
+    
+    async def transcribe_interim(
+        self,
+        audio_data: bytes,
+        sample_rate: int = 16000,
+    ) -> TranscriptionResult:
+        """Decode speech still in progress, with word timings.
+        
+        Interim decodes repeat every few hundred ms of an utterance, so they
+        are kept out of the transcription stats and debug capture; their
+        latency goes to the stt_interim_ms histogram.
+        
+        Args:
+            audio_data: Raw audio bytes (16-bit PCM).
+            sample_rate: Sample rate in Hz.
+            
+        Returns:
+            TranscriptionResult with text, metadata and result.words.
+        """
+        return await self._transcribe_samples(
+            audio_data,
+            sample_rate,
+            len(audio_data) * 1000 // (sample_rate * 2),
+            interim=True,
+            word_timestamps=True,
+            capture=False,
+        )
+    
+    async def _transcribe_samples(
+        self,
+        audio_input: Any,
+        sample_rate: int,
+        duration_ms: int,
+        interim: bool = False,
+        **kwargs
+    ) -> TranscriptionResult:
+        """Transcribe an in-memory numpy array or PCM buffer.
+        
+        Args:
+            audio_input: Numpy array or raw 16-bit PCM.
+            sample_rate: Sample rate of the audio.
+            duration_ms: Audio duration.
+            interim: Interim decode; recorded as stt_interim_ms only.
+            **kwargs: Additional arguments passed to transcribe().
+            
         Returns:
             TranscriptionResult.
         """
         start_time = time.time()
         
-        if not self.is_model_loaded():
-            if not self.load_model():
+        try:
+            if not await self._ensure_model():
                 return TranscriptionResult(
                     text="",
                     confidence=0.0,
                     language="error",
                     is_final=True,
                 )
-        
-        try:
-            result = await self._transcribe_with_faster_whisper(audio_array, **kwargs)
+            
+            result = await self._transcribe_with_faster_whisper(
+                audio_input, sample_rate, **kwargs
+            )
             
             latency_ms = int((time.time() - start_time) * 1000)
             result.latency_ms = latency_ms
-            result.duration_ms = len(audio_array) * 1000 // sample_rate
+            result.duration_ms = duration_ms
             
             # Update stats
-            self.stats.total_transcriptions += 1
-            self.stats.total_latency_ms += latency_ms
-            self.stats.confidence_scores.append(result.confidence)
+            if interim:
+                self.stats.record_interim(latency_ms)
+            else:
+                self.stats.record_transcription(latency_ms, result.confidence)
             
             return result
             
@@ -1036,26 +1275,6 @@ class FasterWhisperSTT:
                 is_final=True,
             )
     
-    async def transcribe_audio_bytes(
-        self,
-        audio_data: bytes,
-        sample_rate: int = 16000,
-        **kwargs
-    ) -> TranscriptionResult:
-        """Transcribe raw audio bytes (16-bit PCM).
-        
-        Args:
-            audio_data: Raw audio bytes (16-bit PCM).
-            sample_rate: Sample rate in Hz.
-            **kwargs: Additional arguments passed to transcribe().
-            
-        Returns:
-            TranscriptionResult.
-        """
-        # Convert bytes to numpy array
-        audio_array = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
-        return await self.transcribe_audio_array(audio_array, sample_rate, **kwargs)
-    
     async def transcribe_microphone(
         self,
         duration_ms: int = 5000,
@@ -1098,6 +1317,7 @@ class FasterWhisperSTT:
         callback: Optional[Callable[[TranscriptionResult], None]] = None,
         min_speech_duration_ms: int = 250,
         max_speech_duration_s: float = 30.0,
+        interim_interval_ms: Optional[int] = None,
     ) -> AsyncGenerator[TranscriptionResult, None]:
         """Transcribe audio stream in real-time with VAD.
         
@@ -1109,14 +1329,17 @@ class FasterWhisperSTT:
             callback: Optional callback for each final transcription.
             min_speech_duration_ms: Minimum speech duration to transcribe.
             max_speech_duration_s: Maximum segment duration before forced split.
+            interim_interval_ms: If set, also yield interim results
+                (is_final=False) for the audio accumulated so far, re-decoding
+                its uncommitted part at this interval.
             
         Yields:
-            TranscriptionResult for each detected speech segment.
+            TranscriptionResult for each detected speech segment, preceded
+            by its interim results when enabled.
         """
-        if not self.is_model_loaded():
-            if not self.load_model():
-                logger.error("Cannot start stream transcription: model not loaded")
-                return
+        if not await self._ensure_model():
+            logger.error("Cannot start stream transcription: model not loaded")
+            return
         
         logger.info("Starting stream transcription with VAD")
         
@@ -1124,42 +1347,54 @@ class FasterWhisperSTT:
         buffer = bytearray()
         speech_active = False
         speech_start_time = 0.0
+        sample_rate = audio_stream.sample_rate
+        interim = _create_interim(self, sample_rate, interim_interval_ms)
         
-        async for chunk in audio_stream.iter_chunks():
-            if chunk is None:
-                break
-            
-            buffer.extend(chunk)
-            buffer_duration_ms = len(buffer) * 1000 // (audio_stream.sample_rate * 2)
-            
-            # Check for max duration to prevent memory issues
-            if buffer_duration_ms > max_speech_duration_s * 1000:
-                # Force transcription of accumulated audio
-                if buffer:
-                    audio_array = np.frombuffer(buffer, dtype=np.int16).astype(np.float32) / 32768.0
-                    result = await self.transcribe_audio_array(
-                        audio_array, audio_stream.sample_rate
-                    )
-                    
-                    if callback:
-                        callback(result)
+        async def transcribe_buffer(audio: bytearray) -> TranscriptionResult:
+            if interim:
+                return await interim.finish(audio)
+            return await self.transcribe_audio_bytes(audio, sample_rate)
+        
+        try:
+            async for chunk in audio_stream.iter_chunks():
+                if chunk is None:
+                    break
+                
+                buffer.extend(chunk)
+                buffer_duration_ms = len(buffer) * 1000 // (sample_rate * 2)
+                
+                # Check for max duration to prevent memory issues
+                if buffer_duration_ms > max_speech_duration_s * 1000:
+                    # Force transcription of accumulated audio
+                    if buffer:
+                        result = await transcribe_buffer(buffer)
+                        
+                        if callback:
+                            callback(result)
+                        
+                        if result.text.strip():
+                            yield result
                     
-                    if result.text.strip():
-                        yield result
+                    buffer = bytearray()
+                    speech_active = False
                 
-                buffer = bytearray()
-                speech_active = False
-        
-        # Handle remaining audio
-        if buffer:
-            audio_array = np.frombuffer(buffer, dtype=np.int16).astype(np.float32) / 32768.0
-            result = await self.transcribe_audio_array(audio_array, audio_stream.sample_rate)
+                elif interim:
+                    partial = interim.poll(buffer_duration_ms, lambda: buffer)
+                    if partial:
+                        yield partial
             
-            if callback:
-                callback(result)
-            
-            if result.text.strip():
-                yield result
+            # Handle remaining audio
+            if buffer:
+                result = await transcribe_buffer(buffer)
+                
+                if callback:
+                    callback(result)
+                
+                if result.text.strip():
+                    yield result
+        finally:
+            if interim:
+                interim.reset()
         
         logger.info("Stream transcription ended")
     
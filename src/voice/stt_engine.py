@@ -0,0 +1,246 @@
+"""Off-event-loop execution engine for speech-to-text jobs.
+
+Whisper decoding is CPU/GPU bound and takes seconds. Run on the event loop
+it stalls Discord heartbeats, websockets and the dashboard, so every STT
+entry point submits its blocking work here instead.
+
+Jobs go through a bounded submission queue to a fixed set of worker
+threads sharing the already-loaded model (faster-whisper/CTranslate2
+releases the GIL while decoding). Each job has a timeout; a job that times
+out or whose caller is cancelled is dropped if it has not started yet.
+
+Usage:
+    engine = get_stt_engine()
+    result = await engine.run(model_transcribe_sync, audio, timeout=30)
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from src.monitoring.latency import record_latency
+
+logger = logging.getLogger(__name__)
+
+# Each decode is itself multi-threaded, so more workers than this only
+# oversubscribe the CPU
+DEFAULT_WORKERS = max(1, min(4, os.cpu_count() or 1))
+
+# Jobs waiting beyond this are rejected instead of queued
+DEFAULT_MAX_QUEUE = 32
+
+# Per-job timeout when the caller does not pass one
+DEFAULT_JOB_TIMEOUT_SECONDS = 60.0
+
+
+class STTQueueFullError(RuntimeError):
+    """Raised when the STT submission queue is full."""
+
+
+@dataclass
+class _Job:
+    """A blocking call waiting for a worker."""
+
+    fn: Callable[..., Any]
+    args: tuple
+    kwargs: dict
+    future: concurrent.futures.Future = field(default_factory=concurrent.futures.Future)
+    submitted_at: float = field(default_factory=time.monotonic)
+
+
+class STTEngine:
+    """Runs blocking STT calls on a pool of worker threads."""
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        default_timeout_s: float = DEFAULT_JOB_TIMEOUT_SECONDS,
+    ):
+        """Initialize engine. Worker threads start on first submission.
+
+        Args:
+            workers: Number of worker threads
+            max_queue: Maximum jobs waiting for a worker
+            default_timeout_s: Timeout for jobs submitted without one
+        """
+        self.workers = max(1, workers)
+        self.max_queue = max_queue
+        self.default_timeout_s = default_timeout_s
+
+        self._queue: "queue.Queue[Optional[_Job]]" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+        # Counters (guarded by _lock)
+        self._active = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._timed_out = 0
+        self._cancelled = 0
+        self._rejected = 0
+        self._peak_queue_depth = 0
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("STT engine is shut down")
+            while len(self._threads) < self.workers:
+                thread = threading.Thread(
+                    target=self._worker,
+                    name=f"stt-worker-{len(self._threads)}",
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def _worker(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+
+            # Skip jobs whose caller timed out or was cancelled while queued
+            if not job.future.set_running_or_notify_cancel():
+                with self._lock:
+                    self._cancelled += 1
+                continue
+
+            started = time.monotonic()
+            record_latency("stt_queue_wait_ms", (started - job.submitted_at) * 1000)
+            with self._lock:
+                self._active += 1
+
+            # Counters are updated before the future resolves so callers see
+            # them as soon as their job returns
+            try:
+                result = job.fn(*job.args, **job.kwargs)
+            except BaseException as e:
+                self._finish_job(started, failed=True)
+                job.future.set_exception(e)
+            else:
+                self._finish_job(started, failed=False)
+                job.future.set_result(result)
+
+    def _finish_job(self, started: float, failed: bool):
+        record_latency("stt_job_run_ms", (time.monotonic() - started) * 1000)
+        with self._lock:
+            self._active -= 1
+            if failed:
+                self._failed += 1
+            else:
+                self._completed += 1
+
+    async def run(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Run fn(*args, **kwargs) on a worker thread and await the result.
+
+        Args:
+            fn: Blocking callable
+            *args: Positional arguments for fn
+            timeout: Seconds to wait for the result (default: default_timeout_s)
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            fn's return value
+
+        Raises:
+            STTQueueFullError: Too many jobs already waiting
+            asyncio.TimeoutError: Job did not finish in time
+        """
+        self._ensure_started()
+
+        depth = self._queue.qsize()
+        with self._lock:
+            if depth >= self.max_queue:
+                self._rejected += 1
+                raise STTQueueFullError(f"STT queue full ({depth} jobs waiting)")
+            self._submitted += 1
+            self._peak_queue_depth = max(self._peak_queue_depth, depth + 1)
+
+        job = _Job(fn, args, kwargs)
+        self._queue.put(job)
+
+        # Cancelling the wrapper (timeout or caller cancellation) cancels the
+        # job if a worker has not picked it up yet
+        try:
+            return await asyncio.wait_for(
+                asyncio.wrap_future(job.future),
+                timeout if timeout is not None else self.default_timeout_s,
+            )
+        except asyncio.TimeoutError:
+            with self._lock:
+                self._timed_out += 1
+            logger.warning(f"STT job timed out: {getattr(fn, '__name__', fn)}")
+            raise
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue depth and job counters."""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queue_depth": self._queue.qsize(),
+                "peak_queue_depth": self._peak_queue_depth,
+                "max_queue": self.max_queue,
+                "active": self._active,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "timed_out": self._timed_out,
+                "cancelled": self._cancelled,
+                "rejected": self._rejected,
+            }
+
+    def shutdown(self, wait: bool = True):
+        """Stop the workers after the jobs already queued.
+
+        Args:
+            wait: Block until the worker threads exit
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            threads = list(self._threads)
+        for _ in threads:
+            self._queue.put(None)
+        if wait:
+            for thread in threads:
+                thread.join()
+
+
+# Global STT engine instance
+_stt_engine: Optional[STTEngine] = None
+_stt_engine_lock = threading.Lock()
+
+
+def get_stt_engine() -> STTEngine:
+    """Get global STT engine instance."""
+    global _stt_engine
+    if _stt_engine is None:
+        with _stt_engine_lock:
+            if _stt_engine is None:
+                _stt_engine = STTEngine()
+    return _stt_engine
+
+
+def close_stt_engine():
+    """Shut down the global STT engine, if one was created."""
+    global _stt_engine
+    with _stt_engine_lock:
+        engine, _stt_engine = _stt_engine, None
+    if engine is not None:
+        engine.shutdown()
@@ -26,6 +26,7 @@ from pathlib import Path
 from typing import Optional, Union, Dict, Any, List
 
 from src.core.logger import get_logger
+from src.monitoring.latency import record_latency
 from src.emotion.models import EmotionalState
 from src.voice.emotion_voice import EmotionVoiceMapper, VoiceParameters
 
@@ -624,6 +625,7 @@ class TextToSpeech:
             latency_ms = (time.time() - start_time) * 1000
             self._stats["total_utterances"] += 1
             self._stats["total_latency_ms"] += latency_ms
+            record_latency("tts_latency_ms", latency_ms)
             self.logger.debug(f"TTS synthesis completed in {latency_ms:.1f}ms")
 
             return result
@@ -10,6 +10,8 @@ from dataclasses import dataclass
 from typing import Optional, List, Dict, Any
 import asyncio
 
+from src.monitoring.latency import record_latency
+
 
 @dataclass
 class TTSVoice:
@@ -116,3 +118,4 @@ class TTSBackend(ABC):
         """Update synthesis statistics."""
         self._stats["total_utterances"] += 1
         self._stats["total_latency_ms"] += latency_ms
+        record_latency("tts_latency_ms", latency_ms)
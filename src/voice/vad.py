@@ -57,6 +57,7 @@ class SpeechBuffer:
         padding_frames: Number of frames to keep as padding before/after speech.
         max_silence_frames: Maximum consecutive silence frames before segment ends.
         min_speech_frames: Minimum frames required to consider it speech.
+        max_segment_frames: Segment length at which it is split (None for no limit).
     """
 
     def __init__(
@@ -65,11 +66,15 @@ class SpeechBuffer:
         padding_duration_ms: int = 300,
         max_silence_ms: int = 500,
         min_speech_ms: int = 200,
+        max_speech_ms: Optional[int] = None,
     ):
         self.frame_duration_ms = frame_duration_ms
         self.padding_frames = padding_duration_ms // frame_duration_ms
         self.max_silence_frames = max_silence_ms // frame_duration_ms
         self.min_speech_frames = min_speech_ms // frame_duration_ms
+        self.max_segment_frames = (
+            max(1, max_speech_ms // frame_duration_ms) if max_speech_ms else None
+        )
 
         # Ring buffer: list of (frame_data, is_speech) tuples
         self._buffer: collections.deque = collections.deque(maxlen=1000)
@@ -78,6 +83,9 @@ class SpeechBuffer:
         self._speech_frames = 0
         self._pending_segment: List[bytes] = []
 
+        # Silence just before speech starts, so onsets are not clipped
+        self._preroll: collections.deque = collections.deque(maxlen=self.padding_frames)
+
     def add_frame(self, frame: bytes, is_speech: bool) -> Optional[bytes]:
         """Add an audio frame with its VAD result.
         
@@ -91,21 +99,43 @@ class SpeechBuffer:
         self._buffer.append((frame, is_speech))
 
         if is_speech:
-            self._speech_started = True
+            if not self._speech_started:
+                self._speech_started = True
+                self._pending_segment.extend(self._preroll)
+                self._preroll.clear()
             self._silence_counter = 0
             self._speech_frames += 1
             self._pending_segment.append(frame)
+        elif self._speech_started:
+            self._silence_counter += 1
+            self._pending_segment.append(frame)
+
+            # Check if speech segment should end (hangover expired)
+            if self._silence_counter >= self.max_silence_frames:
+                return self._finalize_segment()
         else:
-            if self._speech_started:
-                self._silence_counter += 1
-                self._pending_segment.append(frame)
+            self._preroll.append(frame)
+            return None
 
-                # Check if speech segment should end
-                if self._silence_counter >= self.max_silence_frames:
-                    return self._finalize_segment()
+        # Split overlong speech so it is not held back until the speaker pauses
+        if (
+            self.max_segment_frames is not None
+            and len(self._pending_segment) >= self.max_segment_frames
+        ):
+            return self._finalize_segment()
 
         return None
 
+    def flush(self) -> Optional[bytes]:
+        """Finalize the active speech segment, if any (e.g. at end of stream).
+        
+        Returns:
+            Speech segment bytes if one was active and long enough, None otherwise.
+        """
+        if not self._speech_started:
+            return None
+        return self._finalize_segment()
+
     def _finalize_segment(self) -> Optional[bytes]:
         """Finalize current speech segment if long enough.
         
@@ -173,12 +203,22 @@ class SpeechBuffer:
         self._silence_counter = 0
         self._speech_frames = 0
         self._pending_segment = []
+        self._preroll.clear()
 
     @property
     def is_speech_active(self) -> bool:
         """True if currently in an active speech segment."""
         return self._speech_started
 
+    @property
+    def pending_ms(self) -> int:
+        """Duration of the active speech segment so far (0 when idle)."""
+        return len(self._pending_segment) * self.frame_duration_ms
+
+    def pending_audio(self) -> bytes:
+        """Copy of the active speech segment so far, pre-roll included."""
+        return b"".join(self._pending_segment)
+
 
 class VoiceActivityDetector:
     """Voice Activity Detection using webrtcvad.
@@ -270,6 +310,7 @@ class VoiceActivityDetector:
         padding_duration_ms: Optional[int] = None,
         max_silence_ms: int = 500,
         min_speech_ms: int = 200,
+        max_speech_ms: Optional[int] = None,
     ) -> SpeechBuffer:
         """Create a new speech buffer for streaming VAD.
         
@@ -277,16 +318,22 @@ class VoiceActivityDetector:
             padding_duration_ms: Padding in ms, or None to use config default.
             max_silence_ms: Maximum silence before segment ends.
             min_speech_ms: Minimum speech duration for valid segment.
+            max_speech_ms: Segment length at which it is split (None for no limit).
             
         Returns:
             Configured SpeechBuffer instance.
         """
-        padding = padding_duration_ms or self.config.padding_duration_ms
+        padding = (
+            self.config.padding_duration_ms
+            if padding_duration_ms is None
+            else padding_duration_ms
+        )
         return SpeechBuffer(
             frame_duration_ms=self.config.frame_duration_ms,
             padding_duration_ms=padding,
             max_silence_ms=max_silence_ms,
             min_speech_ms=min_speech_ms,
+            max_speech_ms=max_speech_ms,
         )
 
     def _validate_audio_format(self, audio_data: bytes, sample_rate: int) -> None:
@@ -318,6 +365,96 @@ class VoiceActivityDetector:
             )
 
 
+class SpeechSegmenter:
+    """Streaming speech segmenter for one speaker.
+    
+    Audio arrives in packets of any size (Discord sends 20 ms). Each packet
+    is cut into VAD frames as it arrives, every frame is classified exactly
+    once, and a finished segment is returned from the feed() call that
+    completes it: after the hangover of silence, or when it reaches the
+    maximum length.
+    
+    Attributes:
+        vad: VoiceActivityDetector classifying each frame.
+        buffer: SpeechBuffer assembling frames into segments.
+        sample_rate: Sample rate of the fed audio.
+        frame_bytes: Size of one VAD frame in bytes.
+    """
+
+    def __init__(
+        self,
+        vad: VoiceActivityDetector,
+        sample_rate: int = 16000,
+        padding_ms: Optional[int] = None,
+        hangover_ms: int = 500,
+        min_speech_ms: int = 200,
+        max_utterance_ms: Optional[int] = None,
+    ):
+        """Initialize segmenter.
+        
+        Args:
+            vad: VoiceActivityDetector to classify frames with.
+            sample_rate: Sample rate of the fed 16-bit mono PCM.
+            padding_ms: Pre-roll kept before speech onset (None for VAD config default).
+            hangover_ms: Silence after speech before the segment ends.
+            min_speech_ms: Minimum speech in a segment; shorter ones are dropped.
+            max_utterance_ms: Segment length at which it is split (None for no limit).
+        """
+        self.vad = vad
+        self.sample_rate = sample_rate
+        self.frame_bytes = sample_rate * vad.config.frame_duration_ms // 1000 * 2
+        self.buffer = vad.create_buffer(
+            padding_duration_ms=padding_ms,
+            max_silence_ms=hangover_ms,
+            min_speech_ms=min_speech_ms,
+            max_speech_ms=max_utterance_ms,
+        )
+        # Bytes of a partial frame carried over to the next packet
+        self._partial = bytearray()
+
+    def feed(self, pcm: bytes) -> List[bytes]:
+        """Add audio and return any segments it completed.
+        
+        Args:
+            pcm: 16-bit mono PCM at sample_rate.
+            
+        Returns:
+            Finished speech segments, oldest first (usually empty).
+        """
+        self._partial.extend(pcm)
+        frame_bytes = self.frame_bytes
+        segments = []
+        offset = 0
+        with memoryview(self._partial) as view:
+            while len(view) - offset >= frame_bytes:
+                frame = bytes(view[offset:offset + frame_bytes])
+                offset += frame_bytes
+                try:
+                    is_speech = self.vad.is_speech(frame, self.sample_rate)
+                except ValueError as e:
+                    logger.warning(f"VAD error: {e}")
+                    is_speech = False
+                segment = self.buffer.add_frame(frame, is_speech)
+                if segment:
+                    segments.append(segment)
+        del self._partial[:offset]
+        return segments
+
+    def flush(self) -> Optional[bytes]:
+        """Finalize any active segment (e.g. when the speaker leaves).
+        
+        Returns:
+            Speech segment bytes, or None.
+        """
+        self._partial.clear()
+        return self.buffer.flush()
+
+    @property
+    def is_speech_active(self) -> bool:
+        """True while the speaker is inside a speech segment."""
+        return self.buffer.is_speech_active
+
+
 def validate_audio_format(audio_data: bytes, sample_rate: int, frame_duration_ms: int = 30) -> bool:
     """Validate audio format for VAD processing.
     
@@ -0,0 +1,62 @@
+"""Tests for in-process latency histograms."""
+
+import pytest
+
+from src.monitoring.latency import LatencyHistogram, LatencyRegistry
+
+
+class TestLatencyHistogram:
+    """Test sliding-window percentiles."""
+
+    def test_percentiles(self):
+        histogram = LatencyHistogram("llm_response_time_ms")
+        for i in range(1, 1001):
+            histogram.record(float(i), now=1000.0)
+
+        summary = histogram.snapshot(60, now=1000.0)
+        assert summary["count"] == 1000
+        assert summary["avg"] == 500.5
+        assert summary["p50"] == pytest.approx(500, rel=0.02)
+        assert summary["p95"] == pytest.approx(950, rel=0.02)
+        assert summary["p99"] == pytest.approx(990, rel=0.02)
+        assert summary["max"] == 1000.0
+
+    def test_windows_exclude_old_samples(self):
+        histogram = LatencyHistogram("stt_latency_ms")
+        histogram.record(1000.0, now=0.0)  # 20 minutes before "now"
+        histogram.record(10.0, now=1200.0)
+
+        windows = histogram.snapshots(now=1200.0)
+        assert windows["1m"]["count"] == 1
+        assert windows["5m"]["max"] == 10.0
+        assert windows["60m"]["count"] == 2
+        assert windows["60m"]["max"] == 1000.0
+
+    def test_expired_slots_are_reused(self):
+        histogram = LatencyHistogram("tts_latency_ms")
+        histogram.record(500.0, now=0.0)
+        # Same ring position one full horizon later
+        histogram.record(5.0, now=3610.0)
+
+        summary = histogram.snapshot(3600, now=3610.0)
+        assert summary["count"] == 1
+        assert summary["p50"] == 5.0
+
+    def test_empty_window(self):
+        summary = LatencyHistogram("empty").snapshot(60)
+        assert summary["count"] == 0
+        assert summary["p95"] is None
+
+
+class TestLatencyRegistry:
+    """Test named histogram registry."""
+
+    def test_snapshot_by_prefix(self):
+        registry = LatencyRegistry()
+        registry.record("llm_response_time_ms", 100.0)
+        registry.record("stt_latency_ms", 200.0)
+
+        assert registry.histogram("llm_response_time_ms") is registry.get("llm_response_time_ms")
+        snapshot = registry.snapshot("llm_")
+        assert list(snapshot) == ["llm_response_time_ms"]
+        assert snapshot["llm_response_time_ms"]["1m"]["count"] == 1
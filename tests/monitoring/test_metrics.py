@@ -170,6 +170,72 @@ class TestMetricsCollector:
         assert callbacks == ["test_cb"]
 
 
+class TestWriteBehind:
+    """Test buffered metric writes."""
+
+    @pytest.fixture
+    def temp_db(self):
+        """Create a temporary database file."""
+        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+            db_path = f.name
+        yield db_path
+        os.unlink(db_path)
+
+    def stored_rows(self, db_path):
+        import sqlite3
+
+        with sqlite3.connect(db_path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM metrics").fetchone()[0]
+
+    def test_record_is_buffered_until_flush(self, temp_db):
+        """Test record() doesn't touch the database."""
+        collector = MetricsCollector(db_path=temp_db, flush_interval_ms=60000)
+        collector.record("buffered", 1.0)
+        collector.record("buffered", 2.0)
+
+        assert self.stored_rows(temp_db) == 0
+        assert collector.flush() == 2
+        assert self.stored_rows(temp_db) == 2
+        assert collector.get_buffer_stats()["flushes"] == 1
+        collector.close()
+
+    def test_full_batch_flushes_in_background(self, temp_db):
+        """Test the flusher writes once a batch fills up."""
+        import time
+
+        collector = MetricsCollector(
+            db_path=temp_db, flush_interval_ms=60000, flush_batch_size=5
+        )
+        for i in range(5):
+            collector.record("batch", float(i))
+
+        deadline = time.time() + 5
+        while self.stored_rows(temp_db) < 5 and time.time() < deadline:
+            time.sleep(0.01)
+        assert self.stored_rows(temp_db) == 5
+        collector.close()
+
+    def test_overflow_drops_oldest(self, temp_db):
+        """Test the bounded buffer counts dropped rows."""
+        collector = MetricsCollector(
+            db_path=temp_db, flush_interval_ms=60000, max_buffered=3
+        )
+        for i in range(5):
+            collector.record("overflow", float(i))
+
+        assert collector.dropped == 2
+        assert [m.value for m in collector.get_metric("overflow")] == [2.0, 3.0, 4.0]
+        collector.close()
+
+    def test_close_flushes_remaining(self, temp_db):
+        """Test close() writes everything still buffered."""
+        collector = MetricsCollector(db_path=temp_db, flush_interval_ms=60000)
+        collector.record("closing", 1.0)
+        collector.close()
+
+        assert self.stored_rows(temp_db) == 1
+
+
 class TestMetricTypes:
     """Test different metric types."""
 
@@ -184,3 +250,131 @@ class TestMetricTypes:
     def test_histogram_type(self):
         """Test histogram metric type."""
         assert MetricType.HISTOGRAM.value == "histogram"
+
+
+class TestRollups:
+    """Test rollup maintenance and resolution selection."""
+
+    @pytest.fixture
+    def collector(self, tmp_path):
+        collector = MetricsCollector(
+            db_path=str(tmp_path / "metrics.db"), flush_interval_ms=60000
+        )
+        yield collector
+        collector.close()
+
+    def test_rollups_accumulate_across_flushes(self, collector):
+        """Test buckets merge counts and sketches incrementally."""
+        for i in range(1, 51):
+            collector.record("latency", float(i))
+        collector.flush()
+        for i in range(51, 101):
+            collector.record("latency", float(i))
+
+        (rollup,) = collector.get_rollups("latency", "1h")
+        assert rollup.count == 100
+        assert rollup.sum == 5050.0
+        assert (rollup.min, rollup.max) == (1.0, 100.0)
+        assert rollup.quantile(0.95) == pytest.approx(95, rel=0.02)
+
+    def test_long_range_aggregate_matches_raw(self, collector):
+        """Test rollup-backed aggregates equal raw aggregates."""
+        for i in range(10):
+            collector.record("values", float(i))
+
+        week = timedelta(days=7)
+        assert collector.aggregate("values", "count", week) == 10
+        assert collector.aggregate("values", "sum", week) == 45.0
+        assert collector.aggregate("values", "avg", week) == 4.5
+        assert collector.aggregate("values", "min", week) == 0.0
+        assert collector.aggregate("values", "max", week) == 9.0
+        assert collector.aggregate("missing", "avg", week) is None
+
+    def test_series_resolution_follows_point_budget(self, collector):
+        """Test get_series falls back to rollups when raw is too dense."""
+        for i in range(20):
+            collector.record("dense", float(i))
+
+        raw = collector.get_series("dense", timedelta(hours=1), max_points=50)
+        assert raw["resolution"] == "raw"
+        assert len(raw["points"]) == 20
+
+        week = collector.get_series("dense", timedelta(days=7), max_points=10)
+        assert week["resolution"] == "1h"
+        assert week["points"][0]["count"] == 20
+        assert week["points"][0]["value"] == 9.5
+
+    def test_cleanup_applies_rollup_retention(self, collector):
+        """Test each resolution is pruned by its own retention."""
+        import time
+
+        def insert_old(conn):
+            old = time.time() - 40 * 86400
+            for table in ("metrics_rollup_1m", "metrics_rollup_1h"):
+                conn.execute(
+                    f"INSERT INTO {table} (name, bucket, count, sum, min, max) "
+                    "VALUES ('old', ?, 1, 1, 1, 1)",
+                    (old // 3600 * 3600,),
+                )
+
+        collector._db.write(insert_old)
+        assert collector.cleanup_old_data() == 1  # 1m is past 30 days, 1h is kept
+        assert len(collector.get_rollups("old", "1h")) == 1
+        assert collector.get_rollups("old", "1m") == []
+
+
+class TestHotBuffer:
+    """Test reads served from the in-memory ring buffers."""
+
+    @pytest.fixture
+    def collector(self, tmp_path):
+        collector = MetricsCollector(
+            db_path=str(tmp_path / "metrics.db"),
+            flush_interval_ms=60000,
+            hot_buffer_size=4,
+        )
+        yield collector
+        collector.close()
+
+    def test_recent_reads_skip_the_database(self, collector):
+        """Test hot reads don't flush the write buffer."""
+        import time
+
+        time.sleep(0.2)  # Ranges must start after the collector did
+        for i in range(3):
+            collector.record("hot", float(i))
+
+        assert collector.get_latest("hot").value == 2.0
+        assert collector.aggregate("hot", "avg", timedelta(seconds=0.1)) == 1.0
+        assert [p["value"] for p in collector.get_recent("hot", limit=2)] == [1.0, 2.0]
+        assert collector.get_buffer_stats()["buffered"] == 3  # nothing flushed
+
+    def test_ring_keeps_newest_samples(self, collector):
+        """Test the ring overwrites the oldest sample and keeps running totals."""
+        for i in range(6):
+            collector.record("wrap", float(i))
+
+        recent = collector.get_recent("wrap", limit=4)
+        assert [p["value"] for p in recent] == [2.0, 3.0, 4.0, 5.0]
+        stats = collector.get_hot_stats()["wrap"]
+        assert stats["buffered"] == 4
+        assert stats["total_count"] == 6
+        assert stats["total_min"] == 0.0
+
+    def test_falls_back_to_sqlite_for_older_ranges(self, collector):
+        """Test ranges older than the ring are read from SQLite."""
+        import time
+
+        def insert_old(conn):
+            conn.execute(
+                "INSERT INTO metrics (id, name, value, metric_type, timestamp, labels) "
+                "VALUES ('old', 'mixed', 100.0, 'gauge', ?, '{}')",
+                (time.time() - 600,),
+            )
+
+        collector._db.write(insert_old)
+        collector.record("mixed", 1.0)
+
+        assert collector.aggregate("mixed", "count", timedelta(minutes=1)) == 1
+        assert collector.aggregate("mixed", "count", timedelta(hours=1)) == 2
+        assert len(collector.get_recent("mixed", limit=10)) == 2
@@ -0,0 +1,51 @@
+"""Tests for the quantile sketch."""
+
+import random
+
+import pytest
+
+from src.monitoring.sketch import QuantileSketch
+
+
+class TestQuantileSketch:
+    """Test QuantileSketch accuracy, merging and serialization."""
+
+    def test_empty(self):
+        assert QuantileSketch().quantile(0.5) is None
+
+    def test_quantiles_within_relative_error(self):
+        values = [random.lognormvariate(3, 1) for _ in range(5000)]
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        values.sort()
+        for q in (0.5, 0.95, 0.99):
+            exact = values[int(q * (len(values) - 1))]
+            assert sketch.quantile(q) == pytest.approx(exact, rel=0.02)
+        assert sketch.quantile(0) == values[0]
+        assert sketch.quantile(1) == values[-1]
+
+    def test_zero_and_negative_values(self):
+        sketch = QuantileSketch()
+        for value in (-10.0, -1.0, 0.0, 0.0, 5.0):
+            sketch.add(value)
+
+        assert sketch.quantile(0) == -10.0
+        assert sketch.quantile(0.5) == 0.0
+        assert sketch.quantile(1) == 5.0
+
+    def test_merge_and_round_trip(self):
+        a, b = QuantileSketch(), QuantileSketch()
+        for i in range(1, 51):
+            a.add(float(i))
+        for i in range(51, 101):
+            b.add(float(i))
+
+        a.merge(QuantileSketch.from_dict(b.to_dict()))
+        assert a.count == 100
+        assert a.quantile(0.5) == pytest.approx(50, rel=0.02)
+
+    def test_merge_rejects_different_accuracy(self):
+        with pytest.raises(ValueError):
+            QuantileSketch(0.01).merge(QuantileSketch(0.05))
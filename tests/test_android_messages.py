@@ -0,0 +1,148 @@
+"""Tests for Android message history: keyset pagination and delta sync."""
+
+import pytest
+
+from src.api.messages import (
+    get_conversation_history,
+    get_messages_before,
+    iter_messages_since,
+    store_message,
+)
+from src.api.migrations import create_android_messages_table
+from src.core.storage import close_database
+
+
+@pytest.fixture
+def conversation(tmp_path, monkeypatch):
+    """Point the message API at a temporary database."""
+    path = tmp_path / "demi.sqlite"
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{path}")
+    create_android_messages_table()
+    yield "user-1"
+    close_database(str(path))
+
+
+async def store_messages(count, conversation_id="user-1"):
+    messages = []
+    for i in range(count):
+        messages.append(
+            await store_message(conversation_id, conversation_id, "user", f"message {i}")
+        )
+    return messages
+
+
+async def collect_since(conversation_id, message_id, **kwargs):
+    chunks = []
+    async for chunk, has_more in iter_messages_since(conversation_id, message_id, **kwargs):
+        chunks.append(([m.content for m in chunk], has_more))
+    return chunks
+
+
+class TestMessageHistory:
+    """Test cursor-based history queries."""
+
+    @pytest.mark.asyncio
+    async def test_delta_sync_streams_chunks(self, conversation):
+        stored = await store_messages(25)
+
+        chunks = await collect_since(conversation, stored[4].message_id, chunk_size=8)
+
+        assert [len(c) for c, _ in chunks] == [8, 8, 4]
+        assert [has_more for _, has_more in chunks] == [True, True, False]
+        assert chunks[0][0][0] == "message 5"
+        assert chunks[-1][0][-1] == "message 24"
+
+    @pytest.mark.asyncio
+    async def test_delta_sync_up_to_date_and_unknown_cursor(self, conversation):
+        stored = await store_messages(3)
+
+        assert await collect_since(conversation, stored[-1].message_id) == [([], False)]
+        assert await collect_since(conversation, "no-such-message") == []
+        assert await collect_since("other-user", stored[0].message_id) == []
+
+    @pytest.mark.asyncio
+    async def test_delta_sync_respects_max_messages(self, conversation):
+        stored = await store_messages(10)
+
+        chunks = await collect_since(
+            conversation, stored[0].message_id, chunk_size=3, max_messages=5
+        )
+
+        assert [c for c, _ in chunks] == [
+            ["message 1", "message 2", "message 3"],
+            ["message 4", "message 5"],
+        ]
+        assert chunks[-1][1] is True  # Client must sync again from message 5
+
+    @pytest.mark.asyncio
+    async def test_pages_before_cursor(self, conversation):
+        stored = await store_messages(10)
+
+        messages, has_more = await get_messages_before(conversation, stored[6].message_id, 4)
+        assert [m.content for m in messages] == [f"message {i}" for i in range(2, 6)]
+        assert has_more
+
+        messages, has_more = await get_messages_before(conversation, stored[2].message_id, 4)
+        assert [m.content for m in messages] == ["message 0", "message 1"]
+        assert not has_more
+
+        assert await get_messages_before(conversation, "no-such-message") is None
+
+    @pytest.mark.asyncio
+    async def test_equal_timestamps_keep_insertion_order(self, conversation, monkeypatch):
+        from datetime import datetime, timezone
+        import src.api.messages as messages_module
+
+        fixed = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+        class FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return fixed
+
+        monkeypatch.setattr(messages_module, "datetime", FrozenDatetime)
+        stored = await store_messages(6)
+
+        chunks = await collect_since(conversation, stored[1].message_id, chunk_size=2)
+        assert [c for c, _ in chunks] == [
+            ["message 2", "message 3"],
+            ["message 4", "message 5"],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_recent_history_is_chronological(self, conversation):
+        await store_messages(5)
+
+        history = await get_conversation_history(conversation, days=7, limit=3)
+
+        assert [m.content for m in history] == ["message 2", "message 3", "message 4"]
+
+
+class TestHistoryRequest:
+    """Test validation of client "history" requests."""
+
+    def test_valid_request_clamps_limit(self):
+        from src.api.messages import HISTORY_CHUNK_SIZE
+        from src.api.websocket import parse_history_request
+
+        assert parse_history_request({"before": "m1", "limit": "20"}) == ("m1", 20)
+        assert parse_history_request({"before": "m1", "limit": 0}) == ("m1", 1)
+        assert parse_history_request({"before": "m1"}) == ("m1", HISTORY_CHUNK_SIZE)
+        assert parse_history_request({"before": "m1", "limit": 10**6})[1] == HISTORY_CHUNK_SIZE
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"before": "m1", "limit": "ten"},
+            {"before": "m1", "limit": None},
+            {"before": "m1", "limit": [5]},
+            {"before": {"id": "m1"}},
+            {"limit": 5},
+            "m1",
+        ],
+    )
+    def test_invalid_request_raises_value_error(self, data):
+        from src.api.websocket import parse_history_request
+
+        with pytest.raises(ValueError):
+            parse_history_request(data)
@@ -1,10 +1,27 @@
 # tests/test_emotion_decay.py
 import pytest
 from datetime import datetime, timedelta, UTC
+from unittest.mock import patch
 from src.emotion.models import EmotionalState
 from src.emotion.decay import DecaySystem, DecayTuner
 
 
+def baseline_tick(decay, state, tick_multiplier, idle_seconds):
+    """Original two-pass tick: decay every emotion, then apply idle effects."""
+    for name, base_rate in decay.base_decay_rates.items():
+        current = getattr(state, name)
+        rate = base_rate * 0.5 if current > 0.8 else base_rate
+        state.set_emotion(name, current - rate * current * tick_multiplier)
+
+    idle_multiplier = min(idle_seconds / (3600 * 12), 3.0)
+    for name, idle_delta in decay.idle_effects.items():
+        new_value = getattr(state, name) + idle_delta * idle_multiplier * tick_multiplier
+        if name == "loneliness" and new_value > 1.0:
+            state.set_emotion(name, new_value, momentum_override=True)
+        else:
+            state.set_emotion(name, new_value)
+
+
 class TestDecaySystemBasics:
     """Test basic decay functionality."""
 
@@ -146,3 +163,102 @@ class TestDecayTuner:
         # System should complete simulation without errors
         assert aged is not None
         assert isinstance(aged.excitement, float)
+
+
+class TestOfflineFastForward:
+    """Closed-form offline decay must match per-tick replay."""
+
+    @pytest.mark.parametrize(
+        "offline_seconds", [0, 299, 300, 301, 3600, 86400 + 123, 7 * 86400]
+    )
+    @pytest.mark.parametrize(
+        "values",
+        [
+            {},
+            {"loneliness": 0.95, "excitement": 0.9, "vulnerability": 0.85},
+            {"loneliness": 0.3, "excitement": 0.1, "affection": 0.12},
+            {"loneliness": 1.0, "confidence": 0.81, "curiosity": 0.79},
+        ],
+    )
+    def test_matches_per_tick(self, values, offline_seconds):
+        decay = DecaySystem()
+        fast = decay.simulate_offline_decay(EmotionalState(**values), offline_seconds)
+        slow = decay.simulate_offline_decay(
+            EmotionalState(**values), offline_seconds, fast_forward=False
+        )
+
+        for name, value in slow.get_all_emotions().items():
+            assert getattr(fast, name) == pytest.approx(value, abs=1e-9)
+
+    def test_matches_per_tick_with_overflow(self):
+        """Clamps and loneliness momentum are reproduced too."""
+        decay = DecaySystem(tick_interval_seconds=60)
+        decay.idle_effects["loneliness"] = 20.0
+        decay.idle_effects["affection"] = 10.0
+
+        fast = decay.simulate_offline_decay(EmotionalState(), 86400)
+        slow = decay.simulate_offline_decay(EmotionalState(), 86400, fast_forward=False)
+
+        assert fast.get_all_emotions() == pytest.approx(slow.get_all_emotions(), abs=1e-9)
+        assert fast.momentum["loneliness"] == pytest.approx(slow.momentum["loneliness"])
+        assert fast.momentum["loneliness"] > 0
+
+    def test_cost_independent_of_duration(self):
+        """A year offline should take a handful of steps, not 100k ticks."""
+        decay = DecaySystem()
+        with patch.object(
+            DecaySystem, "_step_value", wraps=DecaySystem._step_value
+        ) as step:
+            decay.simulate_offline_decay(EmotionalState(loneliness=0.95), 365 * 86400)
+        assert step.call_count < 100
+
+    def test_does_not_touch_live_tick_clock(self):
+        decay = DecaySystem()
+        last_tick = decay.last_tick
+        decay.simulate_offline_decay(EmotionalState(), 86400)
+        assert decay.last_tick == last_tick
+
+
+class TestOverflowMomentum:
+    """Loneliness momentum must follow the original two-pass tick."""
+
+    def test_live_tick_momentum_tracks_current_excess(self):
+        decay = DecaySystem(tick_interval_seconds=60)
+        state = EmotionalState(loneliness=0.99)
+        reference = EmotionalState(loneliness=0.99)
+
+        # A large overflow, then smaller ones, then none
+        for loneliness_effect in (20.0, 0.5, 0.5, 0.0):
+            decay.idle_effects["loneliness"] = loneliness_effect
+            # Clamped to two full ticks, so both sides use the same multiplier
+            decay.last_tick = datetime.now(UTC) - timedelta(hours=1)
+            decay.apply_decay(state, idle_time_seconds=43200)
+            baseline_tick(decay, reference, 2.0, 43200)
+
+            assert state.get_all_emotions() == pytest.approx(
+                reference.get_all_emotions(), abs=1e-9
+            )
+            assert state.momentum["loneliness"] == pytest.approx(
+                reference.momentum["loneliness"], abs=1e-9
+            )
+
+        assert state.momentum["loneliness"] == 0.0
+
+    @pytest.mark.parametrize("fast_forward", [True, False])
+    def test_offline_momentum_matches_baseline(self, fast_forward):
+        decay = DecaySystem(tick_interval_seconds=60)
+        decay.idle_effects["loneliness"] = 20.0
+        start = {"loneliness": 0.5}
+
+        state = decay.simulate_offline_decay(
+            EmotionalState(**start), 3600 + 30, fast_forward=fast_forward
+        )
+        reference = EmotionalState(**start)
+        for _ in range(60):
+            baseline_tick(decay, reference, 1.0, 60)
+        baseline_tick(decay, reference, 0.5, 30)
+
+        assert state.get_all_emotions() == pytest.approx(reference.get_all_emotions(), abs=1e-9)
+        assert state.momentum["loneliness"] == pytest.approx(
+            reference.momentum["loneliness"], abs=1e-9
+        )
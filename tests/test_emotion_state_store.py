@@ -0,0 +1,142 @@
+# tests/test_emotion_state_store.py
+import asyncio
+import sqlite3
+
+import pytest
+from unittest.mock import patch
+
+from src.emotion.models import EmotionalState
+from src.emotion.persistence import EmotionPersistence
+from src.emotion.state_store import EmotionStateStore
+from src.emotion.interactions import InteractionType
+
+
+@pytest.fixture
+def persistence(tmp_path):
+    return EmotionPersistence(db_path=str(tmp_path / "emotions.db"))
+
+
+def count_rows(persistence, table):
+    with sqlite3.connect(persistence.db_path) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+class TestEmotionStateStore:
+    """Test in-memory state ownership and write-behind flushing."""
+
+    def test_load_reads_latest_state(self, persistence):
+        """load() should seed memory from the database once."""
+        persistence.save_state(EmotionalState(loneliness=0.9))
+        store = EmotionStateStore(persistence)
+        assert store.load().loneliness == 0.9
+        assert not store.dirty
+
+    @pytest.mark.asyncio
+    async def test_reads_and_writes_do_no_io(self, persistence):
+        """get()/set() should never touch SQLite."""
+        store = EmotionStateStore(persistence)
+        store.load()
+        with patch.object(persistence, "save_batch") as save_batch, patch.object(
+            persistence, "load_latest_state"
+        ) as load:
+            await store.set(EmotionalState(excitement=0.55))
+            assert store.get().excitement == 0.55
+            save_batch.assert_not_called()
+            load.assert_not_called()
+        assert store.dirty
+
+    @pytest.mark.asyncio
+    async def test_get_returns_copy(self, persistence):
+        """Mutating a read copy must not change the live state."""
+        store = EmotionStateStore(persistence)
+        state = store.get()
+        state.loneliness = 1.0
+        assert store.get().loneliness == 0.5
+
+    @pytest.mark.asyncio
+    async def test_flush_coalesces_writes(self, persistence):
+        """Several writes between flushes should produce one row."""
+        store = EmotionStateStore(persistence)
+        for value in (0.51, 0.52, 0.53):
+            await store.set(EmotionalState(excitement=value))
+
+        assert await store.flush()
+        assert count_rows(persistence, "emotional_state") == 1
+        assert persistence.load_latest_state().excitement == 0.53
+        assert store.get_stats()["coalesced_writes"] == 2
+        assert not store.dirty
+
+    @pytest.mark.asyncio
+    async def test_interactions_flushed_with_state(self, persistence):
+        """Buffered interaction logs are written in the same flush."""
+        store = EmotionStateStore(persistence)
+        before = store.get()
+        after = EmotionalState(affection=0.6)
+        store.log_interaction(InteractionType.SUCCESSFUL_HELP, before, after, {"n": 1})
+        await store.set(after)
+        assert count_rows(persistence, "interaction_log") == 0
+
+        await store.flush()
+        assert count_rows(persistence, "interaction_log") == 1
+        assert count_rows(persistence, "emotional_state") == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_pending(self, persistence):
+        """A failed write should leave everything pending for retry."""
+        store = EmotionStateStore(persistence)
+        store.log_interaction(
+            InteractionType.SUCCESSFUL_HELP, store.get(), store.get(), {}
+        )
+        await store.set(EmotionalState(curiosity=0.6))
+
+        with patch.object(persistence, "save_batch", return_value=False):
+            assert not await store.flush()
+        assert store.dirty
+        assert store.get_stats()["pending_interactions"] == 1
+
+        assert await store.flush()
+        assert count_rows(persistence, "interaction_log") == 1
+        assert store.get_stats()["failed_flushes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_significant_delta_flushes_early(self, persistence):
+        """Large emotion changes should not wait for the interval."""
+        store = EmotionStateStore(persistence, flush_interval_sec=60, flush_delta=0.2)
+        await store.start()
+        try:
+            await store.set(EmotionalState(excitement=0.55))
+            await asyncio.sleep(0.05)
+            assert store.dirty
+
+            await store.set(EmotionalState(excitement=0.9))
+            for _ in range(50):
+                if not store.dirty:
+                    break
+                await asyncio.sleep(0.01)
+            assert not store.dirty
+            assert persistence.load_latest_state().excitement == 0.9
+        finally:
+            await store.close()
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending(self, persistence):
+        """Shutdown should persist the latest state."""
+        store = EmotionStateStore(persistence, flush_interval_sec=60)
+        await store.start()
+
+        def bump(state):
+            state.set_emotion("jealousy", 0.45)
+            return state
+
+        await store.modify(bump, notes="test")
+        await store.close()
+
+        assert persistence.load_latest_state().jealousy == 0.45
+        assert count_rows(persistence, "emotional_state") == 1
+
+    def test_from_config(self, persistence):
+        store = EmotionStateStore.from_config(
+            {"flush_interval_sec": 5, "flush_delta": 0.3}, persistence
+        )
+        assert store.flush_interval_sec == 5
+        assert store.flush_delta == 0.3
@@ -0,0 +1,186 @@
+"""
+Unit tests for the asynchronous self-evolution pipeline.
+
+Validates background processing, batched persistence, load shedding and
+per-stage latency stats.
+"""
+
+import sqlite3
+import time
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.evolution import (
+    ErrorAnalyzer,
+    ConversationQualityAnalyzer,
+    SelfCritique,
+    SelfRewarder,
+    ResponseRevisor,
+    EvolutionPipeline,
+    EvolutionJob,
+)
+from src.emotion.models import EmotionalState
+
+
+@pytest.fixture(autouse=True)
+def metrics_collector():
+    """Keep stage metrics out of the real metrics DB."""
+    collector = MagicMock()
+    with patch("src.evolution.pipeline.get_metrics_collector", return_value=collector):
+        yield collector
+
+
+@pytest.fixture
+def pipeline_factory(tmp_path):
+    """Build pipelines backed by temporary databases."""
+
+    def make(**kwargs):
+        return EvolutionPipeline(
+            error_analyzer=ErrorAnalyzer(db_path=str(tmp_path / "errors.db")),
+            quality_analyzer=ConversationQualityAnalyzer(db_path=str(tmp_path / "quality.db")),
+            self_critique=SelfCritique(),
+            self_rewarder=SelfRewarder(db_path=str(tmp_path / "rewards.db")),
+            change_tracker=MagicMock(),
+            response_revisor=ResponseRevisor(db_path=str(tmp_path / "revisions.db")),
+            **kwargs,
+        )
+
+    return make
+
+
+def make_job(i=0):
+    return EvolutionJob(
+        user_message=f"How was your day {i}?",
+        response="Ugh, fine I guess. Mortals are exhausting!!",
+        emotional_state=EmotionalState(),
+        conversation_id=f"conv_{i}",
+    )
+
+
+def count_rows(db_path, table):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+class TestEvolutionPipeline:
+    """Test EvolutionPipeline processing."""
+
+    @pytest.mark.asyncio
+    async def test_submit_returns_before_analysis(self, pipeline_factory):
+        """submit() should only enqueue; workers analyze later."""
+        pipeline = pipeline_factory()
+        with patch.object(pipeline, "_process_batch") as process:
+            assert pipeline.submit(make_job()) is True
+            process.assert_not_called()
+            assert pipeline.queue_depth == 1
+            await pipeline.stop()
+            process.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_batches_persisted_together(self, pipeline_factory):
+        """Queued jobs should be analyzed in one batch and written in bulk."""
+        pipeline = pipeline_factory(batch_size=8)
+        with patch.object(
+            pipeline.self_rewarder, "store_rewards", wraps=pipeline.self_rewarder.store_rewards
+        ) as store_rewards:
+            for i in range(5):
+                pipeline.submit(make_job(i))
+            await pipeline.stop()
+
+        store_rewards.assert_called_once()
+        assert len(store_rewards.call_args[0][0]) == 5
+        assert count_rows(pipeline.self_rewarder.db_path, "rewards") == 5
+        assert count_rows(pipeline.quality_analyzer.db_path, "quality_metrics") == 5
+
+        stats = pipeline.get_stats()
+        assert stats["processed"] == 5
+        assert stats["batches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_workers_do_not_analyze_concurrently(self, pipeline_factory):
+        """With several workers, batches should still be analyzed one at a time."""
+        pipeline = pipeline_factory(batch_size=1, workers=4)
+        analyze = pipeline._analyze_batch
+        running = []
+        overlap = []
+
+        def tracked(jobs):
+            running.append(1)
+            overlap.append(len(running))
+            time.sleep(0.01)
+            try:
+                analyze(jobs)
+            finally:
+                running.pop()
+
+        with patch.object(pipeline, "_analyze_batch", side_effect=tracked):
+            for i in range(8):
+                pipeline.submit(make_job(i))
+            await pipeline.stop()
+
+        assert max(overlap) == 1
+        assert pipeline.get_stats()["processed"] == 8
+        assert count_rows(pipeline.self_rewarder.db_path, "rewards") == 8
+
+    @pytest.mark.asyncio
+    async def test_stage_latency_breakdown(self, pipeline_factory, metrics_collector):
+        """Each stage should report latency; revision only when non-blocking."""
+        pipeline = pipeline_factory(blocking_revision=False)
+        pipeline.submit(make_job())
+        await pipeline.stop()
+
+        stages = pipeline.get_stats()["stages"]
+        for stage in ("revision", "error_analysis", "quality", "critique", "reward", "persist"):
+            assert stages[stage]["count"] == 1
+            assert stages[stage]["avg_ms"] >= 0
+        assert count_rows(pipeline.response_revisor.db_path, "revisions") == 1
+        assert metrics_collector.record.call_count == 6
+
+    @pytest.mark.asyncio
+    async def test_blocking_revision_session_persisted(self, pipeline_factory):
+        """A session produced on the hot path should be stored, not recomputed."""
+        pipeline = pipeline_factory(blocking_revision=True)
+        job = make_job()
+        job.revision_session = pipeline.response_revisor.revise_response(
+            original_response=job.response, user_message=job.user_message, persist=False
+        )
+        job.was_revised = True
+        job.revision_improvement = 1.2
+
+        pipeline.submit(job)
+        await pipeline.stop()
+
+        assert pipeline.get_stats()["stages"]["revision"]["count"] == 0
+        assert count_rows(pipeline.response_revisor.db_path, "revisions") == 1
+        pipeline.change_tracker.record_change.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_drops_when_full(self, pipeline_factory):
+        """Jobs beyond the queue bound should be dropped, not block."""
+        pipeline = pipeline_factory(max_queue_size=4, sample_threshold=1.0)
+        with patch.object(pipeline, "_process_batch"):
+            accepted = [pipeline.submit(make_job(i)) for i in range(6)]
+            stats = pipeline.get_stats()
+            await pipeline.stop()
+
+        assert accepted == [True] * 4 + [False] * 2
+        assert stats["dropped"] == 2
+
+    @pytest.mark.asyncio
+    async def test_samples_above_high_water_mark(self, pipeline_factory):
+        """Above the threshold only one in sample_every jobs is kept."""
+        pipeline = pipeline_factory(max_queue_size=100, sample_threshold=0.02, sample_every=3)
+        with patch.object(pipeline, "_process_batch"):
+            accepted = [pipeline.submit(make_job(i)) for i in range(8)]
+            await pipeline.stop()
+
+        # First two fill to the threshold; then 1 in 3 is kept
+        assert accepted == [True, True, False, False, True, False, False, True]
+        assert pipeline.get_stats()["sampled_out"] == 4
+
+    def test_runs_inline_without_event_loop(self, pipeline_factory):
+        """Without a running loop, work should be processed synchronously."""
+        pipeline = pipeline_factory()
+        assert pipeline.submit(make_job()) is True
+        assert pipeline.get_stats()["processed"] == 1
@@ -330,6 +330,115 @@ class TestRelevanceCalculation:
         assert long_score >= 0 and short_score >= 0
 
 
+class TestIncrementalIndexing:
+    """Test AST extraction and mtime-based re-indexing."""
+
+    def test_ast_extraction_boundaries(self, logger, tmp_path):
+        """Blocks end at the AST end line, not at the next definition."""
+        (tmp_path / "mod.py").write_text(
+            "import os\n\n"
+            "class Greeter:\n"
+            "    def greet(self):\n"
+            "        return 'hi'\n\n"
+            "CONSTANT = 1\n\n"
+            "async def fetch_weather():\n"
+            "    pass\n"
+        )
+        reader = CodebaseReader(logger=logger, codebase_root=str(tmp_path))
+
+        greeter = reader.get_code_for_module("Greeter")
+        assert (greeter.start_line, greeter.end_line) == (3, 5)
+        assert "CONSTANT" not in greeter.content
+        assert reader.get_code_for_module("fetch_weather") is not None
+        assert reader.get_code_for_module("greet") is None  # Methods are not top-level
+
+    def test_unparseable_file_falls_back(self, logger, tmp_path):
+        """Files with syntax errors are still indexed by indentation."""
+        (tmp_path / "broken.py").write_text("def half_written(:\n    pass\n")
+        reader = CodebaseReader(logger=logger, codebase_root=str(tmp_path))
+        assert reader.get_code_for_module("half_written") is not None
+
+    def test_refresh_reindexes_changed_files_only(self, logger, tmp_path):
+        """refresh() picks up edits, additions and deletions."""
+        first = tmp_path / "first.py"
+        second = tmp_path / "second.py"
+        first.write_text("def alpha_handler():\n    return 'alpha'\n")
+        second.write_text("def beta_handler():\n    return 'beta'\n")
+        reader = CodebaseReader(logger=logger, codebase_root=str(tmp_path))
+        assert reader.refresh() == 0
+
+        first.write_text("def gamma_handler():\n    return 'gamma rays'\n")
+        assert reader.refresh() == 1
+        assert reader.get_code_for_module("alpha_handler") is None
+        assert reader.get_relevant_code("gamma")[0].class_or_function == "gamma_handler"
+        assert reader.get_relevant_code("alpha") == []
+
+        second.unlink()
+        (tmp_path / "third.py").write_text("class Delta:\n    pass\n")
+        assert reader.refresh() == 2
+        assert reader.get_code_for_module("beta_handler") is None
+        assert reader.get_code_for_module("Delta") is not None
+        assert set(reader._file_cache) == {str(first), str(tmp_path / "third.py")}
+
+
+class TestIndexCache:
+    """Test the on-disk index cache."""
+
+    @pytest.fixture
+    def tree(self, tmp_path):
+        root = tmp_path / "src"
+        root.mkdir()
+        (root / "mood.py").write_text("class MoodTracker:\n    def track(self):\n        pass\n")
+        return root
+
+    def test_cache_hit_skips_parsing(self, logger, tree, tmp_path, monkeypatch):
+        """A warm cache serves lookups without parsing any file."""
+        cache = tmp_path / "index.json"
+        CodebaseReader(logger=logger, codebase_root=str(tree), cache_path=str(cache))
+        assert cache.exists()
+
+        def fail(*args):
+            raise AssertionError("file was parsed")
+
+        monkeypatch.setattr(CodebaseReader, "_extract_code_blocks", fail)
+        reader = CodebaseReader(logger=logger, codebase_root=str(tree), cache_path=str(cache))
+
+        snippet = reader.get_code_for_module("MoodTracker")
+        assert snippet.content.startswith("class MoodTracker:")
+        assert (snippet.start_line, snippet.end_line) == (1, 3)
+        assert reader.get_relevant_code("mood tracker")[0] is snippet
+
+    def test_stale_cache_revalidated_in_background(self, logger, tree, tmp_path):
+        """Changed files are re-indexed by the background thread and the cache rewritten."""
+        cache = tmp_path / "index.json"
+        CodebaseReader(logger=logger, codebase_root=str(tree), cache_path=str(cache))
+        (tree / "mood.py").write_text("def sulk():\n    return 'hmph'\n")
+
+        reader = CodebaseReader(
+            logger=logger, codebase_root=str(tree), cache_path=str(cache), background=True
+        )
+        reader._refresh_thread.join(timeout=10)
+
+        assert reader.get_code_for_module("MoodTracker") is None
+        assert reader.get_code_for_module("sulk") is not None
+        assert "sulk" in cache.read_text()
+
+    def test_background_build_without_cache(self, logger, tree):
+        """Lookups wait for the initial background build."""
+        reader = CodebaseReader(logger=logger, codebase_root=str(tree), background=True)
+        assert reader.get_code_for_module("MoodTracker") is not None
+
+    def test_corrupt_cache_is_rebuilt(self, logger, tree, tmp_path):
+        """An unreadable cache is ignored and replaced."""
+        cache = tmp_path / "index.json"
+        cache.write_text("{not json")
+
+        reader = CodebaseReader(logger=logger, codebase_root=str(tree), cache_path=str(cache))
+
+        assert reader.get_code_for_module("MoodTracker") is not None
+        assert "MoodTracker" in cache.read_text()
+
+
 class TestImports:
     """Test that CodebaseReader can be imported properly."""
 
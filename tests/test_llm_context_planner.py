@@ -0,0 +1,124 @@
+"""
+Unit tests for the context window planner.
+
+Validates single-pass trimming against the original drop-oldest and
+walk-back-from-newest algorithms, and that each message is counted once.
+"""
+
+import random
+
+import pytest
+from src.llm.context_planner import ContextPlan, plan_context_window
+from src.llm.history_manager import ConversationHistory
+from src.llm import OllamaInference, LLMConfig
+from src.llm.tokenizer import TokenCounter
+from src.core.logger import DemiLogger
+
+
+def reference_drop_oldest(counts, budget):
+    """Original _trim_context loop: drop oldest until it fits or one is left."""
+    start = 0
+    while sum(counts[start:]) > budget and len(counts) - start > 1:
+        start += 1
+    return start
+
+
+def reference_walk_back(counts, budget, pinned):
+    """Original trim_for_inference loop: add newest while it fits."""
+    kept = 0
+    current = 0
+    for i in range(len(counts) - 1, -1, -1):
+        if i == pinned or current + counts[i] <= budget:
+            kept += 1
+            current += counts[i]
+        else:
+            break
+    return len(counts) - kept
+
+
+class TestPlanContextWindow:
+    """Test plan_context_window."""
+
+    def test_fits_keeps_everything(self):
+        """Should keep all messages when under budget."""
+        plan = plan_context_window([10, 20, 30], budget=100)
+        assert plan == ContextPlan(start=0, kept_tokens=60, total_tokens=60)
+        assert plan.dropped == 0
+
+    def test_drops_oldest(self):
+        """Should drop oldest messages until the suffix fits."""
+        plan = plan_context_window([50, 20, 30], budget=55)
+        assert plan.start == 1
+        assert plan.kept_tokens == 50
+        assert plan.apply(["a", "b", "c"]) == ["b", "c"]
+
+    def test_min_keep_retains_oversized_latest(self):
+        """Should keep the latest message even if it exceeds the budget."""
+        plan = plan_context_window([10, 500], budget=100, min_keep=1)
+        assert plan.start == 1
+        assert plan.kept_tokens == 500
+
+    def test_pinned_message_always_kept(self):
+        """Should keep pinned message and continue past it."""
+        plan = plan_context_window([5, 5, 500], budget=100, pinned_index=2)
+        assert plan.start == 2
+
+    def test_empty(self):
+        """Should handle empty input."""
+        plan = plan_context_window([], budget=10)
+        assert plan.start == 0
+        assert plan.total_tokens == 0
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_matches_reference_algorithms(self, seed):
+        """Should match the original quadratic trimming results."""
+        rng = random.Random(seed)
+        counts = [rng.randint(0, 60) for _ in range(rng.randint(1, 40))]
+        budget = rng.randint(-10, 600)
+        pinned = rng.choice([None] + list(range(len(counts))))
+
+        plan = plan_context_window(counts, budget, min_keep=1)
+        assert plan.start == reference_drop_oldest(counts, budget)
+
+        plan = plan_context_window(counts, budget, pinned_index=pinned)
+        assert plan.start == reference_walk_back(counts, budget, pinned)
+
+
+class TestSinglePassCounting:
+    """Each message should be tokenized exactly once per trim."""
+
+    def test_history_counts_each_message_once(self):
+        """trim_for_inference should call the counter once per message."""
+        history = ConversationHistory(max_context_tokens=1000)
+        for i in range(200):
+            history.add_message("user" if i % 2 == 0 else "assistant", "x" * 40)
+
+        calls = []
+
+        def token_counter(text):
+            calls.append(text)
+            return len(text) // 4
+
+        trimmed = history.trim_for_inference(
+            system_prompt_tokens=100, token_counter=token_counter
+        )
+        assert len(calls) == 200
+        assert 0 < len(trimmed) < 200
+
+    def test_inference_trim_counts_each_message_once(self):
+        """_trim_context should batch-count the conversation once."""
+        inference = OllamaInference(LLMConfig(), DemiLogger())
+        counter = TokenCounter()
+        counter._tokenizer_attempted = True
+        inference.token_counter = counter
+
+        messages = [{"role": "system", "content": "sys"}] + [
+            {"role": "user", "content": f"{i:04d}" + "y" * 396} for i in range(100)
+        ]
+        trimmed = inference._trim_context(messages, max_tokens=2048)
+
+        stats = counter.get_stats()
+        assert stats["hits"] + stats["misses"] == 101
+        assert trimmed[0]["role"] == "system"
+        assert trimmed[-1] == messages[-1]
+        assert len(trimmed) < len(messages)
@@ -14,6 +14,7 @@ import pytest
 import asyncio
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from src.llm import OllamaInference, LLMConfig, InferenceError, ContextOverflowError
+from src.llm.tokenizer import TokenCounter, get_token_counter
 from src.core.logger import DemiLogger
 
 
@@ -79,8 +80,7 @@ class TestOllamaInferenceInit:
 
         assert inference.config == config
         assert inference.logger == logger
-        assert inference._tokenizer is None
-        assert inference._tokenizer_attempted is False
+        assert inference.token_counter is get_token_counter()
 
 
 class TestHealthCheck:
@@ -237,6 +237,65 @@ class TestTokenCounting:
         assert 12 <= count <= 20
 
 
+class TestTokenCounter:
+    """Test shared memoized token counter."""
+
+    def _counter(self, cache_size=4096):
+        counter = TokenCounter(cache_size=cache_size)
+        # Force fallback estimation so tests don't depend on transformers
+        counter._tokenizer_attempted = True
+        return counter
+
+    def test_repeated_text_served_from_cache(self):
+        """Should tokenize identical text only once."""
+        counter = self._counter()
+        with patch.object(counter, "_encode_batch", wraps=counter._encode_batch) as enc:
+            assert counter.count("Hello world!") == 3
+            assert counter.count("Hello world!") == 3
+            assert enc.call_count == 1
+
+        stats = counter.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_lru_eviction(self):
+        """Should evict least recently used entries beyond cache_size."""
+        counter = self._counter(cache_size=2)
+        counter.count("a" * 4)
+        counter.count("b" * 8)
+        counter.count("a" * 4)  # refresh 'a'
+        counter.count("c" * 12)  # evicts 'b'
+
+        stats = counter.get_stats()
+        assert stats["cache_entries"] == 2
+        assert stats["evictions"] == 1
+        assert counter._key("b" * 8) not in counter._cache
+        assert counter._key("a" * 4) in counter._cache
+
+    def test_count_messages_batches_misses(self):
+        """Should encode only unique uncached contents in one batch."""
+        counter = self._counter()
+        counter.count("x" * 40)
+        messages = [
+            {"role": "system", "content": "x" * 40},
+            {"role": "user", "content": "y" * 8},
+            {"role": "user", "content": "y" * 8},
+        ]
+        with patch.object(counter, "_encode_batch", wraps=counter._encode_batch) as enc:
+            counts = counter.count_messages(messages, model="test-model")
+            enc.assert_called_once_with(["y" * 8])
+
+        assert counts == [10, 2, 2]
+        by_model = counter.get_stats()["by_model"]["test-model"]
+        assert by_model == {"requests": 3, "tokens": 14}
+
+    def test_invalid_cache_size(self):
+        """Should reject non-positive cache size."""
+        with pytest.raises(ValueError, match="cache_size"):
+            TokenCounter(cache_size=0)
+
+
 class TestContextTrimmingLogic:
     """Test context trimming algorithm."""
 
@@ -331,3 +390,149 @@ class TestChatInterface:
 
         with pytest.raises(ValueError):
             asyncio.run(inference.chat([]))
+
+
+class TestConnectionPool:
+    """Test persistent provider connection pools."""
+
+    def test_pool_config_validation(self):
+        """Should reject per-host limit above the total connection limit."""
+        with pytest.raises(ValueError, match="pool_max_connections_per_host"):
+            LLMConfig(pool_max_connections=2, pool_max_connections_per_host=4)
+
+    def test_pool_settings_load_from_yaml(self, tmp_path):
+        """Should read pool overrides from the lm section of the YAML config."""
+        from src.core.config import DemiConfig
+
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            "lm:\n"
+            "  pool:\n"
+            "    max_connections: 6\n"
+            "    max_connections_per_host: 3\n"
+            "    keepalive_sec: 12\n"
+        )
+
+        config = LLMConfig.from_global_config(DemiConfig.load(str(config_file)))
+
+        assert config.pool_max_connections == 6
+        assert config.pool_max_connections_per_host == 3
+        assert config.pool_keepalive_sec == 12
+
+    def test_unified_shares_pools_with_providers(self):
+        """Should create one pool per provider and hand it to each provider."""
+        from src.llm import UnifiedLLMInference
+
+        unified = UnifiedLLMInference(LLMConfig(), DemiLogger())
+
+        assert unified.ollama.connection_pool is unified.ollama_pool
+        assert unified.lmstudio.connection_pool is unified.lmstudio_pool
+        stats = unified.get_pool_stats()
+        assert set(stats) == {"ollama", "lmstudio"}
+        assert stats["ollama"]["in_flight"] == 0
+
+    def test_pool_reuses_client_and_tracks_stats(self):
+        """Should reuse a single client across requests within one event loop."""
+        from src.llm.connection_pool import LMStudioConnectionPool
+
+        pool = LMStudioConnectionPool(LLMConfig(), DemiLogger())
+
+        async def run():
+            async with pool.acquire() as first:
+                assert pool.get_stats()["in_flight"] == 1
+            async with pool.acquire() as second:
+                pass
+            assert first is second
+            await pool.close()
+            return first
+
+        session = asyncio.run(run())
+        stats = pool.get_stats()
+        assert session.closed
+        assert stats["total_requests"] == 2
+        assert stats["clients_created"] == 1
+        assert stats["peak_in_flight"] == 1
+        assert stats["in_flight"] == 0
+        assert stats["is_open"] is False
+
+    def test_pool_recreates_client_for_new_event_loop(self):
+        """Should not hand out a client bound to a closed event loop."""
+        from src.llm.connection_pool import OllamaConnectionPool
+
+        pool = OllamaConnectionPool(LLMConfig(), DemiLogger())
+
+        async def get():
+            return await pool.get_client()
+
+        first = asyncio.run(get())
+        second = asyncio.run(get())
+        assert first is not second
+        assert pool.get_stats()["clients_created"] == 2
+
+
+class TestChatStream:
+    """Test streaming inference and provider fallback."""
+
+    @staticmethod
+    def _collect(unified, messages):
+        async def run():
+            return [chunk async for chunk in unified.chat_stream(messages)]
+
+        return asyncio.run(run())
+
+    @staticmethod
+    def _stream_of(*deltas, fail_after=None):
+        async def stream(messages, max_context_tokens=8000):
+            for i, delta in enumerate(deltas):
+                if fail_after is not None and i == fail_after:
+                    raise InferenceError("connection dropped")
+                yield delta
+            if fail_after is not None and fail_after >= len(deltas):
+                raise InferenceError("connection refused")
+
+        return stream
+
+    def test_stream_yields_deltas_then_final(self):
+        """Should yield each delta and a final chunk with the full text."""
+        from src.llm import UnifiedLLMInference
+
+        unified = UnifiedLLMInference(LLMConfig(), DemiLogger())
+        unified.ollama.chat_stream = self._stream_of("Hel", "lo", "!")
+        metrics = MagicMock()
+
+        with patch("src.llm.inference.get_llm_metrics", return_value=metrics):
+            chunks = self._collect(unified, [{"role": "user", "content": "hi"}])
+
+        assert [c.delta for c in chunks[:-1]] == ["Hel", "lo", "!"]
+        assert chunks[-1].done is True
+        assert chunks[-1].text == "Hello!"
+        assert chunks[-1].provider == "ollama"
+        metrics.record_time_to_first_token.assert_called_once()
+        metrics.record_inference.assert_called_once()
+
+    def test_stream_falls_back_before_first_token(self):
+        """Should switch to LMStudio if Ollama fails before emitting tokens."""
+        from src.llm import UnifiedLLMInference
+
+        unified = UnifiedLLMInference(LLMConfig(), DemiLogger())
+        unified.ollama.chat_stream = self._stream_of(fail_after=0)
+        unified.lmstudio.chat_stream = self._stream_of("fallback")
+
+        with patch("src.llm.inference.get_llm_metrics", return_value=MagicMock()):
+            chunks = self._collect(unified, [{"role": "user", "content": "hi"}])
+
+        assert chunks[-1].text == "fallback"
+        assert chunks[-1].provider == "lmstudio"
+
+    def test_stream_failure_after_first_token_raises(self):
+        """Should not restart on another provider once tokens were delivered."""
+        from src.llm import UnifiedLLMInference
+
+        unified = UnifiedLLMInference(LLMConfig(), DemiLogger())
+        unified.ollama.chat_stream = self._stream_of("partial", "more", fail_after=1)
+        unified.lmstudio.chat_stream = self._stream_of("fallback")
+
+        with patch("src.llm.inference.get_llm_metrics", return_value=MagicMock()):
+            with pytest.raises(InferenceError, match="interrupted"):
+                self._collect(unified, [{"role": "user", "content": "hi"}])
+        assert unified.get_active_requests() == 0
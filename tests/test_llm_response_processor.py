@@ -9,7 +9,7 @@ import pytest
 from datetime import datetime, UTC
 from unittest.mock import Mock, MagicMock, patch
 
-from src.llm.response_processor import ResponseProcessor, ProcessedResponse
+from src.llm.response_processor import ResponseProcessor, ProcessedResponse, ProcessedText
 from src.emotion.models import EmotionalState
 from src.emotion.interactions import InteractionHandler, InteractionType
 from src.core.logger import DemiLogger
@@ -399,3 +399,59 @@ class TestIntegration:
 
         assert "Hello!" in result.text
         assert "awesome" in result.text
+
+
+class TestProcessingPipeline:
+    """Test single-pass staged processing."""
+
+    def test_stage_timings_recorded(self, response_processor, baseline_emotional_state):
+        """Each stage should be timed once per response."""
+        result = response_processor.process_response(
+            response_text="Test response",
+            inference_time_sec=0.5,
+            emotional_state_before=baseline_emotional_state,
+        )
+
+        assert set(result.stage_timings_ms) == {"clean", "emotion", "persist", "metrics"}
+        assert all(ms >= 0 for ms in result.stage_timings_ms.values())
+        stats = response_processor.get_stage_stats()["stages"]
+        assert stats["persist"]["count"] == 1
+        assert stats["refusal"]["count"] == 0
+
+    def test_processed_text_not_reprocessed(
+        self, response_processor, baseline_emotional_state
+    ):
+        """Processing an already-processed response should not rerun any stage."""
+        first = response_processor.process_response(
+            response_text="Demi: Hello there",
+            inference_time_sec=0.5,
+            emotional_state_before=baseline_emotional_state,
+        )
+        text = first.as_text()
+        assert isinstance(text, ProcessedText)
+        assert text == first.text
+
+        with patch.object(response_processor, "_persist_interaction") as persist, patch.object(
+            response_processor, "_update_emotional_state"
+        ) as update:
+            second = response_processor.process_response(
+                response_text=text,
+                inference_time_sec=0.7,
+                emotional_state_before=baseline_emotional_state,
+            )
+            persist.assert_not_called()
+            update.assert_not_called()
+
+        assert second is first
+        assert response_processor.get_stage_stats()["skipped_reprocessing"] == 1
+
+    def test_accepts_emotional_state_dict(self, response_processor, baseline_emotional_state):
+        """Inference layers pass state as a dict; it should be normalized."""
+        result = response_processor.process_response(
+            response_text="Test",
+            inference_time_sec=0.5,
+            emotional_state_before=baseline_emotional_state.to_dict(),
+        )
+
+        assert isinstance(result.emotional_state_before, EmotionalState)
+        assert result.emotional_state_after is not None
@@ -0,0 +1,239 @@
+"""
+Unit tests for LLM admission control and priority scheduling.
+
+Validates the concurrency limit, priority ordering, load shedding and
+integration with UnifiedLLMInference.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.llm.scheduler import LLMScheduler, RequestPriority, SchedulerOverloadedError
+from src.llm import UnifiedLLMInference, LLMConfig, LLMOverloadedError
+from src.core.logger import DemiLogger
+
+
+@pytest.fixture(autouse=True)
+def llm_metrics():
+    """Replace LLM metrics with a mock so tests don't touch the metrics DB."""
+    metrics = MagicMock()
+    with patch("src.llm.scheduler.get_llm_metrics", return_value=metrics), patch(
+        "src.llm.inference.get_llm_metrics", return_value=metrics
+    ):
+        yield metrics
+
+
+class TestRequestPriority:
+    """Test priority lane classification."""
+
+    def test_ramble_is_autonomous(self):
+        assert (
+            RequestPriority.for_platform("discord", {"is_ramble": True})
+            == RequestPriority.AUTONOMOUS
+        )
+
+    def test_autonomy_platform_is_autonomous(self):
+        assert RequestPriority.for_platform("android_autonomy") == RequestPriority.AUTONOMOUS
+
+    def test_voice_platform(self):
+        assert RequestPriority.for_platform("voice") == RequestPriority.VOICE
+
+    def test_default_is_text(self):
+        assert RequestPriority.for_platform("discord", {}) == RequestPriority.TEXT
+
+
+class TestLLMScheduler:
+    """Test LLMScheduler admission and ordering."""
+
+    def test_invalid_limits(self):
+        with pytest.raises(ValueError):
+            LLMScheduler(max_concurrent=0)
+        with pytest.raises(ValueError):
+            LLMScheduler(max_queue_depth=-1)
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self):
+        """Should never run more than max_concurrent requests."""
+        scheduler = LLMScheduler(max_concurrent=2, max_queue_depth=10)
+        running = 0
+        peak = 0
+
+        async def job():
+            nonlocal running, peak
+            async with scheduler.slot(RequestPriority.TEXT):
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(job() for _ in range(6)))
+        assert peak == 2
+        assert scheduler.active == 0
+        assert scheduler.get_stats()["admitted"] == 6
+
+    @pytest.mark.asyncio
+    async def test_priority_order(self):
+        """Waiting requests should be admitted by lane, FIFO within a lane."""
+        scheduler = LLMScheduler(max_concurrent=1, max_queue_depth=10)
+        order = []
+        gate = asyncio.Event()
+
+        async def blocker():
+            async with scheduler.slot(RequestPriority.TEXT):
+                await gate.wait()
+
+        async def job(name, priority):
+            async with scheduler.slot(priority):
+                order.append(name)
+
+        first = asyncio.create_task(blocker())
+        await asyncio.sleep(0)
+        tasks = [
+            asyncio.create_task(job("review", RequestPriority.SELF_IMPROVEMENT)),
+            asyncio.create_task(job("ramble", RequestPriority.AUTONOMOUS)),
+            asyncio.create_task(job("text1", RequestPriority.TEXT)),
+            asyncio.create_task(job("voice", RequestPriority.VOICE)),
+            asyncio.create_task(job("text2", RequestPriority.TEXT)),
+        ]
+        await asyncio.sleep(0)
+        assert scheduler.queue_depth == 5
+
+        gate.set()
+        await asyncio.gather(first, *tasks)
+        assert order == ["voice", "text1", "text2", "ramble", "review"]
+
+    @pytest.mark.asyncio
+    async def test_sheds_lowest_priority_when_full(self, llm_metrics):
+        """A higher-priority arrival should evict the lowest-priority waiter."""
+        scheduler = LLMScheduler(max_concurrent=1, max_queue_depth=1)
+        gate = asyncio.Event()
+
+        async def blocker():
+            async with scheduler.slot(RequestPriority.TEXT):
+                await gate.wait()
+
+        async def job(priority):
+            async with scheduler.slot(priority):
+                return priority
+
+        first = asyncio.create_task(blocker())
+        await asyncio.sleep(0)
+        review = asyncio.create_task(job(RequestPriority.SELF_IMPROVEMENT))
+        await asyncio.sleep(0)
+        voice = asyncio.create_task(job(RequestPriority.VOICE))
+        await asyncio.sleep(0)
+
+        with pytest.raises(SchedulerOverloadedError):
+            await review
+
+        gate.set()
+        await first
+        assert await voice == RequestPriority.VOICE
+
+        stats = scheduler.get_stats()
+        assert stats["shed_by_priority"]["self_improvement"] == 1
+        llm_metrics.record_load_shed.assert_called_with("self_improvement")
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_full_of_higher_priority(self):
+        """An arrival that outranks nobody should fail fast."""
+        scheduler = LLMScheduler(max_concurrent=1, max_queue_depth=1)
+        gate = asyncio.Event()
+
+        async def blocker():
+            async with scheduler.slot(RequestPriority.TEXT):
+                await gate.wait()
+
+        first = asyncio.create_task(blocker())
+        await asyncio.sleep(0)
+        waiting = asyncio.create_task(blocker())
+        await asyncio.sleep(0)
+
+        with pytest.raises(SchedulerOverloadedError):
+            await scheduler.acquire(RequestPriority.AUTONOMOUS)
+
+        gate.set()
+        await asyncio.gather(first, waiting)
+        assert scheduler.active == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        """Cancelling a queued request should not consume a slot."""
+        scheduler = LLMScheduler(max_concurrent=1, max_queue_depth=5)
+        await scheduler.acquire()
+
+        waiter = asyncio.create_task(scheduler.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        scheduler.release()
+        assert scheduler.active == 0
+        assert scheduler.queue_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_queue_wait_recorded(self, llm_metrics):
+        """Queue wait time and depth should be exported as metrics."""
+        scheduler = LLMScheduler(max_concurrent=1, max_queue_depth=5)
+        await scheduler.acquire(RequestPriority.TEXT)
+
+        waiter = asyncio.create_task(scheduler.acquire(RequestPriority.VOICE))
+        await asyncio.sleep(0.01)
+        scheduler.release()
+        wait_ms = await waiter
+        scheduler.release()
+
+        assert wait_ms > 0
+        llm_metrics.record_queue_wait.assert_called_with(wait_ms, "voice")
+        llm_metrics.record_queue_depth.assert_any_call(1, 1)
+
+
+class TestUnifiedScheduling:
+    """Test scheduler integration with UnifiedLLMInference."""
+
+    @pytest.mark.asyncio
+    async def test_shed_request_raises_overloaded(self):
+        """Load-shed requests should surface as LLMOverloadedError."""
+        config = LLMConfig(max_concurrent_requests=1, max_queue_depth=0)
+        inference = UnifiedLLMInference(config, DemiLogger())
+        gate = asyncio.Event()
+
+        async def slow_chat(*args, **kwargs):
+            await gate.wait()
+            return "ok"
+
+        inference.ollama.chat = AsyncMock(side_effect=slow_chat)
+
+        first = asyncio.create_task(inference.chat([{"role": "user", "content": "hi"}]))
+        await asyncio.sleep(0)
+
+        with pytest.raises(LLMOverloadedError):
+            await inference.chat(
+                [{"role": "user", "content": "again"}],
+                priority=RequestPriority.AUTONOMOUS,
+            )
+
+        gate.set()
+        assert await first == "ok"
+        assert inference.get_scheduler_stats()["shed"] == 1
+        assert inference.get_active_requests() == 0
+
+    def test_scheduler_settings_load_from_yaml(self, tmp_path):
+        """Scheduler limits in the lm section of the YAML config should reach LLMConfig."""
+        from src.core.config import DemiConfig
+
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            "lm:\n"
+            "  scheduler:\n"
+            "    max_concurrent: 4\n"
+            "    max_queue_depth: 8\n"
+        )
+
+        config = LLMConfig.from_global_config(DemiConfig.load(str(config_file)))
+
+        assert config.max_concurrent_requests == 4
+        assert config.max_queue_depth == 8
@@ -0,0 +1,97 @@
+# tests/test_pattern_learning.py
+import sqlite3
+
+import pytest
+
+from src.evolution.pattern_learning import KeywordIndex, PatternLearningDB
+
+
+@pytest.fixture
+def db(tmp_path):
+    return PatternLearningDB(db_path=str(tmp_path / "patterns.db"))
+
+
+def learn(db, issue, strategy="add_persona_markers", score=0.8):
+    return db.learn_from_revision(
+        original_issue=issue,
+        strategy_used=strategy,
+        was_successful=True,
+        improvement_score=score,
+        before_text="before",
+        after_text="after",
+    )
+
+
+class TestKeywordIndex:
+    """Test the in-memory inverted index."""
+
+    def test_match_counts_shared_keywords(self):
+        index = KeywordIndex()
+        index.add("a", ["tone", "persona", "formal"])
+        index.add("b", ["tone", "length"])
+        index.add("a", ["ignored"])  # Already indexed
+
+        assert index.match(["tone", "persona", "tone"]) == {"a": 2, "b": 1}
+        assert index.match(["ignored", "missing"]) == {}
+        assert len(index) == 2
+
+
+class TestPatternLookups:
+    """Test indexed pattern and mistake lookups."""
+
+    def test_find_patterns_for_issue(self, db):
+        learn(db, "Missing goddess persona markers in reply", "add_persona_markers")
+        learn(db, "Response length exceeds platform limits", "shorten")
+
+        found = db.find_patterns_for_issue("reply lacks goddess persona markers")
+        assert [p.effective_strategy for p in found] == ["add_persona_markers"]
+        assert db.find_patterns_for_issue("completely unrelated words") == []
+
+    def test_similar_issue_updates_existing_pattern(self, db):
+        first = learn(db, "Missing goddess persona markers")
+        again = learn(db, "missing goddess persona markers", score=0.2)
+        assert again == first
+
+        (pattern,) = db.find_patterns_for_issue("goddess persona markers")
+        assert pattern.times_applied == 2
+
+    def test_mistake_prevention_and_dedup(self, db):
+        entry_id = db.add_mistake(
+            mistake_type="tone",
+            mistake_description="Sounded overly apologetic and submissive",
+            example_response="I'm so sorry, please forgive me",
+            correction_strategy="assert_confidence",
+            corrected_response="Fine. Here it is.",
+            root_cause="Defaulted to assistant voice",
+            prevention_tip="Stay confident",
+        )
+        assert db.add_mistake("tone", "sounded overly apologetic and submissive",
+                              "", "", "", "", "") == entry_id
+
+        found = db.find_mistake_prevention("Sorry, I was overly apologetic there")
+        assert [m.entry_id for m in found] == [entry_id]
+        assert found[0].times_encountered == 2
+        assert db.find_mistake_prevention("All good here") == []
+
+    def test_index_persists_and_backfills(self, tmp_path):
+        path = str(tmp_path / "patterns.db")
+        first = PatternLearningDB(db_path=path)
+        learn(first, "Missing goddess persona markers")
+
+        # A row written before the keyword tables existed
+        with sqlite3.connect(path) as conn:
+            conn.execute(
+                "INSERT INTO patterns (pattern_id, timestamp, trigger_issue, trigger_keywords, "
+                "effective_strategy) VALUES ('pat_legacy', '2026-01-01T00:00:00+00:00', "
+                "'Emoji spam in replies', '[\"emoji\", \"spam\", \"replies\"]', 'strip_emoji')"
+            )
+
+        reopened = PatternLearningDB(db_path=path)
+        assert reopened.find_patterns_for_issue("goddess persona")[0].trigger_issue == (
+            "Missing goddess persona markers"
+        )
+        assert reopened.find_patterns_for_issue("emoji spam")[0].pattern_id == "pat_legacy"
+        with sqlite3.connect(path) as conn:
+            assert conn.execute(
+                "SELECT COUNT(*) FROM pattern_keywords WHERE pattern_id = 'pat_legacy'"
+            ).fetchone()[0] == 3
@@ -0,0 +1,293 @@
+# tests/test_plugin_worker.py
+import asyncio
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.conductor.isolation import PluginWorker, PluginWorkerPool
+from src.plugins import worker as worker_mod
+from src.plugins.worker import (
+    ProtocolError,
+    encode_frame,
+    read_frame,
+    read_frame_async,
+    write_frame,
+)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# Worker entry point serving a stub plugin, so tests don't need entry points
+STUB_WORKER = """
+import os, sys
+frames_fd = os.dup(1)
+os.dup2(2, 1)
+from src.plugins import worker
+
+class Health:
+    status = "healthy"
+
+class Plugin:
+    def handle_request(self, request):
+        if request.get("sleep"):
+            import time
+            time.sleep(request["sleep"])
+        return {"echo": request.get("content"), "pid": os.getpid()}
+    def health_check(self):
+        return Health()
+    def shutdown(self):
+        pass
+
+async def load(name):
+    return Plugin()
+
+worker._load_plugin = load
+sys.exit(worker.main(frames_fd))
+"""
+
+
+class StubPlugin:
+    def __init__(self):
+        self.shut_down = False
+
+    def handle_request(self, request):
+        if request.get("fail"):
+            raise ValueError("bad request")
+        return {"type": request["type"], "content": request.get("content")}
+
+    def health_check(self):
+        return type("Health", (), {"status": "healthy"})()
+
+    def shutdown(self):
+        self.shut_down = True
+
+
+class StubRunner:
+    """Runner stand-in that spawns stub workers for a pool."""
+
+    _timeout_seconds = 10
+
+    def __init__(self):
+        self._active_processes = {}
+
+    async def _create_worker(self, plugin_name):
+        process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-c",
+            STUB_WORKER,
+            plugin_name,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            cwd=str(PROJECT_ROOT),
+        )
+        self._active_processes[process.pid] = process
+        return PluginWorker(plugin_name, process)
+
+    async def _kill_process_tree(self, process):
+        if process.returncode is None:
+            process.kill()
+        await process.wait()
+        self._active_processes.pop(process.pid, None)
+
+
+class TestFraming:
+    """Test the length-prefixed JSON protocol."""
+
+    def test_round_trip(self):
+        stream = io.BytesIO()
+        write_frame(stream, {"id": 1, "op": "ping"})
+        write_frame(stream, {"id": 2, "op": "request", "request": {"content": "hi"}})
+        stream.seek(0)
+        assert read_frame(stream) == {"id": 1, "op": "ping"}
+        assert read_frame(stream)["request"] == {"content": "hi"}
+        assert read_frame(stream) is None
+
+    def test_truncated_payload(self):
+        stream = io.BytesIO(encode_frame({"id": 1})[:-2])
+        with pytest.raises(ProtocolError):
+            read_frame(stream)
+
+    def test_oversized_length_rejected(self):
+        header = worker_mod.FRAME_HEADER.pack(worker_mod.MAX_FRAME_BYTES + 1)
+        with pytest.raises(ProtocolError):
+            read_frame(io.BytesIO(header))
+
+    def test_non_object_payload_rejected(self):
+        payload = b"[1, 2]"
+        stream = io.BytesIO(worker_mod.FRAME_HEADER.pack(len(payload)) + payload)
+        with pytest.raises(ProtocolError):
+            read_frame(stream)
+
+    @pytest.mark.asyncio
+    async def test_async_reader(self):
+        reader = asyncio.StreamReader()
+        reader.feed_data(encode_frame({"id": 7, "ok": True}))
+        reader.feed_eof()
+        assert await read_frame_async(reader) == {"id": 7, "ok": True}
+        assert await read_frame_async(reader) is None
+
+
+class TestServe:
+    """Test the worker request loop."""
+
+    def run_serve(self, monkeypatch, messages, plugin=None):
+        plugin = plugin or StubPlugin()
+
+        async def load(name):
+            return plugin
+
+        monkeypatch.setattr(worker_mod, "_load_plugin", load)
+        stdin = io.BytesIO(b"".join(encode_frame(m) for m in messages))
+        stdout = io.BytesIO()
+        code = worker_mod.serve("discord", stdin, stdout)
+        stdout.seek(0)
+        replies = []
+        while (reply := read_frame(stdout)) is not None:
+            replies.append(reply)
+        return code, replies
+
+    def test_handshake_and_requests(self, monkeypatch):
+        plugin = StubPlugin()
+        code, replies = self.run_serve(
+            monkeypatch,
+            [
+                {"id": 1, "op": "request", "request": {"content": "hello"}},
+                {"id": 2, "op": "ping"},
+                {"id": 3, "op": "shutdown"},
+            ],
+            plugin,
+        )
+        assert code == 0
+        assert replies[0]["ok"] and replies[0]["result"]["ready"] == "discord"
+        assert replies[1] == {
+            "id": 1,
+            "ok": True,
+            "result": {"type": "discord", "content": "hello"},
+        }
+        assert replies[2]["result"] == {"status": "healthy"}
+        assert replies[3]["id"] == 3
+        assert plugin.shut_down
+
+    def test_plugin_error_keeps_worker_alive(self, monkeypatch):
+        _, replies = self.run_serve(
+            monkeypatch,
+            [
+                {"id": 1, "op": "request", "request": {"fail": True}},
+                {"id": 2, "op": "request", "request": {"content": "ok"}},
+            ],
+        )
+        assert not replies[1]["ok"]
+        assert "bad request" in replies[1]["error"]
+        assert replies[2]["ok"]
+
+    def test_missing_plugin(self, monkeypatch):
+        async def load(name):
+            return None
+
+        monkeypatch.setattr(worker_mod, "_load_plugin", load)
+        stdout = io.BytesIO()
+        assert worker_mod.serve("missing", io.BytesIO(), stdout) == 1
+        stdout.seek(0)
+        assert not read_frame(stdout)["ok"]
+
+    @pytest.mark.asyncio
+    async def test_bootstrap_keeps_import_output_off_frames(self):
+        # Package imports print to stdout; the first thing read must still be a frame
+        process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-c",
+            worker_mod.BOOTSTRAP,
+            "no_such_plugin",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            cwd=str(PROJECT_ROOT),
+        )
+        try:
+            reply = await asyncio.wait_for(read_frame_async(process.stdout), timeout=30)
+        finally:
+            process.stdin.close()
+            await process.wait()
+        assert reply["id"] == 0
+        assert "no_such_plugin" in reply["error"]
+
+
+class TestPluginWorkerPool:
+    """Test worker reuse, recycling and kill-on-failure."""
+
+    def make_pool(self, size=1, max_requests=100, health_check_interval=60):
+        return PluginWorkerPool(
+            "stub",
+            StubRunner(),
+            size=size,
+            max_requests_per_worker=max_requests,
+            health_check_interval=health_check_interval,
+        )
+
+    @pytest.mark.asyncio
+    async def test_worker_is_reused(self):
+        pool = self.make_pool()
+        try:
+            pids = set()
+            for i in range(3):
+                worker = await pool.acquire()
+                reply = await worker.call("request", request={"content": i})
+                worker.requests_served += 1
+                pool.release(worker)
+                assert reply["result"]["echo"] == i
+                pids.add(reply["result"]["pid"])
+            assert len(pids) == 1
+            assert pool.spawned == 1
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_recycles_after_max_requests(self):
+        pool = self.make_pool(max_requests=2)
+        try:
+            pids = []
+            for _ in range(4):
+                worker = await pool.acquire()
+                await worker.call("request", request={})
+                worker.requests_served += 1
+                pids.append(worker.pid)
+                pool.release(worker)
+            assert pids[0] == pids[1] != pids[2] == pids[3]
+            assert pool.recycled == 2
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_discard_kills_worker_and_frees_slot(self):
+        pool = self.make_pool()
+        try:
+            worker = await pool.acquire()
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    worker.call("request", request={"sleep": 5}), timeout=0.2
+                )
+            await pool.discard(worker, release_slot=True)
+            assert not worker.alive
+
+            replacement = await asyncio.wait_for(pool.acquire(), timeout=10)
+            assert replacement.pid != worker.pid
+            pool.release(replacement)
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_dead_idle_worker_is_replaced(self):
+        pool = self.make_pool(health_check_interval=0)
+        try:
+            worker = await pool.acquire()
+            pool.release(worker)
+            worker.process.kill()
+            await worker.process.wait()
+
+            replacement = await pool.acquire()
+            assert replacement.pid != worker.pid
+            assert (await replacement.call("ping"))["ok"]
+            pool.release(replacement)
+        finally:
+            await pool.close()
@@ -0,0 +1,78 @@
+# tests/test_storage.py
+import asyncio
+import sqlite3
+import threading
+
+import pytest
+
+from src.core.storage import close_database, get_database
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = tmp_path / "test.db"
+    database = get_database(path)
+    database.executescript(
+        "CREATE TABLE IF NOT EXISTS items (id INTEGER PRIMARY KEY, name TEXT)"
+    )
+    yield database
+    close_database(path)
+
+
+class TestSQLiteDatabase:
+    """Test the shared SQLite access layer."""
+
+    def test_same_file_shares_instance(self, db, tmp_path):
+        assert get_database(str(tmp_path / "test.db")) is db
+
+    def test_pragmas(self, db):
+        with db.read() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+    def test_write_then_read(self, db):
+        cursor = db.execute("INSERT INTO items (name) VALUES (?)", ("a",))
+        assert cursor.lastrowid == 1
+        db.executemany("INSERT INTO items (name) VALUES (?)", [("b",), ("c",)])
+        assert db.query("SELECT name FROM items ORDER BY id") == [("a",), ("b",), ("c",)]
+        assert db.query_one("SELECT COUNT(*) FROM items")[0] == 3
+
+    def test_writes_run_on_writer_thread(self, db):
+        def write(conn):
+            conn.execute("INSERT INTO items (name) VALUES ('x')")
+            return threading.current_thread()
+
+        assert db.write(write) is not threading.current_thread()
+
+    def test_failed_write_rolls_back(self, db):
+        def write(conn):
+            conn.execute("INSERT INTO items (name) VALUES ('x')")
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            db.write(write)
+        assert db.query_one("SELECT COUNT(*) FROM items")[0] == 0
+
+    def test_row_factory_does_not_leak(self, db):
+        db.execute("INSERT INTO items (name) VALUES ('a')")
+        with db.read() as conn:
+            conn.row_factory = sqlite3.Row
+            assert conn.execute("SELECT name FROM items").fetchone()["name"] == "a"
+        assert db.query_one("SELECT name FROM items") == ("a",)
+
+    def test_reader_sees_external_writes(self, db):
+        with sqlite3.connect(db.path) as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('ext')")
+        assert db.query_one("SELECT name FROM items") == ("ext",)
+
+    @pytest.mark.asyncio
+    async def test_execute_async(self, db):
+        await asyncio.gather(
+            *(db.execute_async("INSERT INTO items (name) VALUES (?)", (str(i),)) for i in range(20))
+        )
+        assert db.query_one("SELECT COUNT(*) FROM items")[0] == 20
+
+    def test_close_rejects_new_writes(self, db):
+        db.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            db.execute("INSERT INTO items (name) VALUES ('late')")
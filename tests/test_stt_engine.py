@@ -0,0 +1,121 @@
+"""Tests for the off-event-loop STT worker engine."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.voice.stt_engine import STTEngine, STTQueueFullError
+
+
+@pytest.fixture
+def engine():
+    """Create a two-worker engine."""
+    engine = STTEngine(workers=2, max_queue=4, default_timeout_s=5.0)
+    yield engine
+    engine.shutdown(wait=False)
+
+
+class TestSTTEngine:
+    """Test job execution, timeouts, cancellation and backpressure."""
+
+    @pytest.mark.asyncio
+    async def test_jobs_run_off_the_event_loop(self, engine):
+        loop_thread = threading.get_ident()
+        result = await engine.run(lambda x, y=0: (threading.get_ident(), x + y), 1, y=2)
+        assert result[0] != loop_thread
+        assert result[1] == 3
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive(self, engine):
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.create_task(ticker())
+        await engine.run(time.sleep, 0.3)
+        task.cancel()
+        assert ticks >= 10
+
+    @pytest.mark.asyncio
+    async def test_jobs_run_concurrently(self, engine):
+        start = time.monotonic()
+        await asyncio.gather(engine.run(time.sleep, 0.3), engine.run(time.sleep, 0.3))
+        assert time.monotonic() - start < 0.55
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate(self, engine):
+        def fail():
+            raise ValueError("bad audio")
+
+        with pytest.raises(ValueError, match="bad audio"):
+            await engine.run(fail)
+        assert engine.get_stats()["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_timeout_drops_queued_job(self, engine):
+        ran = []
+        blockers = [asyncio.create_task(engine.run(time.sleep, 0.4)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await engine.run(ran.append, "late", timeout=0.1)
+
+        await asyncio.gather(*blockers)
+        await engine.run(lambda: None)
+        assert ran == []
+        stats = engine.get_stats()
+        assert stats["timed_out"] == 1
+        assert stats["cancelled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_drops_queued_job(self, engine):
+        ran = []
+        blockers = [asyncio.create_task(engine.run(time.sleep, 0.3)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+
+        queued = asyncio.create_task(engine.run(ran.append, "cancelled"))
+        await asyncio.sleep(0.05)
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+
+        await asyncio.gather(*blockers)
+        await engine.run(lambda: None)
+        assert ran == []
+        assert engine.get_stats()["cancelled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects(self, engine):
+        release = threading.Event()
+        jobs = [asyncio.create_task(engine.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        jobs += [asyncio.create_task(engine.run(release.wait)) for _ in range(4)]
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(STTQueueFullError):
+            await engine.run(lambda: None)
+
+        stats = engine.get_stats()
+        assert stats["active"] == 2
+        assert stats["queue_depth"] == 4
+        assert stats["rejected"] == 1
+
+        release.set()
+        await asyncio.gather(*jobs)
+        stats = engine.get_stats()
+        assert stats["completed"] == 6
+        assert stats["queue_depth"] == 0
+        assert stats["peak_queue_depth"] == 4
+
+    @pytest.mark.asyncio
+    async def test_shutdown_rejects_new_jobs(self, engine):
+        await engine.run(lambda: None)
+        engine.shutdown()
+        with pytest.raises(RuntimeError):
+            await engine.run(lambda: None)
@@ -155,6 +155,90 @@ class TestSpeechBuffer:
                 # Segment finalized
                 break
 
+    def test_preroll_padding(self):
+        """Test silence just before speech onset is kept in the segment."""
+        from src.voice.vad import SpeechBuffer
+
+        buffer = SpeechBuffer(padding_duration_ms=60, max_silence_ms=60, min_speech_ms=30)
+        for i in range(5):
+            buffer.add_frame(bytes([i]) * 960, is_speech=False)
+        buffer.add_frame(b"\x7f" * 960, is_speech=True)
+        buffer.add_frame(b"\x00" * 960, is_speech=False)
+        segment = buffer.add_frame(b"\x00" * 960, is_speech=False)
+
+        # Two pre-roll frames, the speech frame, two hangover frames
+        assert segment == b"\x03" * 960 + b"\x04" * 960 + b"\x7f" * 960 + b"\x00" * 1920
+
+    def test_max_speech_splits_segment(self):
+        """Test continuous speech is split at max_speech_ms."""
+        from src.voice.vad import SpeechBuffer
+
+        buffer = SpeechBuffer(padding_duration_ms=0, min_speech_ms=30, max_speech_ms=300)
+        frame = b"\x01\x02" * 480
+        segments = [buffer.add_frame(frame, is_speech=True) for _ in range(25)]
+        finished = [s for s in segments if s is not None]
+
+        assert len(finished) == 2
+        assert all(len(s) == 10 * 960 for s in finished)
+        assert len(buffer.flush()) == 5 * 960
+        assert buffer.flush() is None
+
+
+class TestSpeechSegmenter:
+    """Test streaming per-speaker segmentation."""
+
+    @pytest.fixture
+    def vad(self, monkeypatch):
+        """VoiceActivityDetector whose backend calls any non-zero frame speech."""
+        import src.voice.vad as vad_module
+
+        class FakeVad:
+            def __init__(self, aggressiveness):
+                self.calls = 0
+
+            def is_speech(self, frame, sample_rate):
+                self.calls += 1
+                return any(frame)
+
+        fake = type("webrtcvad", (), {"Vad": FakeVad})
+        monkeypatch.setattr(vad_module, "HAS_WEBRTCVAD", True)
+        monkeypatch.setattr(vad_module, "webrtcvad", fake)
+        return vad_module.VoiceActivityDetector()
+
+    def test_packets_split_into_frames_once(self, vad):
+        """Test 20 ms packets are cut into 30 ms frames, each classified once."""
+        from src.voice.vad import SpeechSegmenter
+
+        segmenter = SpeechSegmenter(vad, padding_ms=0, hangover_ms=90, min_speech_ms=60)
+        packet = b"\x01\x00" * 320  # 20 ms
+        segments = []
+        for _ in range(15):  # 300 ms of speech
+            segments += segmenter.feed(packet)
+        assert vad.vad.calls == 10
+        assert segments == []
+        assert segmenter.is_speech_active
+
+        # Segment is emitted by the packet that completes the hangover
+        silence = b"\x00" * 640
+        for i in range(10):
+            segments = segmenter.feed(silence)
+            if segments:
+                break
+        assert i == 4
+        assert len(segments) == 1
+        assert len(segments[0]) == 13 * 960
+        assert not segmenter.is_speech_active
+
+    def test_flush_and_max_utterance(self, vad):
+        """Test long speech is split and flush returns the remainder."""
+        from src.voice.vad import SpeechSegmenter
+
+        segmenter = SpeechSegmenter(vad, padding_ms=0, min_speech_ms=30, max_utterance_ms=600)
+        segments = segmenter.feed(b"\x01\x00" * 16000)  # 1 s in one call
+        assert [len(s) for s in segments] == [20 * 960]
+        assert len(segmenter.flush()) == 13 * 960
+        assert segmenter.flush() is None
+
 
 class TestAudioUtils:
     """Test audio utility functions."""
@@ -182,6 +266,69 @@ class TestAudioUtils:
         result = normalize_audio(data)
         assert result == data
 
+    def test_pcm16_to_float32(self):
+        """Test PCM conversion to normalized float32 samples."""
+        import numpy as np
+        from src.voice.audio_capture import pcm16_to_float32
+
+        pcm = np.array([0, 16384, -32768, 32767], dtype=np.int16).tobytes()
+        for data in (pcm, bytearray(pcm), memoryview(pcm)):
+            audio = pcm16_to_float32(data)
+            assert audio.dtype == np.float32
+            assert audio.tolist() == [0.0, 0.5, -1.0, 32767 / 32768]
+
+    def test_pcm16_to_float32_resamples(self):
+        """Test PCM at another rate is resampled to the target rate."""
+        import numpy as np
+        from src.voice.audio_capture import pcm16_to_float32
+
+        pcm = np.zeros(48000, dtype=np.int16).tobytes()
+        audio = pcm16_to_float32(pcm, sample_rate=48000, target_rate=16000)
+        assert audio.dtype == np.float32
+        assert len(audio) == 16000
+
+
+class TestPCMRingBuffer:
+    """Test the preallocated PCM ring buffer."""
+
+    def test_append_and_view(self):
+        """Test appended audio reads back in order without copying."""
+        from src.voice.pcm_buffer import PCMRingBuffer
+
+        ring = PCMRingBuffer(8)
+        ring.append(b"ab")
+        ring.append(bytearray(b"cd"))
+        view = ring.view()
+        assert isinstance(view, memoryview)
+        assert view.readonly
+        assert bytes(view) == b"abcd"
+        assert bytes(ring.tail(2)) == b"cd"
+
+    def test_overflow_keeps_newest(self):
+        """Test a full buffer drops the oldest bytes, across the wrap point."""
+        from src.voice.pcm_buffer import PCMRingBuffer
+
+        ring = PCMRingBuffer(6)
+        assert ring.append(b"abcd") == 0
+        assert ring.append(b"efgh") == 2
+        assert len(ring) == 6
+        assert bytes(ring.view()) == b"cdefgh"
+        assert ring.append(b"0123456789") == 10
+        assert bytes(ring.view()) == b"456789"
+
+    def test_take_clears(self):
+        """Test take returns a copy and empties the buffer."""
+        from src.voice.pcm_buffer import PCMRingBuffer
+
+        ring = PCMRingBuffer.for_duration(1.0)
+        assert ring.capacity == 32000
+        ring.append(b"\x00\x01" * 1600)
+        assert ring.duration_ms == 100
+        data = ring.take()
+        assert data == b"\x00\x01" * 1600
+        assert len(ring) == 0
+        assert ring.take() == b""
+
 
 class TestTranscriptionResult:
     """Test TranscriptionResult dataclass."""
@@ -238,6 +385,21 @@ class TestSTTStats:
         assert stats.avg_latency_ms == 500.0
         assert stats.avg_confidence == 0.875
 
+    def test_record_transcription_feeds_latency_histogram(self):
+        """Test recorded transcriptions reach the STT latency histogram."""
+        from src.monitoring.latency import get_latency_registry
+        from src.voice.stt import STTStats
+
+        histogram = get_latency_registry().histogram("stt_latency_ms")
+        before = histogram.total_count
+
+        stats = STTStats()
+        stats.record_transcription(400, 0.9)
+
+        assert stats.total_transcriptions == 1
+        assert stats.avg_latency_ms == 400.0
+        assert histogram.total_count == before + 1
+
 
 class TestAudioCapture:
     """Test AudioCapture functionality (mock)."""
@@ -302,6 +464,214 @@ class TestSpeechToText:
         assert "backend" in stats
         assert "model_loaded" in stats
 
+    @pytest.mark.asyncio
+    async def test_transcribe_audio_bytes_in_memory(self, tmp_path, monkeypatch):
+        """Test PCM reaches the model as a float32 array without a temp file."""
+        import tempfile
+        import numpy as np
+        from src.voice.stt import SpeechToText
+
+        def no_temp_files(*args, **kwargs):
+            raise AssertionError("temp file created")
+
+        monkeypatch.setattr(tempfile, "NamedTemporaryFile", no_temp_files)
+
+        class FakeModel:
+            def transcribe(self, audio, **kwargs):
+                self.audio = audio
+                return {"text": " hello ", "language": "en", "segments": []}
+
+        stt = SpeechToText(model_size="tiny", debug_capture_dir=str(tmp_path))
+        stt._model = FakeModel()
+        stt._model_loaded = True
+        stt._backend = "openai-whisper"
+
+        pcm = np.full(16000, 8192, dtype=np.int16).tobytes()
+        result = await stt.transcribe_audio_bytes(pcm, 16000)
+
+        assert result.text == "hello"
+        assert result.duration_ms == 1000
+        assert stt._model.audio.dtype == np.float32
+        assert stt._model.audio[0] == 0.25
+        assert len(list(tmp_path.glob("utterance_*.wav"))) == 1
+
+
+class TestInterimTranscriber:
+    """Test interim transcripts with stable-prefix commit."""
+
+    # (word, start s, end s) spoken in the utterance
+    SCRIPT = [
+        ("Hello", 0.0, 0.4),
+        ("there,", 0.5, 0.9),
+        ("how", 1.0, 1.2),
+        ("are", 1.3, 1.5),
+        ("you?", 1.6, 1.9),
+    ]
+
+    @staticmethod
+    def utterance(seconds):
+        """PCM whose samples encode their own position (10 ms units)."""
+        import numpy as np
+
+        return (np.arange(int(16000 * seconds)) // 160).astype(np.int16).tobytes()
+
+    @classmethod
+    def transcribe(cls, samples, word_timestamps):
+        """Fake Whisper: returns the scripted words completed in the window."""
+        start = samples[0] / 100
+        end = start + len(samples) / 16000
+        words = [
+            {"word": f" {text}", "start": s - start, "end": e - start}
+            for text, s, e in cls.SCRIPT
+            if s >= start - 0.005 and e <= end
+        ]
+        return {
+            "text": "".join(word["word"] for word in words),
+            "language": "en",
+            "segments": [{"words": words if word_timestamps else []}],
+        }
+
+    @pytest.fixture
+    def decoder(self):
+        """Decode coroutine over the fake Whisper, recording window lengths."""
+        import numpy as np
+        from src.voice.stt import TranscriptionResult, FasterWhisperWord
+
+        windows = []
+
+        async def decode(audio, interim):
+            windows.append(len(audio) // 32)
+            result = self.transcribe(np.frombuffer(audio, dtype=np.int16), interim)
+            return TranscriptionResult(
+                text=result["text"].strip(),
+                words=[
+                    FasterWhisperWord(w["word"], w["start"], w["end"], 1.0)
+                    for w in result["segments"][0]["words"]
+                ],
+            )
+
+        decode.windows = windows
+        return decode
+
+    @pytest.mark.asyncio
+    async def test_agreed_words_are_committed(self, decoder):
+        """Test words two decodes agree on are fixed and not decoded again."""
+        from src.voice.interim import InterimTranscriber
+
+        interim = InterimTranscriber(decoder)
+        audio = self.utterance(2.2)
+
+        first = await interim.update(audio[:32000])
+        assert first.text == "Hello there,"
+        assert first.is_final is False
+        assert interim.committed_text == ""
+
+        second = await interim.update(audio[:51200])
+        assert second.text == "Hello there, how are"
+        assert interim.committed_text == "Hello there,"
+        assert interim.committed_ms == 900
+
+        await interim.update(audio[:64000])
+        assert interim.committed_text == "Hello there, how are"
+
+        final = await interim.finish(audio)
+        assert final.is_final is True
+        assert final.text == "Hello there, how are you?"
+        assert final.duration_ms == 2200
+        # Each decode starts at the last committed word
+        assert decoder.windows == [1000, 1600, 1100, 700]
+        assert interim.committed_text == ""
+
+    @pytest.mark.asyncio
+    async def test_poll_runs_one_decode_in_background(self, decoder):
+        """Test poll never waits and keeps at most one decode in flight."""
+        from src.voice.interim import InterimTranscriber
+
+        interim = InterimTranscriber(decoder, interval_ms=500)
+        audio = self.utterance(2.0)
+
+        assert interim.poll(300, lambda: audio[:9600]) is None
+        assert interim.decodes == 0
+        assert interim.poll(1000, lambda: audio[:32000]) is None
+        assert interim.poll(1600, lambda: audio[:51200]) is None
+        await asyncio.sleep(0)
+        result = interim.poll(1600, lambda: audio[:51200])
+        assert result.text == "Hello there,"
+        # The next decode started with the result collected
+        await asyncio.sleep(0)
+        assert interim.decodes == 2
+        assert interim.poll(1600, lambda: audio[:51200]).text == "Hello there, how are"
+
+    @pytest.mark.asyncio
+    async def test_without_timestamps_window_is_bounded(self):
+        """Test nothing is committed without word timings and decoding stops at max_window_ms."""
+        from src.voice.interim import InterimTranscriber
+        from src.voice.stt import TranscriptionResult
+
+        async def decode(audio, interim):
+            return TranscriptionResult(text="hello there")
+
+        interim = InterimTranscriber(decode, interval_ms=500, max_window_ms=1500)
+        audio = self.utterance(2.0)
+        await interim.update(audio[:16000])
+        result = await interim.update(audio[:32000])
+        assert result.text == "hello there"
+        assert interim.committed_ms == 0
+        assert interim.due(1500) is True
+        assert interim.due(2000) is False
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_interim_then_final(self, monkeypatch, tmp_path):
+        """Test transcribe_stream emits interim results before the final one."""
+        import src.voice.vad as vad_module
+        from src.monitoring.latency import get_latency_registry
+        from src.voice.stt import SpeechToText
+
+        class FakeVad:
+            def __init__(self, aggressiveness):
+                pass
+
+            def is_speech(self, frame, sample_rate):
+                return True
+
+        monkeypatch.setattr(vad_module, "HAS_WEBRTCVAD", True)
+        monkeypatch.setattr(vad_module, "webrtcvad", type("webrtcvad", (), {"Vad": FakeVad}))
+
+        test = self
+
+        class FakeModel:
+            def transcribe(self, audio, word_timestamps=False, **kwargs):
+                return test.transcribe((audio * 32768).round().astype("int16"), word_timestamps)
+
+        class FakeStream:
+            sample_rate = 16000
+
+            async def iter_chunks(self):
+                audio = test.utterance(2.1)
+                for i in range(0, len(audio), 960):
+                    await asyncio.sleep(0.002)
+                    yield audio[i:i + 960]
+
+        stt = SpeechToText(model_size="tiny")
+        stt._model = FakeModel()
+        stt._model_loaded = True
+        stt._backend = "openai-whisper"
+        stt.debug_capture_dir = str(tmp_path)
+        interim_latency = get_latency_registry().histogram("stt_interim_ms")
+        before = interim_latency.total_count
+
+        results = [r async for r in stt.transcribe_stream(FakeStream(), interim_interval_ms=300)]
+
+        assert results[-1].is_final is True
+        assert results[-1].text == "Hello there, how are you?"
+        interims = [r for r in results if not r.is_final]
+        assert interims
+        assert all(r.text for r in interims)
+        # Only the final decode counts as a transcription and is captured
+        assert stt.stats.total_transcriptions == 1
+        assert interim_latency.total_count - before >= len(interims)
+        assert len(list(tmp_path.iterdir())) == 1
+
 
 @pytest.mark.asyncio
 class TestAsyncOperations:
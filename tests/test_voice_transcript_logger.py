@@ -0,0 +1,112 @@
+"""Tests for the indexed, rotating voice transcript store."""
+
+import gzip
+import json
+
+import pytest
+
+from src.integrations.voice_transcript_logger import VoiceTranscriptLogger
+
+
+@pytest.fixture
+def transcript_logger(tmp_path):
+    """Create a transcript logger writing to a temp directory."""
+    transcript_logger = VoiceTranscriptLogger(log_dir=str(tmp_path))
+    yield transcript_logger
+    transcript_logger.close()
+
+
+def log_conversation(transcript_logger, guild_id, session_id, turns):
+    for i in range(turns):
+        transcript_logger.log_user_speech(
+            f"question {i}", guild_id, 10, 42, "alice", session_id=session_id
+        )
+        transcript_logger.log_demi_response(f"answer {i}", guild_id, 10, session_id=session_id)
+
+
+class TestTranscriptLookups:
+    """Test recent-entry and session lookups."""
+
+    def test_recent_transcripts_filters_and_order(self, transcript_logger):
+        log_conversation(transcript_logger, 1, "s1", 5)
+        log_conversation(transcript_logger, 2, "s2", 5)
+
+        recent = transcript_logger.get_recent_transcripts(guild_id=1, limit=3)
+        assert [e["text"] for e in recent] == ["answer 3", "question 4", "answer 4"]
+
+        users = transcript_logger.get_recent_transcripts(guild_id=2, limit=2, speaker_type="user")
+        assert [e["text"] for e in users] == ["question 3", "question 4"]
+        assert all(e["guild_id"] == 2 for e in users)
+
+        assert len(transcript_logger.get_recent_transcripts(limit=100)) == 20
+        assert transcript_logger.get_recent_transcripts(guild_id=3) == []
+
+    def test_session_context(self, transcript_logger):
+        log_conversation(transcript_logger, 1, "s1", 4)
+        log_conversation(transcript_logger, 1, "s2", 1)
+
+        context = transcript_logger.get_session_context("s1", context_turns=1)
+        assert context == "alice: question 3\nDemi: answer 3"
+        assert transcript_logger.get_session_context("missing") == ""
+
+
+class TestTranscriptStorage:
+    """Test persistence, index recovery, rotation and compression."""
+
+    def test_index_survives_restart(self, tmp_path):
+        first = VoiceTranscriptLogger(log_dir=str(tmp_path))
+        log_conversation(first, 1, "s1", 3)
+        first.close()
+
+        second = VoiceTranscriptLogger(log_dir=str(tmp_path))
+        log_conversation(second, 1, "s1", 1)
+        assert len(second.get_recent_transcripts(guild_id=1)) == 8
+        second.close()
+
+    def test_missing_index_entries_are_rebuilt(self, tmp_path):
+        first = VoiceTranscriptLogger(log_dir=str(tmp_path))
+        log_conversation(first, 1, "s1", 3)
+        first.close()
+
+        index_path = next(tmp_path.glob("*.idx"))
+        lines = index_path.read_text().splitlines(keepends=True)
+        index_path.write_text("".join(lines[:2]))  # Lost the tail of the index
+        data_path = next(tmp_path.glob("*.jsonl"))
+        with open(data_path, "a") as f:
+            f.write('{"guild_id": 1, "text": "half writ')  # Interrupted write
+
+        second = VoiceTranscriptLogger(log_dir=str(tmp_path))
+        assert len(second.get_recent_transcripts(guild_id=1)) == 6
+        assert len(index_path.read_text().splitlines()) == 6
+
+        second.log_demi_response("after crash", 1, 10, session_id="s1")
+        assert second.get_recent_transcripts(limit=1)[0]["text"] == "after crash"
+        second.close()
+
+    def test_size_rotation(self, tmp_path):
+        transcript_logger = VoiceTranscriptLogger(log_dir=str(tmp_path), max_segment_bytes=1000)
+        log_conversation(transcript_logger, 1, "s1", 20)
+
+        segments = sorted(tmp_path.glob("*.jsonl"))
+        assert len(segments) > 1
+        assert all(p.stat().st_size <= 1000 for p in segments)
+
+        recent = transcript_logger.get_recent_transcripts(guild_id=1, limit=40)
+        assert [e["text"] for e in recent[:2]] == ["question 0", "answer 0"]
+        assert recent[-1]["text"] == "answer 19"
+        assert transcript_logger.get_session_context("s1", context_turns=20).count("\n") == 39
+        transcript_logger.close()
+
+    def test_old_segments_are_compressed(self, tmp_path):
+        old = tmp_path / "voice_transcript_2020-01-01.jsonl"
+        old.write_text(json.dumps({"guild_id": 1, "text": "old"}) + "\n")
+        (tmp_path / "voice_transcript_2020-01-01.jsonl.idx").write_text("")
+
+        transcript_logger = VoiceTranscriptLogger(log_dir=str(tmp_path))
+        transcript_logger._compress_thread.join(timeout=10)
+
+        assert not old.exists()
+        with gzip.open(tmp_path / "voice_transcript_2020-01-01.jsonl.gz", "rt") as f:
+            assert json.loads(f.read())["text"] == "old"
+        assert transcript_logger.get_recent_transcripts() == []
+        transcript_logger.close()